@@ -0,0 +1,276 @@
+"""
+데이터베이스 쿼리 벤치마크
+
+기본적으로 임시 SQLite 파일에 스키마를 만들어 측정하며,
+--url 로 별도 MySQL 벤치마크 DB 를 지정할 수 있다. (운영 DB 에 실행하지 말 것)
+
+    python init/benchmark_db.py
+    python init/benchmark_db.py --url mysql+pymysql://user:pw@host/bench_db
+"""
+
+import os
+import sys
+import time
+import argparse
+import logging
+import tempfile
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+HISTORY_SIZES = (10, 100, 1000, 5000)
+
+
+def _prepare_environment(url: str):
+    """shared_modules import 전에 벤치마크 DB URL 지정"""
+    os.environ["MYSQL_URL"] = url
+    sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _timeit(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def _seed_conversation(db, db_models, user_id: int, size: int) -> int:
+    conversation = db_models.Conversation(user_id=user_id)
+    db.add(conversation)
+    db.flush()
+    if size:
+        db.execute(
+            db_models.Message.__table__.insert(),
+            [
+                {
+                    "conversation_id": conversation.conversation_id,
+                    "sender_type": "USER" if i % 2 == 0 else "AGENT",
+                    "agent_type": None if i % 2 == 0 else "mental_health",
+                    "content": f"benchmark message {i} " * 8
+                }
+                for i in range(size)
+            ]
+        )
+    db.commit()
+    return conversation.conversation_id
+
+
+def _create_bench_user(db, db_models):
+    user = db_models.User(
+        email=f"bench-{time.time_ns()}@example.com", nickname="bench", provider="bench",
+        social_id=str(time.time_ns()), admin=False, experience=False, access_token="bench"
+    )
+    db.add(user)
+    db.commit()
+    return user.user_id
+
+
+def bench_message_history(repeat: int = 20):
+    """대화 길이별 히스토리 조회 지연 시간 (전체 로드 후 슬라이스 vs tail 쿼리)"""
+    from shared_modules import db_models
+    from shared_modules.database import get_session_context
+    from shared_modules.queries import get_conversation_history, get_messages_page
+
+    def legacy_history(db, conversation_id, limit=6):
+        messages = db.query(db_models.Message).filter(
+            db_models.Message.conversation_id == conversation_id
+        ).order_by(db_models.Message.message_id).all()
+        return "\n".join(
+            f"{'Human' if m.sender_type == 'USER' else 'AI'}: {m.content}" for m in messages[-limit:]
+        )
+
+    with get_session_context() as db:
+        user_id = _create_bench_user(db, db_models)
+
+        logger.info(f"{'messages':>8} | {'legacy(ms)':>10} | {'tail(ms)':>8} | {'page(ms)':>8}")
+        for size in HISTORY_SIZES:
+            conversation_id = _seed_conversation(db, db_models, user_id, size)
+            assert legacy_history(db, conversation_id) == get_conversation_history(db, conversation_id)
+
+            legacy_ms = _timeit(lambda: legacy_history(db, conversation_id), repeat)
+            tail_ms = _timeit(lambda: get_conversation_history(db, conversation_id), repeat)
+            page_ms = _timeit(lambda: get_messages_page(db, conversation_id, 50), repeat)
+            logger.info(f"{size:>8} | {legacy_ms:>10.2f} | {tail_ms:>8.2f} | {page_ms:>8.2f}")
+
+
+def bench_create_conversation(repeat: int = 20):
+    """대화 생성 처리량 (연결 확인 + 사용자 조회 후 생성 vs INSERT 한 번)"""
+    from datetime import datetime
+    from shared_modules import db_models
+    from shared_modules.database import get_session_context
+    from shared_modules.queries import check_database_connection, ensure_test_user, create_conversation
+
+    def legacy_create(db, user_id):
+        check_database_connection(db)
+        user = ensure_test_user(db, user_id)
+        conversation = db_models.Conversation(user_id=user.user_id, started_at=datetime.now(), is_visible=True)
+        db.add(conversation)
+        db.commit()
+        db.refresh(conversation)
+        return conversation
+
+    count = repeat * 25
+    with get_session_context() as db:
+        user_id = _create_bench_user(db, db_models)
+
+        results = {}
+        for name, create in (("legacy", legacy_create), ("fast_path", create_conversation)):
+            start = time.perf_counter()
+            for _ in range(count):
+                assert create(db, user_id).conversation_id
+            elapsed = time.perf_counter() - start
+            results[name] = count / elapsed
+            logger.info(f"{name:>10}: {results[name]:,.0f} conversations/s ({count}개)")
+
+        logger.info(f"speedup: {results['fast_path'] / results['legacy']:.2f}x")
+
+
+def bench_bulk_queries(repeat: int = 20):
+    """다건 API 처리량 (행 단위 함수 반복 vs bulk 함수)"""
+    from shared_modules import db_models
+    from shared_modules.database import get_session_context
+    from shared_modules.queries import (
+        create_message, create_messages_bulk, update_task_status, bulk_update_task_status,
+        get_recent_messages, get_recent_messages_for_conversations
+    )
+
+    count = repeat * 25
+    with get_session_context() as db:
+        user_id = _create_bench_user(db, db_models)
+        conversation_id = _seed_conversation(db, db_models, user_id, 0)
+
+        def report(name, single_s, bulk_s, rows, unit="rows"):
+            logger.info(
+                f"{name:>16}: row-at-a-time {rows / single_s:>9,.0f} {unit}/s | "
+                f"bulk {rows / bulk_s:>9,.0f} {unit}/s | {single_s / bulk_s:.1f}x"
+            )
+
+        # 메시지 삽입
+        messages = [
+            {"conversation_id": conversation_id, "sender_type": "user", "agent_type": None, "content": f"m{i}"}
+            for i in range(count)
+        ]
+        start = time.perf_counter()
+        for message in messages:
+            create_message(db, message["conversation_id"], message["sender_type"], message["agent_type"], message["content"])
+        single_s = time.perf_counter() - start
+        start = time.perf_counter()
+        assert create_messages_bulk(db, messages) == count
+        report("message insert", single_s, time.perf_counter() - start, count)
+
+        # 작업 상태 전이
+        db.execute(db_models.AutomationTask.__table__.insert(), [
+            {"user_id": user_id, "task_type": "send_email", "title": f"t{i}", "status": "PENDING"}
+            for i in range(count)
+        ])
+        db.commit()
+        task_ids = [row[0] for row in db.query(db_models.AutomationTask.task_id).filter(
+            db_models.AutomationTask.user_id == user_id
+        ).all()]
+        start = time.perf_counter()
+        for task_id in task_ids:
+            update_task_status(db, task_id, "RUNNING")
+        single_s = time.perf_counter() - start
+        start = time.perf_counter()
+        assert bulk_update_task_status(db, task_ids, "COMPLETED") == len(task_ids)
+        report("task status", single_s, time.perf_counter() - start, len(task_ids))
+
+        # 여러 대화의 최근 메시지
+        conversation_ids = [_seed_conversation(db, db_models, user_id, 30) for _ in range(repeat * 5)]
+        start = time.perf_counter()
+        single = {cid: list(reversed(get_recent_messages(db, cid, 10))) for cid in conversation_ids}
+        single_s = time.perf_counter() - start
+        start = time.perf_counter()
+        batched = get_recent_messages_for_conversations(db, conversation_ids, 10)
+        assert batched == single
+        report("recent messages", single_s, time.perf_counter() - start, len(conversation_ids), "conversations")
+
+
+def bench_compression(repeat: int = 20):
+    """긴 응답 압축 전후 저장 크기와 히스토리 조회 지연 시간"""
+    from shared_modules import db_models
+    from shared_modules.column_compression import backfill
+    from shared_modules.database import get_session_context
+    from shared_modules.env_config import get_config
+    from shared_modules.queries import get_conversation_history, get_messages_page
+
+    answer = "\n".join(
+        f"## {i}. 단계별 실행 계획\n- 목표 고객을 정의하고 채널별 예산을 배분합니다.\n"
+        f"- 참고: https://example.com/reference/{i}\n"
+        for i in range(40)
+    )
+    config = get_config()
+    with get_session_context() as db:
+        user_id = _create_bench_user(db, db_models)
+        conversation = db_models.Conversation(user_id=user_id)
+        db.add(conversation)
+        db.flush()
+        db.execute(db_models.Message.__table__.insert(), [
+            {"conversation_id": conversation.conversation_id, "sender_type": "AGENT",
+             "agent_type": "marketing", "content": f"{answer}\n({i})"}
+            for i in range(500)
+        ])
+        db.commit()
+        conversation_id = conversation.conversation_id
+        expected = get_conversation_history(db, conversation_id)
+
+        def measure():
+            history_ms = _timeit(lambda: get_conversation_history(db, conversation_id), repeat)
+            page_ms = _timeit(lambda: get_messages_page(db, conversation_id, 50), repeat)
+            return history_ms, page_ms
+
+        plain = measure()
+        original_codec = config.COLUMN_COMPRESSION_CODEC
+        for codec in ("zlib", "zstd"):
+            config.COLUMN_COMPRESSION_CODEC = codec
+            stats = backfill("message", dry_run=True)
+            logger.info(
+                f"{codec:>5}: {stats['bytes_before']:,} → {stats['bytes_after']:,} bytes "
+                f"({stats['bytes_before'] / max(stats['bytes_after'], 1):.2f}x)"
+            )
+        config.COLUMN_COMPRESSION_CODEC = original_codec
+
+        backfill("message")
+        db.expire_all()
+        assert get_conversation_history(db, conversation_id) == expected
+        compressed = measure()
+
+        logger.info(f"{'':>10} | {'history(ms)':>11} | {'page50(ms)':>10}")
+        logger.info(f"{'plain':>10} | {plain[0]:>11.2f} | {plain[1]:>10.2f}")
+        logger.info(f"{'compressed':>10} | {compressed[0]:>11.2f} | {compressed[1]:>10.2f}")
+
+
+BENCHMARKS = {
+    "history": bench_message_history,
+    "create_conversation": bench_create_conversation,
+    "bulk": bench_bulk_queries,
+    "compression": bench_compression,
+}
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="데이터베이스 쿼리 벤치마크")
+    parser.add_argument("--url", help="벤치마크 DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("benchmarks", nargs="*", help=f"실행할 벤치마크 ({', '.join(BENCHMARKS)}, 기본: 전체)")
+    args = parser.parse_args()
+
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"알 수 없는 벤치마크: {', '.join(sorted(unknown))}")
+
+    url = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'benchmark.db')}"
+    _prepare_environment(url)
+
+    from shared_modules.database import Base, get_db_manager
+    Base.metadata.create_all(get_db_manager().engine)
+
+    logger.info(f"=== 데이터베이스 벤치마크 ({url.split('@')[-1]}) ===")
+    for name in args.benchmarks or BENCHMARKS:
+        logger.info(f"--- {name} ---")
+        BENCHMARKS[name](repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+HTTP 클라이언트 벤치마크
+로컬 웹훅 대역 서버를 띄워 기존 방식(요청마다 ClientSession 생성)과 공유 세션 HttpClient 의
+알림 fan-out 지연(요청 묶음 하나를 동시에 보내고 모두 끝날 때까지의 시간)을 비교한다.
+
+대역 서버는 새 연결의 첫 요청만 --handshake-ms 만큼(DNS + TCP + TLS 왕복) 추가로 지연하고,
+모든 요청을 --request-ms 만큼 지연해 실제 웹훅 엔드포인트와 비슷한 비용을 흉내 낸다.
+
+    python init/benchmark_http.py --rounds 30 --fanout 20 --handshake-ms 40 --request-ms 10
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import logging
+import statistics
+import multiprocessing
+
+import aiohttp
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+# -------------------
+# 웹훅 대역 서버
+# -------------------
+def _run_server(port_queue, handshake_ms: int, request_ms: int, connections):
+    from aiohttp import web
+
+    seen = set()  # 연결별 프로토콜 객체 (id 재사용으로 새 연결을 놓치지 않도록 참조 유지)
+
+    async def webhook(request):
+        if request.protocol not in seen:
+            seen.add(request.protocol)
+            connections.value += 1
+            await asyncio.sleep(handshake_ms / 1000)
+        await request.read()
+        await asyncio.sleep(request_ms / 1000)
+        return web.json_response({"ok": True})
+
+    async def main():
+        app = web.Application()
+        app.router.add_post("/hook/{channel}", webhook)
+        runner = web.AppRunner(app, keepalive_timeout=75, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port_queue.put(site._server.sockets[0].getsockname()[1])
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+# -------------------
+# 발송 방식
+# -------------------
+async def _legacy_post(url: str, payload: dict) -> dict:
+    """변경 전 HttpClient.post 와 같은 방식: 요청마다 ClientSession 생성"""
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+        async with session.post(url, json=payload) as response:
+            return {"success": response.status == 200, "data": await response.json()}
+
+
+async def _run_rounds(send, base_url: str, rounds: int, fanout: int) -> list:
+    """fanout 개 채널로 동시에 보내는 알림을 rounds 번 반복하고 회차별 지연(ms) 반환"""
+    latencies = []
+    for round_index in range(rounds):
+        start = time.perf_counter()
+        results = await asyncio.gather(*[
+            send(f"{base_url}/hook/{channel}", {"text": f"round {round_index}"}) for channel in range(fanout)
+        ])
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert all(result["success"] for result in results), "요청 실패"
+    return latencies
+
+
+async def run_legacy(base_url: str, rounds: int, fanout: int) -> list:
+    return await _run_rounds(_legacy_post, base_url, rounds, fanout)
+
+
+async def run_shared(base_url: str, rounds: int, fanout: int) -> tuple:
+    from automation_task.common.http_client import HttpClient
+
+    client = HttpClient()
+
+    async def send(url: str, payload: dict) -> dict:
+        return await client.post(url, json_data=payload)
+
+    latencies = await _run_rounds(send, base_url, rounds, fanout)
+    stats = client.get_stats()
+    await client.close()
+    return latencies, stats
+
+
+def _summary(latencies: list) -> str:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50 {statistics.median(ordered):>7.1f}ms, p95 {p95:>7.1f}ms"
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="HTTP 클라이언트 벤치마크")
+    parser.add_argument("--rounds", type=int, default=30)
+    parser.add_argument("--fanout", type=int, default=20, help="회차당 동시 요청 수")
+    parser.add_argument("--handshake-ms", type=int, default=40, help="새 연결 지연 (DNS + TCP + TLS)")
+    parser.add_argument("--request-ms", type=int, default=10, help="요청당 서버 처리 지연")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    port_queue = context.Queue()
+    connections = context.Value("i", 0)
+    server = context.Process(
+        target=_run_server, args=(port_queue, args.handshake_ms, args.request_ms, connections), daemon=True
+    )
+    server.start()
+    base_url = f"http://127.0.0.1:{port_queue.get(timeout=30)}"
+
+    sys.path.append(ROOT)
+    sys.path.append(os.path.join(ROOT, "task_agent"))
+
+    logger.info(f"=== HTTP fan-out 벤치마크 ({args.rounds}회 x 동시 {args.fanout}건, "
+                f"새 연결 {args.handshake_ms}ms, 요청당 {args.request_ms}ms) ===")
+
+    legacy = asyncio.run(run_legacy(base_url, args.rounds, args.fanout))
+    legacy_connections = connections.value
+    logger.info(f"기존 (요청마다 세션)  : {_summary(legacy)}, 새 연결 {legacy_connections}")
+
+    shared, stats = asyncio.run(run_shared(base_url, args.rounds, args.fanout))
+    logger.info(f"공유 세션            : {_summary(shared)}, 새 연결 {connections.value - legacy_connections} "
+                f"(p50 {statistics.median(legacy) / statistics.median(shared):.1f}x)")
+    logger.info(f"HttpClient 통계: {stats['hosts']}")
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
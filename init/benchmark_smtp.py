@@ -0,0 +1,194 @@
+"""
+SMTP 발송 벤치마크
+로컬 SMTP 대역 서버를 띄워 기존 방식(메시지마다 연결/로그인, 이벤트 루프에서 블로킹 전송)과
+EmailManager 연결 풀 방식의 처리량(messages/s)을 비교한다.
+
+대역 서버는 연결마다 --handshake-ms 만큼(STARTTLS + 로그인 왕복), 메시지마다 --message-ms 만큼
+지연해 실제 메일 서버와 비슷한 비용을 흉내 내며, --drop-every 로 주기적인 연결 끊김(421)을 재현한다.
+
+    python init/benchmark_smtp.py --messages 200 --handshake-ms 30 --message-ms 5
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import logging
+import smtplib
+import multiprocessing
+from email.mime.text import MIMEText
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+# -------------------
+# SMTP 대역 서버
+# -------------------
+async def _handle_client(reader, writer, handshake_ms: int, message_ms: int, drop_every: int, received):
+    async def reply(line: str):
+        writer.write(f"{line}\r\n".encode())
+        await writer.drain()
+
+    await asyncio.sleep(handshake_ms / 1000)
+    await reply("220 bench ESMTP")
+    messages = 0
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            command = line.decode(errors="replace").strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                await reply("250-bench\r\n250-PIPELINING\r\n250 AUTH PLAIN LOGIN")
+            elif command.startswith("AUTH"):
+                await reply("235 2.7.0 Authentication successful")
+            elif command.startswith("DATA"):
+                await reply("354 End data with <CR><LF>.<CR><LF>")
+                while (await reader.readline()) not in (b".\r\n", b""):
+                    pass
+                await asyncio.sleep(message_ms / 1000)
+                messages += 1
+                received.value += 1
+                await reply("250 2.0.0 queued")
+                if drop_every and messages % drop_every == 0:
+                    await reply("421 4.7.0 too many messages, closing")
+                    break
+            elif command.startswith("QUIT"):
+                await reply("221 bye")
+                break
+            else:  # MAIL / RCPT / RSET / NOOP
+                await reply("250 OK")
+    finally:
+        writer.close()
+
+
+def _run_server(port_queue, handshake_ms: int, message_ms: int, drop_every: int, received):
+    async def main():
+        server = await asyncio.start_server(
+            lambda r, w: _handle_client(r, w, handshake_ms, message_ms, drop_every, received), "127.0.0.1", 0
+        )
+        port_queue.put(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
+
+
+# -------------------
+# 발송 방식
+# -------------------
+def _build_message(index: int) -> MIMEText:
+    message = MIMEText(f"benchmark body {index}\n" * 20, "plain", "utf-8")
+    message["From"] = "bench@example.com"
+    message["To"] = f"user{index}@example.com"
+    message["Subject"] = f"benchmark {index}"
+    return message
+
+
+async def _legacy_send(port: int, index: int):
+    """변경 전 send_via_smtp 와 같은 방식: 메시지마다 연결/로그인, async 함수 안에서 블로킹 전송"""
+    with smtplib.SMTP("127.0.0.1", port) as server:
+        server.login("bench", "bench")
+        server.send_message(_build_message(index), to_addrs=[f"user{index}@example.com"])
+
+
+async def run_legacy(port: int, count: int) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*[_legacy_send(port, i) for i in range(count)])
+    return count / (time.perf_counter() - start)
+
+
+async def run_pooled(port: int, count: int, pool_size: int) -> tuple:
+    """EmailManager.send_via_smtp 동시 호출 (연결 풀)"""
+    from automation_task.common.email_manager import EmailManager
+
+    manager = EmailManager()
+    manager.smtp_pool.max_connections = pool_size
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        manager.send_via_smtp([f"user{i}@example.com"], f"benchmark {i}", f"benchmark body {i}\n" * 20)
+        for i in range(count)
+    ])
+    throughput = count / (time.perf_counter() - start)
+    failures = sum(1 for result in results if not result["success"])
+    stats = manager.smtp_pool.get_stats()
+    await manager.close()
+    return throughput, failures, stats
+
+
+async def run_batched(port: int, count: int, pool_size: int, batch_size: int) -> tuple:
+    """SMTPConnectionPool.send_many 로 batch_size 개씩 한 연결에서 연속 전송"""
+    from automation_task.common.email_manager import EmailManager
+
+    manager = EmailManager()
+    manager.smtp_pool.max_connections = pool_size
+    server = manager.get_smtp_server()
+    messages = [(_build_message(i), [f"user{i}@example.com"]) for i in range(count)]
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        manager.smtp_pool.send_many(server, messages[offset:offset + batch_size])
+        for offset in range(0, count, batch_size)
+    ])
+    throughput = count / (time.perf_counter() - start)
+    failures = sum(1 for errors in results for error in errors if error)
+    stats = manager.smtp_pool.get_stats()
+    await manager.close()
+    return throughput, failures, stats
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="SMTP 발송 벤치마크")
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--pool-size", type=int, default=4, help="서버별 최대 연결 수")
+    parser.add_argument("--batch-size", type=int, default=25, help="send_many 배치 크기")
+    parser.add_argument("--handshake-ms", type=int, default=30, help="연결당 지연 (STARTTLS + 로그인)")
+    parser.add_argument("--message-ms", type=int, default=5, help="메시지당 서버 처리 지연")
+    parser.add_argument("--drop-every", type=int, default=50, help="연결당 N 개 전송 후 421 로 끊음 (0: 끊지 않음)")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    port_queue = context.Queue()
+    received = context.Value("i", 0)
+    server = context.Process(
+        target=_run_server,
+        args=(port_queue, args.handshake_ms, args.message_ms, args.drop_every, received),
+        daemon=True
+    )
+    server.start()
+    port = port_queue.get(timeout=30)
+
+    os.environ.update({
+        "SMTP_HOST": "127.0.0.1", "SMTP_PORT": str(port),
+        "SMTP_USER": "bench", "SMTP_PASSWORD": "bench", "SMTP_USE_TLS": "false"
+    })
+    sys.path.append(ROOT)
+    sys.path.append(os.path.join(ROOT, "task_agent"))
+    logging.getLogger("automation_task").setLevel(logging.WARNING)
+
+    logger.info(f"=== SMTP 발송 벤치마크 (메시지 {args.messages}개, 연결당 {args.handshake_ms}ms, "
+                f"메시지당 {args.message_ms}ms, {args.drop_every or '-'}개마다 연결 끊김) ===")
+
+    legacy = asyncio.run(run_legacy(port, args.messages))
+    logger.info(f"기존 (메시지마다 연결)       : {legacy:>8.1f} messages/s")
+
+    pooled, failures, stats = asyncio.run(run_pooled(port, args.messages, args.pool_size))
+    logger.info(f"연결 풀 (pool={args.pool_size})          : {pooled:>8.1f} messages/s "
+                f"({pooled / legacy:.1f}x, 실패 {failures}, 연결 {stats['connections_opened']}, "
+                f"재연결 {stats['reconnects']})")
+
+    batched, failures, stats = asyncio.run(run_batched(port, args.messages, args.pool_size, args.batch_size))
+    logger.info(f"연결 풀 + 배치 (batch={args.batch_size})  : {batched:>8.1f} messages/s "
+                f"({batched / legacy:.1f}x, 실패 {failures}, 연결 {stats['connections_opened']}, "
+                f"재연결 {stats['reconnects']})")
+
+    logger.info(f"대역 서버 수신: {received.value}개 (기대값 {args.messages * 3})")
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
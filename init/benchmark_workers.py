@@ -0,0 +1,141 @@
+"""
+자동화 워커 수평 확장 벤치마크
+워커 프로세스 수를 바꿔가며 같은 작업 묶음을 처리하고 처리량과 중복 실행 여부를 확인한다.
+작업 실행은 외부 API 호출을 흉내 낸 sleep 과 결과 상태 기록으로 대체한다.
+
+기본적으로 임시 SQLite 파일을 사용하며, --url 로 별도 MySQL 벤치마크 DB 를 지정할 수 있다.
+(MySQL 8 에서는 SELECT ... FOR UPDATE SKIP LOCKED 로 선점한다. 운영 DB 에 실행하지 말 것)
+
+    python init/benchmark_workers.py --workers 1 2 4 --tasks 400 --task-ms 200
+"""
+
+import os
+import sys
+import time
+import argparse
+import logging
+import tempfile
+import multiprocessing
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def _prepare_environment(url: str):
+    """shared_modules import 전에 벤치마크 DB URL 지정"""
+    os.environ["MYSQL_URL"] = url
+    sys.path.append(ROOT)
+    sys.path.append(os.path.join(ROOT, "task_agent"))
+
+    from sqlalchemy import event
+    from shared_modules.database import get_db_manager
+
+    engine = get_db_manager().engine
+    if engine.dialect.name == "sqlite":
+        # 워커 프로세스 여러 개가 같은 파일에 쓰므로 잠금이 풀릴 때까지 기다린다
+        @event.listens_for(engine, "connect")
+        def _busy_timeout(dbapi_connection, _):
+            dbapi_connection.execute("PRAGMA busy_timeout = 30000")
+
+
+def _worker_process(url: str, worker_id: str, concurrency: int, task_ms: int, executed, ready):
+    _prepare_environment(url)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    import asyncio
+    from worker import AutomationWorker
+    from automation_task.common.db_helper import get_automation_db_helper
+
+    db_helper = get_automation_db_helper()
+
+    async def execute(task_id: int):
+        await asyncio.sleep(task_ms / 1000)
+        await db_helper.update_automation_task_status(task_id, "success")
+        executed.put(task_id)
+
+    worker = AutomationWorker(execute, worker_id=worker_id, concurrency=concurrency, poll_interval=0.05)
+    ready.wait()  # import/초기화 시간은 측정에서 제외
+    asyncio.run(worker.run(drain=True))
+
+
+def _seed_tasks(count: int):
+    from shared_modules import db_models
+    from shared_modules.database import get_session_context
+
+    with get_session_context() as db:
+        db.execute(db_models.AutomationTask.__table__.delete())
+        user = db.query(db_models.User).first()
+        if user is None:
+            user = db_models.User(
+                email="bench@example.com", nickname="bench", provider="bench",
+                social_id="bench", admin=False, experience=False, access_token="bench"
+            )
+            db.add(user)
+            db.flush()
+        db.execute(db_models.AutomationTask.__table__.insert(), [
+            {"user_id": user.user_id, "task_type": "send_reminder", "title": f"bench {i}", "status": "pending"}
+            for i in range(count)
+        ])
+        db.commit()
+
+
+def run_round(url: str, workers: int, tasks: int, concurrency: int, task_ms: int) -> float:
+    """워커 workers 개로 tasks 개를 처리하고 처리량(tasks/s) 반환"""
+    _seed_tasks(tasks)
+    context = multiprocessing.get_context("spawn")
+    executed = context.Queue()
+    ready = context.Barrier(workers + 1)
+    processes = [
+        context.Process(target=_worker_process, args=(url, f"bench-{workers}-{i}", concurrency, task_ms, executed, ready))
+        for i in range(workers)
+    ]
+
+    for process in processes:
+        process.start()
+    ready.wait()
+    start = time.perf_counter()
+    task_ids = [executed.get(timeout=300) for _ in range(tasks)]
+    elapsed = time.perf_counter() - start
+    for process in processes:
+        process.join()
+
+    duplicates = len(task_ids) - len(set(task_ids))
+    assert duplicates == 0, f"중복 실행 {duplicates}건"
+    assert executed.empty(), "작업 수보다 많이 실행됨"
+    return tasks / elapsed
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="자동화 워커 수평 확장 벤치마크")
+    parser.add_argument("--url", help="벤치마크 DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--tasks", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=4, help="워커당 동시 실행 수")
+    parser.add_argument("--task-ms", type=int, default=200, help="작업 1건 실행 시간 (ms)")
+    args = parser.parse_args()
+
+    url = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'benchmark_workers.db')}"
+    _prepare_environment(url)
+
+    from shared_modules.database import Base, get_db_manager
+    from shared_modules.migrations import upgrade
+    Base.metadata.create_all(get_db_manager().engine)
+    upgrade()
+
+    logger.info(f"=== 자동화 워커 벤치마크 ({url.split('@')[-1]}) ===")
+    logger.info(f"작업 {args.tasks}개, 작업당 {args.task_ms}ms, 워커당 동시 실행 {args.concurrency}")
+    baseline = None
+    for workers in args.workers:
+        throughput = run_round(url, workers, args.tasks, args.concurrency, args.task_ms)
+        baseline = baseline or throughput / workers
+        logger.info(
+            f"workers={workers:>2}: {throughput:>7.1f} tasks/s "
+            f"(워커 1개 대비 {throughput / baseline:.2f}x, 이상적 {workers}x), 중복 실행 0건"
+        )
+
+
+if __name__ == "__main__":
+    main()
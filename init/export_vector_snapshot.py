@@ -0,0 +1,60 @@
+import os
+import sys
+import time
+import logging
+
+from chromadb import PersistentClient
+
+from config import settings
+
+# 공통 모듈 경로 추가 (읽기 전용 벡터 스냅샷)
+sys.path.append(os.path.join(os.path.dirname(__file__), "../shared_modules"))
+from vector_snapshot import VectorSnapshot, export_snapshot, evaluate_snapshot_recall
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = os.getenv("VECTOR_SNAPSHOT_DIR", os.path.join(os.path.dirname(__file__), "vector_snapshot"))
+SNAPSHOT_DTYPE = os.getenv("VECTOR_SNAPSHOT_DTYPE", "int8")
+
+
+def export_collection(client, collection_name: str):
+    """컬렉션 하나를 스냅샷으로 내보내고 recall / 로드 시간 측정"""
+    collection = client.get_collection(collection_name)
+    if collection.count() == 0:
+        logger.info(f"빈 컬렉션 건너뜀: {collection_name}")
+        return
+
+    output_dir = os.path.join(SNAPSHOT_DIR, collection_name)
+    manifest = export_snapshot(
+        collection, output_dir, dtype=SNAPSHOT_DTYPE,
+        persist_directory=os.path.abspath(settings.VECTOR_DB_PATH)
+    )
+
+    start = time.perf_counter()
+    snapshot = VectorSnapshot.open(output_dir)
+    open_ms = (time.perf_counter() - start) * 1000
+
+    recall = evaluate_snapshot_recall(collection, snapshot)
+    size_mb = os.path.getsize(os.path.join(output_dir, "vectors.npy")) / (1024 * 1024)
+    snapshot.close()
+
+    logger.info(
+        f"  - {collection_name}: {manifest['count']}개, {manifest['dtype']} 벡터 {size_mb:.1f}MB, "
+        f"로드 {open_ms:.1f}ms, float32 대비 recall@5={recall:.3f}"
+    )
+
+
+def main():
+    """메인 실행 함수"""
+    logger.info("=== 읽기 전용 벡터 스냅샷 내보내기 ===")
+
+    client = PersistentClient(path=os.path.abspath(settings.VECTOR_DB_PATH))
+    for collection in client.list_collections():
+        export_collection(client, collection.name)
+
+    logger.info(f"완료 (에이전트에서 사용하려면 VECTOR_SNAPSHOT_DIR={SNAPSHOT_DIR} 설정)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import os
+import sys
 import logging
 import uuid
 import unicodedata
@@ -13,6 +14,10 @@ from chromadb import PersistentClient
 
 from config import settings
 
+# 공통 모듈 경로 추가 (메타데이터 정규화 / 사전 필터 인덱스)
+sys.path.append(os.path.join(os.path.dirname(__file__), "../shared_modules"))
+from metadata_index import MetadataIndex, normalize_metadata, get_index_path, bump_collection_version
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
@@ -36,6 +41,11 @@ class VectorDBManager:
         )
         
         self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        
+        # persona / category / topic 사전 필터 인덱스
+        self.index_path = get_index_path(self.persist_directory, "global-documents")
+        self.metadata_index = MetadataIndex.load(self.index_path) or \
+            MetadataIndex.build_from_collection(self.vectorstore._collection)
 
         # 문서 타입 매핑
         self.doc_type_mapping = {
@@ -143,6 +153,14 @@ class VectorDBManager:
             try:
                 client = PersistentClient(path=settings.VECTOR_DB_PATH)
                 client.delete_collection("global-documents")
+                self.vectorstore = Chroma(
+                    collection_name="global-documents",
+                    embedding_function=self.embedding_function,
+                    persist_directory=self.persist_directory
+                )
+                self.metadata_index = MetadataIndex()
+                self.metadata_index.save(self.index_path)
+                bump_collection_version(self.persist_directory, "global-documents")
                 logger.info("기존 컬렉션을 삭제했습니다.")
             except Exception as e:
                 logger.error(f"컬렉션 삭제 오류: {e}")
@@ -207,19 +225,21 @@ class VectorDBManager:
                 # 메타데이터 생성
                 metadatas = []
                 for i, split in enumerate(splits):
-                    metadata = {
+                    metadata = normalize_metadata({
                         "doc_id": doc_id,
                         "chunk_id": str(uuid.uuid4()),
                         "persona": mapping["persona"],
                         "category": mapping["category"],
                         "topic": mapping["topic"],
-                        "source": ", ".join(mapping["source"]) if isinstance(mapping["source"], list) else mapping["source"],
+                        "source": mapping["source"],
                         "last_updated": datetime.now().isoformat()
-                    }
+                    })
                     metadatas.append(metadata)
                 
                 # 배치 처리
                 self.add_texts_in_batches(texts, metadatas)
+                self.metadata_index.save(self.index_path)
+                bump_collection_version(self.persist_directory, "global-documents")
                 
                 logger.info(f"{doc_name} 인덱싱 완료 ({len(texts)} 청크)")
                 processed_count += 1
@@ -253,12 +273,14 @@ class VectorDBManager:
                 for sub_texts, sub_metas in sub_batches:
                     if sub_texts:
                         try:
-                            self.vectorstore.add_texts(texts=sub_texts, metadatas=sub_metas)
+                            ids = self.vectorstore.add_texts(texts=sub_texts, metadatas=sub_metas)
+                            self.metadata_index.add(ids, sub_metas)
                         except Exception as e:
                             logger.error(f"서브 배치 처리 오류: {e}")
             else:
                 try:
-                    self.vectorstore.add_texts(texts=batch_texts, metadatas=batch_metadatas)
+                    ids = self.vectorstore.add_texts(texts=batch_texts, metadatas=batch_metadatas)
+                    self.metadata_index.add(ids, batch_metadatas)
                 except Exception as e:
                     logger.error(f"배치 처리 오류: {e}")
 
@@ -0,0 +1,150 @@
+import os
+import sys
+import time
+import random
+import logging
+
+from chromadb import PersistentClient
+
+from config import settings
+
+# 공통 모듈 경로 추가 (메타데이터 정규화 / 사전 필터 인덱스)
+sys.path.append(os.path.join(os.path.dirname(__file__), "../shared_modules"))
+from metadata_index import MetadataIndex, normalize_metadata, get_index_path, bump_collection_version
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+BASE_COLLECTION = "global-documents"
+SHARD_CATEGORIES = ("business_planning", "customer_management", "marketing", "mental_health")
+
+
+def get_shard_collection_name(category: str) -> str:
+    return f"{BASE_COLLECTION}-{category}"
+
+
+class VectorShardManager:
+    """global-documents 컬렉션을 category 기준 샤드 컬렉션으로 분할"""
+
+    def __init__(self, batch_size: int = 500):
+        self.persist_directory = os.path.abspath(settings.VECTOR_DB_PATH)
+        self.client = PersistentClient(path=self.persist_directory)
+        self.batch_size = batch_size
+
+    def build_shards(self):
+        """기존 임베딩을 그대로 복사하여 샤드 생성 (재임베딩 없음)"""
+        source = self.client.get_collection(BASE_COLLECTION)
+        total = source.count()
+        logger.info(f"{BASE_COLLECTION}: {total}개 청크 분할 시작")
+
+        space = (source.metadata or {}).get("hnsw:space", "l2")
+        shards = {}
+        indexes = {}
+        for category in SHARD_CATEGORIES:
+            name = get_shard_collection_name(category)
+            try:
+                self.client.delete_collection(name)
+            except Exception:
+                pass
+            shards[category] = self.client.create_collection(name, metadata={"hnsw:space": space})
+            indexes[category] = MetadataIndex()
+
+        skipped = 0
+        for offset in range(0, total, self.batch_size):
+            batch = source.get(
+                include=["embeddings", "documents", "metadatas"],
+                limit=self.batch_size,
+                offset=offset
+            )
+
+            grouped = {}
+            for i, chunk_id in enumerate(batch["ids"]):
+                metadata = normalize_metadata(batch["metadatas"][i] or {})
+                category = metadata.get("category")
+                if category not in shards:
+                    skipped += 1
+                    continue
+                group = grouped.setdefault(category, {"ids": [], "embeddings": [], "documents": [], "metadatas": []})
+                group["ids"].append(chunk_id)
+                group["embeddings"].append(batch["embeddings"][i])
+                group["documents"].append(batch["documents"][i])
+                group["metadatas"].append(metadata)
+
+            for category, group in grouped.items():
+                shards[category].add(**group)
+                indexes[category].add(group["ids"], group["metadatas"])
+
+        for category, shard in shards.items():
+            indexes[category].save(get_index_path(self.persist_directory, shard.name))
+            bump_collection_version(self.persist_directory, shard.name)
+            logger.info(f"  - {shard.name}: {shard.count()}개 청크")
+
+        if skipped:
+            logger.warning(f"샤드 카테고리에 속하지 않아 건너뛴 청크: {skipped}개")
+
+    def compare_with_monolith(self, samples_per_shard: int = 20, k: int = 5):
+        """
+        샤드 검색과 단일 컬렉션 + category 필터 검색의 recall@k / 지연 시간 비교
+
+        저장된 청크 임베딩을 질의로 사용하므로 임베딩 API 호출이 필요 없다.
+        """
+        monolith = self.client.get_collection(BASE_COLLECTION)
+        report = {}
+
+        for category in SHARD_CATEGORIES:
+            try:
+                shard = self.client.get_collection(get_shard_collection_name(category))
+            except Exception:
+                continue
+
+            count = shard.count()
+            if count == 0:
+                continue
+
+            sample = shard.get(include=["embeddings"], limit=count)
+            picks = random.sample(range(count), min(samples_per_shard, count))
+            queries = [sample["embeddings"][i] for i in picks]
+            n_results = min(k, count)
+
+            start = time.perf_counter()
+            expected = monolith.query(
+                query_embeddings=queries, n_results=n_results, where={"category": category}
+            )["ids"]
+            monolith_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+            start = time.perf_counter()
+            actual = shard.query(query_embeddings=queries, n_results=n_results)["ids"]
+            shard_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+            hits = sum(len(set(a) & set(e)) for a, e in zip(actual, expected))
+            total = sum(len(e) for e in expected) or 1
+
+            report[category] = {
+                "chunks": count,
+                "recall_at_k": round(hits / total, 4),
+                "monolith_ms_per_query": round(monolith_ms, 2),
+                "shard_ms_per_query": round(shard_ms, 2)
+            }
+            logger.info(
+                f"  - {category}: recall@{k}={hits / total:.3f}, "
+                f"단일 {monolith_ms:.2f}ms → 샤드 {shard_ms:.2f}ms"
+            )
+
+        return report
+
+
+def main():
+    """메인 실행 함수"""
+    logger.info("=== 벡터 데이터베이스 카테고리 샤딩 ===")
+
+    manager = VectorShardManager()
+    manager.build_shards()
+
+    logger.info("단일 컬렉션 대비 recall / 지연 시간 비교")
+    manager.compare_with_monolith()
+
+    logger.info("완료 (에이전트에서 사용하려면 VECTOR_SHARDING=true 설정)")
+
+
+if __name__ == "__main__":
+    main()
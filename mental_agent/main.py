@@ -33,6 +33,7 @@ from shared_modules import (
     get_current_timestamp,
     save_or_update_phq9_result,
     get_latest_phq9_by_user,
+    get_user_cache,
     create_mental_response  # 표준 응답 생성 함수 추가
 )
 
@@ -533,6 +534,7 @@ def health_check():
                 "connected": db_status,
                 "engine_info": db_manager.get_engine_info()
             },
+            "user_cache": get_user_cache().get_stats(),
             "mental_graph_available": mental_health_service.mental_graph is not None
         }
         
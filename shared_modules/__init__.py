@@ -8,6 +8,7 @@ from .database import *
 from .db_models import *
 from .llm_utils import *
 from .vector_utils import *
+from .user_cache import *
 from .queries import *
 from .logging_utils import *  # 추가
 from .utils import *          # 추가
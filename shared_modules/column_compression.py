@@ -0,0 +1,229 @@
+"""
+대용량 텍스트/JSON 컬럼 투명 압축
+긴 LLM 응답(message.content)과 결과가 누적되는 작업 데이터(automation_task.task_data)를
+임계값 이상일 때만 압축해 저장하고, 읽을 때는 항상 자동으로 해제한다.
+
+압축 값은 스키마 변경 없이 기존 TEXT / JSON 컬럼에 들어가도록 문자열로 인코딩된다.
+    TEXT: "\\x1f" + 코덱 문자 + ":" + base64(압축 바이트)
+    JSON: {"$compressed": <TEXT 와 같은 형식>}
+
+COLUMN_COMPRESSION_ENABLED 를 꺼도 이미 압축된 행은 그대로 읽히며,
+기존 행은 backfill 로 압축한다.
+
+    python -m shared_modules.column_compression backfill [--target message] [--batch-size 500] [--dry-run]
+"""
+
+import sys
+import json
+import zlib
+import base64
+import argparse
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Text, JSON, bindparam, select, type_coerce, update
+from sqlalchemy.types import TypeDecorator
+
+from shared_modules.env_config import get_config
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+COMPRESSED_PREFIX = "\x1f"
+_JSON_KEY = "$compressed"
+_CODEC_TAGS = {"zlib": "z", "zstd": "s"}
+
+
+def _resolve_codec(codec: str) -> str:
+    if codec == "zstd" and not ZSTD_AVAILABLE:
+        return "zlib"
+    if codec not in _CODEC_TAGS:
+        raise ValueError(f"지원하지 않는 압축 코덱: {codec} (zlib | zstd)")
+    return codec
+
+
+def is_compressed(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith(COMPRESSED_PREFIX)
+
+
+def compress_text(value: str, codec: str = "zstd") -> str:
+    """문자열을 압축 후 TEXT 컬럼에 저장 가능한 형식으로 인코딩"""
+    codec = _resolve_codec(codec)
+    raw = value.encode("utf-8")
+    if codec == "zstd":
+        packed = zstandard.ZstdCompressor(level=3).compress(raw)
+    else:
+        packed = zlib.compress(raw, 6)
+    return f"{COMPRESSED_PREFIX}{_CODEC_TAGS[codec]}:{base64.b64encode(packed).decode('ascii')}"
+
+
+def decompress_text(value: str) -> str:
+    """compress_text 결과를 원문으로 복원 (압축 형식이 아니면 그대로 반환)"""
+    if not is_compressed(value):
+        return value
+
+    tag, payload = value[1], base64.b64decode(value[3:])
+    if tag == _CODEC_TAGS["zstd"]:
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstd 로 압축된 값을 읽으려면 zstandard 패키지가 필요합니다")
+        return zstandard.ZstdDecompressor().decompress(payload).decode("utf-8")
+    return zlib.decompress(payload).decode("utf-8")
+
+
+def _text_size(value: str) -> int:
+    return len(value.encode("utf-8"))
+
+
+class CompressedText(TypeDecorator):
+    """임계값 이상인 문자열을 압축해 저장하는 TEXT 타입"""
+
+    impl = Text
+    cache_ok = True
+
+    def compress_value(self, value: Optional[str]) -> Optional[str]:
+        """설정과 무관하게 압축 (임계값 미만이거나 이득이 없으면 원문 반환)"""
+        if value is None or is_compressed(value):
+            return value
+        config = get_config()
+        if _text_size(value) < config.COLUMN_COMPRESSION_MIN_BYTES:
+            return value
+        encoded = compress_text(value, config.COLUMN_COMPRESSION_CODEC)
+        return encoded if len(encoded) < _text_size(value) else value
+
+    def process_bind_param(self, value, dialect):
+        if not get_config().COLUMN_COMPRESSION_ENABLED:
+            return value
+        return self.compress_value(value)
+
+    def process_result_value(self, value, dialect):
+        return decompress_text(value) if value is not None else None
+
+
+class CompressedJSON(TypeDecorator):
+    """직렬화 크기가 임계값 이상인 JSON 값을 {"$compressed": ...} 로 저장하는 JSON 타입"""
+
+    impl = JSON
+    cache_ok = True
+
+    def compress_value(self, value: Any) -> Any:
+        """설정과 무관하게 압축 (임계값 미만이거나 이득이 없으면 원래 값 반환)"""
+        if value is None or self._is_compressed_json(value):
+            return value
+        config = get_config()
+        raw = json.dumps(value, ensure_ascii=False)
+        if _text_size(raw) < config.COLUMN_COMPRESSION_MIN_BYTES:
+            return value
+        encoded = compress_text(raw, config.COLUMN_COMPRESSION_CODEC)
+        return {_JSON_KEY: encoded} if len(encoded) < _text_size(raw) else value
+
+    @staticmethod
+    def _is_compressed_json(value: Any) -> bool:
+        return isinstance(value, dict) and len(value) == 1 and is_compressed(value.get(_JSON_KEY))
+
+    def process_bind_param(self, value, dialect):
+        if not get_config().COLUMN_COMPRESSION_ENABLED:
+            return value
+        return self.compress_value(value)
+
+    def process_result_value(self, value, dialect):
+        if self._is_compressed_json(value):
+            return json.loads(decompress_text(value[_JSON_KEY]))
+        return value
+
+
+# -------------------
+# 기존 행 압축 (backfill)
+# -------------------
+def _backfill_targets() -> Dict[str, tuple]:
+    import shared_modules.db_models as db_models
+    return {
+        "message": (db_models.Message.__table__, "message_id", "content"),
+        "message_archive": (db_models.MessageArchive.__table__, "message_id", "content"),
+        "automation_task": (db_models.AutomationTask.__table__, "task_id", "task_data"),
+    }
+
+
+def _stored_size(value: Any) -> int:
+    return _text_size(value if isinstance(value, str) else json.dumps(value, ensure_ascii=False))
+
+
+def backfill(target: str, batch_size: int = 500, dry_run: bool = False, engine=None) -> Dict[str, Any]:
+    """
+    기존 행을 pk 순서로 batch_size 개씩 읽어 임계값 이상인 값을 압축
+
+    Returns:
+        Dict: scanned, compressed, bytes_before, bytes_after, bytes_saved (압축한 행 기준)
+    """
+    from shared_modules.database import get_db_manager
+
+    table, pk_name, column_name = _backfill_targets()[target]
+    engine = engine or get_db_manager().engine
+    column = table.c[column_name]
+    pk = table.c[pk_name]
+    raw_column = type_coerce(column, column.type.impl)
+
+    statement = update(table).where(pk == bindparam("_pk")).values(
+        {column_name: type_coerce(bindparam("_value"), column.type.impl)}
+    )
+
+    stats = {"target": target, "scanned": 0, "compressed": 0, "bytes_before": 0, "bytes_after": 0}
+    last_id = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select(pk, raw_column.label("value"))
+                .where(pk > last_id, column.isnot(None))
+                .order_by(pk)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+
+            changes = []
+            for row in rows:
+                encoded = column.type.compress_value(row.value)
+                if encoded is not row.value:
+                    changes.append({"_pk": row[0], "_value": encoded})
+                    stats["bytes_before"] += _stored_size(row.value)
+                    stats["bytes_after"] += _stored_size(encoded)
+
+            if changes and not dry_run:
+                conn.execute(statement, changes)
+
+        last_id = rows[-1][0]
+        stats["scanned"] += len(rows)
+        stats["compressed"] += len(changes)
+
+    stats["bytes_saved"] = stats["bytes_before"] - stats["bytes_after"]
+    logger.info(
+        f"{target} backfill{' (dry-run)' if dry_run else ''}: {stats['compressed']}/{stats['scanned']}행 압축, "
+        f"{stats['bytes_before']:,} → {stats['bytes_after']:,} bytes (절감 {stats['bytes_saved']:,})"
+    )
+    return stats
+
+
+def main(argv: List[str] = None) -> int:
+    """CLI 진입점"""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(prog="python -m shared_modules.column_compression", description="컬럼 압축")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backfill_parser = subparsers.add_parser("backfill", help="기존 행 압축")
+    backfill_parser.add_argument("--target", choices=list(_backfill_targets()), action="append",
+                                 help="대상 테이블 (기본: 전체, 여러 번 지정 가능)")
+    backfill_parser.add_argument("--batch-size", type=int, default=500)
+    backfill_parser.add_argument("--dry-run", action="store_true", help="변경 없이 절감량만 계산")
+
+    args = parser.parse_args(argv)
+    for target in args.target or _backfill_targets():
+        backfill(target, args.batch_size, args.dry_run)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
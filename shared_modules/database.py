@@ -3,14 +3,19 @@
 각 에이전트에서 공통으로 사용하는 데이터베이스 연결 및 세션 관리
 """
 
+import time
 import logging
-from typing import Generator, Optional
+import threading
+from typing import Generator, Optional, Dict, Any, List
 from contextlib import contextmanager
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import (
+    SQLAlchemyError, DBAPIError, OperationalError, InterfaceError, TimeoutError as PoolTimeoutError
+)
+from sqlalchemy.pool import QueuePool
 
 from shared_modules.env_config import get_config
 
@@ -19,20 +24,188 @@ logger = logging.getLogger(__name__)
 # SQLAlchemy Base 클래스
 Base = declarative_base()
 
+
+class MeteredQueuePool(QueuePool):
+    """커넥션 체크아웃 대기 시간 / 풀 고갈(타임아웃)을 집계하는 QueuePool"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self.metrics = {
+            "checkouts": 0,
+            "timeouts": 0,
+            "wait_ms_total": 0.0,
+            "wait_ms_max": 0.0,
+            "peak_checked_out": 0
+        }
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            with self._metrics_lock:
+                self.metrics["timeouts"] += 1
+            logger.warning(f"커넥션 풀 고갈: {self.status()}")
+            raise
+
+        wait_ms = (time.perf_counter() - start) * 1000
+        with self._metrics_lock:
+            self.metrics["checkouts"] += 1
+            self.metrics["wait_ms_total"] += wait_ms
+            self.metrics["wait_ms_max"] = max(self.metrics["wait_ms_max"], wait_ms)
+            self.metrics["peak_checked_out"] = max(self.metrics["peak_checked_out"], self.checkedout())
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """풀 상태 및 체크아웃 대기 지표"""
+        with self._metrics_lock:
+            metrics = dict(self.metrics)
+        checkouts = metrics["checkouts"]
+        return {
+            "pool_size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": self.overflow(),
+            "checkouts": checkouts,
+            "timeouts": metrics["timeouts"],
+            "peak_checked_out": metrics["peak_checked_out"],
+            "wait_ms_avg": round(metrics["wait_ms_total"] / checkouts, 3) if checkouts else 0.0,
+            "wait_ms_max": round(metrics["wait_ms_max"], 3)
+        }
+
+
+# 프로세스 전역 엔진 레지스트리 (URL 당 엔진/커넥션 풀 하나)
+_engine_registry: Dict[str, Engine] = {}
+_engine_registry_lock = threading.Lock()
+
+
+def _build_engine(url: str, config) -> Engine:
+    engine_options = {
+        "echo": False,  # SQL 로그 출력 여부
+        "pool_pre_ping": True,  # 연결 확인
+        "pool_recycle": config.DB_POOL_RECYCLE,  # 연결 재사용 시간
+    }
+
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        # 메모리 SQLite 는 스레드별 단일 연결 풀을 그대로 사용
+        return create_engine(url, **engine_options)
+
+    return create_engine(
+        url,
+        poolclass=MeteredQueuePool,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,  # 최대 오버플로우 연결 수
+        pool_timeout=config.DB_POOL_TIMEOUT,  # 연결 타임아웃
+        **engine_options
+    )
+
+
+def get_engine(url: str = None, config=None) -> Optional[Engine]:
+    """
+    프로세스 전역 엔진 반환 (같은 URL 이면 같은 커넥션 풀을 공유)
+
+    Args:
+        url: DB URL (기본값: 설정의 MySQL URL)
+        config: 환경 설정 객체 (풀 크기 / 오버플로우 / 재사용 시간)
+    """
+    config = config if config else get_config()
+    url = url or config.get_mysql_url()
+    if not url:
+        return None
+
+    with _engine_registry_lock:
+        engine = _engine_registry.get(url)
+        if engine is None:
+            engine = _build_engine(url, config)
+            _engine_registry[url] = engine
+            logger.info(f"데이터베이스 엔진 생성: {engine.url.render_as_string(hide_password=True)}")
+        return engine
+
+
+def get_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """등록된 모든 엔진의 커넥션 풀 지표 (호스트/DB 별)"""
+    with _engine_registry_lock:
+        engines = list(_engine_registry.values())
+
+    stats = {}
+    for engine in engines:
+        key = engine.url.render_as_string(hide_password=True)
+        if isinstance(engine.pool, MeteredQueuePool):
+            stats[key] = engine.pool.get_metrics()
+        else:
+            stats[key] = {"pool": engine.pool.status()}
+    return stats
+
+
+def dispose_engines():
+    """등록된 엔진의 커넥션을 모두 반환 (fork 후 자식 프로세스 / 종료 시)"""
+    with _engine_registry_lock:
+        for engine in _engine_registry.values():
+            engine.dispose()
+        _engine_registry.clear()
+
+def measure_replica_lag(engine: Engine) -> Optional[float]:
+    """
+    복제본 지연(초) 측정
+
+    MySQL 은 SHOW REPLICA STATUS (구버전은 SHOW SLAVE STATUS) 의 Seconds_Behind_* 값을 사용한다.
+    복제 설정이 없는 단독 인스턴스/다른 DB 는 연결 가능하면 0 으로 본다.
+
+    Returns:
+        Optional[float]: 지연 초 (연결 불가 / 복제 중단이면 None)
+    """
+    try:
+        with engine.connect() as conn:
+            if engine.dialect.name != "mysql":
+                conn.execute(text("SELECT 1"))
+                return 0.0
+
+            for statement, column in (("SHOW REPLICA STATUS", "Seconds_Behind_Source"),
+                                      ("SHOW SLAVE STATUS", "Seconds_Behind_Master")):
+                try:
+                    row = conn.execute(text(statement)).mappings().first()
+                except DBAPIError:
+                    continue
+                if row is None:
+                    return 0.0
+                lag = row.get(column)
+                return float(lag) if lag is not None else None
+            return 0.0
+    except Exception as e:
+        logger.warning(f"복제본 상태 확인 실패 ({engine.url.render_as_string(hide_password=True)}): {e}")
+        return None
+
+
 class DatabaseManager:
     """데이터베이스 연결 관리 클래스"""
     
-    def __init__(self, config=None):
+    def __init__(self, config=None, replica_urls: List[str] = None):
         """
         데이터베이스 매니저 초기화
         
         Args:
             config: 환경 설정 객체 (기본값: 전역 설정 사용)
+            replica_urls: 읽기 전용 복제본 URL 목록 (기본값: MYSQL_REPLICA_URLS)
         """
         self.config = config if config else get_config()
         self.engine: Optional[Engine] = None
         self.SessionLocal: Optional[sessionmaker] = None
+        self.replica_engines: Dict[str, Engine] = {}
+        self._replica_state: Dict[str, Dict[str, Any]] = {}
+        self._replica_lock = threading.Lock()
+        self._replica_cursor = 0
+        self.read_stats = {"replica": 0, "primary_fallback": 0}
         self._initialize_engine()
+        self._initialize_replicas(
+            replica_urls if replica_urls is not None else self.config.get_replica_urls()
+        )
     
     def _initialize_engine(self):
         """SQLAlchemy 엔진 초기화"""
@@ -42,15 +215,8 @@ class DatabaseManager:
                 logger.warning("MySQL URL이 설정되지 않았습니다")
                 return
             
-            # 엔진 생성
-            self.engine = create_engine(
-                mysql_url,
-                echo=False,  # SQL 로그 출력 여부
-                pool_pre_ping=True,  # 연결 확인
-                pool_recycle=3600,  # 연결 재사용 시간 (1시간)
-                pool_timeout=30,  # 연결 타임아웃
-                max_overflow=10  # 최대 오버플로우 연결 수
-            )
+            # 프로세스 전역 엔진 공유 (매니저마다 별도 풀을 만들지 않음)
+            self.engine = get_engine(mysql_url, self.config)
             
             # 세션 팩토리 생성
             self.SessionLocal = sessionmaker(
@@ -65,6 +231,82 @@ class DatabaseManager:
             logger.error(f"데이터베이스 엔진 초기화 실패: {e}")
             raise
     
+    def _initialize_replicas(self, replica_urls: List[str]):
+        """읽기 전용 복제본 엔진 초기화 (엔진 레지스트리 공유)"""
+        if not self.engine:
+            return
+
+        for url in replica_urls:
+            try:
+                engine = get_engine(url, self.config)
+            except Exception as e:
+                logger.error(f"복제본 엔진 생성 실패: {e}")
+                continue
+            key = engine.url.render_as_string(hide_password=True)
+            self.replica_engines[key] = engine
+            self._replica_state[key] = {"healthy": True, "lag": None, "checked_at": 0.0, "errors": 0}
+
+        if self.replica_engines:
+            logger.info(f"읽기 전용 복제본 {len(self.replica_engines)}개 등록")
+
+    def _check_replica(self, key: str) -> bool:
+        """복제본 상태 확인 (DB_REPLICA_CHECK_INTERVAL 동안 결과 재사용)"""
+        state = self._replica_state[key]
+        if time.monotonic() - state["checked_at"] < self.config.DB_REPLICA_CHECK_INTERVAL:
+            return state["healthy"]
+
+        lag = measure_replica_lag(self.replica_engines[key])
+        healthy = lag is not None and lag <= self.config.DB_REPLICA_MAX_LAG
+        with self._replica_lock:
+            if state["healthy"] != healthy:
+                logger.warning(f"복제본 상태 변경: {key} → {'정상' if healthy else '제외'} (lag={lag})")
+            state.update({"healthy": healthy, "lag": lag, "checked_at": time.monotonic()})
+        return healthy
+
+    def mark_replica_failed(self, engine: Engine):
+        """조회 중 오류가 난 복제본을 다음 상태 확인 전까지 제외"""
+        key = engine.url.render_as_string(hide_password=True)
+        state = self._replica_state.get(key)
+        if state is None:
+            return
+        with self._replica_lock:
+            state.update({"healthy": False, "checked_at": time.monotonic()})
+            state["errors"] += 1
+        logger.warning(f"복제본 오류로 주 DB 로 전환: {key}")
+
+    def get_read_engine(self) -> Optional[Engine]:
+        """
+        읽기 전용 조회에 사용할 엔진 반환
+
+        지연이 허용 범위 안인 복제본을 순환 선택하고, 없으면 주 DB 엔진을 반환한다.
+        """
+        keys = list(self.replica_engines)
+        with self._replica_lock:
+            start = self._replica_cursor
+            self._replica_cursor += 1
+
+        for offset in range(len(keys)):
+            key = keys[(start + offset) % len(keys)]
+            if self._check_replica(key):
+                self.read_stats["replica"] += 1
+                return self.replica_engines[key]
+
+        if keys:
+            self.read_stats["primary_fallback"] += 1
+        return self.engine
+
+    def get_replica_status(self) -> Dict[str, Any]:
+        """복제본 상태 및 읽기 라우팅 통계"""
+        with self._replica_lock:
+            replicas = {key: dict(state) for key, state in self._replica_state.items()}
+        for state in replicas.values():
+            state.pop("checked_at", None)
+        return {
+            "replicas": replicas,
+            "max_lag": self.config.DB_REPLICA_MAX_LAG,
+            "reads": dict(self.read_stats)
+        }
+
     def get_mysql_connector_engine(self):
         """MySQL Connector 엔진 생성 (기존 코드 호환성용)"""
         try:
@@ -73,7 +315,7 @@ class DatabaseManager:
                 logger.warning("MySQL Connector URL이 설정되지 않았습니다")
                 return None
             
-            engine = create_engine(mysql_url, echo=False)
+            engine = get_engine(mysql_url, self.config)
             SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
             
             return engine, SessionLocal
@@ -82,10 +324,13 @@ class DatabaseManager:
             logger.error(f"MySQL Connector 엔진 생성 실패: {e}")
             return None, None
     
-    def get_session(self) -> Optional[Session]:
+    def get_session(self, read_only: bool = False) -> Optional[Session]:
         """
         데이터베이스 세션 반환 (직접 사용)
         
+        Args:
+            read_only: True 이면 복제본에 바인딩된 세션 (복제본이 없거나 지연 시 주 DB)
+        
         Returns:
             Session: SQLAlchemy 세션 객체
         """
@@ -93,6 +338,8 @@ class DatabaseManager:
             logger.error("세션 팩토리가 초기화되지 않았습니다")
             return None
         
+        if read_only:
+            return self.SessionLocal(bind=self.get_read_engine())
         return self.SessionLocal()
     
     def get_db_dependency(self) -> Generator[Session, None, None]:
@@ -114,13 +361,17 @@ class DatabaseManager:
             db.close()
     
     @contextmanager
-    def get_session_context(self):
+    def get_session_context(self, read_only: bool = False):
         """
         컨텍스트 매니저로 사용할 데이터베이스 세션
         
+        Args:
+            read_only: True 이면 복제본에서 조회하고 커밋하지 않는다.
+                       복제본 연결 오류 시 해당 복제본을 제외해 다음 조회부터 주 DB 를 사용한다.
+        
         Example:
-            with db_manager.get_session_context() as session:
-                # 데이터베이스 작업
+            with db_manager.get_session_context(read_only=True) as session:
+                # 조회 작업
                 pass
         """
         if not self.SessionLocal:
@@ -128,12 +379,16 @@ class DatabaseManager:
             yield None
             return
         
-        session = self.SessionLocal()
+        session = self.get_session(read_only)
         try:
             yield session
-            session.commit()
+            if not read_only:
+                session.commit()
         except Exception as e:
             session.rollback()
+            bind = session.get_bind()
+            if read_only and bind is not self.engine and isinstance(e, (OperationalError, InterfaceError)):
+                self.mark_replica_failed(bind)
             logger.error(f"데이터베이스 트랜잭션 오류: {e}")
             raise
         finally:
@@ -199,7 +454,9 @@ class DatabaseManager:
             "driver": self.engine.dialect.name,
             "pool_size": self.engine.pool.size() if hasattr(self.engine.pool, 'size') else "N/A",
             "pool_checked_in": self.engine.pool.checkedin() if hasattr(self.engine.pool, 'checkedin') else "N/A",
-            "pool_checked_out": self.engine.pool.checkedout() if hasattr(self.engine.pool, 'checkedout') else "N/A"
+            "pool_checked_out": self.engine.pool.checkedout() if hasattr(self.engine.pool, 'checkedout') else "N/A",
+            "pool_metrics": self.engine.pool.get_metrics() if isinstance(self.engine.pool, MeteredQueuePool) else {},
+            "replication": self.get_replica_status()
         }
 
 
@@ -236,17 +493,21 @@ def reload_db_manager(config=None) -> DatabaseManager:
     return _global_db_manager
 
 # 편의 함수들
-def get_db_session() -> Optional[Session]:
+def get_db_session(read_only: bool = False) -> Optional[Session]:
     """데이터베이스 세션 반환"""
-    return get_db_manager().get_session()
+    return get_db_manager().get_session(read_only)
 
 def get_db_dependency() -> Generator[Session, None, None]:
     """FastAPI 의존성용 세션 제너레이터"""
     yield from get_db_manager().get_db_dependency()
 
-def get_session_context():
-    """컨텍스트 매니저 세션"""
-    return get_db_manager().get_session_context()
+def get_session_context(read_only: bool = False):
+    """컨텍스트 매니저 세션 (read_only=True 이면 복제본 라우팅)"""
+    return get_db_manager().get_session_context(read_only)
+
+def get_read_engine() -> Optional[Engine]:
+    """읽기 전용 조회용 엔진 (복제본 또는 주 DB)"""
+    return get_db_manager().get_read_engine()
 
 def test_db_connection() -> bool:
     """데이터베이스 연결 테스트"""
@@ -2,10 +2,11 @@
 데이터베이스 모델 v4 - 실제 DDL과 완전 일치
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, TIMESTAMP, ForeignKey, JSON, DECIMAL, CheckConstraint
+from sqlalchemy import Column, Integer, String, Text, Boolean, TIMESTAMP, ForeignKey, JSON, DECIMAL, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from shared_modules.database import Base
+from shared_modules.column_compression import CompressedText, CompressedJSON
 
 class User(Base):
     """사용자 테이블 - DDL과 완전 일치"""
@@ -47,13 +48,17 @@ class FAQ(Base):
 class Conversation(Base):
     """대화 세션 테이블"""
     __tablename__ = 'conversation'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index('ix_conversation_user_visible_started', 'user_id', 'is_visible', 'started_at'),
+        {'extend_existing': True}
+    )
     
     conversation_id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey('user.user_id'), nullable=False)
     started_at = Column(TIMESTAMP, server_default=func.current_timestamp(), nullable=False)
     ended_at = Column(TIMESTAMP, nullable=True)
     is_visible = Column(Boolean, nullable=False, default=True)
+    archived_at = Column(TIMESTAMP, nullable=True)  # 메시지가 message_archive 로 이동된 시각
     
     # 관계
     user = relationship("User", back_populates="conversations")
@@ -86,6 +91,7 @@ class Message(Base):
     __tablename__ = 'message'
     __table_args__ = (
         CheckConstraint("sender_type IN ('USER', 'AGENT')", name='ck_sender_type'),
+        Index('ix_message_conversation_created', 'conversation_id', 'created_at'),
         {'extend_existing': True}
     )
     
@@ -93,12 +99,28 @@ class Message(Base):
     conversation_id = Column(Integer, ForeignKey('conversation.conversation_id'), nullable=False)
     sender_type = Column(String(20), nullable=False)
     agent_type = Column(String(50), nullable=True)
-    content = Column(Text, nullable=False)
+    content = Column(CompressedText, nullable=False)
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp(), nullable=False)
     
     # 관계
     conversation = relationship("Conversation", back_populates="messages")
 
+class MessageArchive(Base):
+    """보관 메시지 테이블 (종료/비활성 대화의 메시지를 message_id 그대로 이동)"""
+    __tablename__ = 'message_archive'
+    __table_args__ = (
+        Index('ix_message_archive_conversation', 'conversation_id', 'message_id'),
+        {'extend_existing': True}
+    )
+    
+    message_id = Column(Integer, primary_key=True, autoincrement=False)
+    conversation_id = Column(Integer, ForeignKey('conversation.conversation_id', ondelete='CASCADE'), nullable=False)
+    sender_type = Column(String(20), nullable=False)
+    agent_type = Column(String(50), nullable=True)
+    content = Column(CompressedText, nullable=False)
+    created_at = Column(TIMESTAMP, nullable=False)
+    archived_at = Column(TIMESTAMP, server_default=func.current_timestamp(), nullable=False)
+
 class PHQ9Result(Base):
     """PHQ-9 검사 결과 테이블"""
     __tablename__ = 'phq9_result'
@@ -154,6 +176,8 @@ class TemplateMessage(Base):
     __tablename__ = 'template_message'
     __table_args__ = (
         CheckConstraint("channel_type IN ('EMAIL', 'SMS', 'PUSH', 'SLACK')", name='ck_channel_type'),
+        Index('ix_template_message_type_created', 'template_type', 'created_at'),
+        Index('ix_template_message_title', 'title'),
         {'extend_existing': True}
     )
     
@@ -174,7 +198,15 @@ class AutomationTask(Base):
     """자동화 작업 테이블"""
     __tablename__ = 'automation_task'
     __table_args__ = (
-        CheckConstraint("status IN ('PENDING', 'RUNNING', 'COMPLETED', 'FAILED')", name='ck_status'),
+        # 대문자 값은 기존 데이터 호환용 (마이그레이션 0007 과 같은 조건)
+        CheckConstraint(
+            "status IN ('pending', 'processing', 'success', 'failed', 'cancelled', 'dead_letter', "
+            "'PENDING', 'RUNNING', 'COMPLETED', 'FAILED')",
+            name='ck_status'
+        ),
+        Index('ix_automation_task_status_scheduled', 'status', 'scheduled_at'),
+        Index('ix_automation_task_user_status', 'user_id', 'status'),
+        Index('ix_automation_task_status_lease', 'status', 'lease_expires_at'),
         {'extend_existing': True}
     )
     
@@ -184,10 +216,15 @@ class AutomationTask(Base):
     task_type = Column(String(50), nullable=False)
     title = Column(String(200), nullable=False)
     template_id = Column(Integer, ForeignKey('template_message.template_id'), nullable=True)
-    task_data = Column(JSON, nullable=True)
+    task_data = Column(CompressedJSON, nullable=True)
     status = Column(String(20), nullable=False)
     scheduled_at = Column(TIMESTAMP, nullable=True)
     executed_at = Column(TIMESTAMP, nullable=True)
+    locked_by = Column(String(100), nullable=True)  # 작업을 선점한 워커 ID
+    lease_expires_at = Column(TIMESTAMP, nullable=True)  # 워커 리스 만료 시각 (하트비트로 연장)
+    attempts = Column(Integer, nullable=False, server_default='0', default=0)  # 실행 시도 횟수 (재시도 포함)
+    recurrence = Column(String(255), nullable=True)  # 반복 규칙 (cron 또는 RRULE), scheduled_at 은 다음 회차
+    timezone = Column(String(50), nullable=True)  # 반복 규칙을 해석할 시간대
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp(), nullable=False)
     
     # 관계
@@ -195,6 +232,46 @@ class AutomationTask(Base):
     conversation = relationship("Conversation", back_populates="automation_tasks")
     template = relationship("TemplateMessage", back_populates="automation_tasks")
 
+class EmailCampaign(Base):
+    """대량 이메일 캠페인 테이블 (템플릿 1개 + 수신자별 변수)"""
+    __tablename__ = 'email_campaign'
+    __table_args__ = (
+        Index('ix_email_campaign_user_created', 'user_id', 'created_at'),
+        {'extend_existing': True}
+    )
+    
+    campaign_id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey('user.user_id'), nullable=False)
+    template_id = Column(Integer, ForeignKey('template_message.template_id', ondelete='SET NULL'), nullable=True)
+    task_id = Column(Integer, ForeignKey('automation_task.task_id', ondelete='SET NULL'), nullable=True)  # 발송 작업
+    subject = Column(String(200), nullable=False)  # 제목 템플릿
+    body = Column(Text, nullable=False)  # 본문 템플릿 ({변수} 형식)
+    content_type = Column(String(20), nullable=True)  # html | text
+    status = Column(String(20), nullable=False, server_default='pending')  # pending | running | completed | cancelled
+    batch_size = Column(Integer, nullable=False, server_default='50')
+    total_count = Column(Integer, nullable=False, server_default='0')
+    sent_count = Column(Integer, nullable=False, server_default='0')
+    failed_count = Column(Integer, nullable=False, server_default='0')
+    created_at = Column(TIMESTAMP, server_default=func.current_timestamp(), nullable=False)
+    started_at = Column(TIMESTAMP, nullable=True)
+    finished_at = Column(TIMESTAMP, nullable=True)
+
+class EmailCampaignRecipient(Base):
+    """캠페인 수신자별 변수와 발송 상태 (발송 진행 체크포인트)"""
+    __tablename__ = 'email_campaign_recipient'
+    __table_args__ = (
+        Index('ix_email_campaign_recipient_status', 'campaign_id', 'status', 'recipient_id'),
+        {'extend_existing': True}
+    )
+    
+    recipient_id = Column(Integer, primary_key=True, autoincrement=True)
+    campaign_id = Column(Integer, ForeignKey('email_campaign.campaign_id', ondelete='CASCADE'), nullable=False)
+    email = Column(String(255), nullable=False)
+    variables = Column(JSON, nullable=True)
+    status = Column(String(20), nullable=False, server_default='pending')  # pending | sent | failed
+    error = Column(String(500), nullable=True)
+    sent_at = Column(TIMESTAMP, nullable=True)
+
 # Vector store collections table (벡터 스토어용)
 class VectorCollection(Base):
     """벡터 스토어 컬렉션 테이블"""
@@ -4,7 +4,7 @@
 """
 
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from dotenv import load_dotenv
 
 class EnvironmentConfig:
@@ -36,6 +36,17 @@ class EnvironmentConfig:
         self.MYSQL_DB = os.getenv("MYSQL_DB")
         self.MYSQL_URL = os.getenv("MYSQL_URL")
         
+        # 커넥션 풀 설정 (프로세스당 엔진 하나를 공유)
+        self.DB_POOL_SIZE = self._get_int_env("DB_POOL_SIZE", 5)
+        self.DB_MAX_OVERFLOW = self._get_int_env("DB_MAX_OVERFLOW", 10)
+        self.DB_POOL_RECYCLE = self._get_int_env("DB_POOL_RECYCLE", 3600)
+        self.DB_POOL_TIMEOUT = self._get_int_env("DB_POOL_TIMEOUT", 30)
+        
+        # 읽기 전용 복제본 (콤마 구분 URL 목록, 허용 지연 초 / 상태 확인 주기 초)
+        self.MYSQL_REPLICA_URLS = os.getenv("MYSQL_REPLICA_URLS")
+        self.DB_REPLICA_MAX_LAG = self._get_float_env("DB_REPLICA_MAX_LAG", 5.0)
+        self.DB_REPLICA_CHECK_INTERVAL = self._get_float_env("DB_REPLICA_CHECK_INTERVAL", 10.0)
+        
         # API 키
         self.OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
         self.GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
@@ -44,6 +55,12 @@ class EnvironmentConfig:
         # 벡터 데이터베이스 설정
         self.CHROMA_DIR = os.getenv("CHROMA_DIR", "/Users/comet39/SKN_PJT/SKN11-FINAL-5Team/unified_agent_system/vector_db")
         self.CHROMA_PERSIST_DIR = os.getenv("CHROMA_PERSIST_DIR", "/Users/comet39/SKN_PJT/SKN11-FINAL-5Team/unified_agent_system/vector_db")
+        self.VECTOR_SHARDING = self._get_bool_env("VECTOR_SHARDING", False)
+        # 다른 프로세스가 만든 샤드를 반영하기 위한 샤드 목록 재조회 주기 (초)
+        self.VECTOR_SHARD_REFRESH_INTERVAL = self._get_int_env("VECTOR_SHARD_REFRESH_INTERVAL", 300)
+        self.VECTOR_SNAPSHOT_DIR = os.getenv("VECTOR_SNAPSHOT_DIR")
+        self.VECTOR_BRUTE_FORCE_THRESHOLD = self._get_int_env("VECTOR_BRUTE_FORCE_THRESHOLD", 2000)
+        self.VECTOR_CACHE_SIZE = self._get_int_env("VECTOR_CACHE_SIZE", 1024)
         
         # SMTP 설정
         self.SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
@@ -78,6 +95,22 @@ class EnvironmentConfig:
         self.APP_NAME = os.getenv("APP_NAME", "Solo Preneur Helper")
         self.DEBUG = self._get_bool_env("DEBUG", False)
         self.CACHE_TTL = self._get_int_env("CACHE_TTL", 1800)
+        
+        # 메시지 보관 (migrations 0002 적용 후 활성화)
+        self.MESSAGE_ARCHIVE_ENABLED = self._get_bool_env("MESSAGE_ARCHIVE_ENABLED", False)
+        self.MESSAGE_ARCHIVE_INACTIVE_DAYS = self._get_int_env("MESSAGE_ARCHIVE_INACTIVE_DAYS", 90)
+        
+        # 대용량 텍스트/JSON 컬럼 압축 (message.content, automation_task.task_data)
+        self.COLUMN_COMPRESSION_ENABLED = self._get_bool_env("COLUMN_COMPRESSION_ENABLED", False)
+        self.COLUMN_COMPRESSION_MIN_BYTES = self._get_int_env("COLUMN_COMPRESSION_MIN_BYTES", 1024)
+        self.COLUMN_COMPRESSION_CODEC = os.getenv("COLUMN_COMPRESSION_CODEC", "zstd")
+        
+        # 사용자 컨텍스트 캐시 (business_type / 프로필 / PHQ-9)
+        self.USER_CACHE_TTL = self._get_int_env("USER_CACHE_TTL", 300)
+        self.USER_CACHE_SIZE = self._get_int_env("USER_CACHE_SIZE", 10000)
+        self.USER_CACHE_REDIS_URL = os.getenv("USER_CACHE_REDIS_URL")
+        # Redis 없이 프로세스 메모리에 PHQ-9 를 캐시할 TTL (다른 프로세스의 무효화가 전달되지 않으므로 기본 0 = 캐시 안 함)
+        self.USER_CACHE_PHQ9_MEMORY_TTL = self._get_int_env("USER_CACHE_PHQ9_MEMORY_TTL", 0)
     
     def _get_int_env(self, key: str, default: int) -> int:
         """정수형 환경 변수 가져오기"""
@@ -113,6 +146,12 @@ class EnvironmentConfig:
         
         return None
     
+    def get_replica_urls(self) -> List[str]:
+        """읽기 전용 복제본 URL 목록"""
+        if not self.MYSQL_REPLICA_URLS:
+            return []
+        return [url.strip() for url in self.MYSQL_REPLICA_URLS.split(",") if url.strip()]
+    
     def get_mysql_connector_url(self) -> str:
         """MySQL Connector 연결 URL 생성"""
         if all([self.MYSQL_HOST, self.MYSQL_USER, self.MYSQL_PASSWORD, self.MYSQL_DB]):
@@ -159,9 +198,14 @@ class EnvironmentConfig:
             "mysql_host": self.MYSQL_HOST,
             "mysql_port": self.MYSQL_PORT,
             "mysql_db": self.MYSQL_DB,
+            "db_pool_size": self.DB_POOL_SIZE,
+            "db_max_overflow": self.DB_MAX_OVERFLOW,
+            "db_replica_count": len(self.get_replica_urls()),
             "openai_available": bool(self.OPENAI_API_KEY),
             "google_available": bool(self.GOOGLE_API_KEY),
             "chroma_dir": self.CHROMA_DIR,
+            "vector_sharding": self.VECTOR_SHARDING,
+            "vector_snapshot_dir": self.VECTOR_SNAPSHOT_DIR,
             "smtp_host": self.SMTP_HOST,
             "smtp_port": self.SMTP_PORT,
             "default_model": self.DEFAULT_MODEL,
@@ -0,0 +1,214 @@
+"""
+메시지 보관(archival) 모듈
+종료되었거나 오래 비활성인 대화의 메시지를 message 테이블에서 message_archive 테이블로 옮겨
+핫 테이블과 인덱스를 작게 유지한다.
+
+보관된 메시지는 message_id 를 그대로 유지하므로 MESSAGE_ARCHIVE_ENABLED=true 이면
+queries 의 메시지 조회 함수가 두 테이블을 함께 읽고, 대화가 다시 열리면
+rehydrate_conversation 으로 핫 테이블에 되돌린다. (migrations 0002 적용 필요)
+
+    python -m shared_modules.message_archive stats
+    python -m shared_modules.message_archive archive [--days 90] [--batch-size 200] [--max-batches N] [--dry-run]
+    python -m shared_modules.message_archive rehydrate <conversation_id>
+"""
+
+import sys
+import argparse
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import select, insert, delete, update, func, literal, and_, or_, exists
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from shared_modules.database import get_db_manager
+from shared_modules.env_config import get_config
+import shared_modules.db_models as db_models
+
+logger = logging.getLogger(__name__)
+
+_MESSAGE_FIELDS = ("message_id", "conversation_id", "sender_type", "agent_type", "content", "created_at")
+
+
+def _get_engine(engine: Engine = None) -> Engine:
+    engine = engine or get_db_manager().engine
+    if engine is None:
+        raise RuntimeError("데이터베이스 엔진이 초기화되지 않았습니다")
+    return engine
+
+
+def find_archivable_conversations(conn: Connection, inactive_days: int, limit: int,
+                                  after_id: int = 0) -> List[int]:
+    """
+    보관 대상 대화 ID 조회 (conversation_id 오름차순)
+
+    아직 보관되지 않았고, 종료(ended_at 설정)되었거나
+    inactive_days 동안 새 메시지가 없는 대화가 대상이다.
+    """
+    Conversation = db_models.Conversation.__table__
+    Message = db_models.Message.__table__
+    cutoff = datetime.now() - timedelta(days=inactive_days)
+
+    recent_message = exists().where(
+        Message.c.conversation_id == Conversation.c.conversation_id,
+        Message.c.created_at >= cutoff
+    )
+    statement = select(Conversation.c.conversation_id).where(
+        Conversation.c.archived_at.is_(None),
+        Conversation.c.conversation_id > after_id,
+        or_(
+            Conversation.c.ended_at.isnot(None),
+            and_(Conversation.c.started_at < cutoff, ~recent_message)
+        )
+    ).order_by(Conversation.c.conversation_id).limit(limit)
+    return [row[0] for row in conn.execute(statement)]
+
+
+def archive_batch(conn: Connection, conversation_ids: List[int]) -> int:
+    """
+    대화 메시지를 보관 테이블로 이동 (호출자의 트랜잭션 안에서 실행)
+
+    Returns:
+        int: 이동한 메시지 수
+    """
+    if not conversation_ids:
+        return 0
+
+    Message = db_models.Message.__table__
+    Archive = db_models.MessageArchive.__table__
+    Conversation = db_models.Conversation.__table__
+    now = datetime.now()
+
+    source = select(
+        *[Message.c[field] for field in _MESSAGE_FIELDS], literal(now, Archive.c.archived_at.type)
+    ).where(Message.c.conversation_id.in_(conversation_ids))
+    conn.execute(insert(Archive).from_select([*_MESSAGE_FIELDS, "archived_at"], source))
+
+    moved = conn.execute(delete(Message).where(Message.c.conversation_id.in_(conversation_ids))).rowcount
+    conn.execute(
+        update(Conversation)
+        .where(Conversation.c.conversation_id.in_(conversation_ids))
+        .values(archived_at=now)
+    )
+    return moved
+
+
+def archive_conversations(inactive_days: int = None, batch_size: int = 200, max_batches: int = None,
+                          dry_run: bool = False, engine: Engine = None) -> Dict[str, int]:
+    """
+    보관 대상 대화를 batch_size 개씩 나누어 보관 (배치마다 별도 트랜잭션)
+
+    Returns:
+        Dict: conversations, messages, batches
+    """
+    engine = _get_engine(engine)
+    if inactive_days is None:
+        inactive_days = get_config().MESSAGE_ARCHIVE_INACTIVE_DAYS
+
+    result = {"conversations": 0, "messages": 0, "batches": 0}
+    after_id = 0
+    while max_batches is None or result["batches"] < max_batches:
+        with engine.begin() as conn:
+            conversation_ids = find_archivable_conversations(conn, inactive_days, batch_size, after_id)
+            if not conversation_ids:
+                break
+            moved = 0 if dry_run else archive_batch(conn, conversation_ids)
+
+        after_id = conversation_ids[-1]
+        result["conversations"] += len(conversation_ids)
+        result["messages"] += moved
+        result["batches"] += 1
+        logger.info(
+            f"보관 배치 {result['batches']}: 대화 {len(conversation_ids)}개, 메시지 {moved}개"
+            f"{' (dry-run)' if dry_run else ''}"
+        )
+
+    return result
+
+
+def rehydrate_conversation(db: Session, conversation_id: int) -> int:
+    """
+    보관된 대화의 메시지를 핫 테이블로 되돌림 (보관되지 않은 대화는 아무 작업도 하지 않음)
+
+    Returns:
+        int: 복원한 메시지 수
+    """
+    Message = db_models.Message.__table__
+    Archive = db_models.MessageArchive.__table__
+    Conversation = db_models.Conversation.__table__
+
+    try:
+        archived_at = db.execute(
+            select(Conversation.c.archived_at).where(Conversation.c.conversation_id == conversation_id)
+        ).scalar()
+        if archived_at is None:
+            return 0
+
+        source = select(*[Archive.c[field] for field in _MESSAGE_FIELDS]).where(
+            Archive.c.conversation_id == conversation_id
+        )
+        db.execute(insert(Message).from_select(list(_MESSAGE_FIELDS), source))
+        restored = db.execute(delete(Archive).where(Archive.c.conversation_id == conversation_id)).rowcount
+        db.execute(
+            update(Conversation)
+            .where(Conversation.c.conversation_id == conversation_id)
+            .values(archived_at=None)
+        )
+        db.commit()
+        logger.info(f"보관 대화 복원: {conversation_id} (메시지 {restored}개)")
+        return restored
+    except Exception as e:
+        logger.error(f"[rehydrate_conversation 오류] {e}", exc_info=True)
+        db.rollback()
+        return 0
+
+
+def get_archive_stats(engine: Engine = None) -> Dict[str, Any]:
+    """핫/보관 테이블 메시지 수 및 보관된 대화 수"""
+    engine = _get_engine(engine)
+    with engine.connect() as conn:
+        return {
+            "hot_messages": conn.execute(select(func.count()).select_from(db_models.Message.__table__)).scalar(),
+            "archived_messages": conn.execute(
+                select(func.count()).select_from(db_models.MessageArchive.__table__)
+            ).scalar(),
+            "archived_conversations": conn.execute(
+                select(func.count()).select_from(db_models.Conversation.__table__)
+                .where(db_models.Conversation.archived_at.isnot(None))
+            ).scalar(),
+        }
+
+
+def main(argv: List[str] = None) -> int:
+    """CLI 진입점"""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(prog="python -m shared_modules.message_archive", description="메시지 보관")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    archive_parser = subparsers.add_parser("archive", help="종료/비활성 대화 보관")
+    archive_parser.add_argument("--days", type=int, default=None, help="비활성 기준 일수 (기본: MESSAGE_ARCHIVE_INACTIVE_DAYS)")
+    archive_parser.add_argument("--batch-size", type=int, default=200)
+    archive_parser.add_argument("--max-batches", type=int, default=None)
+    archive_parser.add_argument("--dry-run", action="store_true")
+
+    rehydrate_parser = subparsers.add_parser("rehydrate", help="보관된 대화 복원")
+    rehydrate_parser.add_argument("conversation_id", type=int)
+
+    subparsers.add_parser("stats", help="보관 현황")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "archive":
+        result = archive_conversations(args.days, args.batch_size, args.max_batches, args.dry_run)
+        logger.info(f"보관 완료: {result}")
+    elif args.command == "rehydrate":
+        with get_db_manager().get_session_context() as db:
+            logger.info(f"복원된 메시지: {rehydrate_conversation(db, args.conversation_id)}개")
+    else:
+        logger.info(f"보관 현황: {get_archive_stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+"""
+벡터 스토어 메타데이터 사전 필터 인덱스
+persona / category / topic 메타데이터를 청크 ID 포스팅 리스트로 관리하여
+필터 검색 시 후보 청크 집합을 미리 계산한다.
+
+init 스크립트에서도 단독으로 import 할 수 있도록 shared_modules 의 다른 모듈에 의존하지 않는다.
+"""
+
+import os
+import json
+import logging
+from typing import Dict, Any, List, Optional, Set, Iterable
+
+logger = logging.getLogger(__name__)
+
+# 콤마로 구분된 다중 값을 가지는 메타데이터 필드
+MULTI_VALUE_FIELDS = ("topic", "source")
+
+# 포스팅 리스트를 유지하는 메타데이터 필드
+INDEXED_FIELDS = ("persona", "category", "topic")
+
+INDEX_FORMAT_VERSION = 1
+
+
+def split_multi_value(value: Any) -> List[str]:
+    """
+    다중 값 메타데이터를 정규화된 토큰 리스트로 변환
+
+    "business_model, market_research" / ["market_research", "business_model"]
+    모두 ["business_model", "market_research"] 로 변환된다.
+    """
+    if value is None:
+        return []
+
+    if isinstance(value, (list, tuple, set)):
+        items = value
+    else:
+        items = str(value).split(",")
+
+    tokens = {str(item).strip() for item in items}
+    tokens.discard("")
+    return sorted(tokens)
+
+
+def normalize_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    적재 시점 메타데이터 정규화
+
+    다중 값 필드는 정렬·중복 제거된 콤마 구분 문자열로 저장한다.
+    (Chroma 메타데이터는 스칼라 값만 허용하므로 리스트 대신 정규형 문자열 사용)
+    """
+    normalized = dict(metadata or {})
+    for field in MULTI_VALUE_FIELDS:
+        if field in normalized:
+            normalized[field] = ",".join(split_multi_value(normalized[field]))
+    return normalized
+
+
+def get_index_path(persist_directory: str, collection_name: str) -> str:
+    """컬렉션별 인덱스 파일 경로 반환"""
+    return os.path.join(persist_directory, f"{collection_name}.metadata_index.json")
+
+
+def get_version_path(persist_directory: str, collection_name: str) -> str:
+    """컬렉션 버전 카운터 파일 경로 반환"""
+    return os.path.join(persist_directory, f"{collection_name}.version")
+
+
+def read_collection_version(persist_directory: str, collection_name: str) -> int:
+    """
+    컬렉션 버전 카운터 조회
+
+    적재(ingestion)할 때마다 증가하며, 검색 결과 캐시와 메타데이터 인덱스의 무효화 기준으로 쓰인다.
+    """
+    try:
+        with open(get_version_path(persist_directory, collection_name), "r") as f:
+            return int(f.read().strip() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def bump_collection_version(persist_directory: str, collection_name: str) -> int:
+    """컬렉션 버전 카운터 증가 (다른 프로세스의 캐시도 다음 조회 시 무효화된다)"""
+    version = read_collection_version(persist_directory, collection_name) + 1
+    path = get_version_path(persist_directory, collection_name)
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(str(version))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.error(f"컬렉션 버전 갱신 실패 ({path}): {e}")
+    return version
+
+
+class MetadataIndex:
+    """메타데이터 → 청크 ID 포스팅 리스트 인덱스"""
+
+    def __init__(self, fields: Iterable[str] = INDEXED_FIELDS):
+        self.fields = tuple(fields)
+        # field -> token -> chunk ids
+        self.postings: Dict[str, Dict[str, Set[str]]] = {field: {} for field in self.fields}
+        # field -> token -> 실제 저장된 원본 값들 (Chroma where 재작성용)
+        self.raw_values: Dict[str, Dict[str, Set[str]]] = {field: {} for field in self.fields}
+        self.ids: Set[str] = set()
+
+    def _tokens(self, field: str, value: Any) -> List[str]:
+        if field in MULTI_VALUE_FIELDS:
+            return split_multi_value(value)
+        return [] if value is None else [str(value)]
+
+    def add(self, ids: List[str], metadatas: List[Dict[str, Any]]):
+        """청크 ID와 메타데이터를 인덱스에 추가"""
+        for chunk_id, metadata in zip(ids, metadatas):
+            if chunk_id in self.ids:
+                self.remove([chunk_id])
+
+            self.ids.add(chunk_id)
+            for field in self.fields:
+                value = (metadata or {}).get(field)
+                for token in self._tokens(field, value):
+                    self.postings[field].setdefault(token, set()).add(chunk_id)
+                    self.raw_values[field].setdefault(token, set()).add(str(value))
+
+    def remove(self, ids: List[str]):
+        """청크 ID를 인덱스에서 제거"""
+        targets = set(ids) & self.ids
+        if not targets:
+            return
+
+        self.ids -= targets
+        for field in self.fields:
+            for token in list(self.postings[field].keys()):
+                self.postings[field][token] -= targets
+                if not self.postings[field][token]:
+                    del self.postings[field][token]
+                    self.raw_values[field].pop(token, None)
+
+    def _resolve_condition(self, field: str, condition: Any) -> Optional[Set[str]]:
+        """필드 조건 해석 ({"$in": [...], "$ne": x} 처럼 연산자가 여럿이면 모두 만족하는 교집합)"""
+        if field not in self.fields:
+            return None
+
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+
+        if not condition:
+            return None
+
+        result: Optional[Set[str]] = None
+        for operator, operand in condition.items():
+            current = self._resolve_operator(field, operator, operand)
+            if current is None:
+                return None
+            result = current if result is None else result & current
+        return result
+
+    def _resolve_operator(self, field: str, operator: str, operand: Any) -> Optional[Set[str]]:
+        postings = self.postings[field]
+
+        if operator == "$eq":
+            tokens = self._tokens(field, operand)
+            if not tokens:
+                return set()
+            result = set(postings.get(tokens[0], set()))
+            for token in tokens[1:]:
+                result &= postings.get(token, set())
+            return result
+
+        if operator in ("$in", "$nin"):
+            matched = set()
+            for value in operand or []:
+                for token in self._tokens(field, value):
+                    matched |= postings.get(token, set())
+            return matched if operator == "$in" else self.ids - matched
+
+        if operator == "$ne":
+            return self.ids - self._resolve_operator(field, "$eq", operand)
+
+        return None
+
+    def resolve(self, filter_dict: Optional[Dict[str, Any]]) -> Optional[Set[str]]:
+        """
+        필터 조건을 만족하는 후보 청크 ID 집합 계산
+
+        Returns:
+            Set[str]: 후보 ID 집합 (인덱스로 해석할 수 없는 필터면 None)
+        """
+        if not filter_dict:
+            return None
+
+        result: Optional[Set[str]] = None
+        for key, condition in filter_dict.items():
+            if key in ("$and", "$or"):
+                subsets = [self.resolve(sub) for sub in condition or []]
+                if not subsets or any(subset is None for subset in subsets):
+                    return None
+                if key == "$and":
+                    current = set.intersection(*subsets)
+                else:
+                    current = set.union(*subsets)
+            else:
+                current = self._resolve_condition(key, condition)
+                if current is None:
+                    return None
+
+            result = current if result is None else result & current
+
+        return result
+
+    def _raw_values_for(self, field: str, values: List[Any], match_all: bool) -> List[str]:
+        tokens = []
+        for value in values:
+            tokens.extend(self._tokens(field, value))
+
+        if not tokens:
+            return []
+
+        raw_sets = [self.raw_values[field].get(token, set()) for token in tokens]
+        raw = set.intersection(*raw_sets) if match_all else set.union(*raw_sets)
+        return sorted(raw)
+
+    def rewrite_filter(self, filter_dict: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        다중 값 필드 조건을 Chroma 가 정확히 평가할 수 있는 형태로 재작성
+
+        {"topic": {"$in": ["business_model"]}} 처럼 콤마 문자열에 대해 동작하지 않던 조건을
+        해당 토큰을 포함하는 실제 저장 값 목록의 $in / $nin 조건으로 바꾼다.
+        """
+        if not filter_dict:
+            return filter_dict
+
+        rewritten = {}
+        for key, condition in filter_dict.items():
+            if key in ("$and", "$or"):
+                subs = [self.rewrite_filter(sub) for sub in condition or []]
+                if key == "$and":
+                    rewritten.setdefault(key, []).extend(subs)
+                else:
+                    rewritten[key] = subs
+                continue
+
+            if key not in MULTI_VALUE_FIELDS or key not in self.fields:
+                rewritten[key] = condition
+                continue
+
+            if not isinstance(condition, dict):
+                condition = {"$eq": condition}
+
+            # Chroma 는 필드 조건 하나에 연산자 하나만 허용하므로 여러 연산자는 $and 로 나눈다
+            parts = [self._rewrite_operator(key, operator, operand) for operator, operand in condition.items()]
+            if len(parts) == 1:
+                rewritten[key] = parts[0]
+            elif parts:
+                rewritten.setdefault("$and", []).extend({key: part} for part in parts)
+            else:
+                rewritten[key] = condition
+
+        return rewritten
+
+    def _rewrite_operator(self, field: str, operator: str, operand: Any) -> Dict[str, Any]:
+        if operator == "$eq":
+            raw = self._raw_values_for(field, [operand], match_all=True)
+            return {"$in": raw} if raw else {operator: operand}
+        if operator in ("$in", "$nin"):
+            raw = self._raw_values_for(field, list(operand or []), match_all=False)
+            return {operator: raw} if raw else {operator: operand}
+        if operator == "$ne":
+            raw = self._raw_values_for(field, [operand], match_all=True)
+            return {"$nin": raw} if raw else {operator: operand}
+        return {operator: operand}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """인덱스 통계 반환"""
+        return {
+            "indexed_chunks": len(self.ids),
+            "fields": {
+                field: {token: len(ids) for token, ids in sorted(self.postings[field].items())}
+                for field in self.fields
+            }
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": INDEX_FORMAT_VERSION,
+            "fields": list(self.fields),
+            "ids": sorted(self.ids),
+            "postings": {
+                field: {token: sorted(ids) for token, ids in self.postings[field].items()}
+                for field in self.fields
+            },
+            "raw_values": {
+                field: {token: sorted(values) for token, values in self.raw_values[field].items()}
+                for field in self.fields
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MetadataIndex":
+        index = cls(data.get("fields", INDEXED_FIELDS))
+        index.ids = set(data.get("ids", []))
+        for field in index.fields:
+            index.postings[field] = {
+                token: set(ids) for token, ids in data.get("postings", {}).get(field, {}).items()
+            }
+            index.raw_values[field] = {
+                token: set(values) for token, values in data.get("raw_values", {}).get(field, {}).items()
+            }
+        return index
+
+    def save(self, path: str) -> bool:
+        """인덱스를 파일로 저장 (임시 파일 작성 후 교체)"""
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            logger.error(f"메타데이터 인덱스 저장 실패 ({path}): {e}")
+            return False
+
+    @classmethod
+    def load(cls, path: str) -> Optional["MetadataIndex"]:
+        """인덱스 파일 로드 (없거나 형식이 다르면 None)"""
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_FORMAT_VERSION:
+                logger.warning(f"메타데이터 인덱스 버전 불일치, 재생성 필요: {path}")
+                return None
+            return cls.from_dict(data)
+        except Exception as e:
+            logger.error(f"메타데이터 인덱스 로드 실패 ({path}): {e}")
+            return None
+
+    @classmethod
+    def build_from_collection(cls, collection, batch_size: int = 1000) -> "MetadataIndex":
+        """
+        기존 Chroma 컬렉션의 메타데이터로 인덱스 생성
+        (콤마 문자열로 저장된 기존 데이터도 토큰 단위로 색인된다)
+        """
+        index = cls()
+        total = collection.count()
+        for offset in range(0, total, batch_size):
+            batch = collection.get(include=["metadatas"], limit=batch_size, offset=offset)
+            index.add(batch.get("ids", []), batch.get("metadatas") or [])
+        return index
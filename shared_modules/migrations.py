@@ -0,0 +1,442 @@
+"""
+버전 관리 DDL 마이그레이션 및 쿼리 실행 계획 점검
+
+신규 DB 는 Base.metadata.create_all 로 인덱스까지 생성되지만, 이미 운영 중인 DB 에는
+schema_migrations 테이블에 적용 이력을 남기며 순서대로 DDL 을 적용한다.
+
+    python -m shared_modules.migrations status
+    python -m shared_modules.migrations upgrade
+    python -m shared_modules.migrations check   # 핫 쿼리가 풀 스캔이면 종료 코드 1
+    python -m shared_modules.migrations verify  # ORM 이 매핑한 컬럼/테이블이 DB 에 없으면 종료 코드 1
+
+배포 순서: ORM 모델(db_models)은 마이그레이션으로 추가되는 컬럼(conversation.archived_at,
+automation_task.locked_by / lease_expires_at / attempts / recurrence ... , email_campaign 테이블)을
+매핑하므로, 새 코드를 띄우기 전에 반드시 upgrade 를 먼저 실행해야 한다.
+서비스 시작 시 ensure_schema_current() 가 누락된 컬럼을 발견하면 upgrade 실행 안내와 함께 시작을 중단한다.
+"""
+
+import re
+import sys
+import logging
+from datetime import datetime
+from typing import Callable, Dict, Any, List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import (
+    Column, Integer, String, TIMESTAMP, MetaData, Table, inspect, select, text, desc, or_
+)
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from shared_modules.database import get_db_manager
+import shared_modules.db_models as db_models
+
+logger = logging.getLogger(__name__)
+
+_migration_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    _migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String(200), nullable=False),
+    Column("applied_at", TIMESTAMP, nullable=False),
+)
+
+
+class SchemaOutdatedError(RuntimeError):
+    """DB 스키마가 ORM 모델보다 오래되어 마이그레이션이 필요한 경우"""
+
+
+class Migration(NamedTuple):
+    """버전별 마이그레이션 정의"""
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+# -------------------
+# DDL 헬퍼
+# -------------------
+def _create_index(conn: Connection, table_name: str, index_name: str, columns: Sequence[str]):
+    """인덱스가 없을 때만 생성 (create_all 로 이미 만들어진 DB 에서도 안전)"""
+    existing = {index["name"] for index in inspect(conn).get_indexes(table_name)}
+    if index_name in existing:
+        logger.info(f"  - 인덱스 존재, 건너뜀: {table_name}.{index_name}")
+        return
+
+    quote = conn.dialect.identifier_preparer.quote
+    column_sql = ", ".join(quote(column) for column in columns)
+    conn.execute(text(f"CREATE INDEX {quote(index_name)} ON {quote(table_name)} ({column_sql})"))
+    logger.info(f"  - 인덱스 생성: {table_name}.{index_name} ({', '.join(columns)})")
+
+
+def _add_column(conn: Connection, table_name: str, column_name: str, column_ddl: str):
+    """컬럼이 없을 때만 추가"""
+    existing = {column["name"] for column in inspect(conn).get_columns(table_name)}
+    if column_name in existing:
+        logger.info(f"  - 컬럼 존재, 건너뜀: {table_name}.{column_name}")
+        return
+
+    quote = conn.dialect.identifier_preparer.quote
+    conn.execute(text(f"ALTER TABLE {quote(table_name)} ADD COLUMN {quote(column_name)} {column_ddl}"))
+    logger.info(f"  - 컬럼 추가: {table_name}.{column_name} {column_ddl}")
+
+
+def _replace_check_constraint(conn: Connection, table_name: str, constraint_name: str, condition: str):
+    """
+    CHECK 제약조건을 새 조건으로 교체 (없으면 추가)
+
+    SQLite 는 제약조건을 ALTER 할 수 없으므로 새 테이블을 만들어 행을 옮긴 뒤 이름을 바꾼다.
+    (SQLite 기본값인 foreign_keys=OFF 에서 실행해야 다른 테이블의 외래 키 동작이 일어나지 않음)
+    """
+    quote = conn.dialect.identifier_preparer.quote
+    table, constraint = quote(table_name), quote(constraint_name)
+
+    if conn.dialect.name == "sqlite":
+        _rebuild_sqlite_table_check(conn, table_name, constraint_name, condition)
+    else:
+        existing = {check["name"] for check in inspect(conn).get_check_constraints(table_name)}
+        if constraint_name in existing:
+            # MySQL 8.0.16+ 는 DROP CHECK, MariaDB/PostgreSQL 은 DROP CONSTRAINT
+            drop = "CHECK" if conn.dialect.name == "mysql" and not conn.dialect.is_mariadb else "CONSTRAINT"
+            conn.execute(text(f"ALTER TABLE {table} DROP {drop} {constraint}"))
+        conn.execute(text(f"ALTER TABLE {table} ADD CONSTRAINT {constraint} CHECK ({condition})"))
+    logger.info(f"  - 제약조건 교체: {table_name}.{constraint_name} CHECK ({condition})")
+
+
+def _rebuild_sqlite_table_check(conn: Connection, table_name: str, constraint_name: str, condition: str):
+    """SQLite 테이블 재생성으로 CHECK 제약조건 교체 (컬럼 순서와 인덱스는 그대로 유지)"""
+    create_sql = conn.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": table_name}
+    ).scalar()
+    index_sqls = conn.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = :name AND sql IS NOT NULL"),
+        {"name": table_name}
+    ).scalars().all()
+
+    check_sql = f"CONSTRAINT {constraint_name} CHECK ({condition})"
+    pattern = re.compile(rf"CONSTRAINT\s+[\"`]?{re.escape(constraint_name)}[\"`]?\s+CHECK\s*\((?:[^()]|\([^()]*\))*\)",
+                         re.IGNORECASE)
+    if pattern.search(create_sql):
+        create_sql = pattern.sub(lambda _: check_sql, create_sql, count=1)
+    else:
+        create_sql = create_sql[:create_sql.rstrip().rindex(")")] + f", {check_sql})"
+
+    # 다른 테이블의 외래 키가 가리키는 이름이 바뀌지 않도록 새 테이블을 만든 뒤 원래 이름으로 바꾼다
+    temp_name = f"{table_name}__rebuild"
+    create_sql = re.sub(rf"^CREATE TABLE\s+[\"`]?{re.escape(table_name)}[\"`]?", f'CREATE TABLE "{temp_name}"',
+                        create_sql, count=1, flags=re.IGNORECASE)
+    conn.execute(text(create_sql))
+    conn.execute(text(f'INSERT INTO "{temp_name}" SELECT * FROM "{table_name}"'))
+    conn.execute(text(f'DROP TABLE "{table_name}"'))
+    conn.execute(text(f'ALTER TABLE "{temp_name}" RENAME TO "{table_name}"'))
+    for index_sql in index_sqls:
+        conn.execute(text(index_sql))
+
+
+# -------------------
+# 마이그레이션 목록 (추가만 하고 기존 항목은 수정하지 않는다)
+# -------------------
+def _0001_hot_table_indexes(conn: Connection):
+    _create_index(conn, "message", "ix_message_conversation_created", ["conversation_id", "created_at"])
+    _create_index(conn, "conversation", "ix_conversation_user_visible_started", ["user_id", "is_visible", "started_at"])
+    _create_index(conn, "automation_task", "ix_automation_task_status_scheduled", ["status", "scheduled_at"])
+    _create_index(conn, "automation_task", "ix_automation_task_user_status", ["user_id", "status"])
+    _create_index(conn, "template_message", "ix_template_message_type_created", ["template_type", "created_at"])
+    _create_index(conn, "template_message", "ix_template_message_title", ["title"])
+
+
+def _0002_message_archive(conn: Connection):
+    _add_column(conn, "conversation", "archived_at", "TIMESTAMP NULL")
+    db_models.MessageArchive.__table__.create(conn, checkfirst=True)
+    logger.info("  - message_archive 테이블 확인/생성")
+
+
+def _0003_automation_task_lease(conn: Connection):
+    _add_column(conn, "automation_task", "locked_by", "VARCHAR(100) NULL")
+    _add_column(conn, "automation_task", "lease_expires_at", "TIMESTAMP NULL")
+    _create_index(conn, "automation_task", "ix_automation_task_status_lease", ["status", "lease_expires_at"])
+
+
+def _0004_automation_task_attempts(conn: Connection):
+    _add_column(conn, "automation_task", "attempts", "INTEGER NOT NULL DEFAULT 0")
+
+
+def _0005_automation_task_recurrence(conn: Connection):
+    _add_column(conn, "automation_task", "recurrence", "VARCHAR(255) NULL")
+    _add_column(conn, "automation_task", "timezone", "VARCHAR(50) NULL")
+
+
+def _0006_email_campaign(conn: Connection):
+    db_models.EmailCampaign.__table__.create(conn, checkfirst=True)
+    db_models.EmailCampaignRecipient.__table__.create(conn, checkfirst=True)
+    logger.info("  - email_campaign / email_campaign_recipient 테이블 확인/생성")
+
+
+def _0007_automation_task_status_check(conn: Connection):
+    # 에이전트가 기록하는 소문자 상태값(워커 선점, 재시도 소진 포함)과 기존 대문자 값을 모두 허용
+    _replace_check_constraint(
+        conn, "automation_task", "ck_status",
+        "status IN ('pending', 'processing', 'success', 'failed', 'cancelled', 'dead_letter', "
+        "'PENDING', 'RUNNING', 'COMPLETED', 'FAILED')"
+    )
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "hot table composite indexes", _0001_hot_table_indexes),
+    Migration(2, "conversation.archived_at and message_archive table", _0002_message_archive),
+    Migration(3, "automation_task worker lease columns", _0003_automation_task_lease),
+    Migration(4, "automation_task.attempts for retries", _0004_automation_task_attempts),
+    Migration(5, "automation_task recurrence columns", _0005_automation_task_recurrence),
+    Migration(6, "email_campaign and email_campaign_recipient tables", _0006_email_campaign),
+    Migration(7, "automation_task.ck_status allows every task status", _0007_automation_task_status_check),
+]
+
+
+# -------------------
+# 마이그레이션 실행
+# -------------------
+def _get_engine(engine: Optional[Engine]) -> Engine:
+    engine = engine or get_db_manager().engine
+    if engine is None:
+        raise RuntimeError("데이터베이스 엔진이 초기화되지 않았습니다")
+    return engine
+
+
+def get_applied_versions(engine: Engine = None) -> List[int]:
+    """적용된 마이그레이션 버전 목록"""
+    engine = _get_engine(engine)
+    _migration_metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        return [row.version for row in conn.execute(select(schema_migrations.c.version))]
+
+
+def get_pending_migrations(engine: Engine = None) -> List[Migration]:
+    """아직 적용되지 않은 마이그레이션 목록"""
+    applied = set(get_applied_versions(engine))
+    return [migration for migration in MIGRATIONS if migration.version not in applied]
+
+
+def upgrade(engine: Engine = None, target: int = None) -> List[int]:
+    """
+    미적용 마이그레이션을 버전 순으로 적용
+
+    Args:
+        target: 이 버전까지만 적용 (기본값: 최신)
+
+    Returns:
+        List[int]: 이번에 적용한 버전 목록
+    """
+    engine = _get_engine(engine)
+    applied = []
+
+    for migration in sorted(get_pending_migrations(engine), key=lambda m: m.version):
+        if target is not None and migration.version > target:
+            break
+
+        logger.info(f"마이그레이션 적용: {migration.version:04d} {migration.description}")
+        with engine.begin() as conn:
+            migration.upgrade(conn)
+            conn.execute(schema_migrations.insert().values(
+                version=migration.version,
+                description=migration.description,
+                applied_at=datetime.now()
+            ))
+        applied.append(migration.version)
+
+    return applied
+
+
+# -------------------
+# 스키마 확인
+# -------------------
+def find_schema_drift(engine: Engine = None) -> Dict[str, List[str]]:
+    """
+    ORM 이 매핑했지만 DB 에 없는 테이블/컬럼 조회 (DDL 을 실행하지 않음)
+
+    Returns:
+        Dict: 테이블 이름 → 누락된 컬럼 목록 (테이블 자체가 없으면 ["*"])
+    """
+    engine = _get_engine(engine)
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+
+    drift = {}
+    for table in db_models.Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            drift[table.name] = ["*"]
+            continue
+        existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        missing = [column.name for column in table.columns if column.name not in existing_columns]
+        if missing:
+            drift[table.name] = missing
+    return drift
+
+
+def _recorded_versions(engine: Engine) -> List[int]:
+    """schema_migrations 에 기록된 버전 (테이블이 없으면 빈 목록, 테이블을 만들지 않음)"""
+    if not inspect(engine).has_table(schema_migrations.name):
+        return []
+    with engine.connect() as conn:
+        return [row.version for row in conn.execute(select(schema_migrations.c.version))]
+
+
+def ensure_schema_current(engine: Engine = None) -> bool:
+    """
+    서비스 시작 시 스키마 확인
+
+    ORM 이 매핑한 컬럼이 DB 에 없으면 조회가 실패하므로 upgrade 실행 안내와 함께 SchemaOutdatedError 를 던진다.
+    DB 가 설정되지 않았거나 연결할 수 없으면 경고만 남긴다. (연결 오류는 기존처럼 요청 시점에 처리)
+
+    Returns:
+        bool: 스키마를 확인했으면 True
+    """
+    engine = engine or get_db_manager().engine
+    if engine is None:
+        logger.warning("데이터베이스 엔진이 없어 스키마 확인을 건너뜁니다")
+        return False
+
+    try:
+        drift = find_schema_drift(engine)
+        applied = set(_recorded_versions(engine))
+    except SQLAlchemyError as e:
+        logger.warning(f"스키마 확인 실패 (건너뜀): {e}")
+        return False
+
+    pending = [f"{migration.version:04d}" for migration in MIGRATIONS if migration.version not in applied]
+    if drift:
+        missing = ", ".join(f"{table}.{'/'.join(columns)}" for table, columns in drift.items())
+        raise SchemaOutdatedError(
+            f"DB 스키마가 코드보다 오래되었습니다 (누락: {missing}, 미적용 마이그레이션: {', '.join(pending) or '없음'}). "
+            f"서비스를 시작하기 전에 'python -m shared_modules.migrations upgrade' 를 실행하세요."
+        )
+    if pending:
+        logger.warning(
+            f"미적용 마이그레이션이 있습니다 ({', '.join(pending)}): "
+            f"'python -m shared_modules.migrations upgrade' 로 인덱스를 적용하세요"
+        )
+    return True
+
+
+# -------------------
+# 실행 계획 점검
+# -------------------
+def _hot_queries() -> Dict[str, Any]:
+    """인덱스로 처리되어야 하는 핫 쿼리 (쿼리 함수와 같은 조건/정렬)"""
+    Message = db_models.Message
+    Conversation = db_models.Conversation
+    AutomationTask = db_models.AutomationTask
+    TemplateMessage = db_models.TemplateMessage
+
+    return {
+        "message_tail": select(Message.message_id, Message.content).where(
+            Message.conversation_id == 1
+        ).order_by(desc(Message.message_id)).limit(6),
+        "messages_by_created_at": select(Message.message_id).where(
+            Message.conversation_id == 1
+        ).order_by(Message.created_at),
+        "user_conversations": select(Conversation.conversation_id).where(
+            Conversation.user_id == 1, Conversation.is_visible == True
+        ).order_by(desc(Conversation.started_at)),
+        "pending_tasks": select(AutomationTask.task_id).where(
+            AutomationTask.status == "PENDING"
+        ).order_by(AutomationTask.scheduled_at).limit(100),
+        "expired_task_leases": select(AutomationTask.task_id).where(
+            AutomationTask.status == "processing",
+            or_(AutomationTask.lease_expires_at.is_(None), AutomationTask.lease_expires_at < datetime(2000, 1, 1))
+        ).order_by(AutomationTask.lease_expires_at).limit(100),
+        "user_tasks_by_status": select(AutomationTask.task_id).where(
+            AutomationTask.user_id == 1, AutomationTask.status == "PENDING"
+        ),
+        "templates_by_type": select(TemplateMessage.template_id).where(
+            TemplateMessage.template_type == "marketing"
+        ).order_by(desc(TemplateMessage.created_at)),
+        "template_by_title": select(TemplateMessage.template_id).where(
+            TemplateMessage.title == "welcome"
+        ),
+    }
+
+
+def explain(conn: Connection, statement) -> List[Dict[str, Any]]:
+    """방언별 EXPLAIN 결과를 dict 리스트로 반환"""
+    sql = str(statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    prefix = "EXPLAIN QUERY PLAN" if conn.dialect.name == "sqlite" else "EXPLAIN"
+    return [dict(row._mapping) for row in conn.execute(text(f"{prefix} {sql}"))]
+
+
+def is_full_scan(dialect_name: str, plan: List[Dict[str, Any]]) -> bool:
+    """
+    실행 계획에 테이블 풀 스캔이 있는지 판단
+
+    MySQL: access type 이 ALL 인 행 / SQLite: 인덱스 없이 'SCAN <table>' 하는 행
+    """
+    for row in plan:
+        if dialect_name == "sqlite":
+            detail = str(row.get("detail", ""))
+            if detail.startswith("SCAN") and "USING" not in detail:
+                return True
+        elif str(row.get("type", "")).upper() == "ALL":
+            return True
+    return False
+
+
+def check_query_plans(engine: Engine = None) -> Dict[str, Dict[str, Any]]:
+    """
+    핫 쿼리 실행 계획 점검
+
+    Returns:
+        Dict: 쿼리 이름 → {"full_scan": bool, "plan": [...]}
+    """
+    engine = _get_engine(engine)
+    report = {}
+    with engine.connect() as conn:
+        for name, statement in _hot_queries().items():
+            plan = explain(conn, statement)
+            report[name] = {"full_scan": is_full_scan(engine.dialect.name, plan), "plan": plan}
+    return report
+
+
+def main(argv: List[str] = None) -> int:
+    """CLI 진입점"""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    args = argv if argv is not None else sys.argv[1:]
+    command = args[0] if args else "status"
+
+    if command == "upgrade":
+        applied = upgrade()
+        logger.info(f"적용 완료: {applied or '변경 없음'}")
+        return 0
+
+    if command == "status":
+        applied = set(get_applied_versions())
+        for migration in MIGRATIONS:
+            mark = "applied" if migration.version in applied else "pending"
+            logger.info(f"{migration.version:04d} [{mark}] {migration.description}")
+        return 0
+
+    if command == "check":
+        regressions = []
+        for name, result in check_query_plans().items():
+            status = "FULL SCAN" if result["full_scan"] else "ok"
+            logger.info(f"{name}: {status} {result['plan']}")
+            if result["full_scan"]:
+                regressions.append(name)
+        if regressions:
+            logger.error(f"풀 스캔으로 실행되는 핫 쿼리: {', '.join(regressions)}")
+            return 1
+        return 0
+
+    if command == "verify":
+        try:
+            ensure_schema_current()
+        except SchemaOutdatedError as e:
+            logger.error(str(e))
+            return 1
+        return 0
+
+    logger.error(f"알 수 없는 명령: {command} (upgrade | status | check | verify)")
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
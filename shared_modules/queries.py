@@ -3,17 +3,22 @@
 Fully qualified path 사용으로 SQLAlchemy 충돌 완전 해결
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 from datetime import datetime
+from typing import NamedTuple, Optional, List, Dict, Any, Iterator
+import base64
+import json
 import logging
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import bindparam, text
-from shared_modules.database import DatabaseManager
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy import bindparam, text, insert, update, select, func, and_, or_, true, union_all
+from shared_modules.database import get_db_manager, get_read_engine
+from shared_modules.env_config import get_config
+from shared_modules.user_cache import get_user_cache, invalidate_user_cache
 
 # SQLAlchemy 충돌 방지를 위해 fully qualified import 사용
 import shared_modules.db_models as db_models
 
-engine = DatabaseManager().engine
+engine = get_db_manager().engine
 logger = logging.getLogger(__name__)
 
 # -------------------
@@ -38,6 +43,7 @@ def create_user_social(db: Session, provider: str, social_id: str, email: str,
         db.add(user)
         db.commit()
         db.refresh(user)
+        invalidate_user_cache(user.user_id)
         return user
     except Exception as e:
         logger.error(f"[create_user_social 오류] {e}", exc_info=True)
@@ -77,6 +83,7 @@ def update_user_tokens(db: Session, user_id: int, access_token: str, refresh_tok
             if refresh_token:
                 user.refresh_token = refresh_token
             db.commit()
+            invalidate_user_cache(user_id, "user")
             return True
         return False
     except Exception as e:
@@ -91,6 +98,7 @@ def update_user_experience(db: Session, user_id: int, experience: bool) -> bool:
         if user:
             user.experience = experience
             db.commit()
+            invalidate_user_cache(user_id, "user")
             return True
         return False
     except Exception as e:
@@ -200,54 +208,44 @@ def ensure_test_user(db: Session, user_id: int):
         return None
 
 def create_conversation(db: Session, user_id: int):
-    """대화 생성 - 자세한 로깅 포함"""
+    """
+    대화 생성
+
+    INSERT 한 번으로 생성하고 lastrowid 로 받은 PK 로 객체를 구성한다.
+    사용자 존재 여부는 FK 제약으로, 연결 상태는 pool_pre_ping 으로 확인한다.
+    """
     try:
-        logger.info(f"[create_conversation] 시작 - user_id: {user_id}")
-        
-        # 0. 데이터베이스 연결 상태 확인
-        if not check_database_connection(db):
-            logger.error("[create_conversation] 데이터베이스 연결 실패")
-            return None
-        
-        # 1. 사용자 존재 여부 확인 및 자동 생성
-        user = ensure_test_user(db, user_id)
-        if not user:
-            logger.error(f"[create_conversation] 사용자 생성/조회 실패 - user_id: {user_id}")
-            return None
-        
-        # 실제 사용할 user_id (새로 생성된 경우 다를 수 있음)
-        actual_user_id = user.user_id
-        logger.info(f"[create_conversation] 사용자 확인됨: {user.email} (ID: {actual_user_id})")
-        
-        # 2. Conversation 객체 생성
+        started_at = datetime.now()
+        result = db.execute(
+            insert(db_models.Conversation).values(
+                user_id=user_id,
+                started_at=started_at,
+                is_visible=True
+            )
+        )
+        db.commit()
+
         conversation = db_models.Conversation(
-            user_id=actual_user_id,
-            started_at=datetime.now(),
+            conversation_id=result.inserted_primary_key[0],
+            user_id=user_id,
+            started_at=started_at,
+            ended_at=None,
             is_visible=True
         )
-        logger.info(f"[create_conversation] Conversation 객체 생성됨")
-        
-        # 3. 데이터베이스에 추가
+        # 추가 SELECT 없이 세션에 영속 객체로 연결
+        make_transient_to_detached(conversation)
         db.add(conversation)
-        logger.info(f"[create_conversation] DB에 추가됨")
-        
-        # 4. 커밋
-        db.commit()
-        logger.info(f"[create_conversation] 커밋 완료")
-        
-        # 5. 새로고침
-        db.refresh(conversation)
-        logger.info(f"[create_conversation] 새로고침 완료 - conversation_id: {conversation.conversation_id}")
-        
+
+        logger.debug(f"[create_conversation] user_id={user_id}, conversation_id={conversation.conversation_id}")
         return conversation
-        
+
+    except IntegrityError as e:
+        logger.error(f"[create_conversation] 존재하지 않는 사용자 - user_id: {user_id} ({e.orig})")
+        db.rollback()
+        return None
     except Exception as e:
-        logger.error(f"[create_conversation 상세 오류] {type(e).__name__}: {e}", exc_info=True)
-        try:
-            db.rollback()
-            logger.info(f"[create_conversation] 롤백 완료")
-        except Exception as rollback_error:
-            logger.error(f"[create_conversation] 롤백 실패: {rollback_error}")
+        logger.error(f"[create_conversation 오류] {type(e).__name__}: {e}", exc_info=True)
+        db.rollback()
         return None
 
 def get_conversation_by_id(db: Session, conversation_id: int):
@@ -269,6 +267,39 @@ def get_user_conversations(db: Session, user_id: int, visible_only: bool = True)
         logger.error(f"[get_user_conversations 오류] {e}", exc_info=True)
         return []
 
+def get_user_conversations_page(db: Session, user_id: int, limit: int = 20, cursor: str = None,
+                                visible_only: bool = True) -> Dict[str, Any]:
+    """
+    사용자 대화 목록 keyset 페이지 조회 (started_at 최신순)
+
+    Returns:
+        Dict: conversations (Conversation 리스트), next_cursor, has_more
+    """
+    try:
+        Conversation = db_models.Conversation
+        query = db.query(Conversation).filter(Conversation.user_id == user_id)
+        if visible_only:
+            query = query.filter(Conversation.is_visible == True)
+        if cursor:
+            query = query.filter(_keyset_before(Conversation.started_at, Conversation.conversation_id, cursor))
+
+        rows = query.order_by(
+            Conversation.started_at.desc(), Conversation.conversation_id.desc()
+        ).limit(limit + 1).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return {
+            "conversations": rows,
+            "next_cursor": encode_cursor(rows[-1].started_at, rows[-1].conversation_id) if has_more else None,
+            "has_more": has_more
+        }
+    except ValueError:
+        raise
+    except Exception as e:
+        logger.error(f"[get_user_conversations_page 오류] {e}", exc_info=True)
+        return {"conversations": [], "next_cursor": None, "has_more": False}
+
 def end_conversation(db: Session, conversation_id: int) -> bool:
     try:
         conversation = db.query(db_models.Conversation).filter(
@@ -320,22 +351,116 @@ def get_conversation_messages(db: Session, conversation_id: int, limit: int = 10
         logger.error(f"[get_conversation_messages 오류] {e}", exc_info=True)
         return []
 
-def get_recent_messages(db: Session, conversation_id: int, limit: int = 10):
+class MessageRow(NamedTuple):
+    """메시지 조회 결과 (ORM 인스턴스 대신 필요한 컬럼만 담는 경량 튜플)"""
+    message_id: int
+    conversation_id: int
+    sender_type: str
+    agent_type: Optional[str]
+    content: str
+    created_at: Optional[datetime]
+
+
+_MESSAGE_COLUMNS = (
+    db_models.Message.message_id,
+    db_models.Message.conversation_id,
+    db_models.Message.sender_type,
+    db_models.Message.agent_type,
+    db_models.Message.content,
+    db_models.Message.created_at,
+)
+
+
+def _message_tables():
+    """메시지 조회 대상 테이블 (보관이 활성화되면 message_archive 포함)"""
+    if get_config().MESSAGE_ARCHIVE_ENABLED:
+        return (db_models.Message.__table__, db_models.MessageArchive.__table__)
+    return (db_models.Message.__table__,)
+
+
+def _message_select(table, *criteria):
+    return select(*[table.c[column.key] for column in _MESSAGE_COLUMNS]).where(*criteria)
+
+
+def _query_message_tail(db: Session, conversation_id: int, limit: int, before_id: int = None):
+    """
+    대화의 마지막 limit 개 메시지를 message_id 역순으로 조회
+
+    (conversation_id, message_id) 범위만 읽고 LIMIT 으로 끊기 때문에
+    대화 길이와 관계없이 조회 비용이 일정하다.
+    보관이 활성화되면 테이블별로 같은 범위를 읽어 UNION ALL 후 다시 LIMIT 한다.
+    (보관 메시지는 원래 message_id 를 유지하므로 커서가 그대로 동작한다)
+    """
+    branches = []
+    for table in _message_tables():
+        criteria = [table.c.conversation_id == conversation_id]
+        if before_id is not None:
+            criteria.append(table.c.message_id < before_id)
+        branches.append(
+            _message_select(table, *criteria).order_by(table.c.message_id.desc()).limit(limit)
+        )
+
+    if len(branches) == 1:
+        statement = branches[0]
+    else:
+        merged = union_all(*[select(branch.subquery()) for branch in branches]).subquery()
+        statement = select(merged).order_by(merged.c.message_id.desc()).limit(limit)
+
+    rows = db.execute(statement).all()
+    return [MessageRow(*row) for row in rows]
+
+
+def get_message_tail(db: Session, conversation_id: int, limit: int = 6, before_id: int = None) -> List[MessageRow]:
+    """
+    대화의 최근 메시지를 시간순(오래된 것 → 최신)으로 조회
+
+    Args:
+        limit: 가져올 메시지 수
+        before_id: 이 message_id 보다 이전 메시지만 조회 (keyset 페이지네이션 커서)
+    """
     try:
-        return db.query(db_models.Message).filter(
-            db_models.Message.conversation_id == conversation_id
-        ).order_by(db_models.Message.created_at.desc()).limit(limit).all()
+        rows = _query_message_tail(db, conversation_id, limit, before_id)
+        rows.reverse()
+        return rows
+    except Exception as e:
+        logger.error(f"[get_message_tail 오류] {e}", exc_info=True)
+        return []
+
+
+def get_messages_page(db: Session, conversation_id: int, limit: int = 50, before_id: int = None) -> Dict[str, Any]:
+    """
+    메시지 keyset 페이지 조회 (최신 페이지부터 과거 방향으로)
+
+    Returns:
+        Dict: messages (시간순 MessageRow 리스트), next_cursor (다음 페이지 before_id), has_more
+    """
+    try:
+        rows = _query_message_tail(db, conversation_id, limit + 1, before_id)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        rows.reverse()
+        return {
+            "messages": rows,
+            "next_cursor": rows[0].message_id if has_more and rows else None,
+            "has_more": has_more
+        }
+    except Exception as e:
+        logger.error(f"[get_messages_page 오류] {e}", exc_info=True)
+        return {"messages": [], "next_cursor": None, "has_more": False}
+
+
+def get_recent_messages(db: Session, conversation_id: int, limit: int = 10) -> List[MessageRow]:
+    """최근 메시지 조회 (최신순, 기존 호출부 호환을 위해 역순 유지)"""
+    try:
+        return _query_message_tail(db, conversation_id, limit)
     except Exception as e:
         logger.error(f"[get_recent_messages 오류] {e}", exc_info=True)
         return []
 
 def get_conversation_history(db: Session, conversation_id: int, limit=6):
     try:
-        messages = db.query(db_models.Message).filter(
-            db_models.Message.conversation_id == conversation_id
-        ).order_by(db_models.Message.message_id).all()
         history = []
-        for m in messages[-limit:]:
+        for m in get_message_tail(db, conversation_id, limit):
             prefix = "Human" if m.sender_type == "USER" else "AI"
             history.append(f"{prefix}: {m.content}")
         return "\n".join(history)
@@ -343,6 +468,86 @@ def get_conversation_history(db: Session, conversation_id: int, limit=6):
         logger.error(f"[get_conversation_history 오류] {e}", exc_info=True)
         return ""
 
+def _normalize_sender_type(sender_type: str) -> str:
+    """sender_type 을 DDL 제약조건 값('USER' / 'AGENT')으로 변환"""
+    if sender_type.lower() == 'user':
+        return 'USER'
+    if sender_type.lower() == 'agent':
+        return 'AGENT'
+    return sender_type
+
+def create_messages_bulk(db: Session, messages: List[Dict[str, Any]]) -> int:
+    """
+    메시지 다건 삽입 (단일 executemany + 커밋 1회)
+
+    Args:
+        messages: conversation_id, sender_type, content, agent_type(선택) 를 담은 dict 리스트
+
+    Returns:
+        int: 삽입한 메시지 수 (실패 시 0)
+    """
+    if not messages:
+        return 0
+
+    try:
+        rows = [
+            {
+                "conversation_id": message["conversation_id"],
+                "sender_type": _normalize_sender_type(message["sender_type"]),
+                "agent_type": message.get("agent_type"),
+                "content": message["content"]
+            }
+            for message in messages
+        ]
+        db.execute(insert(db_models.Message), rows)
+        db.commit()
+        return len(rows)
+    except Exception as e:
+        logger.error(f"[create_messages_bulk 오류] {e}", exc_info=True)
+        db.rollback()
+        return 0
+
+def get_recent_messages_for_conversations(db: Session, conversation_ids: List[int],
+                                          limit: int = 10) -> Dict[int, List[MessageRow]]:
+    """
+    여러 대화의 최근 메시지를 한 번의 쿼리로 조회
+
+    ROW_NUMBER() 윈도우 함수로 대화별 최신 limit 개만 남긴다. (MySQL 8+, SQLite 3.25+)
+
+    Returns:
+        Dict[int, List[MessageRow]]: 대화 ID → 시간순 메시지 (메시지가 없는 대화는 빈 리스트)
+    """
+    result: Dict[int, List[MessageRow]] = {conversation_id: [] for conversation_id in conversation_ids}
+    if not conversation_ids:
+        return result
+
+    try:
+        branches = [
+            _message_select(table, table.c.conversation_id.in_(list(result)))
+            for table in _message_tables()
+        ]
+        source = (branches[0] if len(branches) == 1 else union_all(*branches)).subquery()
+        ranked = select(
+            *[source.c[column.key] for column in _MESSAGE_COLUMNS],
+            func.row_number().over(
+                partition_by=source.c.conversation_id,
+                order_by=source.c.message_id.desc()
+            ).label("rn")
+        ).subquery()
+
+        rows = db.execute(
+            select(*[ranked.c[column.key] for column in _MESSAGE_COLUMNS])
+            .where(ranked.c.rn <= limit)
+            .order_by(ranked.c.conversation_id, ranked.c.message_id)
+        ).all()
+
+        for row in rows:
+            result[row.conversation_id].append(MessageRow(*row))
+        return result
+    except Exception as e:
+        logger.error(f"[get_recent_messages_for_conversations 오류] {e}", exc_info=True)
+        return result
+
 # -------------------
 # Feedback 관련 함수 (새로 추가)
 # -------------------
@@ -415,15 +620,41 @@ def save_or_update_phq9_result(db: Session, user_id: int, score: int, level: int
             )
             db.add(result)
         db.commit()
+        invalidate_user_cache(user_id, "phq9")
         return result
     except Exception as e:
         logger.error(f"[save_or_update_phq9_result 오류] {e}", exc_info=True)
         db.rollback()
         return None
 
-def get_latest_phq9_by_user(db: Session, user_id: int):
+class PHQ9Row(NamedTuple):
+    """PHQ-9 결과 (캐시 가능한 경량 튜플)"""
+    user_id: int
+    score: int
+    level: Optional[int]
+    updated_at: Optional[datetime]
+
+
+def _load_latest_phq9(db: Session, user_id: int) -> Optional[PHQ9Row]:
+    row = db.query(
+        db_models.PHQ9Result.user_id,
+        db_models.PHQ9Result.score,
+        db_models.PHQ9Result.level,
+        db_models.PHQ9Result.updated_at
+    ).filter_by(user_id=user_id).first()
+    return PHQ9Row(*row) if row else None
+
+
+def get_latest_phq9_by_user(db: Session, user_id: int) -> Optional[PHQ9Row]:
+    """
+    최근 PHQ-9 결과 조회 (사용자 캐시 경유, save_or_update_phq9_result 에서 무효화)
+
+    무효화가 모든 프로세스에 전달되는 Redis 저장소에서만 캐시되고, 메모리 저장소에서는
+    USER_CACHE_PHQ9_MEMORY_TTL (기본 0) 동안만 캐시된다.
+    """
     try:
-        return db.query(db_models.PHQ9Result).filter_by(user_id=user_id).first()
+        row = get_user_cache().get_or_load("phq9", user_id, lambda: _load_latest_phq9(db, user_id))
+        return PHQ9Row(*row) if row else None
     except Exception as e:
         logger.error(f"[get_latest_phq9_by_user 오류] {e}", exc_info=True)
         return None
@@ -664,6 +895,48 @@ def get_pending_tasks(db: Session, limit: int = 100):
         logger.error(f"[get_pending_tasks 오류] {e}", exc_info=True)
         return []
 
+def get_automation_tasks_page(db: Session, user_id: int = None, status: str = None,
+                              limit: int = 50, after_id: int = None) -> Dict[str, Any]:
+    """
+    자동화 작업 목록 keyset 페이지 조회 (task_id 최신순)
+
+    Args:
+        after_id: 이전 페이지의 next_cursor (이 task_id 보다 오래된 작업만 조회)
+
+    Returns:
+        Dict: tasks (dict 리스트), next_cursor, has_more
+    """
+    try:
+        AutomationTask = db_models.AutomationTask
+        query = db.query(
+            AutomationTask.task_id,
+            AutomationTask.user_id,
+            AutomationTask.task_type,
+            AutomationTask.title,
+            AutomationTask.status,
+            AutomationTask.scheduled_at,
+            AutomationTask.executed_at,
+            AutomationTask.created_at
+        )
+        if user_id is not None:
+            query = query.filter(AutomationTask.user_id == user_id)
+        if status:
+            query = query.filter(AutomationTask.status == status.upper())
+        if after_id is not None:
+            query = query.filter(AutomationTask.task_id < after_id)
+
+        rows = query.order_by(AutomationTask.task_id.desc()).limit(limit + 1).all()
+        has_more = len(rows) > limit
+        tasks = [dict(row._mapping) for row in rows[:limit]]
+        return {
+            "tasks": tasks,
+            "next_cursor": tasks[-1]["task_id"] if has_more else None,
+            "has_more": has_more
+        }
+    except Exception as e:
+        logger.error(f"[get_automation_tasks_page 오류] {e}", exc_info=True)
+        return {"tasks": [], "next_cursor": None, "has_more": False}
+
 def update_task_status(db: Session, task_id: int, status: str, executed_at: datetime = None) -> bool:
     """작업 상태 업데이트"""
     try:
@@ -687,9 +960,76 @@ def update_task_status(db: Session, task_id: int, status: str, executed_at: date
         db.rollback()
         return False
 
+def bulk_update_task_status(db: Session, task_ids: List[int], status: str, executed_at: datetime = None) -> int:
+    """
+    여러 작업의 상태를 UPDATE 한 번으로 변경
+
+    Returns:
+        int: 변경된 작업 수 (실패 시 0)
+    """
+    if not task_ids:
+        return 0
+
+    try:
+        if status not in ['PENDING', 'RUNNING', 'COMPLETED', 'FAILED']:
+            raise ValueError("Invalid status")
+
+        values = {"status": status}
+        if executed_at:
+            values["executed_at"] = executed_at
+        elif status in ['COMPLETED', 'FAILED']:
+            values["executed_at"] = datetime.now()
+
+        result = db.execute(
+            update(db_models.AutomationTask)
+            .where(db_models.AutomationTask.task_id.in_(list(task_ids)))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount
+    except Exception as e:
+        logger.error(f"[bulk_update_task_status 오류] {e}", exc_info=True)
+        db.rollback()
+        return 0
+
 # -------------------
 # 유틸리티 함수들
 # -------------------
+def encode_cursor(*values) -> str:
+    """keyset 페이지네이션 커서 인코딩 (정렬 키 값 → 불투명 문자열)"""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+def decode_cursor(cursor: str, *types) -> list:
+    """encode_cursor 로 만든 커서 디코딩 (types 에 datetime 을 주면 해당 위치를 datetime 으로 복원)"""
+    values = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+    if len(values) != len(types):
+        raise ValueError("잘못된 커서입니다")
+    return [
+        datetime.fromisoformat(value) if value_type is datetime and value is not None else value
+        for value, value_type in zip(values, types)
+    ]
+
+def _keyset_before(sort_column, id_column, cursor: Optional[str]):
+    """(sort_column DESC, id_column DESC) 정렬에서 커서 이전 행 조건"""
+    sort_value, id_value = decode_cursor(cursor, datetime, int)
+    return or_(sort_column < sort_value, and_(sort_column == sort_value, id_column < id_value))
+
+def stream_rows(statement, params: Dict[str, Any] = None, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+    """
+    서버 사이드 커서로 조회 결과를 한 행씩 전달 (관리자 내보내기용)
+
+    stream_results 로 전체 결과를 메모리에 올리지 않으며, 읽기 전용 복제본을 사용한다.
+    """
+    with get_read_engine().connect() as conn:
+        result = conn.execution_options(stream_results=True, max_row_buffer=batch_size).execute(
+            statement, params or {}
+        )
+        for partition in result.mappings().partitions(batch_size):
+            for row in partition:
+                yield dict(row)
+
 def handle_db_error(e: Exception, operation: str):
     logger.error(f"[{operation} 오류] {type(e).__name__}: {e}", exc_info=True)
     if isinstance(e, SQLAlchemyError):
@@ -724,20 +1064,25 @@ def insert_user_raw(email: str, nickname: str, provider: str, social_id: str,
                     "refresh_token": refresh_token
                 }
             )
+            invalidate_user_cache(result.lastrowid)
             return result.lastrowid
     except SQLAlchemyError as e:
         logger.error(f"Error inserting user: {e}")
         return -1
 
+def _load_business_type(user_id: int) -> str:
+    with engine.connect() as conn:
+        result = conn.execute(
+            text("SELECT business_type FROM user WHERE user_id = :user_id"),
+            {"user_id": user_id}
+        )
+        row = result.fetchone()
+        return row.business_type if row else "common"
+
 def get_business_type(user_id: int) -> str:
+    """사용자 업종 조회 (사용자 캐시 경유)"""
     try:
-        with engine.connect() as conn:
-            result = conn.execute(
-                text("SELECT business_type FROM user WHERE user_id = :user_id"),
-                {"user_id": user_id}
-            )
-            row = result.fetchone()
-            return row.business_type if row else "common"
+        return get_user_cache().get_or_load("business_type", user_id, lambda: _load_business_type(user_id))
     except Exception as e:
         return handle_db_error(e, "get_business_type") or "common"
 
@@ -767,7 +1112,7 @@ def get_user_by_email_raw(email: str) -> dict:
 
 def get_all_users() -> list:
     try:
-        with engine.connect() as conn:
+        with get_read_engine().connect() as conn:
             result = conn.execute(
                 text("SELECT * FROM user")
             )
@@ -775,6 +1120,40 @@ def get_all_users() -> list:
     except Exception as e:
         return handle_db_error(e, "get_all_users") or []
 
+def get_users_page(limit: int = 100, after_id: int = None) -> Dict[str, Any]:
+    """
+    사용자 목록 keyset 페이지 조회 (user_id 순)
+
+    Returns:
+        Dict: users (dict 리스트), next_cursor (다음 페이지 after_id), has_more
+    """
+    try:
+        with get_read_engine().connect() as conn:
+            result = conn.execute(
+                text("""
+                    SELECT * FROM user
+                    WHERE user_id > :after_id
+                    ORDER BY user_id
+                    LIMIT :limit
+                """),
+                {"after_id": after_id or 0, "limit": limit + 1}
+            )
+            users = [dict(row._mapping) for row in result]
+        has_more = len(users) > limit
+        users = users[:limit]
+        return {
+            "users": users,
+            "next_cursor": users[-1]["user_id"] if has_more else None,
+            "has_more": has_more
+        }
+    except Exception as e:
+        logger.error(f"[get_users_page 오류] {e}", exc_info=True)
+        return {"users": [], "next_cursor": None, "has_more": False}
+
+def stream_all_users(batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+    """전체 사용자를 서버 사이드 커서로 한 행씩 조회"""
+    return stream_rows(text("SELECT * FROM user ORDER BY user_id"), batch_size=batch_size)
+
 def insert_message_raw(conversation_id: int, sender_type: str, content: str, agent_type: str = None) -> bool:
     """Raw SQL을 사용한 메시지 삽입 (DDL 제약조건 적용)"""
     try:
@@ -871,9 +1250,9 @@ def get_template_by_title(title: str) -> dict:
         return handle_db_error(e, "get_template_by_title") or {}
 
 def get_templates_by_type(template_type: str) -> list:
-    """템플릿 타입별 조회 함수"""
+    """템플릿 타입별 조회 함수 (읽기 전용 복제본 사용)"""
     try:
-        with engine.connect() as conn:
+        with get_read_engine().connect() as conn:
             if template_type == "전체":
                 result = conn.execute(
                     text("SELECT * FROM template_message ORDER BY created_at DESC")
@@ -896,6 +1275,49 @@ def get_templates_by_type(template_type: str) -> list:
         logger.error(f"❌ get_templates_by_type 오류: {e}")
         return handle_db_error(e, "get_templates_by_type") or []
 
+def _template_type_clause(template_type: str):
+    if template_type == "전체":
+        return true()
+    return db_models.TemplateMessage.template_type == template_type
+
+def get_templates_page(template_type: str, limit: int = 50, cursor: str = None) -> Dict[str, Any]:
+    """
+    템플릿 타입별 keyset 페이지 조회 (created_at 최신순)
+
+    Returns:
+        Dict: templates (dict 리스트), next_cursor, has_more
+    """
+    TemplateMessage = db_models.TemplateMessage
+    statement = select(TemplateMessage.__table__).where(_template_type_clause(template_type))
+    if cursor:
+        statement = statement.where(_keyset_before(TemplateMessage.created_at, TemplateMessage.template_id, cursor))
+    statement = statement.order_by(
+        TemplateMessage.created_at.desc(), TemplateMessage.template_id.desc()
+    ).limit(limit + 1)
+
+    try:
+        with get_read_engine().connect() as conn:
+            templates = [dict(row._mapping) for row in conn.execute(statement)]
+        has_more = len(templates) > limit
+        templates = templates[:limit]
+        last = templates[-1] if templates else None
+        return {
+            "templates": templates,
+            "next_cursor": encode_cursor(last["created_at"], last["template_id"]) if has_more else None,
+            "has_more": has_more
+        }
+    except Exception as e:
+        logger.error(f"[get_templates_page 오류] {e}", exc_info=True)
+        return {"templates": [], "next_cursor": None, "has_more": False}
+
+def stream_templates_by_type(template_type: str, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+    """템플릿 타입별 전체 목록을 서버 사이드 커서로 한 행씩 조회"""
+    TemplateMessage = db_models.TemplateMessage
+    statement = select(TemplateMessage.__table__).where(
+        _template_type_clause(template_type)
+    ).order_by(TemplateMessage.created_at.desc(), TemplateMessage.template_id.desc())
+    return stream_rows(statement, batch_size=batch_size)
+
 def update_template(template_id: int, **kwargs) -> bool:
     try:
         valid_keys = {"template_type", "channel_type", "title", "content", "content_type"}
@@ -0,0 +1,222 @@
+"""
+사용자 컨텍스트 캐시 공통 모듈
+business_type / 사용자 프로필 / PHQ-9 처럼 자주 읽고 드물게 바뀌는 사용자 데이터를
+TTL 기반 read-through 캐시로 제공한다.
+
+USER_CACHE_REDIS_URL 이 설정되고 redis 패키지가 있으면 프로세스 간에 공유되는 Redis 를,
+아니면 프로세스 내부 LRU 메모리를 저장소로 사용한다.
+
+메모리 저장소의 무효화는 같은 프로세스에만 적용된다. 여러 워커 프로세스로 운영하면 다른 프로세스는
+TTL 이 끝날 때까지 이전 값을 반환하므로, 최신 값이 중요한 PHQ-9 는 메모리 저장소에서 기본적으로
+캐시하지 않는다. (USER_CACHE_PHQ9_MEMORY_TTL 로 단일 프로세스 환경에서만 켤 것)
+"""
+
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from shared_modules.env_config import get_config
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 캐시 항목 종류 (쓰기 함수는 해당 종류를 무효화해야 한다)
+USER_CACHE_KINDS = ("business_type", "user", "phq9")
+
+
+def _encode(value: Any) -> str:
+    def default(obj):
+        if isinstance(obj, datetime):
+            return {"$dt": obj.isoformat()}
+        raise TypeError(f"직렬화할 수 없는 값: {type(obj).__name__}")
+    return json.dumps({"v": value}, default=default, ensure_ascii=False)
+
+
+def _decode(raw: str) -> Any:
+    def object_hook(obj):
+        if len(obj) == 1 and "$dt" in obj:
+            return datetime.fromisoformat(obj["$dt"])
+        return obj
+    return json.loads(raw, object_hook=object_hook)["v"]
+
+
+class UserContextCache:
+    """사용자 단위 read-through 캐시 (TTL + 명시적 무효화)"""
+
+    def __init__(self, ttl: int = 300, max_entries: int = 10000, redis_url: str = None,
+                 key_prefix: str = "user_ctx", memory_ttls: Dict[str, int] = None):
+        """
+        Args:
+            memory_ttls: 메모리 저장소일 때 종류별 TTL (0 이하면 캐시하지 않고 매번 loader 호출)
+        """
+        self.ttl = ttl
+        self.memory_ttls = memory_ttls or {}
+        self.max_entries = max_entries
+        self.key_prefix = key_prefix
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {kind: {"hits": 0, "misses": 0, "bypassed": 0} for kind in USER_CACHE_KINDS}
+        self._invalidations = 0
+        self._redis = None
+
+        if redis_url:
+            if not REDIS_AVAILABLE:
+                logger.warning("redis 패키지가 없어 사용자 캐시를 프로세스 메모리로 사용합니다")
+            else:
+                try:
+                    self._redis = redis.Redis.from_url(redis_url, socket_timeout=0.5)
+                    self._redis.ping()
+                except Exception as e:
+                    logger.warning(f"Redis 연결 실패, 사용자 캐시를 프로세스 메모리로 사용합니다: {e}")
+                    self._redis = None
+
+    @property
+    def backend(self) -> str:
+        return "redis" if self._redis is not None else "memory"
+
+    def get_ttl(self, kind: str) -> int:
+        """종류별 TTL (Redis 는 공통 TTL, 메모리 저장소는 memory_ttls 우선)"""
+        if self._redis is None and kind in self.memory_ttls:
+            return self.memory_ttls[kind]
+        return self.ttl
+
+    def _key(self, kind: str, user_id: int) -> str:
+        return f"{self.key_prefix}:{kind}:{user_id}"
+
+    def _lookup(self, key: str):
+        """(found, value) 반환"""
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(key)
+                return (True, _decode(raw)) if raw is not None else (False, None)
+            except Exception as e:
+                logger.warning(f"사용자 캐시 조회 실패 ({key}): {e}")
+                return False, None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def _store(self, key: str, value: Any, ttl: int):
+        if self._redis is not None:
+            try:
+                self._redis.setex(key, ttl, _encode(value))
+            except Exception as e:
+                logger.warning(f"사용자 캐시 저장 실패 ({key}): {e}")
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _record(self, kind: str, hit: Optional[bool]):
+        """hit: True 적중 / False 미스 / None 캐시 우회"""
+        with self._lock:
+            stats = self._stats.setdefault(kind, {"hits": 0, "misses": 0, "bypassed": 0})
+            stats["bypassed" if hit is None else "hits" if hit else "misses"] += 1
+
+    def get_or_load(self, kind: str, user_id: int, loader: Callable[[], Any]) -> Any:
+        """
+        캐시된 값을 반환하고 없으면 loader 결과를 저장 후 반환
+
+        loader 가 예외를 던지면 캐시하지 않고 그대로 전파한다. (None 결과는 캐시된다)
+        TTL 이 0 이하인 종류는 캐시를 거치지 않는다.
+        """
+        ttl = self.get_ttl(kind)
+        if ttl <= 0:
+            self._record(kind, None)
+            return loader()
+
+        key = self._key(kind, user_id)
+        found, value = self._lookup(key)
+        self._record(kind, found)
+        if found:
+            return value
+
+        value = loader()
+        self._store(key, value, ttl)
+        return value
+
+    def invalidate(self, user_id: int, kinds: Iterable[str] = None):
+        """사용자 캐시 항목 무효화 (kinds 미지정 시 전체 종류)"""
+        keys = [self._key(kind, user_id) for kind in (kinds or USER_CACHE_KINDS)]
+
+        if self._redis is not None:
+            try:
+                self._redis.delete(*keys)
+            except Exception as e:
+                logger.warning(f"사용자 캐시 무효화 실패 (user_id={user_id}): {e}")
+
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+            self._invalidations += 1
+
+    def clear(self):
+        """프로세스 메모리 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """종류별 적중률 통계"""
+        with self._lock:
+            kinds = {kind: dict(stats) for kind, stats in self._stats.items()}
+            size = len(self._entries)
+            invalidations = self._invalidations
+
+        total_hits = sum(stats["hits"] for stats in kinds.values())
+        total = total_hits + sum(stats["misses"] for stats in kinds.values())
+        for stats in kinds.values():
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+
+        return {
+            "backend": self.backend,
+            "ttl": self.ttl,
+            "ttl_by_kind": {kind: self.get_ttl(kind) for kind in USER_CACHE_KINDS},
+            "size": size,
+            "invalidations": invalidations,
+            "hit_rate": round(total_hits / total, 4) if total else 0.0,
+            "kinds": kinds
+        }
+
+
+# 전역 사용자 캐시 인스턴스
+_global_user_cache: Optional[UserContextCache] = None
+
+
+def get_user_cache() -> UserContextCache:
+    """전역 사용자 컨텍스트 캐시 반환 (싱글톤)"""
+    global _global_user_cache
+    if _global_user_cache is None:
+        config = get_config()
+        _global_user_cache = UserContextCache(
+            ttl=config.USER_CACHE_TTL,
+            max_entries=config.USER_CACHE_SIZE,
+            redis_url=config.USER_CACHE_REDIS_URL,
+            memory_ttls={"phq9": config.USER_CACHE_PHQ9_MEMORY_TTL}
+        )
+    return _global_user_cache
+
+
+def invalidate_user_cache(user_id: int, *kinds: str):
+    """사용자 데이터 쓰기 후 호출하는 무효화 훅"""
+    get_user_cache().invalidate(user_id, kinds or None)
@@ -12,8 +12,10 @@ from pathlib import Path
 from shared_modules import (
     create_conversation,
     get_conversation_by_id,
-    get_session_context
+    get_session_context,
+    get_config
 )
+from shared_modules.message_archive import rehydrate_conversation
 
 def get_or_create_conversation_session(user_id: int, conversation_id: int = None) -> Dict[str, Any]:
     """통일된 대화 세션 조회 또는 생성 로직"""
@@ -22,6 +24,8 @@ def get_or_create_conversation_session(user_id: int, conversation_id: int = None
             if conversation_id:
                 conversation = get_conversation_by_id(db, conversation_id)
                 if conversation and conversation.user_id == user_id:
+                    if conversation.archived_at is not None and get_config().MESSAGE_ARCHIVE_ENABLED:
+                        rehydrate_conversation(db, conversation_id)
                     print(f"🔄 기존 대화 세션 사용: {conversation_id}")
                     return {
                         "conversation_id": conversation.conversation_id,
@@ -0,0 +1,326 @@
+"""
+읽기 전용 벡터 스냅샷 모듈
+Chroma 컬렉션을 양자화(int8 / float16)된 벡터 파일과 ID → 문서/메타데이터 테이블로 내보내고,
+memory-map 으로 열어 NumPy 로 검색한다.
+
+같은 호스트의 여러 에이전트 프로세스가 OS 페이지 캐시를 공유하도록 모든 파일은 mmap 으로만 읽는다.
+init 스크립트에서도 단독으로 import 할 수 있도록 shared_modules 중 metadata_index 에만 의존한다.
+(패키지로 import 하면 상대 경로, shared_modules 를 sys.path 에 추가한 스크립트에서는 모듈 이름으로 import)
+"""
+
+import os
+import json
+import mmap
+import logging
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+
+import numpy as np
+
+try:
+    from .metadata_index import MetadataIndex, normalize_metadata, bump_collection_version
+except ImportError:
+    from metadata_index import MetadataIndex, normalize_metadata, bump_collection_version
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+SUPPORTED_DTYPES = ("int8", "float16", "float32")
+
+# 전체 스캔 시 한 번에 역양자화할 행 수 (임시 메모리 상한)
+SCAN_BLOCK_ROWS = 65536
+
+
+def compute_distances(query: np.ndarray, dots: np.ndarray, norms: np.ndarray, space: str = "l2") -> np.ndarray:
+    """
+    내적과 제곱 노름으로 Chroma 와 같은 거리 계산
+
+    Args:
+        query: 질의 벡터
+        dots: 대상 벡터들과 질의 벡터의 내적
+        norms: 대상 벡터들의 제곱 노름
+        space: Chroma hnsw:space ("l2", "cosine", "ip")
+
+    Returns:
+        np.ndarray: 거리 (작을수록 유사)
+    """
+    if space == "cosine":
+        denom = np.sqrt(norms) * float(np.linalg.norm(query))
+        denom[denom == 0] = 1.0
+        return 1.0 - dots / denom
+    if space == "ip":
+        return 1.0 - dots
+    # l2 (Chroma 기본값: 제곱 거리)
+    return np.maximum(norms + float(query @ query) - 2.0 * dots, 0.0)
+
+
+def _write_snapshot_files(
+    output_dir: str,
+    ids: List[str],
+    embeddings: np.ndarray,
+    documents: List[str],
+    metadatas: List[Dict[str, Any]],
+    dtype: str
+):
+    """스냅샷 파일 작성 (vectors / scales / norms / records / offsets)"""
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    norms = np.einsum("ij,ij->i", vectors, vectors).astype(np.float32)
+
+    if dtype == "int8":
+        # 행 단위 대칭 양자화: v ≈ q * scale
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+        np.save(os.path.join(output_dir, "scales.npy"), scales.astype(np.float32))
+    else:
+        quantized = vectors.astype(dtype)
+
+    np.save(os.path.join(output_dir, "vectors.npy"), quantized)
+    np.save(os.path.join(output_dir, "norms.npy"), norms)
+
+    offsets = np.zeros(len(ids) + 1, dtype=np.uint64)
+    with open(os.path.join(output_dir, "records.jsonl"), "wb") as f:
+        for i, (chunk_id, document, metadata) in enumerate(zip(ids, documents, metadatas)):
+            line = json.dumps(
+                {"id": chunk_id, "document": document, "metadata": metadata},
+                ensure_ascii=False
+            ).encode("utf-8") + b"\n"
+            f.write(line)
+            offsets[i + 1] = offsets[i] + len(line)
+    np.save(os.path.join(output_dir, "offsets.npy"), offsets)
+
+    with open(os.path.join(output_dir, "ids.json"), "w", encoding="utf-8") as f:
+        json.dump(ids, f, ensure_ascii=False)
+
+
+def export_snapshot(
+    collection,
+    output_dir: str,
+    dtype: str = "int8",
+    batch_size: int = 1000,
+    embedding_model: str = None,
+    persist_directory: str = None
+) -> Dict[str, Any]:
+    """
+    Chroma 컬렉션을 읽기 전용 스냅샷으로 내보내기
+
+    Args:
+        collection: chromadb Collection 객체
+        output_dir: 스냅샷 디렉토리 (기존 스냅샷은 교체된다)
+        dtype: 벡터 저장 형식 ("int8", "float16", "float32")
+        batch_size: 컬렉션 조회 배치 크기
+        embedding_model: manifest 에 기록할 임베딩 모델 이름
+        persist_directory: 컬렉션 버전 파일이 있는 Chroma 저장 디렉토리
+            (지정하면 교체 후 버전을 올려 이전 스냅샷 기준의 검색 결과 캐시를 무효화)
+
+    Returns:
+        dict: 스냅샷 manifest
+    """
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"지원하지 않는 dtype: {dtype} (가능: {SUPPORTED_DTYPES})")
+
+    ids, embeddings, documents, metadatas = [], [], [], []
+    total = collection.count()
+    for offset in range(0, total, batch_size):
+        batch = collection.get(
+            include=["embeddings", "documents", "metadatas"],
+            limit=batch_size,
+            offset=offset
+        )
+        ids.extend(batch["ids"])
+        embeddings.extend(batch["embeddings"])
+        documents.extend(batch["documents"])
+        metadatas.extend(normalize_metadata(m or {}) for m in batch["metadatas"])
+
+    if not ids:
+        raise ValueError(f"빈 컬렉션은 스냅샷으로 내보낼 수 없습니다: {collection.name}")
+
+    # 작성 중인 스냅샷을 읽는 프로세스가 없도록 임시 디렉토리에 쓴 뒤 교체
+    tmp_dir = f"{output_dir.rstrip(os.sep)}.tmp"
+    os.makedirs(tmp_dir, exist_ok=True)
+
+    _write_snapshot_files(tmp_dir, ids, np.asarray(embeddings), documents, metadatas, dtype)
+
+    index = MetadataIndex()
+    index.add(ids, metadatas)
+    index.save(os.path.join(tmp_dir, "metadata_index.json"))
+
+    manifest = {
+        "version": SNAPSHOT_FORMAT_VERSION,
+        "collection": collection.name,
+        "dtype": dtype,
+        "count": len(ids),
+        "dim": len(embeddings[0]),
+        "space": (collection.metadata or {}).get("hnsw:space", "l2"),
+        "embedding_model": embedding_model,
+        "created_at": datetime.now().isoformat()
+    }
+    with open(os.path.join(tmp_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    if os.path.exists(output_dir):
+        old_dir = f"{output_dir.rstrip(os.sep)}.old"
+        os.replace(output_dir, old_dir)
+        os.replace(tmp_dir, output_dir)
+        for name in os.listdir(old_dir):
+            os.remove(os.path.join(old_dir, name))
+        os.rmdir(old_dir)
+    else:
+        os.replace(tmp_dir, output_dir)
+
+    if persist_directory:
+        manifest["collection_version"] = bump_collection_version(persist_directory, collection.name)
+
+    logger.info(f"벡터 스냅샷 내보내기 완료: {collection.name} → {output_dir} ({len(ids)}개, {dtype})")
+    return manifest
+
+
+class VectorSnapshot:
+    """memory-map 기반 읽기 전용 벡터 스냅샷"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "manifest.json"), "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+
+        if self.manifest.get("version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"스냅샷 버전 불일치: {path}")
+
+        self.dtype = self.manifest["dtype"]
+        self.space = self.manifest.get("space", "l2")
+        self.vectors = np.load(os.path.join(path, "vectors.npy"), mmap_mode="r")
+        self.norms = np.load(os.path.join(path, "norms.npy"), mmap_mode="r")
+        self.offsets = np.load(os.path.join(path, "offsets.npy"), mmap_mode="r")
+        self.scales = (
+            np.load(os.path.join(path, "scales.npy"), mmap_mode="r")
+            if self.dtype == "int8" else None
+        )
+
+        self._records_file = open(os.path.join(path, "records.jsonl"), "rb")
+        self._records = mmap.mmap(self._records_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._row_by_id: Optional[Dict[str, int]] = None
+        self._metadata_index: Optional[MetadataIndex] = None
+
+    @classmethod
+    def open(cls, path: str) -> Optional["VectorSnapshot"]:
+        """스냅샷 열기 (없거나 손상되면 None)"""
+        if not os.path.exists(os.path.join(path, "manifest.json")):
+            return None
+        try:
+            return cls(path)
+        except Exception as e:
+            logger.error(f"벡터 스냅샷 열기 실패 ({path}): {e}")
+            return None
+
+    def __len__(self) -> int:
+        return int(self.manifest["count"])
+
+    @property
+    def metadata_index(self) -> MetadataIndex:
+        if self._metadata_index is None:
+            self._metadata_index = MetadataIndex.load(
+                os.path.join(self.path, "metadata_index.json")
+            ) or MetadataIndex()
+        return self._metadata_index
+
+    def rows_for_ids(self, ids: Iterable[str]) -> np.ndarray:
+        """청크 ID → 행 번호 변환"""
+        if self._row_by_id is None:
+            with open(os.path.join(self.path, "ids.json"), "r", encoding="utf-8") as f:
+                self._row_by_id = {chunk_id: row for row, chunk_id in enumerate(json.load(f))}
+        rows = [self._row_by_id[i] for i in ids if i in self._row_by_id]
+        return np.asarray(sorted(rows), dtype=np.int64)
+
+    def get_record(self, row: int) -> Dict[str, Any]:
+        """행 번호로 {id, document, metadata} 레코드 조회"""
+        start, end = int(self.offsets[row]), int(self.offsets[row + 1])
+        return json.loads(self._records[start:end])
+
+    def _distances(self, query: np.ndarray, rows: Optional[np.ndarray]) -> np.ndarray:
+        """질의 벡터와 대상 행들의 거리 계산 (Chroma 와 같은 거리 정의 사용)"""
+        if rows is None:
+            blocks = [
+                self._block_dot(query, slice(start, min(start + SCAN_BLOCK_ROWS, len(self))))
+                for start in range(0, len(self), SCAN_BLOCK_ROWS)
+            ]
+            dots = np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.float32)
+            norms = np.asarray(self.norms, dtype=np.float32)
+        else:
+            dots = self._block_dot(query, rows)
+            norms = np.asarray(self.norms[rows], dtype=np.float32)
+
+        return compute_distances(query, dots, norms, self.space)
+
+    def _block_dot(self, query: np.ndarray, rows) -> np.ndarray:
+        block = np.asarray(self.vectors[rows], dtype=np.float32)
+        dots = block @ query
+        if self.scales is not None:
+            dots *= np.asarray(self.scales[rows], dtype=np.float32)
+        return dots
+
+    def search(
+        self,
+        query_embedding: List[float],
+        k: int = 5,
+        candidate_ids: Optional[Iterable[str]] = None
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        스냅샷 검색
+
+        Args:
+            query_embedding: 질의 임베딩
+            k: 반환할 결과 수
+            candidate_ids: 후보 청크 ID (None 이면 전체 스캔)
+
+        Returns:
+            List[tuple]: 거리 오름차순 (레코드, 거리) 리스트
+        """
+        query = np.asarray(query_embedding, dtype=np.float32)
+        rows = None if candidate_ids is None else self.rows_for_ids(candidate_ids)
+        if rows is not None and len(rows) == 0:
+            return []
+
+        distances = self._distances(query, rows)
+        k = min(k, len(distances))
+        if k <= 0:
+            return []
+
+        top = np.argpartition(distances, k - 1)[:k]
+        top = top[np.argsort(distances[top])]
+        result_rows = top if rows is None else rows[top]
+
+        return [
+            (self.get_record(int(row)), float(distances[i]))
+            for row, i in zip(result_rows, top)
+        ]
+
+    def close(self):
+        try:
+            self._records.close()
+            self._records_file.close()
+        except Exception:
+            pass
+
+
+def evaluate_snapshot_recall(collection, snapshot: VectorSnapshot, samples: int = 50, k: int = 5) -> float:
+    """
+    저장된 청크 임베딩을 질의로 사용해 float32 Chroma 인덱스 대비 스냅샷 recall@k 측정
+    """
+    count = collection.count()
+    if count == 0:
+        return 0.0
+
+    sample = collection.get(include=["embeddings"], limit=min(samples, count))
+    queries = sample["embeddings"]
+    n_results = min(k, count)
+    expected = collection.query(query_embeddings=queries, n_results=n_results)["ids"]
+
+    hits = 0
+    total = 0
+    for query, expected_ids in zip(queries, expected):
+        actual_ids = {record["id"] for record, _ in snapshot.search(query, n_results)}
+        hits += len(actual_ids & set(expected_ids))
+        total += len(expected_ids)
+
+    return hits / total if total else 0.0
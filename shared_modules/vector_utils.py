@@ -3,17 +3,197 @@
 각 에이전트에서 공통으로 사용하는 벡터 스토어 및 임베딩 관련 함수
 """
 
+import os
+import json
+import time
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional, Union
+import threading
+from collections import OrderedDict
+import numpy as np
+from typing import Dict, Any, List, Optional, Union, Set, Tuple
 from langchain_openai import OpenAIEmbeddings
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStore
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
 
 from shared_modules.env_config import get_config
+from shared_modules.metadata_index import (
+    MetadataIndex, normalize_metadata, get_index_path,
+    read_collection_version, bump_collection_version
+)
+from shared_modules.vector_snapshot import VectorSnapshot, export_snapshot, compute_distances
 
 logger = logging.getLogger(__name__)
 
+# 카테고리별 샤드 컬렉션 (global-documents-<category>)
+SHARD_FIELD = "category"
+SHARD_CATEGORIES = ("business_planning", "customer_management", "marketing", "mental_health")
+
+
+def get_shard_collection_name(category: str, base_collection: str = "global-documents") -> str:
+    """카테고리 샤드 컬렉션 이름 반환"""
+    return f"{base_collection}-{category}"
+
+
+def extract_shard_key(filter_dict: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    필터에서 단일 카테고리 조건 추출
+
+    {"category": "x"}, {"category": {"$eq": "x"}}, 최상위 $and 안의 카테고리 조건을 인식한다.
+    """
+    if not filter_dict:
+        return None
+
+    condition = filter_dict.get(SHARD_FIELD)
+    if isinstance(condition, dict) and set(condition.keys()) == {"$eq"}:
+        condition = condition["$eq"]
+    if isinstance(condition, str):
+        return condition
+
+    for sub_filter in filter_dict.get("$and", []):
+        category = extract_shard_key(sub_filter)
+        if category:
+            return category
+
+    return None
+
+
+def _canonical_filter(filter_dict: Any) -> Any:
+    """필터를 순서와 무관한 정규형으로 변환 (캐시 키 생성용)"""
+    if isinstance(filter_dict, dict):
+        canonical = {}
+        for key, value in filter_dict.items():
+            if key in ("$in", "$nin") and isinstance(value, list):
+                canonical[key] = sorted(str(v) for v in value)
+            elif key in ("$and", "$or") and isinstance(value, list):
+                canonical[key] = sorted(
+                    (_canonical_filter(v) for v in value),
+                    key=lambda v: json.dumps(v, sort_keys=True, ensure_ascii=False)
+                )
+            else:
+                canonical[key] = _canonical_filter(value)
+        return canonical
+    return filter_dict
+
+
+class RetrievalCache:
+    """
+    검색 결과 캐시
+    
+    (컬렉션, 정규화된 필터, 정규화된 질의 해시, k) → (Document, score) 리스트.
+    컬렉션 버전 카운터가 바뀌면 해당 항목은 무효가 된다.
+    """
+    
+    def __init__(self, max_entries: int = 1024, ttl: int = 1800):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """공백 / 대소문자 / 끝 문장부호 차이를 무시하도록 질의 정규화"""
+        return " ".join((query or "").lower().split()).rstrip("?!.？！ ")
+    
+    def make_key(
+        self,
+        collection_name: str,
+        persist_directory: str,
+        query: str,
+        k: int,
+        filter_dict: Dict[str, Any] = None
+    ) -> str:
+        raw = json.dumps(
+            [
+                collection_name,
+                persist_directory,
+                self.normalize_query(query),
+                k,
+                _canonical_filter(filter_dict or {})
+            ],
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def _copy_results(results: List[tuple]) -> List[tuple]:
+        """(Document, score) 리스트 복사 (Document 와 메타데이터까지 새로 만듦)"""
+        return [
+            (Document(page_content=doc.page_content, metadata=dict(doc.metadata), id=doc.id), score)
+            for doc, score in results
+        ]
+    
+    def get(self, key: str, version: int) -> Optional[List[tuple]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version or entry[1] < time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            results = entry[2]
+        
+        # 호출 측에서 메타데이터를 수정해도 캐시가 오염되지 않도록 복사본 반환
+        return self._copy_results(results)
+    
+    def put(self, key: str, version: int, results: List[tuple]):
+        if self.max_entries <= 0:
+            return
+        
+        # 저장 후 호출 측이 같은 Document 를 수정해도 캐시에는 반영되지 않도록 복사본 저장
+        results = self._copy_results(results)
+        with self._lock:
+            self._entries[key] = (version, time.time() + self.ttl, results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
+
+
+class ManagedRetriever(BaseRetriever):
+    """VectorStoreManager 검색 경로(샤드 라우팅, 사전 필터, 스냅샷)를 그대로 사용하는 검색기"""
+    
+    manager: Any
+    collection_name: Optional[str] = None
+    persist_directory: Optional[str] = None
+    k: int = 5
+    filter_dict: Optional[Dict[str, Any]] = None
+    
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return self.manager.search_documents(
+            query,
+            self.collection_name,
+            self.persist_directory,
+            k=self.k,
+            filter_dict=self.filter_dict
+        )
+
+
 class VectorStoreManager:
     """벡터 스토어 관리 클래스"""
     
@@ -27,7 +207,22 @@ class VectorStoreManager:
         self.config = config if config else get_config()
         self.embedding = None
         self.vectorstores = {}
+        self.metadata_indexes: Dict[str, MetadataIndex] = {}
         self.default_collection = "global-documents"
+        self.sharding_enabled = getattr(self.config, "VECTOR_SHARDING", False)
+        self._available_shards: Optional[Set[str]] = None
+        self._shard_versions: Tuple[int, ...] = ()
+        self._shards_refreshed_at = 0.0
+        self.shard_refresh_interval = getattr(self.config, "VECTOR_SHARD_REFRESH_INTERVAL", 300)
+        self.snapshots: Dict[str, Optional[VectorSnapshot]] = {}
+        self.snapshot_versions: Dict[str, int] = {}
+        self.brute_force_threshold = getattr(self.config, "VECTOR_BRUTE_FORCE_THRESHOLD", 2000)
+        self.search_stats = {"snapshot": 0, "brute_force": 0, "hnsw": 0}
+        self.metadata_index_versions: Dict[str, int] = {}
+        self.retrieval_cache = RetrievalCache(
+            max_entries=getattr(self.config, "VECTOR_CACHE_SIZE", 1024),
+            ttl=getattr(self.config, "CACHE_TTL", 1800)
+        )
         
         self._initialize_embedding()
     
@@ -156,6 +351,372 @@ class VectorStoreManager:
                     logger.error(f"벡터 스토어 생성 실패: {create_error}")
             
             return None
+
+    def get_metadata_index(
+        self,
+        collection_name: str = None,
+        persist_directory: str = None,
+        rebuild: bool = False
+    ) -> Optional[MetadataIndex]:
+        """
+        컬렉션 메타데이터 사전 필터 인덱스 반환
+
+        인덱스 파일이 없으면 컬렉션 메타데이터를 한 번 읽어 생성 후 저장한다.
+
+        Args:
+            collection_name: 컬렉션 이름
+            persist_directory: 저장 디렉토리
+            rebuild: 기존 인덱스를 무시하고 재생성할지 여부
+
+        Returns:
+            MetadataIndex: 메타데이터 인덱스 (생성 실패 시 None)
+        """
+        collection_name = collection_name or self.default_collection
+        persist_directory = persist_directory or self.config.CHROMA_DIR
+
+        cache_key = f"{collection_name}_{persist_directory}"
+        version = read_collection_version(persist_directory, collection_name)
+        if (
+            not rebuild
+            and cache_key in self.metadata_indexes
+            and self.metadata_index_versions.get(cache_key) == version
+        ):
+            return self.metadata_indexes[cache_key]
+
+        index_path = get_index_path(persist_directory, collection_name)
+        index = None if rebuild else MetadataIndex.load(index_path)
+
+        if index is None:
+            vectorstore = self.get_vectorstore(collection_name, persist_directory)
+            if not vectorstore:
+                return None
+
+            try:
+                index = MetadataIndex.build_from_collection(vectorstore._collection)
+                index.save(index_path)
+                logger.info(f"메타데이터 인덱스 생성: {collection_name} ({len(index.ids)}개 청크)")
+            except Exception as e:
+                logger.error(f"메타데이터 인덱스 생성 실패: {e}")
+                return None
+
+        self.metadata_indexes[cache_key] = index
+        self.metadata_index_versions[cache_key] = version
+        return index
+
+    def _prepare_filter(
+        self,
+        collection_name: str,
+        persist_directory: str,
+        filter_dict: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Set[str]]]:
+        """
+        메타데이터 인덱스로 필터 후보 집합 계산 및 Chroma where 조건 재작성
+
+        Returns:
+            tuple: (재작성된 필터, 후보 청크 ID 집합 - 인덱스로 해석 불가 시 None)
+        """
+        if not filter_dict:
+            return filter_dict, None
+
+        index = self.get_metadata_index(collection_name, persist_directory)
+        if not index:
+            return filter_dict, None
+
+        return index.rewrite_filter(filter_dict), index.resolve(filter_dict)
+
+    def _update_metadata_index(
+        self,
+        collection_name: str,
+        persist_directory: str,
+        ids: List[str],
+        metadatas: List[Dict[str, Any]]
+    ):
+        """문서 추가 후 메타데이터 인덱스 갱신"""
+        index = self.get_metadata_index(collection_name, persist_directory)
+        if not index:
+            return
+
+        persist_directory = persist_directory or self.config.CHROMA_DIR
+        collection_name = collection_name or self.default_collection
+        
+        index.add(ids, metadatas)
+        index.save(get_index_path(persist_directory, collection_name))
+        
+        # 버전 증가 → 모든 프로세스의 검색 결과 캐시 무효화
+        version = bump_collection_version(persist_directory, collection_name)
+        self.metadata_index_versions[f"{collection_name}_{persist_directory}"] = version
+
+    def _read_shard_versions(self, persist_directory: str = None) -> Tuple[int, ...]:
+        """카테고리 샤드별 컬렉션 버전 (샤드 적재 시 증가)"""
+        persist_directory = persist_directory or self.config.CHROMA_DIR
+        return tuple(
+            read_collection_version(persist_directory, get_shard_collection_name(category, self.default_collection))
+            for category in SHARD_CATEGORIES
+        )
+
+    def get_available_shards(self, persist_directory: str = None) -> Set[str]:
+        """
+        사용 가능한 샤드 목록 반환
+
+        다른 프로세스(init/shard_vector_db.py 등)가 샤드를 만들면 샤드 컬렉션 버전이 오르므로
+        버전이 바뀌었거나 재조회 주기가 지났을 때만 목록을 다시 조회한다.
+        """
+        if (
+            self._available_shards is None
+            or self._read_shard_versions(persist_directory) != self._shard_versions
+            or time.time() - self._shards_refreshed_at >= self.shard_refresh_interval
+        ):
+            self.refresh_shards(persist_directory)
+        return self._available_shards
+
+    def refresh_shards(self, persist_directory: str = None) -> Set[str]:
+        """
+        비어 있지 않은 카테고리 샤드 목록 갱신
+
+        Returns:
+            Set[str]: 사용 가능한 샤드 카테고리 집합
+        """
+        self._available_shards = set()
+        # 조회 전에 기록해 조회 중에 오른 버전은 다음 검색에서 다시 반영
+        self._shard_versions = self._read_shard_versions(persist_directory)
+        self._shards_refreshed_at = time.time()
+        vectorstore = self.get_vectorstore(self.default_collection, persist_directory)
+        if not vectorstore:
+            return self._available_shards
+
+        try:
+            collections = {c.name: c for c in vectorstore._client.list_collections()}
+            for category in SHARD_CATEGORIES:
+                shard = collections.get(get_shard_collection_name(category, self.default_collection))
+                if shard is not None and shard.count() > 0:
+                    self._available_shards.add(category)
+        except Exception as e:
+            logger.warning(f"샤드 목록 조회 실패: {e}")
+
+        return self._available_shards
+
+    def route_collection(
+        self,
+        collection_name: str = None,
+        filter_dict: Dict[str, Any] = None,
+        persist_directory: str = None
+    ) -> str:
+        """
+        검색 대상 컬렉션 결정 (샤드 라우터)
+
+        샤딩이 켜져 있고 기본 컬렉션 검색의 필터가 단일 카테고리로 고정되면
+        해당 카테고리 샤드로 보낸다. 샤드가 없으면 원래 컬렉션을 그대로 사용한다.
+        """
+        collection_name = collection_name or self.default_collection
+        if not self.sharding_enabled or collection_name != self.default_collection:
+            return collection_name
+
+        category = extract_shard_key(filter_dict)
+        if not category:
+            return collection_name
+
+        if category in self.get_available_shards(persist_directory):
+            return get_shard_collection_name(category, collection_name)
+        return collection_name
+
+    def search_across_shards(
+        self,
+        query: str,
+        categories: List[str] = None,
+        k: int = 5,
+        filter_dict: Dict[str, Any] = None,
+        persist_directory: str = None
+    ) -> List[tuple]:
+        """
+        여러 카테고리 샤드를 검색해 점수 기준으로 병합
+
+        Args:
+            query: 검색 쿼리
+            categories: 검색할 카테고리 목록 (기본값: 사용 가능한 모든 샤드)
+            k: 반환할 문서 수
+            filter_dict: 샤드별로 적용할 추가 필터
+            persist_directory: 저장 디렉토리
+
+        Returns:
+            List[tuple]: 거리(점수) 오름차순 (Document, score) 튜플 리스트
+        """
+        available_shards = self.get_available_shards(persist_directory)
+        targets = [c for c in (categories or SHARD_CATEGORIES) if c in available_shards]
+        if not targets:
+            # 샤드가 없으면 단일 컬렉션에서 카테고리 필터로 검색
+            shard_filter = {SHARD_FIELD: {"$in": list(categories)}} if categories else None
+            if filter_dict and shard_filter:
+                shard_filter = {"$and": [shard_filter, filter_dict]}
+            return self.search_with_scores(
+                query, persist_directory=persist_directory, k=k,
+                filter_dict=shard_filter or filter_dict
+            )
+
+        merged = []
+        for category in targets:
+            merged.extend(self.search_with_scores(
+                query,
+                collection_name=get_shard_collection_name(category, self.default_collection),
+                persist_directory=persist_directory,
+                k=k,
+                filter_dict=filter_dict
+            ))
+
+        merged.sort(key=lambda item: item[1])
+        return merged[:k]
+
+    def _brute_force_search(
+        self,
+        vectorstore: Chroma,
+        query: str,
+        candidate_ids: Set[str],
+        k: int
+    ) -> List[tuple]:
+        """
+        후보 청크 벡터를 읽어 NumPy 행렬곱 한 번으로 정확한 거리 계산
+        
+        거리는 컬렉션의 hnsw:space 정의를 따르므로 HNSW 경로의 점수와 같은 의미를 가진다.
+        
+        Returns:
+            List[tuple]: 거리 오름차순 (Document, score) 튜플 리스트
+        """
+        collection = vectorstore._collection
+        candidates = collection.get(
+            ids=list(candidate_ids),
+            include=["embeddings", "documents", "metadatas"]
+        )
+        if not candidates["ids"]:
+            return []
+        
+        query_vector = np.asarray(self.embedding.embed_query(query), dtype=np.float32)
+        vectors = np.asarray(candidates["embeddings"], dtype=np.float32)
+        norms = np.einsum("ij,ij->i", vectors, vectors)
+        space = (collection.metadata or {}).get("hnsw:space", "l2")
+        distances = compute_distances(query_vector, vectors @ query_vector, norms, space)
+        
+        k = min(k, len(distances))
+        top = np.argpartition(distances, k - 1)[:k]
+        top = top[np.argsort(distances[top])]
+        
+        return [
+            (
+                Document(
+                    page_content=candidates["documents"][i] or "",
+                    metadata=candidates["metadatas"][i] or {}
+                ),
+                float(distances[i])
+            )
+            for i in top
+        ]
+    
+    def get_snapshot(self, collection_name: str = None, persist_directory: str = None) -> Optional[VectorSnapshot]:
+        """
+        컬렉션의 읽기 전용 스냅샷 반환 (VECTOR_SNAPSHOT_DIR/<컬렉션> 이 있을 때만)
+        
+        다른 프로세스가 스냅샷을 다시 내보내 컬렉션 버전이 바뀌면 새 스냅샷으로 다시 연다.
+        
+        Args:
+            collection_name: 컬렉션 이름
+            persist_directory: 컬렉션 버전 파일이 있는 저장 디렉토리
+        
+        Returns:
+            VectorSnapshot: memory-map 스냅샷 (없으면 None)
+        """
+        snapshot_dir = getattr(self.config, "VECTOR_SNAPSHOT_DIR", None)
+        if not snapshot_dir:
+            return None
+        
+        collection_name = collection_name or self.default_collection
+        version = read_collection_version(persist_directory or self.config.CHROMA_DIR, collection_name)
+        if collection_name in self.snapshots and self.snapshot_versions.get(collection_name) != version:
+            stale = self.snapshots.pop(collection_name)
+            if stale is not None:
+                stale.close()
+        
+        if collection_name not in self.snapshots:
+            snapshot = VectorSnapshot.open(os.path.join(snapshot_dir, collection_name))
+            if snapshot is not None:
+                logger.info(f"벡터 스냅샷 로드: {collection_name} ({len(snapshot)}개, {snapshot.dtype})")
+            self.snapshots[collection_name] = snapshot
+            self.snapshot_versions[collection_name] = version
+        
+        return self.snapshots[collection_name]
+    
+    def export_snapshot(
+        self,
+        collection_name: str = None,
+        persist_directory: str = None,
+        dtype: str = "int8",
+        output_dir: str = None
+    ) -> Dict[str, Any]:
+        """
+        컬렉션을 읽기 전용 양자화 스냅샷으로 내보내기
+        
+        Args:
+            collection_name: 컬렉션 이름
+            persist_directory: 저장 디렉토리
+            dtype: 벡터 저장 형식 ("int8", "float16", "float32")
+            output_dir: 스냅샷 디렉토리 (기본값: VECTOR_SNAPSHOT_DIR/<컬렉션>)
+        
+        Returns:
+            dict: 스냅샷 manifest 또는 오류 정보
+        """
+        collection_name = collection_name or self.default_collection
+        snapshot_dir = getattr(self.config, "VECTOR_SNAPSHOT_DIR", None)
+        output_dir = output_dir or (os.path.join(snapshot_dir, collection_name) if snapshot_dir else None)
+        if not output_dir:
+            return {"error": "VECTOR_SNAPSHOT_DIR 또는 output_dir 가 필요합니다"}
+        
+        vectorstore = self.get_vectorstore(collection_name, persist_directory)
+        if not vectorstore:
+            return {"error": "컬렉션을 찾을 수 없습니다"}
+        
+        try:
+            manifest = export_snapshot(
+                vectorstore._collection, output_dir, dtype=dtype,
+                embedding_model=self.config.EMBEDDING_MODEL,
+                persist_directory=persist_directory or self.config.CHROMA_DIR
+            )
+            # 다음 검색부터 새 스냅샷을 사용하도록 캐시 제거
+            stale = self.snapshots.pop(collection_name, None)
+            if stale is not None:
+                stale.close()
+            return manifest
+        
+        except Exception as e:
+            logger.error(f"벡터 스냅샷 내보내기 실패: {e}")
+            return {"error": str(e)}
+    
+    def _search_snapshot(
+        self,
+        snapshot: VectorSnapshot,
+        query: str,
+        k: int,
+        filter_dict: Dict[str, Any] = None
+    ) -> Optional[List[tuple]]:
+        """
+        스냅샷에서 검색 (인덱스로 해석할 수 없는 필터면 None 반환 → Chroma 로 폴백)
+        """
+        if not self.embedding:
+            return None
+        
+        candidate_ids = None
+        if filter_dict:
+            candidate_ids = snapshot.metadata_index.resolve(filter_dict)
+            if candidate_ids is None:
+                return None
+            if not candidate_ids:
+                return []
+        
+        try:
+            query_embedding = self.embedding.embed_query(query)
+            return [
+                (Document(page_content=record["document"] or "", metadata=record["metadata"] or {}), score)
+                for record, score in snapshot.search(query_embedding, k, candidate_ids)
+            ]
+        except Exception as e:
+            logger.error(f"스냅샷 검색 실패: {e}")
+            return None
     
     def get_retriever(
         self,
@@ -178,6 +739,23 @@ class VectorStoreManager:
         Returns:
             VectorStoreRetriever: 검색기 객체
         """
+        if search_type == "similarity":
+            # 유사도 검색은 매니저 검색 경로를 그대로 사용 (스냅샷 / 사전 필터 / 샤드 라우팅)
+            if not self.embedding:
+                logger.error("임베딩 모델이 초기화되지 않았습니다")
+                return None
+            
+            return ManagedRetriever(
+                manager=self,
+                collection_name=collection_name,
+                persist_directory=persist_directory,
+                k=k,
+                filter_dict=(search_kwargs or {}).get("filter")
+            )
+        
+        collection_name = self.route_collection(
+            collection_name, (search_kwargs or {}).get("filter"), persist_directory
+        )
         vectorstore = self.get_vectorstore(collection_name, persist_directory)
         if not vectorstore:
             return None
@@ -188,6 +766,12 @@ class VectorStoreManager:
         else:
             search_kwargs = {**search_kwargs, "k": k}
         
+        # 다중 값 메타데이터 필터 재작성 (topic $in 등)
+        if search_kwargs.get("filter"):
+            search_kwargs["filter"], _ = self._prepare_filter(
+                collection_name, persist_directory, search_kwargs["filter"]
+            )
+        
         try:
             retriever = vectorstore.as_retriever(
                 search_type=search_type,
@@ -201,11 +785,32 @@ class VectorStoreManager:
             logger.error(f"검색기 생성 실패: {e}")
             return None
     
+    def _group_by_shard(
+        self,
+        collection_name: str,
+        metadatas: List[Dict[str, Any]]
+    ) -> Dict[str, List[int]]:
+        """메타데이터 category 기준으로 대상 샤드 컬렉션별 인덱스 묶기"""
+        base_collection = collection_name or self.default_collection
+        groups: Dict[str, List[int]] = {}
+        for i, metadata in enumerate(metadatas):
+            category = (metadata or {}).get(SHARD_FIELD)
+            if category in SHARD_CATEGORIES:
+                target = get_shard_collection_name(category, base_collection)
+            else:
+                target = base_collection
+            groups.setdefault(target, []).append(i)
+        
+        # 새 샤드가 생길 수 있으므로 라우팅 정보 초기화
+        self._available_shards = None
+        return groups
+    
     def add_documents(
         self,
         documents: List[Document],
         collection_name: str = None,
-        persist_directory: str = None
+        persist_directory: str = None,
+        shard_by_category: bool = False
     ) -> bool:
         """
         문서 추가
@@ -214,16 +819,35 @@ class VectorStoreManager:
             documents: 추가할 문서 리스트
             collection_name: 컬렉션 이름
             persist_directory: 저장 디렉토리
+            shard_by_category: category 메타데이터 기준으로 샤드 컬렉션에 나누어 저장할지 여부
         
         Returns:
             bool: 성공 여부
         """
+        if shard_by_category:
+            groups = self._group_by_shard(
+                collection_name, [doc.metadata for doc in documents]
+            )
+            # 한 샤드가 실패해도 나머지 샤드는 모두 저장 (all() 의 단락 평가로 건너뛰지 않도록 먼저 수집)
+            results = [
+                self.add_documents([documents[i] for i in indices], target, persist_directory)
+                for target, indices in groups.items()
+            ]
+            return all(results)
+        
         vectorstore = self.get_vectorstore(collection_name, persist_directory)
         if not vectorstore:
             return False
         
         try:
-            vectorstore.add_documents(documents)
+            documents = [
+                Document(page_content=doc.page_content, metadata=normalize_metadata(doc.metadata))
+                for doc in documents
+            ]
+            ids = vectorstore.add_documents(documents)
+            self._update_metadata_index(
+                collection_name, persist_directory, ids, [doc.metadata for doc in documents]
+            )
             logger.info(f"{len(documents)}개 문서 추가 성공")
             return True
             
@@ -236,7 +860,8 @@ class VectorStoreManager:
         texts: List[str],
         metadatas: List[Dict[str, Any]] = None,
         collection_name: str = None,
-        persist_directory: str = None
+        persist_directory: str = None,
+        shard_by_category: bool = False
     ) -> bool:
         """
         텍스트 추가
@@ -246,16 +871,33 @@ class VectorStoreManager:
             metadatas: 메타데이터 리스트
             collection_name: 컬렉션 이름
             persist_directory: 저장 디렉토리
+            shard_by_category: category 메타데이터 기준으로 샤드 컬렉션에 나누어 저장할지 여부
         
         Returns:
             bool: 성공 여부
         """
+        if shard_by_category and metadatas:
+            groups = self._group_by_shard(collection_name, metadatas)
+            results = [
+                self.add_texts(
+                    [texts[i] for i in indices], [metadatas[i] for i in indices],
+                    target, persist_directory
+                )
+                for target, indices in groups.items()
+            ]
+            return all(results)
+        
         vectorstore = self.get_vectorstore(collection_name, persist_directory)
         if not vectorstore:
             return False
         
         try:
-            vectorstore.add_texts(texts, metadatas=metadatas)
+            if metadatas is not None:
+                metadatas = [normalize_metadata(metadata) for metadata in metadatas]
+            ids = vectorstore.add_texts(texts, metadatas=metadatas)
+            self._update_metadata_index(
+                collection_name, persist_directory, ids, metadatas or [{} for _ in texts]
+            )
             logger.info(f"{len(texts)}개 텍스트 추가 성공")
             return True
             
@@ -284,26 +926,10 @@ class VectorStoreManager:
         Returns:
             List[Document]: 검색된 문서 리스트
         """
-        vectorstore = self.get_vectorstore(collection_name, persist_directory)
-        if not vectorstore:
-            return []
-        
-        try:
-            if filter_dict:
-                documents = vectorstore.similarity_search(
-                    query, 
-                    k=k,
-                    filter=filter_dict
-                )
-            else:
-                documents = vectorstore.similarity_search(query, k=k)
-            
-            logger.info(f"문서 검색 성공: {len(documents)}개 문서 반환")
-            return documents
-            
-        except Exception as e:
-            logger.error(f"문서 검색 실패: {e}")
-            return []
+        results = self.search_with_scores(
+            query, collection_name, persist_directory, k=k, filter_dict=filter_dict
+        )
+        return [doc for doc, _ in results]
     
     def search_with_scores(
         self,
@@ -326,11 +952,66 @@ class VectorStoreManager:
         Returns:
             List[tuple]: (Document, score) 튜플 리스트
         """
+        collection_name = self.route_collection(collection_name, filter_dict, persist_directory)
+        persist_directory = persist_directory or self.config.CHROMA_DIR
+        
+        # 같은 질문이 반복되면 ANN 검색 없이 캐시에서 반환
+        version = read_collection_version(persist_directory, collection_name)
+        cache_key = self.retrieval_cache.make_key(
+            collection_name, persist_directory, query, k, filter_dict
+        )
+        cached = self.retrieval_cache.get(cache_key, version)
+        if cached is not None:
+            logger.info(f"검색 캐시 적중: {len(cached)}개 문서 반환")
+            return cached
+        
+        results = self._search_with_scores_uncached(
+            query, collection_name, persist_directory, k, filter_dict
+        )
+        if results is None:
+            return []
+        
+        self.retrieval_cache.put(cache_key, version, results)
+        return results
+    
+    def _search_with_scores_uncached(
+        self,
+        query: str,
+        collection_name: str,
+        persist_directory: str,
+        k: int,
+        filter_dict: Dict[str, Any] = None
+    ) -> Optional[List[tuple]]:
+        """실제 검색 수행 (스냅샷 → 전수 비교 → HNSW 순으로 전략 선택, 실패 시 None)"""
+        # 읽기 전용 스냅샷이 있으면 Chroma 를 열지 않고 스냅샷에서 검색
+        snapshot = self.get_snapshot(collection_name, persist_directory)
+        if snapshot is not None:
+            results = self._search_snapshot(snapshot, query, k, filter_dict)
+            if results is not None:
+                self.search_stats["snapshot"] += 1
+                logger.info(f"스냅샷 검색 성공: {len(results)}개 문서 반환")
+                return results
+        
         vectorstore = self.get_vectorstore(collection_name, persist_directory)
         if not vectorstore:
-            return []
+            return None
         
         try:
+            filter_dict, candidate_ids = self._prepare_filter(
+                collection_name, persist_directory, filter_dict
+            )
+            if candidate_ids is not None and not candidate_ids:
+                logger.info("점수 포함 검색: 필터 조건에 해당하는 문서 없음")
+                return []
+            
+            # 후보가 적으면 ANN 대신 정확한 전수 비교
+            if candidate_ids is not None and len(candidate_ids) <= self.brute_force_threshold:
+                results = self._brute_force_search(vectorstore, query, candidate_ids, k)
+                self.search_stats["brute_force"] += 1
+                logger.info(f"점수 포함 검색 성공 (전수 비교, 후보 {len(candidate_ids)}개): {len(results)}개 문서 반환")
+                return results
+            
+            self.search_stats["hnsw"] += 1
             if filter_dict:
                 results = vectorstore.similarity_search_with_score(
                     query,
@@ -345,7 +1026,7 @@ class VectorStoreManager:
             
         except Exception as e:
             logger.error(f"점수 포함 검색 실패: {e}")
-            return []
+            return None
     
     def delete_collection(
         self,
@@ -370,6 +1051,12 @@ class VectorStoreManager:
             cache_key = f"{collection_name}_{persist_directory}"
             if cache_key in self.vectorstores:
                 del self.vectorstores[cache_key]
+            self.metadata_indexes.pop(cache_key, None)
+            
+            index_path = get_index_path(persist_directory, collection_name)
+            if os.path.exists(index_path):
+                os.remove(index_path)
+            bump_collection_version(persist_directory, collection_name)
             
             # 실제 컬렉션 삭제는 Chroma 클라이언트를 통해 수행
             vectorstore = Chroma(
@@ -424,7 +1111,16 @@ class VectorStoreManager:
             "default_collection": self.default_collection,
             "persist_directory": self.config.CHROMA_DIR,
             "cached_vectorstores": len(self.vectorstores),
-            "cached_collections": list(self.vectorstores.keys())
+            "cached_collections": list(self.vectorstores.keys()),
+            "sharding_enabled": self.sharding_enabled,
+            "brute_force_threshold": self.brute_force_threshold,
+            "search_strategies": dict(self.search_stats),
+            "retrieval_cache": self.retrieval_cache.get_stats(),
+            "snapshots": sorted(name for name, snap in self.snapshots.items() if snap is not None),
+            "available_shards": sorted(self._available_shards or []),
+            "metadata_indexes": {
+                key: len(index.ids) for key, index in self.metadata_indexes.items()
+            }
         }
 
 
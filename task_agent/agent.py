@@ -14,7 +14,7 @@ from typing import Dict, List, Any, Optional, Tuple
 sys.path.append(os.path.join(os.path.dirname(__file__), "../shared_modules"))
 sys.path.append(os.path.join(os.path.dirname(__file__), "../unified_agent_system"))
 
-from models import UserQuery, AutomationRequest, AutomationResponse, PersonaType, IntentType
+from models import UserQuery, AutomationRequest, AutomationResponse, PersonaType, IntentType, TaskReplayRequest, CampaignRequest
 from core.models import UnifiedResponse, AgentType, RoutingDecision, Priority
 from llm_handler import TaskAgentLLMHandler
 from rag import TaskAgentRAGManager
@@ -807,6 +807,48 @@ class TaskAgent:
             logger.error(f"자동화 작업 취소 실패: {e}")
             return False
 
+    async def get_dead_letter_tasks(self, task_type: Optional[str] = None, user_id: Optional[int] = None,
+                                    limit: int = 100, after_id: int = 0) -> List[Dict[str, Any]]:
+        """재시도를 소진한 자동화 작업 목록 조회"""
+        return await self.automation_manager.get_dead_letter_tasks(task_type, user_id, limit, after_id)
+
+    async def replay_automation_tasks(self, request: TaskReplayRequest) -> Dict[str, Any]:
+        """dead letter 자동화 작업 일괄 재실행"""
+        result = await self.automation_manager.replay_tasks(
+            task_ids=request.task_ids,
+            task_type=request.task_type.value if request.task_type else None,
+            user_id=request.user_id,
+            include_failed=request.include_failed,
+            limit=request.limit
+        )
+        
+        TaskAgentLogger.log_automation_task(
+            task_id=",".join(str(task_id) for task_id in result["task_ids"][:20]) or "none",
+            task_type=request.task_type.value if request.task_type else "all",
+            status="replayed",
+            details=f"{result['replayed']} tasks replayed via agent"
+        )
+        
+        return result
+
+    async def create_email_campaign(self, request: CampaignRequest) -> Dict[str, Any]:
+        """대량 이메일 캠페인 생성 및 발송 예약"""
+        result = await self.automation_manager.create_campaign(request)
+        
+        TaskAgentLogger.log_automation_task(
+            task_id=str(result.get("task_id", "failed")),
+            task_type="send_campaign",
+            status="created" if result.get("success") else "failed",
+            details=f"campaign {result.get('campaign_id')}, {result.get('total', 0)} recipients via agent"
+        )
+        
+        return result
+
+    async def get_email_campaign(self, campaign_id: int, status: Optional[str] = None,
+                                 after_id: int = 0, limit: int = 100) -> Optional[Dict[str, Any]]:
+        """대량 이메일 캠페인 진행 현황 조회"""
+        return await self.automation_manager.get_campaign_progress(campaign_id, status, after_id, limit)
+
     # ===== 시스템 관리 =====
 
     async def get_status(self) -> Dict[str, Any]:
@@ -5,10 +5,13 @@ Task Agent 자동화 시스템 v4
 
 import sys
 import os
+import time
+import heapq
 import asyncio
+import itertools
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 import shared_modules.db_models as db_models
 
 # 공통 모듈 경로 추가
@@ -17,7 +20,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "../shared_modules"))
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
   # 공통 모듈의 DB 모델들
-from models import AutomationRequest, AutomationResponse, AutomationStatus, AutomationTaskType
+from models import AutomationRequest, AutomationResponse, AutomationStatus, AutomationTaskType, CampaignRequest
 from database import get_db_session
 from utils import TaskAgentLogger, create_success_response, create_error_response
 
@@ -26,16 +29,275 @@ from automation_task.email_service import EmailService
 from automation_task.google_calendar_service import GoogleCalendarService
 # from automation_task.sns_service import SNSService
 from automation_task.reminder_service import ReminderService
+from automation_task.campaign_service import EmailCampaignService
 from automation_task.common.config_manager import get_automation_config_manager
 from automation_task.common.db_helper import get_automation_db_helper
+from automation_task.common.http_client import get_http_client, close_http_clients
+from automation_task.common.task_scheduler import DurableTaskScheduler
+from automation_task.common.retry_policy import build_retry_policies
+from automation_task.common.recurrence import (
+    MISFIRE_POLICIES, MISFIRE_SKIP, is_misfired, next_occurrence, normalize_recurrence, plan_next_run
+)
 
 logger = logging.getLogger(__name__)
 
+# 우선순위 레인 (값이 작을수록 먼저 실행)
+PRIORITY_LEVELS = {"urgent": 0, "high": 1, "normal": 2, "low": 3}
+DEFAULT_TASK_PRIORITIES = {
+    AutomationTaskType.SEND_REMINDER.value: "high",
+    AutomationTaskType.SCHEDULE_CALENDAR.value: "normal",
+    AutomationTaskType.SEND_MESSAGE.value: "normal",
+    AutomationTaskType.SEND_EMAIL.value: "normal",
+    AutomationTaskType.PUBLISH_SNS.value: "low",
+    AutomationTaskType.SEND_CAMPAIGN.value: "low",
+}
+# 수신자가 이보다 많은 이메일은 대량 발송으로 보고 low 레인에서 실행
+BULK_EMAIL_RECIPIENTS = 20
+
+
+def get_task_priority(task_info: Dict[str, Any]) -> str:
+    """task_data.priority 가 있으면 그 값, 없으면 작업 타입 기본값"""
+    task_data = task_info.get("task_data") or {}
+    priority = str(task_data.get("priority", "")).lower()
+    if priority in PRIORITY_LEVELS:
+        return priority
+    if task_info["task_type"] == AutomationTaskType.SEND_EMAIL.value \
+            and len(task_data.get("to_emails") or []) > BULK_EMAIL_RECIPIENTS:
+        return "low"
+    return DEFAULT_TASK_PRIORITIES.get(task_info["task_type"], "normal")
+
+
+def get_task_channel(task_info: Dict[str, Any]) -> Optional[str]:
+    """작업이 호출하는 외부 채널 (토큰 버킷 키)"""
+    task_type = task_info["task_type"]
+    task_data = task_info.get("task_data") or {}
+    if task_type in (AutomationTaskType.SEND_EMAIL.value, AutomationTaskType.SEND_CAMPAIGN.value):
+        return "smtp"
+    if task_type == AutomationTaskType.SCHEDULE_CALENDAR.value:
+        return "google_calendar"
+    if task_type == AutomationTaskType.SEND_MESSAGE.value:
+        return str(task_data.get("platform", "")).lower() or None
+    if task_type == AutomationTaskType.SEND_REMINDER.value:
+        return "smtp" if task_data.get("notification_type") == "email" else "notification"
+    if task_type == AutomationTaskType.PUBLISH_SNS.value:
+        return f"sns_{str(task_data.get('platform', '')).lower()}"
+    return None
+
+
+class TokenBucket:
+    """
+    초당 rate 개씩 채워지고 최대 burst 개까지 모아 쓰는 토큰 버킷
+    
+    토큰이 부족하면 대기자를 우선순위 힙에 넣고, 토큰이 채워질 때마다 우선순위(같으면 요청 순서)가
+    가장 높은 대기자에게 배분한다. 같은 채널을 쓰는 여러 작업 타입의 레인이 한 버킷을 공유해도
+    urgent/high 작업이 low 작업 뒤에 줄 서지 않는다.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = float(rate)
+        self.capacity = max(int(burst), 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._waiters: List[tuple] = []  # (우선순위, 순번, 요청 시각, future) 힙
+        self._sequence = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    async def acquire(self, priority: int = PRIORITY_LEVELS["normal"]) -> float:
+        """토큰 1개 획득 (부족하면 우선순위 순서로 채워질 때까지 대기), 대기한 시간(초) 반환"""
+        self._refill()
+        if not self._waiters and self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        
+        requested_at = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), requested_at, future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        await future
+        return time.monotonic() - requested_at
+    
+    async def _dispatch(self):
+        """대기자가 남아 있는 동안 토큰이 채워지는 시각마다 우선순위 순서로 배분 (sleep 중에는 상태를 잡지 않음)"""
+        while self._waiters:
+            self._refill()
+            while self._waiters and self.tokens >= 1:
+                future = heapq.heappop(self._waiters)[-1]
+                if future.done():  # 대기 중 취소된 작업
+                    continue
+                self.tokens -= 1
+                future.set_result(None)
+            if self._waiters:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    def waiting(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter[-1].done())
+    
+    def available(self) -> float:
+        self._refill()
+        return round(self.tokens, 2)
+    
+    def close(self):
+        """배분 코루틴 종료 (대기 중인 작업은 취소)"""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        for waiter in self._waiters:
+            if not waiter[-1].done():
+                waiter[-1].cancel()
+        self._waiters.clear()
+
+
+class TaskExecutionEngine:
+    """
+    작업 타입별 고정 크기 실행 풀 + 우선순위 레인 + 외부 채널별 토큰 버킷
+    
+    submit 된 작업은 타입별 우선순위 큐에 들어가고, 타입별 pool_size 개의 실행 코루틴이
+    우선순위(같으면 제출 순서) 대로 꺼내 채널 토큰을 얻은 뒤 실행한다.
+    채널 토큰도 작업 우선순위 순서로 배분되므로 채널을 공유하는 레인 사이에서도 우선순위가 유지된다.
+    """
+    
+    def __init__(self, pool_sizes: Dict[str, int] = None, rate_limits: Dict[str, Dict[str, float]] = None,
+                 default_pool_size: int = 2):
+        self.pool_sizes = pool_sizes or {}
+        self.default_pool_size = default_pool_size
+        self.buckets = {
+            channel: TokenBucket(limit["rate"], limit.get("burst", 1))
+            for channel, limit in (rate_limits or {}).items()
+            if limit and limit.get("rate")
+        }
+        self._queues: Dict[str, asyncio.PriorityQueue] = {}
+        self._pools: Dict[str, List[asyncio.Task]] = {}
+        self._sequence = itertools.count()
+        self._lane_stats: Dict[str, Dict[str, Any]] = {}
+        self._channel_stats: Dict[str, Dict[str, float]] = {}
+    
+    def _get_queue(self, task_type: str) -> asyncio.PriorityQueue:
+        """타입별 큐와 실행 풀을 처음 사용할 때 생성"""
+        queue = self._queues.get(task_type)
+        if queue is None:
+            queue = self._queues[task_type] = asyncio.PriorityQueue()
+            pool_size = self.pool_sizes.get(task_type, self.default_pool_size)
+            self._pools[task_type] = [
+                asyncio.create_task(self._run_pool(task_type, queue)) for _ in range(pool_size)
+            ]
+            self._lane_stats[task_type] = {
+                "pool_size": pool_size, "running": 0, "submitted": 0, "completed": 0, "errors": 0,
+                "wait_ms_total": 0.0, "wait_ms_max": 0.0,
+                "by_priority": {priority: 0 for priority in PRIORITY_LEVELS}
+            }
+        return queue
+    
+    async def submit(self, task_info: Dict[str, Any], run: Callable[[Dict[str, Any]], Awaitable[Any]]) -> Any:
+        """작업을 레인에 넣고 실행이 끝날 때까지 기다려 결과 반환"""
+        task_type = task_info["task_type"]
+        priority = get_task_priority(task_info)
+        queue = self._get_queue(task_type)
+        future = asyncio.get_running_loop().create_future()
+        
+        stats = self._lane_stats[task_type]
+        stats["submitted"] += 1
+        stats["by_priority"][priority] += 1
+        await queue.put((PRIORITY_LEVELS[priority], next(self._sequence), time.monotonic(), task_info, run, future))
+        return await future
+    
+    async def _run_pool(self, task_type: str, queue: asyncio.PriorityQueue):
+        stats = self._lane_stats[task_type]
+        while True:
+            priority, _, enqueued_at, task_info, run, future = await queue.get()
+            try:
+                wait_ms = (time.monotonic() - enqueued_at) * 1000
+                stats["wait_ms_total"] += wait_ms
+                stats["wait_ms_max"] = max(stats["wait_ms_max"], wait_ms)
+                
+                channel = get_task_channel(task_info)
+                bucket = self.buckets.get(channel)
+                if bucket:
+                    throttled = await bucket.acquire(priority)
+                    channel_stats = self._channel_stats.setdefault(channel, {"acquired": 0, "throttled": 0, "throttle_ms_total": 0.0})
+                    channel_stats["acquired"] += 1
+                    if throttled:
+                        channel_stats["throttled"] += 1
+                        channel_stats["throttle_ms_total"] += throttled * 1000
+                
+                stats["running"] += 1
+                try:
+                    result = await run(task_info)
+                finally:
+                    stats["running"] -= 1
+                stats["completed"] += 1
+                if not future.done():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as e:
+                stats["errors"] += 1
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                queue.task_done()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """레인별 큐 깊이/대기 시간, 채널별 토큰 현황"""
+        lanes = {}
+        for task_type, stats in self._lane_stats.items():
+            started = stats["completed"] + stats["errors"] + stats["running"]
+            lanes[task_type] = {
+                **{key: value for key, value in stats.items() if key not in ("wait_ms_total", "wait_ms_max")},
+                "queue_depth": self._queues[task_type].qsize(),
+                "wait_ms_avg": round(stats["wait_ms_total"] / started, 2) if started else 0.0,
+                "wait_ms_max": round(stats["wait_ms_max"], 2),
+                "by_priority": dict(stats["by_priority"])
+            }
+        channels = {
+            channel: {
+                "rate": bucket.rate,
+                "burst": bucket.capacity,
+                "tokens": bucket.available(),
+                "waiting": bucket.waiting(),
+                "acquired": self._channel_stats.get(channel, {}).get("acquired", 0),
+                "throttled": self._channel_stats.get(channel, {}).get("throttled", 0),
+                "throttle_ms_total": round(self._channel_stats.get(channel, {}).get("throttle_ms_total", 0.0), 2)
+            }
+            for channel, bucket in self.buckets.items()
+        }
+        return {"lanes": lanes, "channels": channels}
+    
+    async def shutdown(self):
+        """실행 풀 종료 (대기 중인 작업은 취소)"""
+        workers = [worker for pool in self._pools.values() for worker in pool]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for bucket in self.buckets.values():
+            bucket.close()
+        for queue in self._queues.values():
+            while not queue.empty():
+                future = queue.get_nowait()[-1]
+                if not future.done():
+                    future.cancel()
+        self._queues.clear()
+        self._pools.clear()
+
+
 class TaskAgentAutomationManager:
     """Task Agent 자동화 매니저 (공통 모듈 기반)"""
     
-    def __init__(self):
-        """자동화 매니저 초기화"""
+    def __init__(self, inline_execution: Optional[bool] = None):
+        """
+        자동화 매니저 초기화
+        
+        Args:
+            inline_execution: 이 프로세스에서 작업을 실행할지 여부
+                (기본값: automation.execution_mode 가 inline 이면 True, worker 이면 False)
+        """
         try:
             # 스케줄러 초기화
             self.scheduler = AsyncIOScheduler()
@@ -45,6 +307,42 @@ class TaskAgentAutomationManager:
             self.config_manager = get_automation_config_manager()
             self.db_helper = get_automation_db_helper()
             
+            settings = self.config_manager.get_automation_settings()
+            if inline_execution is None:
+                inline_execution = settings["execution_mode"] != "worker"
+            self.inline_execution = inline_execution
+            
+            # 작업 타입별 실행 풀 / 채널별 속도 제한
+            self.execution_engine = TaskExecutionEngine(
+                pool_sizes=settings["pool_sizes"],
+                rate_limits=settings["rate_limits"]
+            )
+            
+            # 작업 타입별 재시도 정책
+            self.retry_policies = build_retry_policies(settings["retry_policies"])
+            
+            # 반복 작업 기본 시간대 / 지연 실행 처리
+            self.recurrence_timezone = settings["recurrence_timezone"]
+            self.misfire_policy = settings["recurrence_misfire_policy"]
+            self.misfire_grace = settings["recurrence_misfire_grace"]
+            
+            # 대량 이메일 캠페인 기본 배치 크기
+            self.campaign_batch_size = settings["campaign_batch_size"]
+            
+            # 예약 작업은 automation_task 테이블에서 적재 (재시작/다중 프로세스에서도 유지)
+            self.task_scheduler = None
+            if inline_execution:
+                self.task_scheduler = DurableTaskScheduler(
+                    self.scheduler,
+                    self._execute_task,
+                    poll_interval=settings["scheduler_poll_interval"],
+                    lookahead=settings["scheduler_lookahead"],
+                    batch_size=settings["scheduler_batch_size"],
+                    lease_seconds=settings["worker_lease_seconds"],
+                    heartbeat_interval=settings["worker_heartbeat_interval"]
+                )
+                self.task_scheduler.start()
+            
             # 자동화 서비스들 초기화
             self._init_services()
             
@@ -61,6 +359,7 @@ class TaskAgentAutomationManager:
             self.calendar_service = GoogleCalendarService()
             # self.sns_service = SNSService()
             self.reminder_service = ReminderService()
+            self.campaign_service = EmailCampaignService()
             
             logger.info("자동화 서비스들 초기화 완료")
             
@@ -71,6 +370,7 @@ class TaskAgentAutomationManager:
             self.calendar_service = None
             # self.sns_service = None
             self.reminder_service = None
+            self.campaign_service = None
 
     async def create_automation_task(self, request: AutomationRequest) -> AutomationResponse:
         """자동화 작업 생성"""
@@ -91,6 +391,30 @@ class TaskAgentAutomationManager:
                     message=f"작업 데이터 검증 실패: {', '.join(validation_result['errors'])}"
                 )
             
+            # 반복 작업: 규칙을 검증하고 첫 회차를 예약 시각으로 사용
+            recurrence = None
+            timezone = None
+            task_data = request.task_data
+            if request.recurrence:
+                timezone = request.timezone or self.recurrence_timezone
+                try:
+                    if request.misfire_policy and request.misfire_policy not in MISFIRE_POLICIES:
+                        raise ValueError(f"지원하지 않는 misfire_policy: {request.misfire_policy}")
+                    start = request.scheduled_at or datetime.now()
+                    recurrence = normalize_recurrence(request.recurrence, timezone, start)
+                    first_run = next_occurrence(recurrence, timezone, start - timedelta(seconds=1))
+                    if first_run is None:
+                        raise ValueError("실행할 회차가 없습니다")
+                except Exception as recurrence_error:
+                    return AutomationResponse(
+                        task_id=-1,
+                        status=AutomationStatus.FAILED,
+                        message=f"반복 규칙 검증 실패: {recurrence_error}"
+                    )
+                request.scheduled_at = first_run
+                if request.misfire_policy:
+                    task_data = {**task_data, "misfire_policy": request.misfire_policy}
+            
             # DB에 작업 저장 (공통 모듈 활용)
             db_session = get_db_session()
             try:
@@ -98,9 +422,11 @@ class TaskAgentAutomationManager:
                     user_id=request.user_id,
                     task_type=request.task_type.value,
                     title=request.title,
-                    task_data=request.task_data,
+                    task_data=task_data,
                     status=AutomationStatus.PENDING.value,
-                    scheduled_at=request.scheduled_at
+                    scheduled_at=request.scheduled_at,
+                    recurrence=recurrence,
+                    timezone=timezone
                 )
                 
                 db_session.add(automation_task)
@@ -118,24 +444,29 @@ class TaskAgentAutomationManager:
                 details=f"task saved to database"
             )
             
+            # 워커 모드: 저장된 행을 automation 워커가 선점해 실행
+            if not self.inline_execution:
+                return AutomationResponse(
+                    task_id=task_id,
+                    status=AutomationStatus.PENDING,
+                    message=(
+                        f"작업이 {request.scheduled_at.strftime('%Y-%m-%d %H:%M')}에 예약되었습니다."
+                        if request.scheduled_at else "작업이 실행 대기열에 등록되었습니다."
+                    ),
+                    scheduled_time=request.scheduled_at
+                )
+            
             # 스케줄 설정
             if request.scheduled_at:
                 # 예약된 작업
                 try:
-                    self.scheduler.add_job(
-                        self._execute_task,
-                        'date',
-                        run_date=request.scheduled_at,
-                        args=[task_id],
-                        id=f"auto_{task_id}",
-                        misfire_grace_time=300  # 5분 유예시간
-                    )
+                    loaded = self.task_scheduler.schedule(task_id, request.scheduled_at)
                     
                     TaskAgentLogger.log_automation_task(
                         task_id=str(task_id),
                         task_type=request.task_type.value,
                         status="scheduled",
-                        details=f"scheduled for {request.scheduled_at}"
+                        details=f"scheduled for {request.scheduled_at}" + ("" if loaded else " (loaded by sync)")
                     )
                     
                     return AutomationResponse(
@@ -148,20 +479,10 @@ class TaskAgentAutomationManager:
                 except Exception as scheduler_error:
                     logger.error(f"스케줄러 등록 실패: {scheduler_error}")
                     # 스케줄러 실패시 즉시 실행으로 전환
-                    result = await self._execute_task(task_id)
-                    return AutomationResponse(
-                        task_id=task_id,
-                        status=AutomationStatus.SUCCESS if result.get("status") == "success" else AutomationStatus.FAILED,
-                        message=result.get("message", "작업이 실행되었습니다 (스케줄 실패로 즉시 실행)")
-                    )
+                    return await self._execute_now(task_id, "작업이 실행되었습니다 (스케줄 실패로 즉시 실행)")
             else:
                 # 즉시 실행
-                result = await self._execute_task(task_id)
-                return AutomationResponse(
-                    task_id=task_id,
-                    status=AutomationStatus.SUCCESS if result.get("status") == "success" else AutomationStatus.FAILED,
-                    message=result.get("message", "작업이 실행되었습니다.")
-                )
+                return await self._execute_now(task_id, "작업이 실행되었습니다.")
                 
         except Exception as e:
             logger.error(f"자동화 작업 생성 실패: {e}")
@@ -178,6 +499,27 @@ class TaskAgentAutomationManager:
                 message=f"작업 생성 실패: {str(e)}"
             )
 
+    async def _execute_now(self, task_id: int, default_message: str) -> AutomationResponse:
+        """
+        저장된 작업을 이 프로세스에서 바로 실행
+
+        예약 실행과 같이 선점(locked_by / lease_expires_at)을 기록한 뒤 실행하므로,
+        실행 중 프로세스가 비정상 종료되어도 리스 만료 후 워커가 작업을 다시 가져간다.
+        """
+        result = await self.task_scheduler.run_task(task_id)
+        if result is None:
+            return AutomationResponse(
+                task_id=task_id,
+                status=AutomationStatus.PENDING,
+                message="다른 프로세스에서 실행 중이거나 취소된 작업입니다."
+            )
+        
+        return AutomationResponse(
+            task_id=task_id,
+            status=AutomationStatus.SUCCESS if result.get("status") == "success" else AutomationStatus.FAILED,
+            message=result.get("message", default_message)
+        )
+
     def _validate_task_data(self, request: AutomationRequest) -> Dict[str, Any]:
         """작업 데이터 검증"""
         errors = []
@@ -219,6 +561,10 @@ class TaskAgentAutomationManager:
                 errors.append("리마인더 메시지가 필요합니다")
             if not task_data.get("remind_time"):
                 errors.append("알림 시간이 필요합니다")
+                
+        elif task_type == AutomationTaskType.SEND_CAMPAIGN:
+            if not task_data.get("campaign_id"):
+                errors.append("캠페인 ID가 필요합니다")
         
         return {
             "is_valid": len(errors) == 0,
@@ -227,7 +573,7 @@ class TaskAgentAutomationManager:
         }
 
     async def _execute_task(self, task_id: int) -> Dict[str, Any]:
-        """자동화 작업 실행"""
+        """자동화 작업 실행 (실행 엔진의 타입별 풀/우선순위/속도 제한을 거쳐 실행)"""
         try:
             TaskAgentLogger.log_automation_task(
                 task_id=str(task_id),
@@ -249,38 +595,60 @@ class TaskAgentAutomationManager:
                 )
                 return {"status": "failed", "message": error_msg}
             
+            return await self.execution_engine.submit(task_info, self._run_task)
+            
+        except Exception as e:
+            logger.error(f"작업 실행 실패 (ID: {task_id}): {e}")
+            return {"status": "failed", "message": str(e)}
+    
+    async def _run_task(self, task_info: Dict[str, Any]) -> Dict[str, Any]:
+        """조회된 작업을 실행하고 결과 상태 기록 (일시적 오류는 재시도 예약)"""
+        task_id = task_info["task_id"]
+        task_type = task_info["task_type"]
+        attempt = task_info.get("attempts", 0) + 1
+        try:
+            # 반복 작업의 늦은 회차는 정책에 따라 실행하지 않고 다음 회차로 넘김
+            if task_info.get("recurrence") and self._get_misfire_policy(task_info) == MISFIRE_SKIP \
+                    and is_misfired(task_info["scheduled_at"], self.misfire_grace):
+                result = {"status": "skipped", "message": f"예정 시각({task_info['scheduled_at']})이 지나 회차를 건너뜀"}
+                next_run = await self._finish_task(task_info, AutomationStatus.CANCELLED.value, result)
+                TaskAgentLogger.log_automation_task(
+                    task_id=str(task_id),
+                    task_type=task_type,
+                    status="misfire_skipped",
+                    details=f"scheduled {task_info['scheduled_at']}, next run {next_run}"
+                )
+                return result
+            
             # 상태 업데이트 - PROCESSING
             await self.db_helper.update_automation_task_status(
                 task_id, 
                 AutomationStatus.PROCESSING.value,
-                executed_at=datetime.now()
+                executed_at=datetime.now(),
+                attempts=attempt
             )
             
             # 작업 실행
-            task_type = task_info["task_type"]
             task_data = task_info["task_data"] or {}
             
             TaskAgentLogger.log_automation_task(
                 task_id=str(task_id),
                 task_type=task_type,
                 status="processing",
-                details=f"executing {task_type}"
+                details=f"executing {task_type} (attempt {attempt})"
             )
             
             result = await self._execute_by_type(task_type, task_data, task_info["user_id"])
             
-            # 결과에 따른 상태 업데이트
-            final_status = AutomationStatus.SUCCESS.value if result["status"] == "success" else AutomationStatus.FAILED.value
-            await self.db_helper.update_automation_task_status(
-                task_id, 
-                final_status,
-                result_data=result
-            )
+            if result["status"] != "success":
+                return await self._handle_failure(task_info, attempt, result=result)
+            
+            await self._finish_task(task_info, AutomationStatus.SUCCESS.value, result)
             
             TaskAgentLogger.log_automation_task(
                 task_id=str(task_id),
                 task_type=task_type,
-                status=final_status,
+                status=AutomationStatus.SUCCESS.value,
                 details=f"execution completed: {result.get('message', 'no message')}"
             )
             
@@ -289,24 +657,108 @@ class TaskAgentAutomationManager:
         except Exception as e:
             logger.error(f"작업 실행 실패 (ID: {task_id}): {e}")
             
-            # 실패 상태로 업데이트
+            # 실패 상태로 업데이트 (DB 업데이트 실패는 로그만 남기고 넘어감)
             try:
-                await self.db_helper.update_automation_task_status(
-                    task_id, 
-                    AutomationStatus.FAILED.value,
-                    result_data={"error": str(e)}
-                )
-            except:
-                pass  # DB 업데이트 실패는 로그만 남기고 넘어감
+                return await self._handle_failure(task_info, attempt, error=e)
+            except Exception:
+                return {"status": "failed", "message": str(e)}
+    
+    async def _handle_failure(self, task_info: Dict[str, Any], attempt: int,
+                              result: Optional[Dict[str, Any]] = None,
+                              error: Optional[Exception] = None) -> Dict[str, Any]:
+        """
+        실패 기록 후 재시도 예약 또는 종료 상태 결정
+        
+        일시적 오류는 정책의 최대 시도 횟수까지 백오프 후 다시 대기 상태로 돌리고,
+        횟수를 소진하면 dead_letter, 재시도 대상이 아닌 오류는 바로 failed 로 기록한다.
+        """
+        task_id = task_info["task_id"]
+        task_type = task_info["task_type"]
+        result = result or {"status": "failed", "message": str(error)}
+        policy = self.retry_policies.get(task_type, self.retry_policies["default"])
+        retryable = policy.is_retryable(result=result if error is None else None, error=error)
+        
+        failure = {
+            "attempt": attempt,
+            "error": str(result.get("message", ""))[:500],
+            "retryable": retryable,
+            "at": datetime.now().isoformat()
+        }
+        
+        if policy.should_retry(attempt, retryable):
+            retry_at = datetime.now() + timedelta(seconds=policy.next_delay(attempt))
+            await self.db_helper.update_automation_task_status(
+                task_id,
+                AutomationStatus.PENDING.value,
+                result_data=result,
+                error=failure,
+                scheduled_at=retry_at
+            )
+            if self.task_scheduler:
+                self.task_scheduler.schedule(task_id, retry_at)
             
             TaskAgentLogger.log_automation_task(
                 task_id=str(task_id),
-                task_type="unknown",
-                status="failed",
-                details=f"execution error: {str(e)}"
+                task_type=task_type,
+                status="retry_scheduled",
+                details=f"attempt {attempt}/{policy.max_attempts} failed, retry at {retry_at.isoformat()}: {failure['error']}"
             )
-            
-            return {"status": "failed", "message": str(e)}
+            return {**result, "retry_scheduled_at": retry_at.isoformat(), "attempt": attempt}
+        
+        final_status = AutomationStatus.DEAD_LETTER.value if retryable else AutomationStatus.FAILED.value
+        await self._finish_task(task_info, final_status, result, error=failure)
+        
+        TaskAgentLogger.log_automation_task(
+            task_id=str(task_id),
+            task_type=task_type,
+            status=final_status,
+            details=f"attempt {attempt} failed: {failure['error']}"
+        )
+        return {**result, "attempt": attempt}
+    
+    def _get_misfire_policy(self, task_info: Dict[str, Any]) -> str:
+        return (task_info.get("task_data") or {}).get("misfire_policy") or self.misfire_policy
+    
+    async def _finish_task(self, task_info: Dict[str, Any], status: str, result: Dict[str, Any],
+                           error: Optional[Dict[str, Any]] = None) -> Optional[datetime]:
+        """
+        회차 종료 상태 기록
+        
+        반복 작업은 결과를 남기고 같은 행을 다음 회차의 대기 작업으로 되돌린다.
+        (반복이 끝났거나 실행 중 취소되었으면 종료 상태로 남음)
+        
+        Returns:
+            Optional[datetime]: 예약된 다음 실행 시각
+        """
+        task_id = task_info["task_id"]
+        next_run = None
+        if task_info.get("recurrence"):
+            try:
+                next_run = plan_next_run(
+                    task_info["recurrence"], task_info.get("timezone"),
+                    task_info["scheduled_at"], self._get_misfire_policy(task_info)
+                )
+            except Exception as e:
+                logger.error(f"다음 회차 계산 실패 (ID: {task_id}): {e}")
+        
+        if next_run is None:
+            await self.db_helper.update_automation_task_status(task_id, status, result_data=result, error=error)
+            return None
+        
+        rescheduled = await self.db_helper.update_automation_task_status(
+            task_id,
+            AutomationStatus.PENDING.value,
+            result_data=result,
+            error=error,
+            attempts=0,
+            scheduled_at=next_run,
+            expected_status=AutomationStatus.PROCESSING.value
+        )
+        if not rescheduled:
+            return None
+        if self.task_scheduler:
+            self.task_scheduler.schedule(task_id, next_run)
+        return next_run
     
     async def _execute_by_type(self, task_type: str, task_data: Dict[str, Any], user_id: int) -> Dict[str, Any]:
         """타입별 작업 실행"""
@@ -321,6 +773,8 @@ class TaskAgentAutomationManager:
                 return await self._execute_reminder(task_data, user_id)
             elif task_type == AutomationTaskType.SEND_MESSAGE.value:
                 return await self._execute_message(task_data, user_id)
+            elif task_type == AutomationTaskType.SEND_CAMPAIGN.value:
+                return await self._execute_campaign(task_data, user_id)
             else:
                 return {"status": "failed", "message": f"지원하지 않는 작업 타입: {task_type}"}
                 
@@ -522,6 +976,33 @@ class TaskAgentAutomationManager:
         except Exception as e:
             logger.error(f"메시지 작업 실패: {e}")
             return {"status": "failed", "message": f"메시지 작업 실패: {str(e)}"}
+    
+    async def _execute_campaign(self, task_data: Dict[str, Any], user_id: int) -> Dict[str, Any]:
+        """대량 이메일 캠페인 발송 (재시도 시 체크포인트 이후 수신자부터 이어서 발송)"""
+        try:
+            if not self.campaign_service:
+                return {"status": "failed", "message": "캠페인 서비스가 초기화되지 않았습니다"}
+            
+            campaign_id = task_data.get("campaign_id")
+            result = await self.campaign_service.run_campaign(campaign_id)
+            
+            if result.get("success"):
+                return {
+                    "status": "success",
+                    "message": f"캠페인 {campaign_id}: {result.get('sent', 0)}건 발송, {result.get('failed', 0)}건 실패",
+                    "details": result
+                }
+            else:
+                return {
+                    "status": "failed",
+                    "message": result.get("error", "캠페인 발송 실패"),
+                    "details": result,
+                    "retryable": result.get("retryable", False)
+                }
+            
+        except Exception as e:
+            logger.error(f"캠페인 작업 실패: {e}")
+            return {"status": "failed", "message": f"캠페인 작업 실패: {str(e)}"}
 
     async def get_task_status(self, task_id: int) -> Dict[str, Any]:
         """작업 상태 조회"""
@@ -539,6 +1020,9 @@ class TaskAgentAutomationManager:
                 "created_at": task_info["created_at"].isoformat() if task_info["created_at"] else None,
                 "executed_at": task_info["executed_at"].isoformat() if task_info["executed_at"] else None,
                 "scheduled_at": task_info["scheduled_at"].isoformat() if task_info["scheduled_at"] else None,
+                "recurrence": task_info["recurrence"],
+                "timezone": task_info["timezone"],
+                "attempts": task_info["attempts"],
                 "user_id": task_info["user_id"]
             }
             
@@ -549,12 +1033,9 @@ class TaskAgentAutomationManager:
     async def cancel_task(self, task_id: int) -> bool:
         """작업 취소"""
         try:
-            # 스케줄러에서 제거
-            try:
-                self.scheduler.remove_job(f"auto_{task_id}")
+            # 스케줄러에서 제거 (적재 전인 작업은 DB 상태만 바꾸면 적재되지 않음)
+            if self.task_scheduler and self.task_scheduler.unschedule(task_id):
                 logger.info(f"스케줄러에서 작업 제거 완료: {task_id}")
-            except Exception as scheduler_error:
-                logger.warning(f"스케줄러 작업 제거 실패 (이미 실행되었거나 존재하지 않음): {scheduler_error}")
             
             # DB 상태 업데이트 (공통 모듈의 DB 헬퍼 활용)
             success = await self.db_helper.update_automation_task_status(
@@ -576,6 +1057,94 @@ class TaskAgentAutomationManager:
             logger.error(f"작업 취소 실패: {e}")
             return False
 
+    async def get_dead_letter_tasks(self, task_type: Optional[str] = None, user_id: Optional[int] = None,
+                                    limit: int = 100, after_id: int = 0) -> List[Dict[str, Any]]:
+        """재시도를 소진한 작업 목록 조회"""
+        try:
+            return await self.db_helper.get_dead_letter_automation_tasks(task_type, user_id, limit, after_id)
+        except Exception as e:
+            logger.error(f"dead letter 작업 조회 실패: {e}")
+            return []
+
+    async def replay_tasks(self, task_ids: Optional[List[int]] = None, task_type: Optional[str] = None,
+                           user_id: Optional[int] = None, include_failed: bool = False,
+                           limit: int = 500) -> Dict[str, Any]:
+        """
+        dead letter 작업 일괄 재실행 (include_failed 이면 재시도 대상이 아니었던 실패 작업도 포함)
+        
+        시도 횟수를 초기화해 대기 상태로 되돌리므로 재시도 정책이 처음부터 다시 적용된다.
+        """
+        statuses = (AutomationStatus.DEAD_LETTER.value,)
+        if include_failed:
+            statuses += (AutomationStatus.FAILED.value,)
+        
+        try:
+            replayed = await self.db_helper.replay_automation_tasks(task_ids, task_type, user_id, statuses, limit)
+            
+            # 워커 모드에서는 워커가 대기 작업으로 선점해 실행
+            if self.task_scheduler:
+                now = datetime.now()
+                for task_id in replayed:
+                    self.task_scheduler.schedule(task_id, now)
+            
+            return {"replayed": len(replayed), "task_ids": replayed}
+            
+        except Exception as e:
+            logger.error(f"작업 재실행 요청 실패: {e}")
+            return {"replayed": 0, "task_ids": [], "error": str(e)}
+
+    async def create_campaign(self, request: CampaignRequest) -> Dict[str, Any]:
+        """
+        대량 이메일 캠페인 생성 후 발송 작업 등록
+        
+        발송은 수신자 수만큼 오래 걸리므로 즉시 발송이어도 예약 작업으로 등록해 요청을 막지 않는다.
+        """
+        try:
+            if not self.campaign_service:
+                return {"success": False, "error": "캠페인 서비스가 초기화되지 않았습니다"}
+            
+            created = await self.campaign_service.create_campaign(
+                user_id=request.user_id,
+                recipients=[recipient.model_dump() for recipient in request.recipients],
+                template_id=request.template_id,
+                subject=request.subject,
+                body=request.body,
+                content_type=request.content_type,
+                batch_size=request.batch_size or self.campaign_batch_size
+            )
+            if not created.get("success"):
+                return created
+            campaign_id = created["campaign_id"]
+            
+            response = await self.create_automation_task(AutomationRequest(
+                user_id=request.user_id,
+                task_type=AutomationTaskType.SEND_CAMPAIGN,
+                title=f"이메일 캠페인 {campaign_id}",
+                task_data={"campaign_id": campaign_id},
+                scheduled_at=request.scheduled_at or datetime.now()
+            ))
+            if response.task_id > 0:
+                await self.campaign_service.set_campaign_task(campaign_id, response.task_id)
+            
+            return {
+                **created,
+                "success": response.task_id > 0,
+                "task_id": response.task_id,
+                "message": response.message,
+                "scheduled_time": response.scheduled_time
+            }
+            
+        except Exception as e:
+            logger.error(f"캠페인 생성 실패: {e}")
+            return {"success": False, "error": str(e)}
+
+    async def get_campaign_progress(self, campaign_id: int, status: Optional[str] = None,
+                                    after_id: int = 0, limit: int = 100) -> Optional[Dict[str, Any]]:
+        """캠페인 진행 현황 및 수신자별 발송 상태 조회"""
+        if not self.campaign_service:
+            return None
+        return await self.campaign_service.get_campaign_progress(campaign_id, status, after_id, limit)
+
     async def get_user_tasks(self, user_id: int, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
         """사용자의 자동화 작업 목록 조회"""
         try:
@@ -594,11 +1163,17 @@ class TaskAgentAutomationManager:
             
             stats.update({
                 "scheduler_jobs": scheduler_jobs,
+                "execution_engine": self.execution_engine.get_stats(),
+                "http_client": get_http_client().get_stats(),
+                "execution_mode": "inline" if self.inline_execution else "worker",
+                "task_scheduler": self.task_scheduler.get_stats() if self.task_scheduler else None,
+                "retry_policies": {task_type: policy.to_dict() for task_type, policy in self.retry_policies.items()},
                 "services_status": {
                     "email_service": bool(self.email_service),
                     "calendar_service": bool(self.calendar_service),
                     # "sns_service": bool(self.sns_service),
-                    "reminder_service": bool(self.reminder_service)
+                    "reminder_service": bool(self.reminder_service),
+                    "campaign_service": bool(self.campaign_service)
                 },
                 "timestamp": datetime.now().isoformat()
             })
@@ -612,6 +1187,8 @@ class TaskAgentAutomationManager:
     async def shutdown(self):
         """자동화 매니저 종료"""
         try:
+            await self.execution_engine.shutdown()
+            
             # 스케줄러 종료
             if self.scheduler.running:
                 self.scheduler.shutdown()
@@ -627,6 +1204,9 @@ class TaskAgentAutomationManager:
                     except Exception as service_error:
                         logger.warning(f"서비스 정리 실패: {service_error}")
             
+            # 공유 HTTP 세션 (웹훅/OAuth 연결 유지) 정리
+            await close_http_clients()
+            
             logger.info("Task Agent 자동화 매니저 종료 완료")
             
         except Exception as e:
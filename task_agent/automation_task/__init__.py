@@ -9,7 +9,8 @@ AUTOMATION_SERVICES = [
     "email_service",
     "google_calendar_service", 
     # "sns_service",
-    "reminder_service"
+    "reminder_service",
+    "campaign_service"
 ]
 
 # 공통 모듈
@@ -0,0 +1,459 @@
+"""
+대량 이메일 캠페인 서비스
+템플릿 하나와 수신자별 변수로 개인화된 이메일을 배치 단위로 발송한다.
+
+- 제목/본문 템플릿({변수} 형식)은 캠페인마다 한 번만 파싱해 수신자마다 조립만 한다.
+- 배치 하나는 SMTP 연결 풀의 연결 하나로 연속 발송하고, 여러 배치를 동시에 보낸다.
+- 배치가 끝날 때마다 수신자별 상태를 기록(체크포인트)하므로 중단되어도 남은 수신자부터 이어서 보낸다.
+  (중단 시점에 발송 중이던 배치는 다시 보내질 수 있음)
+"""
+
+import html
+import time
+import asyncio
+import logging
+from datetime import datetime
+from string import Formatter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import case, func, insert, select, update
+
+from shared_modules.database import get_session
+from shared_modules.db_models import EmailCampaign, EmailCampaignRecipient, TemplateMessage
+
+from .common import get_email_manager, ValidationUtils
+from .common.email_manager import SMTP_CONNECTION_ERROR
+
+logger = logging.getLogger(__name__)
+
+CAMPAIGN_PENDING = "pending"
+CAMPAIGN_RUNNING = "running"
+CAMPAIGN_COMPLETED = "completed"
+CAMPAIGN_CANCELLED = "cancelled"
+
+RECIPIENT_PENDING = "pending"
+RECIPIENT_SENT = "sent"
+RECIPIENT_FAILED = "failed"
+
+_INSERT_CHUNK = 1000
+
+
+class CompiledTemplate:
+    """
+    str.format 형식({name}, {order.id}, {price:,})의 템플릿을 미리 파싱해 둔 렌더러
+
+    단순 변수는 dict 조회로 바로 채우고, 속성/인덱스/포맷 지정이 있는 필드만 Formatter 로 처리한다.
+    """
+
+    _formatter = Formatter()
+
+    def __init__(self, template: str, escape: Optional[Callable[[str], str]] = None):
+        """
+        Args:
+            escape: 변수 값에 적용할 이스케이프 함수 (HTML 본문이면 html.escape)
+        """
+        self.template = template
+        self.escape = escape
+        self._parts: List[Tuple[str, Optional[str], str, Optional[str], bool]] = []
+        self.fields = set()
+        for literal, field_name, format_spec, conversion in self._formatter.parse(template):
+            if field_name is not None:
+                if not field_name:
+                    raise ValueError("위치 인자({})는 사용할 수 없습니다. {변수명} 형식으로 지정하세요")
+                root = field_name.split(".", 1)[0].split("[", 1)[0]
+                self.fields.add(root)
+                simple = field_name == root and not format_spec and not conversion
+                self._parts.append((literal, field_name, format_spec, conversion, simple))
+            else:
+                self._parts.append((literal, None, "", None, True))
+
+    def missing_fields(self, variables: Dict[str, Any]) -> List[str]:
+        return sorted(field for field in self.fields if field not in variables)
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        """변수로 템플릿 조립 (누락된 변수는 KeyError)"""
+        chunks = []
+        for literal, field_name, format_spec, conversion, simple in self._parts:
+            chunks.append(literal)
+            if field_name is None:
+                continue
+            if simple:
+                value = str(variables[field_name])
+            else:
+                value, _ = self._formatter.get_field(field_name, (), variables)
+                value = self._formatter.format_field(self._formatter.convert_field(value, conversion), format_spec)
+            chunks.append(self.escape(value) if self.escape else value)
+        return "".join(chunks)
+
+
+class EmailCampaignService:
+    """대량 이메일 캠페인 생성/발송/진행 조회"""
+
+    def __init__(self, concurrency: Optional[int] = None):
+        """
+        Args:
+            concurrency: 동시에 발송하는 배치 수 (기본: SMTP 연결 풀의 서버별 최대 연결 수)
+        """
+        self.email_manager = get_email_manager()
+        self.concurrency = concurrency or self.email_manager.smtp_pool.max_connections
+
+    # -------------------
+    # 생성
+    # -------------------
+    async def create_campaign(self, user_id: int, recipients: List[Dict[str, Any]],
+                              template_id: Optional[int] = None, subject: Optional[str] = None,
+                              body: Optional[str] = None, content_type: Optional[str] = None,
+                              batch_size: int = 50) -> Dict[str, Any]:
+        """
+        캠페인과 수신자 저장 (발송은 run_campaign)
+
+        주소 형식이 잘못되었거나 템플릿 변수가 빠진 수신자는 바로 실패로 기록한다.
+
+        Returns:
+            Dict: success, campaign_id, total, rejected
+        """
+        session = get_session()
+        try:
+            if template_id:
+                template = session.get(TemplateMessage, template_id)
+                if template is None:
+                    return {"success": False, "error": f"템플릿을 찾을 수 없습니다: {template_id}"}
+                subject = subject or template.title
+                body = body or template.content
+                content_type = content_type or template.content_type
+
+            if not subject or not body:
+                return {"success": False, "error": "제목과 본문(또는 template_id)이 필요합니다"}
+
+            try:
+                subject_template = CompiledTemplate(subject)
+                body_template = CompiledTemplate(body)
+            except ValueError as e:
+                return {"success": False, "error": f"템플릿 형식 오류: {e}"}
+            fields = subject_template.fields | body_template.fields
+
+            campaign = EmailCampaign(
+                user_id=user_id,
+                template_id=template_id,
+                subject=subject,
+                body=body,
+                content_type=content_type,
+                status=CAMPAIGN_PENDING,
+                batch_size=batch_size,
+                total_count=len(recipients)
+            )
+            session.add(campaign)
+            session.flush()
+
+            rows = []
+            rejected = 0
+            for recipient in recipients:
+                email = (recipient.get("email") or "").strip()
+                variables = recipient.get("variables") or {}
+                error = None
+                if not ValidationUtils.is_valid_email(email):
+                    error = "유효하지 않은 이메일 주소"
+                elif fields - variables.keys():
+                    error = f"템플릿 변수 누락: {', '.join(sorted(fields - variables.keys()))}"
+                rejected += error is not None
+                rows.append({
+                    "campaign_id": campaign.campaign_id,
+                    "email": email[:255],
+                    "variables": variables,
+                    "status": RECIPIENT_FAILED if error else RECIPIENT_PENDING,
+                    "error": error
+                })
+
+            for offset in range(0, len(rows), _INSERT_CHUNK):
+                session.execute(insert(EmailCampaignRecipient), rows[offset:offset + _INSERT_CHUNK])
+            campaign.failed_count = rejected
+            session.commit()
+
+            logger.info(f"캠페인 생성: {campaign.campaign_id} (수신자 {len(rows)}명, 거부 {rejected}명)")
+            return {"success": True, "campaign_id": campaign.campaign_id, "total": len(rows), "rejected": rejected}
+
+        except Exception as e:
+            logger.error(f"캠페인 생성 실패: {e}")
+            session.rollback()
+            return {"success": False, "error": str(e)}
+        finally:
+            session.close()
+
+    async def set_campaign_task(self, campaign_id: int, task_id: int) -> bool:
+        """캠페인을 발송하는 자동화 작업 연결"""
+        session = get_session()
+        try:
+            session.execute(update(EmailCampaign).where(EmailCampaign.campaign_id == campaign_id).values(task_id=task_id))
+            session.commit()
+            return True
+        except Exception as e:
+            logger.error(f"캠페인 작업 연결 실패: {e}")
+            session.rollback()
+            return False
+        finally:
+            session.close()
+
+    # -------------------
+    # 발송
+    # -------------------
+    def _load_pending(self, campaign_id: int, after_id: int, limit: int) -> List[Any]:
+        session = get_session()
+        try:
+            return session.execute(
+                select(EmailCampaignRecipient.recipient_id, EmailCampaignRecipient.email, EmailCampaignRecipient.variables)
+                .where(EmailCampaignRecipient.campaign_id == campaign_id,
+                       EmailCampaignRecipient.status == RECIPIENT_PENDING,
+                       EmailCampaignRecipient.recipient_id > after_id)
+                .order_by(EmailCampaignRecipient.recipient_id)
+                .limit(limit)
+            ).all()
+        finally:
+            session.close()
+
+    def _count_pending(self, campaign_id: int) -> int:
+        session = get_session()
+        try:
+            return session.execute(
+                select(func.count()).select_from(EmailCampaignRecipient)
+                .where(EmailCampaignRecipient.campaign_id == campaign_id,
+                       EmailCampaignRecipient.status == RECIPIENT_PENDING)
+            ).scalar()
+        finally:
+            session.close()
+
+    def _checkpoint(self, campaign_id: int, outcomes: List[Tuple[int, Optional[str]]]) -> str:
+        """
+        배치 결과를 한 트랜잭션으로 기록하고 현재 캠페인 상태 반환
+
+        연결 오류로 보내지 못한 수신자는 대기 상태로 남겨 다음 실행에서 다시 보낸다.
+        """
+        now = datetime.now()
+        sent_ids = [recipient_id for recipient_id, error in outcomes if error is None]
+        failed = [(recipient_id, error) for recipient_id, error in outcomes
+                  if error is not None and not error.startswith(SMTP_CONNECTION_ERROR)]
+
+        session = get_session()
+        try:
+            if sent_ids:
+                session.execute(
+                    update(EmailCampaignRecipient)
+                    .where(EmailCampaignRecipient.recipient_id.in_(sent_ids))
+                    .values(status=RECIPIENT_SENT, error=None, sent_at=now)
+                )
+            if failed:
+                session.execute(
+                    update(EmailCampaignRecipient)
+                    .where(EmailCampaignRecipient.recipient_id.in_([recipient_id for recipient_id, _ in failed]))
+                    .values(
+                        status=RECIPIENT_FAILED,
+                        error=case(
+                            {recipient_id: error[:500] for recipient_id, error in failed},
+                            value=EmailCampaignRecipient.recipient_id
+                        )
+                    )
+                )
+            session.execute(
+                update(EmailCampaign)
+                .where(EmailCampaign.campaign_id == campaign_id)
+                .values(
+                    sent_count=EmailCampaign.sent_count + len(sent_ids),
+                    failed_count=EmailCampaign.failed_count + len(failed)
+                )
+            )
+            status = session.execute(
+                select(EmailCampaign.status).where(EmailCampaign.campaign_id == campaign_id)
+            ).scalar()
+            session.commit()
+            return status
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _set_status(self, campaign_id: int, status: str, **values):
+        session = get_session()
+        try:
+            session.execute(
+                update(EmailCampaign).where(EmailCampaign.campaign_id == campaign_id).values(status=status, **values)
+            )
+            session.commit()
+        finally:
+            session.close()
+
+    async def run_campaign(self, campaign_id: int) -> Dict[str, Any]:
+        """
+        대기 중인 수신자에게 발송 (중단된 캠페인은 남은 수신자부터 이어서 발송)
+
+        Returns:
+            Dict: success, sent, failed, remaining, elapsed, throughput (이번 실행 기준)
+                  연결 문제로 중단되면 success=False, retryable=True
+        """
+        # 방금 생성/체크포인트한 캠페인을 읽으므로 복제 지연이 없는 주 DB 에서 조회
+        session = get_session()
+        try:
+            campaign = session.get(EmailCampaign, campaign_id)
+            if campaign is None:
+                return {"success": False, "error": f"캠페인을 찾을 수 없습니다: {campaign_id}"}
+            if campaign.status in (CAMPAIGN_COMPLETED, CAMPAIGN_CANCELLED):
+                return {"success": True, "status": campaign.status, "sent": 0, "failed": 0, "remaining": 0}
+            subject, body, content_type = campaign.subject, campaign.body, campaign.content_type
+            batch_size, started_at = campaign.batch_size, campaign.started_at
+        finally:
+            session.close()
+
+        smtp_server = self.email_manager.get_smtp_server()
+        if smtp_server is None:
+            return {"success": False, "error": "SMTP 인증 정보가 설정되지 않았습니다"}
+
+        is_html = (content_type or "").lower() == "html"
+        subject_template = CompiledTemplate(subject)
+        body_template = CompiledTemplate(body, escape=html.escape if is_html else None)
+
+        self._set_status(campaign_id, CAMPAIGN_RUNNING, started_at=started_at or datetime.now())
+        logger.info(f"캠페인 발송 시작: {campaign_id}")
+
+        stats = {"sent": 0, "failed": 0}
+        start = time.perf_counter()
+        after_id = 0
+        interrupted = None
+
+        while interrupted is None:
+            # 동시 발송할 배치들을 한 번에 읽어 옴 (recipient_id 순 keyset)
+            rows = self._load_pending(campaign_id, after_id, batch_size * self.concurrency)
+            if not rows:
+                break
+            after_id = rows[-1].recipient_id
+
+            batches = []
+            outcomes: List[Tuple[int, Optional[str]]] = []
+            for offset in range(0, len(rows), batch_size):
+                batch_ids, messages = [], []
+                for row in rows[offset:offset + batch_size]:
+                    variables = row.variables or {}
+                    try:
+                        rendered = body_template.render(variables)
+                        message = self.email_manager.build_smtp_message(
+                            [row.email], subject_template.render(variables),
+                            None if is_html else rendered, rendered if is_html else None,
+                            from_email=smtp_server.user
+                        )
+                    except Exception as e:
+                        outcomes.append((row.recipient_id, f"템플릿 렌더링 실패: {e}"))
+                        continue
+                    batch_ids.append(row.recipient_id)
+                    messages.append((message, [row.email]))
+                if messages:
+                    batches.append((batch_ids, messages))
+
+            results = await asyncio.gather(*[
+                self.email_manager.smtp_pool.send_many(smtp_server, messages) for _, messages in batches
+            ])
+            attempted = connection_errors = 0
+            for (batch_ids, _), errors in zip(batches, results):
+                attempted += len(errors)
+                outcomes.extend(zip(batch_ids, errors))
+                connection_errors += sum(1 for error in errors if error and error.startswith(SMTP_CONNECTION_ERROR))
+
+            status = self._checkpoint(campaign_id, outcomes)
+            stats["sent"] += sum(1 for _, error in outcomes if error is None)
+            stats["failed"] += sum(1 for _, error in outcomes if error and not error.startswith(SMTP_CONNECTION_ERROR))
+
+            if status == CAMPAIGN_CANCELLED:
+                interrupted = "캠페인이 취소되었습니다"
+            elif connection_errors and connection_errors == attempted:
+                # 서버에 연결할 수 없으면 중단하고 재시도 시 남은 수신자부터 이어서 보냄
+                interrupted = f"{SMTP_CONNECTION_ERROR}: 배치 전체 발송 실패"
+
+        elapsed = time.perf_counter() - start
+        remaining = self._count_pending(campaign_id)
+        if remaining and interrupted is None:
+            # 일부 배치의 연결 오류로 남은 수신자는 재시도 때 이어서 보냄
+            interrupted = f"{SMTP_CONNECTION_ERROR}: {remaining}명 미발송"
+        result = {
+            **stats,
+            "campaign_id": campaign_id,
+            "remaining": remaining,
+            "elapsed": round(elapsed, 2),
+            "throughput": round(stats["sent"] / elapsed, 1) if elapsed > 0 else 0.0
+        }
+
+        if interrupted:
+            logger.warning(f"캠페인 발송 중단: {campaign_id} ({interrupted}) {result}")
+            return {**result, "success": False, "error": interrupted,
+                    "retryable": interrupted.startswith(SMTP_CONNECTION_ERROR)}
+
+        self._set_status(campaign_id, CAMPAIGN_COMPLETED, finished_at=datetime.now())
+        logger.info(f"캠페인 발송 완료: {campaign_id} {result}")
+        return {**result, "success": True}
+
+    # -------------------
+    # 조회
+    # -------------------
+    async def get_campaign_progress(self, campaign_id: int, recipient_status: Optional[str] = None,
+                                    after_id: int = 0, limit: int = 100) -> Optional[Dict[str, Any]]:
+        """캠페인 진행 현황과 수신자별 상태 (recipient_id 순 keyset 페이지)"""
+        session = get_session(read_only=True)
+        try:
+            campaign = session.get(EmailCampaign, campaign_id)
+            if campaign is None:
+                return None
+
+            counts = dict(session.execute(
+                select(EmailCampaignRecipient.status, func.count())
+                .where(EmailCampaignRecipient.campaign_id == campaign_id)
+                .group_by(EmailCampaignRecipient.status)
+            ).all())
+
+            query = select(
+                EmailCampaignRecipient.recipient_id, EmailCampaignRecipient.email,
+                EmailCampaignRecipient.status, EmailCampaignRecipient.error, EmailCampaignRecipient.sent_at
+            ).where(EmailCampaignRecipient.campaign_id == campaign_id, EmailCampaignRecipient.recipient_id > after_id)
+            if recipient_status:
+                query = query.where(EmailCampaignRecipient.status == recipient_status)
+            recipients = session.execute(query.order_by(EmailCampaignRecipient.recipient_id).limit(limit)).all()
+
+            elapsed = None
+            if campaign.started_at:
+                elapsed = ((campaign.finished_at or datetime.now()) - campaign.started_at).total_seconds()
+
+            return {
+                "campaign_id": campaign.campaign_id,
+                "task_id": campaign.task_id,
+                "status": campaign.status,
+                "subject": campaign.subject,
+                "total": campaign.total_count,
+                "sent": counts.get(RECIPIENT_SENT, 0),
+                "failed": counts.get(RECIPIENT_FAILED, 0),
+                "pending": counts.get(RECIPIENT_PENDING, 0),
+                "started_at": campaign.started_at.isoformat() if campaign.started_at else None,
+                "finished_at": campaign.finished_at.isoformat() if campaign.finished_at else None,
+                "throughput": round(counts.get(RECIPIENT_SENT, 0) / elapsed, 1) if elapsed else None,
+                "recipients": [
+                    {
+                        "recipient_id": row.recipient_id,
+                        "email": row.email,
+                        "status": row.status,
+                        "error": row.error,
+                        "sent_at": row.sent_at.isoformat() if row.sent_at else None
+                    }
+                    for row in recipients
+                ],
+                "next_after_id": recipients[-1].recipient_id if len(recipients) == limit else None
+            }
+        except Exception as e:
+            logger.error(f"캠페인 진행 현황 조회 실패: {e}")
+            return None
+        finally:
+            session.close()
+
+
+# 전역 인스턴스
+_campaign_service = None
+
+def get_campaign_service() -> EmailCampaignService:
+    """EmailCampaignService 싱글톤 인스턴스 반환"""
+    global _campaign_service
+    if _campaign_service is None:
+        _campaign_service = EmailCampaignService()
+    return _campaign_service
@@ -14,8 +14,8 @@ from .utils import (
 
 # 기존 모듈들 (하위 호환성)
 from .auth_manager import AuthManager, get_auth_manager
-from .http_client import HttpClient, OAuthHttpClient, get_http_client, get_oauth_http_client
-from .email_manager import EmailManager, get_email_manager
+from .http_client import HttpClient, OAuthHttpClient, get_http_client, get_oauth_http_client, close_http_clients
+from .email_manager import EmailManager, SMTPConnectionPool, SMTPServer, get_email_manager
 from .notification_manager import NotificationManager, get_notification_manager
 
 __version__ = "2.0.0"
@@ -31,8 +31,8 @@ __all__ = [
     
     # 기존 컴포넌트들 (하위 호환성)
     "AuthManager", "get_auth_manager",
-    "HttpClient", "OAuthHttpClient", "get_http_client", "get_oauth_http_client", 
-    "EmailManager", "get_email_manager",
+    "HttpClient", "OAuthHttpClient", "get_http_client", "get_oauth_http_client", "close_http_clients",
+    "EmailManager", "SMTPConnectionPool", "SMTPServer", "get_email_manager",
     "NotificationManager", "get_notification_manager"
 ]
 
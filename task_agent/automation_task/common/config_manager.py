@@ -226,6 +226,16 @@ class AutomationConfigManager:
             "client_secret": self.get("teams.client_secret")
         }
     
+    def get_notification_config(self) -> Dict[str, Any]:
+        """알림 발송 설정 가져오기 (채널별 제한 시간, 대량 발송 동시 사용자 수)"""
+        return {
+            "channel_timeouts": self.get("notification.channel_timeouts", {
+                "app": 5, "email": 30, "sms": 10, "slack": 10, "teams": 10
+            }),  # 초
+            "default_timeout": self.get("notification.default_timeout", 15),
+            "bulk_concurrency": self.get("notification.bulk_concurrency", 20)
+        }
+    
     def get_automation_settings(self) -> Dict[str, Any]:
         """자동화 설정 가져오기"""
         return {
@@ -234,6 +244,42 @@ class AutomationConfigManager:
             "retry_attempts": self.get("automation.retry_attempts", 3),
             "retry_delay": self.get("automation.retry_delay", 5),
             "notification_enabled": self.get("automation.notification_enabled", True),
+            "scheduler_poll_interval": self.get("automation.scheduler_poll_interval", 30),  # 초
+            "scheduler_lookahead": self.get("automation.scheduler_lookahead", 300),  # 메모리에 올리는 예약 구간 (초)
+            "scheduler_batch_size": self.get("automation.scheduler_batch_size", 500),
+            # inline: API 프로세스가 직접 실행 / worker: python task_agent/worker.py 가 실행
+            "execution_mode": self.get("automation.execution_mode", "inline"),
+            "worker_concurrency": self.get("automation.worker_concurrency", 4),
+            # 선점 리스와 연장 주기 (워커와 inline 실행 공통)
+            "worker_lease_seconds": self.get("automation.worker_lease_seconds", 60),
+            "worker_heartbeat_interval": self.get("automation.worker_heartbeat_interval", 15),
+            "worker_poll_interval": self.get("automation.worker_poll_interval", 1.0),
+            # 작업 타입별 동시 실행 수 / 외부 채널별 토큰 버킷 (초당 rate, 최대 burst)
+            "pool_sizes": self.get("automation.pool_sizes", {
+                "send_email": 4, "schedule_calendar": 2, "send_reminder": 8, "send_message": 4, "publish_sns": 2,
+                "send_campaign": 1
+            }),
+            "rate_limits": self.get("automation.rate_limits", {
+                "smtp": {"rate": 5, "burst": 10},
+                "google_calendar": {"rate": 5, "burst": 10},
+                "slack": {"rate": 1, "burst": 3},
+                "teams": {"rate": 1, "burst": 3},
+                "notification": {"rate": 20, "burst": 50}
+            }),
+            # 작업 타입별 재시도 정책 ("default" 를 타입별 값으로 덮어씀, 시도 횟수는 첫 실행 포함)
+            "retry_policies": self.get("automation.retry_policies", {
+                "default": {"max_attempts": 3, "base_delay": 30, "max_delay": 1800, "jitter": 0.5},
+                "send_email": {"max_attempts": 5, "base_delay": 60, "max_delay": 3600},
+                "schedule_calendar": {"max_attempts": 4},
+                "send_reminder": {"max_attempts": 4, "base_delay": 10, "max_delay": 300},
+                "send_campaign": {"max_attempts": 5, "base_delay": 60, "max_delay": 3600}
+            }),
+            # 대량 이메일 캠페인: SMTP 연결 하나로 연속 발송하는 메시지 수 (요청에 없을 때)
+            "campaign_batch_size": self.get("automation.campaign_batch_size", 50),
+            # 반복 작업: 규칙에 시간대가 없을 때의 기본값, 지연 실행 처리 (run_once | skip | run_all)
+            "recurrence_timezone": self.get("automation.recurrence_timezone", "Asia/Seoul"),
+            "recurrence_misfire_policy": self.get("automation.recurrence_misfire_policy", "run_once"),
+            "recurrence_misfire_grace": self.get("automation.recurrence_misfire_grace", 300),  # 초
             "log_level": self.get("automation.log_level", "INFO")
         }
     
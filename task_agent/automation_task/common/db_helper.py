@@ -5,15 +5,30 @@
 
 import sys
 import os
+from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 import logging
 
+from sqlalchemy import and_, or_
+
 from shared_modules.database import get_session, engine
 from shared_modules.db_models import User, Conversation, Message, AutomationTask
 from shared_modules.env_config import get_config
+from shared_modules.user_cache import get_user_cache
 
 logger = logging.getLogger(__name__)
 
+# task_agent 는 소문자, shared_modules.queries 는 대문자 상태값을 기록한다
+PENDING_STATUSES = ("pending", "PENDING")
+# 워커가 선점한 작업의 상태 (AutomationStatus.PROCESSING)
+CLAIMED_STATUS = "processing"
+# 재시도를 모두 소진한 작업의 상태 (AutomationStatus.DEAD_LETTER)
+DEAD_LETTER_STATUS = "dead_letter"
+# task_data["errors"] 에 남기는 최근 실패 기록 수
+MAX_ERROR_HISTORY = 20
+# notification_settings 에 행이 없는 사용자의 알림 설정
+DEFAULT_NOTIFICATION_SETTINGS = {"app_notification": True, "email_notification": True, "sms_notification": True}
+
 class AutomationDatabaseHelper:
     """자동화 작업을 위한 데이터베이스 헬퍼 클래스 (공통 모듈 기반)"""
     
@@ -21,19 +36,18 @@ class AutomationDatabaseHelper:
         """데이터베이스 헬퍼 초기화"""
         self.config = get_config()
         
-    def get_session(self):
-        """데이터베이스 세션 반환 (공통 모듈 활용)"""
+    def get_session(self, read_only: bool = False):
+        """데이터베이스 세션 반환 (공통 모듈 활용, read_only=True 이면 복제본)"""
         try:
-            return get_session()
+            return get_session(read_only)
         except Exception as e:
             logger.error(f"데이터베이스 세션 생성 실패: {e}")
             return None
     
-    async def get_user_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
-        """사용자 ID로 사용자 정보 조회"""
+    def _load_user(self, user_id: int) -> Optional[Dict[str, Any]]:
         session = self.get_session()
         if not session:
-            return None
+            raise RuntimeError("데이터베이스 세션을 생성할 수 없습니다")
         
         try:
             user = session.query(User).filter(User.user_id == user_id).first()
@@ -47,11 +61,17 @@ class AutomationDatabaseHelper:
                     "admin": user.admin
                 }
             return None
+        finally:
+            session.close()
+    
+    async def get_user_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """사용자 ID로 사용자 정보 조회 (공통 사용자 캐시 경유)"""
+        try:
+            user = get_user_cache().get_or_load("user", user_id, lambda: self._load_user(user_id))
+            return dict(user) if user else None
         except Exception as e:
             logger.error(f"사용자 조회 실패: {e}")
             return None
-        finally:
-            session.close()
     
     async def get_user_email(self, user_id: int) -> Optional[str]:
         """사용자 이메일 주소 조회"""
@@ -82,6 +102,9 @@ class AutomationDatabaseHelper:
                     "status": task.status,
                     "scheduled_at": task.scheduled_at,
                     "executed_at": task.executed_at,
+                    "attempts": task.attempts or 0,
+                    "recurrence": task.recurrence,
+                    "timezone": task.timezone,
                     "created_at": task.created_at
                 }
             return None
@@ -93,8 +116,20 @@ class AutomationDatabaseHelper:
     
     async def update_automation_task_status(self, task_id: int, status: str, 
                                           executed_at: Optional[Any] = None,
-                                          result_data: Optional[Dict[str, Any]] = None) -> bool:
-        """자동화 작업 상태 업데이트"""
+                                          result_data: Optional[Dict[str, Any]] = None,
+                                          attempts: Optional[int] = None,
+                                          error: Optional[Dict[str, Any]] = None,
+                                          scheduled_at: Optional[datetime] = None,
+                                          expected_status: Optional[str] = None) -> bool:
+        """
+        자동화 작업 상태 업데이트
+        
+        Args:
+            expected_status: 지정하면 현재 상태가 이 값일 때만 변경 (실행 중 취소된 작업을 되살리지 않도록)
+            attempts: 지금까지의 실행 시도 횟수
+            error: task_data["errors"] 에 추가할 실패 기록 (최근 MAX_ERROR_HISTORY 개 유지)
+            scheduled_at: 다음 실행 시각 (재시도 예약)
+        """
         session = self.get_session()
         if not session:
             return False
@@ -105,17 +140,31 @@ class AutomationDatabaseHelper:
                 logger.warning(f"자동화 작업을 찾을 수 없음: {task_id}")
                 return False
             
+            if expected_status and task.status != expected_status:
+                logger.info(f"자동화 작업 상태가 바뀌어 업데이트 건너뜀: task_id={task_id}, status={task.status}")
+                return False
+            
             # 상태 업데이트
             task.status = status
             
             if executed_at:
                 task.executed_at = executed_at
             
-            # 결과 데이터가 있으면 task_data에 추가
-            if result_data:
-                if task.task_data is None:
-                    task.task_data = {}
-                task.task_data.update({"result": result_data})
+            if attempts is not None:
+                task.attempts = attempts
+            
+            if scheduled_at:
+                task.scheduled_at = scheduled_at
+            
+            # 결과 데이터/실패 기록이 있으면 task_data에 추가
+            # (JSON 컬럼은 제자리 변경을 추적하지 않으므로 새 dict 를 대입)
+            if result_data or error:
+                task_data = dict(task.task_data or {})
+                if result_data:
+                    task_data["result"] = result_data
+                if error:
+                    task_data["errors"] = (task_data.get("errors") or [])[-(MAX_ERROR_HISTORY - 1):] + [error]
+                task.task_data = task_data
             
             session.commit()
             logger.info(f"자동화 작업 상태 업데이트 완료: task_id={task_id}, status={status}")
@@ -163,10 +212,267 @@ class AutomationDatabaseHelper:
         finally:
             session.close()
     
+    async def get_due_automation_tasks(self, until: datetime, limit: int = 500) -> List[Dict[str, Any]]:
+        """until 이전으로 예약된 대기 작업 목록 (scheduled_at 순, 내부 스케줄러 적재용)"""
+        session = self.get_session()
+        if not session:
+            return []
+        
+        try:
+            rows = session.query(AutomationTask.task_id, AutomationTask.scheduled_at)\
+                          .filter(AutomationTask.status.in_(PENDING_STATUSES))\
+                          .filter(AutomationTask.scheduled_at.isnot(None))\
+                          .filter(AutomationTask.scheduled_at <= until)\
+                          .order_by(AutomationTask.scheduled_at.asc(), AutomationTask.task_id.asc())\
+                          .limit(limit)\
+                          .all()
+            return [{"task_id": task_id, "scheduled_at": scheduled_at} for task_id, scheduled_at in rows]
+            
+        except Exception as e:
+            logger.error(f"예약 작업 조회 실패: {e}")
+            return []
+        finally:
+            session.close()
+    
+    async def claim_automation_tasks(self, worker_id: str, limit: int, lease_seconds: int) -> List[int]:
+        """
+        실행할 작업을 원자적으로 선점 (워커용)
+        
+        리스가 만료되었거나 없는 실행 중 작업(워커 비정상 종료)을 먼저, 그다음 실행 시각이 된 대기 작업을
+        SELECT ... FOR UPDATE SKIP LOCKED 로 고른 뒤 조건부 UPDATE 로 상태와 리스를 기록한다.
+        SKIP LOCKED 를 지원하지 않는 DB 에서는 여러 워커가 같은 후보를 고를 수 있으므로,
+        조건부 UPDATE 에서 밀린 만큼 후보를 다시 고른다. (빈 리스트는 선점할 작업이 없다는 뜻)
+        
+        Returns:
+            List[int]: 선점한 task_id 목록
+        """
+        session = self.get_session()
+        if not session:
+            return []
+        
+        try:
+            claimed = []
+            while len(claimed) < limit:
+                now = datetime.now()
+                # 리스 없이 실행 중인 행(리스 도입 전 버전이 남긴 작업)도 만료로 본다
+                expired = and_(
+                    AutomationTask.status == CLAIMED_STATUS,
+                    or_(AutomationTask.lease_expires_at.is_(None), AutomationTask.lease_expires_at < now)
+                )
+                due = and_(
+                    AutomationTask.status.in_(PENDING_STATUSES),
+                    or_(AutomationTask.scheduled_at.is_(None), AutomationTask.scheduled_at <= now)
+                )
+                
+                candidate_ids = []
+                for condition, order_by in ((expired, AutomationTask.lease_expires_at), (due, AutomationTask.scheduled_at)):
+                    remaining = limit - len(claimed) - len(candidate_ids)
+                    if remaining <= 0:
+                        break
+                    candidate_ids += [
+                        task_id for (task_id,) in session.query(AutomationTask.task_id)
+                        .filter(condition)
+                        .order_by(order_by.asc(), AutomationTask.task_id.asc())
+                        .limit(remaining)
+                        .with_for_update(skip_locked=True)
+                        .all()
+                    ]
+                
+                if not candidate_ids:
+                    session.rollback()
+                    break
+                
+                session.query(AutomationTask)\
+                       .filter(AutomationTask.task_id.in_(candidate_ids), or_(expired, due))\
+                       .update({
+                           AutomationTask.status: CLAIMED_STATUS,
+                           AutomationTask.locked_by: worker_id,
+                           AutomationTask.lease_expires_at: now + timedelta(seconds=lease_seconds)
+                       }, synchronize_session=False)
+                claimed += [
+                    task_id for (task_id,) in session.query(AutomationTask.task_id)
+                    .filter(AutomationTask.task_id.in_(candidate_ids), AutomationTask.locked_by == worker_id)
+                    .all()
+                ]
+                session.commit()
+            
+            return claimed
+            
+        except Exception as e:
+            logger.error(f"자동화 작업 선점 실패: {e}")
+            session.rollback()
+            return claimed
+        finally:
+            session.close()
+    
+    async def claim_automation_task(self, task_id: int, worker_id: str, lease_seconds: int) -> bool:
+        """특정 대기 작업 하나를 선점 (프로세스 내 스케줄러용, 이미 다른 곳에서 선점했으면 False)"""
+        session = self.get_session()
+        if not session:
+            return False
+        
+        try:
+            now = datetime.now()
+            claimed = session.query(AutomationTask)\
+                             .filter(AutomationTask.task_id == task_id,
+                                     AutomationTask.status.in_(PENDING_STATUSES))\
+                             .update({
+                                 AutomationTask.status: CLAIMED_STATUS,
+                                 AutomationTask.locked_by: worker_id,
+                                 AutomationTask.lease_expires_at: now + timedelta(seconds=lease_seconds)
+                             }, synchronize_session=False)
+            session.commit()
+            return claimed > 0
+            
+        except Exception as e:
+            logger.error(f"자동화 작업 선점 실패 (ID: {task_id}): {e}")
+            session.rollback()
+            return False
+        finally:
+            session.close()
+    
+    async def renew_automation_task_leases(self, worker_id: str, task_ids: List[int], lease_seconds: int) -> int:
+        """선점한 작업의 리스 연장 (하트비트). 연장된 작업 수 반환"""
+        if not task_ids:
+            return 0
+        
+        session = self.get_session()
+        if not session:
+            return 0
+        
+        try:
+            renewed = session.query(AutomationTask)\
+                             .filter(AutomationTask.task_id.in_(task_ids), AutomationTask.locked_by == worker_id)\
+                             .update({AutomationTask.lease_expires_at: datetime.now() + timedelta(seconds=lease_seconds)},
+                                     synchronize_session=False)
+            session.commit()
+            return renewed
+            
+        except Exception as e:
+            logger.error(f"자동화 작업 리스 연장 실패: {e}")
+            session.rollback()
+            return 0
+        finally:
+            session.close()
+    
+    async def release_automation_task(self, task_id: int, worker_id: str) -> bool:
+        """
+        실행이 끝난 작업의 리스 해제
+        
+        상태가 아직 선점 상태이면(결과 기록 실패) 리스를 남겨 만료 후 다른 워커가 다시 가져가게 한다.
+        """
+        session = self.get_session()
+        if not session:
+            return False
+        
+        try:
+            released = session.query(AutomationTask)\
+                              .filter(AutomationTask.task_id == task_id,
+                                      AutomationTask.locked_by == worker_id,
+                                      AutomationTask.status != CLAIMED_STATUS)\
+                              .update({AutomationTask.locked_by: None, AutomationTask.lease_expires_at: None},
+                                      synchronize_session=False)
+            session.commit()
+            return released > 0
+            
+        except Exception as e:
+            logger.error(f"자동화 작업 리스 해제 실패: {e}")
+            session.rollback()
+            return False
+        finally:
+            session.close()
+    
+    async def get_dead_letter_automation_tasks(self, task_type: Optional[str] = None, user_id: Optional[int] = None,
+                                               limit: int = 100, after_id: int = 0) -> List[Dict[str, Any]]:
+        """재시도를 소진한 작업 목록 (task_id 순 keyset 페이지, 마지막 실패 기록 포함)"""
+        session = self.get_session(read_only=True)
+        if not session:
+            return []
+        
+        try:
+            query = session.query(AutomationTask)\
+                           .filter(AutomationTask.status == DEAD_LETTER_STATUS, AutomationTask.task_id > after_id)
+            if task_type:
+                query = query.filter(AutomationTask.task_type == task_type)
+            if user_id:
+                query = query.filter(AutomationTask.user_id == user_id)
+            
+            result = []
+            for task in query.order_by(AutomationTask.task_id.asc()).limit(limit).all():
+                errors = (task.task_data or {}).get("errors") or []
+                result.append({
+                    "task_id": task.task_id,
+                    "user_id": task.user_id,
+                    "task_type": task.task_type,
+                    "title": task.title,
+                    "attempts": task.attempts or 0,
+                    "last_error": errors[-1] if errors else None,
+                    "errors": errors,
+                    "executed_at": task.executed_at,
+                    "created_at": task.created_at
+                })
+            return result
+            
+        except Exception as e:
+            logger.error(f"dead letter 작업 조회 실패: {e}")
+            return []
+        finally:
+            session.close()
+    
+    async def replay_automation_tasks(self, task_ids: Optional[List[int]] = None, task_type: Optional[str] = None,
+                                      user_id: Optional[int] = None, statuses: tuple = (DEAD_LETTER_STATUS,),
+                                      limit: int = 500) -> List[int]:
+        """
+        실패/dead letter 작업을 즉시 실행할 대기 상태로 되돌림 (시도 횟수 초기화, 실패 기록은 유지)
+        
+        Returns:
+            List[int]: 되돌린 task_id 목록
+        """
+        session = self.get_session()
+        if not session:
+            return []
+        
+        try:
+            query = session.query(AutomationTask.task_id).filter(AutomationTask.status.in_(statuses))
+            if task_ids:
+                query = query.filter(AutomationTask.task_id.in_(task_ids))
+            if task_type:
+                query = query.filter(AutomationTask.task_type == task_type)
+            if user_id:
+                query = query.filter(AutomationTask.user_id == user_id)
+            
+            candidate_ids = [
+                task_id for (task_id,) in query.order_by(AutomationTask.task_id.asc())
+                .limit(limit).with_for_update(skip_locked=True).all()
+            ]
+            if not candidate_ids:
+                session.rollback()
+                return []
+            
+            session.query(AutomationTask)\
+                   .filter(AutomationTask.task_id.in_(candidate_ids), AutomationTask.status.in_(statuses))\
+                   .update({
+                       AutomationTask.status: PENDING_STATUSES[0],
+                       AutomationTask.attempts: 0,
+                       AutomationTask.scheduled_at: datetime.now(),
+                       AutomationTask.locked_by: None,
+                       AutomationTask.lease_expires_at: None
+                   }, synchronize_session=False)
+            session.commit()
+            logger.info(f"자동화 작업 재실행 요청: {len(candidate_ids)}개")
+            return candidate_ids
+            
+        except Exception as e:
+            logger.error(f"자동화 작업 재실행 요청 실패: {e}")
+            session.rollback()
+            return []
+        finally:
+            session.close()
+    
     async def get_user_automation_tasks(self, user_id: int, status: Optional[str] = None, 
                                       limit: int = 50) -> List[Dict[str, Any]]:
         """사용자의 자동화 작업 목록 조회"""
-        session = self.get_session()
+        session = self.get_session(read_only=True)
         if not session:
             return []
         
@@ -237,6 +543,90 @@ class AutomationDatabaseHelper:
         finally:
             session.close()
     
+    async def get_notification_settings(self, user_id: int) -> Dict[str, bool]:
+        """사용자 알림 설정 조회 (설정이 없으면 기본값)"""
+        return (await self.get_notification_settings_bulk([user_id]))[user_id]
+    
+    async def get_notification_settings_bulk(self, user_ids: List[int]) -> Dict[int, Dict[str, bool]]:
+        """여러 사용자의 알림 설정을 한 번에 조회 (설정이 없는 사용자는 기본값)"""
+        settings = {user_id: dict(DEFAULT_NOTIFICATION_SETTINGS) for user_id in user_ids}
+        if not user_ids:
+            return settings
+        
+        session = self.get_session(read_only=True)
+        if not session:
+            return settings
+        
+        try:
+            from sqlalchemy import bindparam, text
+            
+            # 설정 테이블이 있다면 조회 (없으면 기본값)
+            query = text("""
+                SELECT user_id, app_notification, email_notification, sms_notification
+                FROM notification_settings
+                WHERE user_id IN :user_ids
+            """).bindparams(bindparam("user_ids", expanding=True))
+            
+            for row in session.execute(query, {"user_ids": list(user_ids)}).mappings():
+                settings[row["user_id"]].update({
+                    key: bool(row[key]) for key in DEFAULT_NOTIFICATION_SETTINGS if row[key] is not None
+                })
+            return settings
+            
+        except Exception as e:
+            logger.debug(f"알림 설정 조회 실패 (기본값 사용): {e}")
+            return settings
+        finally:
+            session.close()
+    
+    async def save_notification_logs(self, logs: List[Dict[str, Any]]) -> bool:
+        """
+        알림 발송 결과를 한 번에 저장
+        
+        Args:
+            logs: user_id, channel, message, success, error_message 를 가진 항목 목록
+        """
+        if not logs:
+            return False
+        
+        session = self.get_session()
+        if not session:
+            return False
+        
+        try:
+            from sqlalchemy import text
+            
+            # 로그 테이블이 있다면 저장 (없으면 스킵)
+            log_query = text("""
+                INSERT INTO notification_logs 
+                (user_id, channel, message, success, error_message, created_at)
+                VALUES (:user_id, :channel, :message, :success, :error_message, :created_at)
+            """)
+            
+            now = datetime.now()
+            session.execute(log_query, [
+                {
+                    "user_id": log.get("user_id"),
+                    "channel": log["channel"],
+                    "message": log.get("message"),
+                    "success": bool(log.get("success")),
+                    "error_message": log.get("error_message"),
+                    "created_at": now
+                }
+                for log in logs
+            ])
+            
+            session.commit()
+            return True
+            
+        except Exception as e:
+            # 로그 테이블이 없는 경우 등은 조용히 처리
+            logger.debug(f"알림 로그 저장 실패 (선택사항): {e}")
+            session.rollback()
+            return False
+        finally:
+            session.close()
+    
     async def get_conversation_context(self, conversation_id: int) -> Optional[Dict[str, Any]]:
         """대화 컨텍스트 조회"""
         session = self.get_session()
@@ -355,7 +745,8 @@ class AutomationDatabaseHelper:
                 "processing": 0,
                 "success": 0,
                 "failed": 0,
-                "cancelled": 0
+                "cancelled": 0,
+                "dead_letter": 0
             }
             
             for status, count in stats:
@@ -5,14 +5,19 @@
 import mimetypes
 import os
 import re
+import time
+import socket
+import asyncio
 import smtplib
 import ssl
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
 from email.utils import formataddr
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 import logging
 
 try:
@@ -32,12 +37,207 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 연결을 버리고 새로 맺어야 하는 오류 (그 외 SMTP 오류는 메시지 단위 실패)
+_SMTP_CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, socket.timeout)
+# 재연결 후에도 보내지 못한 메시지의 오류 메시지 접두어 (수신자 문제가 아니므로 나중에 다시 보낼 수 있음)
+SMTP_CONNECTION_ERROR = "SMTP connection error"
+
+
+class SMTPServer(NamedTuple):
+    """SMTP 접속 정보 (연결 풀의 키)"""
+    host: str
+    port: int
+    user: Optional[str]
+    password: Optional[str]
+    use_tls: bool = True
+    
+    @property
+    def label(self) -> str:
+        return f"{self.user or 'anonymous'}@{self.host}:{self.port}"
+
+
+class _PooledConnection:
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.messages_sent = 0
+        self.last_used = time.monotonic()
+    
+    def close(self):
+        try:
+            self.smtp.quit()
+        except Exception:
+            self.smtp.close()
+
+
+class SMTPConnectionPool:
+    """
+    서버별 SMTP 연결 풀
+    
+    STARTTLS/로그인을 마친 연결을 유지해 재사용하고(keep-alive), 서버별 동시 연결 수를 제한한다.
+    smtplib 는 블로킹이므로 연결과 전송은 풀 전용 스레드에서 실행해 이벤트 루프를 막지 않는다.
+    전송 중 연결이 끊기면 새 연결로 한 번 다시 보낸다.
+    """
+    
+    def __init__(self, max_connections: int = 4, idle_timeout: float = 60,
+                 max_messages_per_connection: int = 100, timeout: float = 30):
+        """
+        Args:
+            max_connections: 서버별 최대 동시 연결 수
+            idle_timeout: 이 시간(초) 이상 쉰 연결은 서버가 끊었을 수 있으므로 새로 연결
+            max_messages_per_connection: 연결 하나로 보내는 최대 메시지 수 (서버 제한 대비)
+            timeout: 소켓 타임아웃 (초)
+        """
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.max_messages_per_connection = max_messages_per_connection
+        self.timeout = timeout
+        self._idle: Dict[SMTPServer, deque] = {}
+        self._limits: Dict[SMTPServer, asyncio.Semaphore] = {}
+        self._executor = None
+        self.stats = {"connections_opened": 0, "connections_reused": 0, "reconnects": 0, "sent": 0, "errors": 0}
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            # 여러 서버를 동시에 사용할 수 있도록 서버별 한도보다 넉넉하게
+            self._executor = ThreadPoolExecutor(max_workers=self.max_connections * 4, thread_name_prefix="smtp")
+        return self._executor
+    
+    def _connect(self, server: SMTPServer) -> _PooledConnection:
+        smtp = smtplib.SMTP(server.host, server.port, timeout=self.timeout)
+        try:
+            if server.use_tls:
+                smtp.starttls(context=ssl.create_default_context())
+            if server.user:
+                smtp.login(server.user, server.password)
+        except Exception:
+            smtp.close()
+            raise
+        self.stats["connections_opened"] += 1
+        return _PooledConnection(smtp)
+    
+    def _acquire_idle(self, server: SMTPServer) -> Optional[_PooledConnection]:
+        idle = self._idle.get(server)
+        while idle:
+            connection = idle.pop()
+            if time.monotonic() - connection.last_used < self.idle_timeout:
+                self.stats["connections_reused"] += 1
+                return connection
+            connection.close()
+        return None
+    
+    def _send_batch(self, server: SMTPServer, connection: Optional[_PooledConnection],
+                    messages: List[Tuple[Any, List[str]]]) -> Tuple[Optional[_PooledConnection], List[Optional[str]]]:
+        """
+        연결 하나로 메시지를 연속 전송 (풀 스레드에서 실행)
+        
+        Returns:
+            (계속 사용할 수 있는 연결, 메시지별 오류 메시지 목록 - 성공이면 None)
+        """
+        errors = []
+        for message, recipients in messages:
+            for retry in (False, True):
+                try:
+                    if connection is None or connection.messages_sent >= self.max_messages_per_connection:
+                        if connection is not None:
+                            connection.close()
+                        connection = self._connect(server)
+                    connection.smtp.send_message(message, to_addrs=recipients)
+                    connection.messages_sent += 1
+                    connection.last_used = time.monotonic()
+                    errors.append(None)
+                    break
+                except _SMTP_CONNECTION_ERRORS as e:
+                    # 서버가 끊은 연결(유휴 타임아웃, 재시작 등)은 버리고 한 번 다시 연결
+                    if connection is not None:
+                        connection.smtp.close()
+                    connection = None
+                    if retry:
+                        errors.append(f"{SMTP_CONNECTION_ERROR}: {e}")
+                    else:
+                        self.stats["reconnects"] += 1
+                except Exception as e:
+                    # 421: 서버가 연결을 닫는 중 (동시 연결/메시지 수 제한) → 새 연결로 재시도
+                    if getattr(e, "smtp_code", None) == 421 and not retry:
+                        if connection is not None:
+                            connection.smtp.close()
+                        connection = None
+                        self.stats["reconnects"] += 1
+                        continue
+                    # 수신자 거부 등 메시지 단위 오류 (smtplib 가 RSET 하므로 연결은 계속 사용)
+                    errors.append(str(e))
+                    if isinstance(e, (smtplib.SMTPAuthenticationError, smtplib.SMTPConnectError)):
+                        connection = None
+                    break
+        
+        self.stats["sent"] += errors.count(None)
+        self.stats["errors"] += len(errors) - errors.count(None)
+        return connection, errors
+    
+    async def send_many(self, server: SMTPServer, messages: List[Tuple[Any, List[str]]]) -> List[Optional[str]]:
+        """
+        메시지 목록을 연결 하나로 연속 전송 (연결/로그인과 스레드 전환 비용을 메시지 수로 나눔)
+        
+        Args:
+            messages: (email.message.Message, 수신자 목록) 목록
+        
+        Returns:
+            List[Optional[str]]: 메시지별 오류 메시지 (성공이면 None)
+        """
+        semaphore = self._limits.setdefault(server, asyncio.Semaphore(self.max_connections))
+        async with semaphore:
+            connection = self._acquire_idle(server)
+            loop = asyncio.get_running_loop()
+            connection, errors = await loop.run_in_executor(
+                self._get_executor(), self._send_batch, server, connection, messages
+            )
+            if connection is not None:
+                self._idle.setdefault(server, deque()).append(connection)
+        return errors
+    
+    async def send(self, server: SMTPServer, message: Any, recipients: List[str]) -> Optional[str]:
+        """메시지 하나 전송 (실패 시 오류 메시지 반환)"""
+        return (await self.send_many(server, [(message, recipients)]))[0]
+    
+    async def close(self):
+        """유휴 연결을 모두 닫음 (이후 요청 시 다시 연결)"""
+        connections = [connection for idle in self._idle.values() for connection in idle]
+        self._idle.clear()
+        if connections:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._get_executor(), lambda: [c.close() for c in connections])
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "idle_connections": {server.label: len(idle) for server, idle in self._idle.items()},
+            "max_connections": self.max_connections
+        }
+
 
 class EmailManager:
     """이메일 발송을 위한 공통 클래스"""
     
     def __init__(self):
-        pass
+        self.smtp_pool = SMTPConnectionPool(
+            max_connections=int(os.getenv('SMTP_POOL_SIZE', '4')),
+            idle_timeout=float(os.getenv('SMTP_IDLE_TIMEOUT', '60')),
+            max_messages_per_connection=int(os.getenv('SMTP_MAX_MESSAGES_PER_CONNECTION', '100')),
+            timeout=float(os.getenv('SMTP_TIMEOUT', '30'))
+        )
+    
+    def get_smtp_server(self) -> Optional[SMTPServer]:
+        """환경 변수의 SMTP 접속 정보 (인증 정보가 없으면 None)"""
+        smtp_user = os.getenv('SMTP_USER')
+        smtp_password = os.getenv('SMTP_PASSWORD')
+        if not smtp_user or not smtp_password:
+            return None
+        return SMTPServer(
+            host=os.getenv('SMTP_HOST', 'smtp.gmail.com'),
+            port=int(os.getenv('SMTP_PORT', '587')),
+            user=smtp_user,
+            password=smtp_password,
+            use_tls=os.getenv('SMTP_USE_TLS', 'true').lower() == 'true'
+        )
     
     def is_valid_email(self, email: str) -> bool:
         """이메일 주소 형식 검증"""
@@ -67,6 +267,46 @@ class EmailManager:
         else:
             return {"success": False, "error": f"지원하지 않는 이메일 서비스: {service}"}
     
+    def build_smtp_message(self, to_emails: List[str], subject: str, body: str,
+                           html_body: Optional[str] = None, attachments: List[str] = None,
+                           cc_emails: List[str] = None, from_email: Optional[str] = None,
+                           from_name: Optional[str] = None) -> MIMEMultipart:
+        """SMTP 로 보낼 MIME 메시지 생성"""
+        sender_name = from_name or "자동 이메일 시스템"
+        
+        message = MIMEMultipart('alternative')
+        message['From'] = formataddr((sender_name, from_email))
+        message['To'] = ', '.join(to_emails)
+        message['Subject'] = subject
+        
+        if cc_emails:
+            message['Cc'] = ', '.join(cc_emails)
+        
+        # 본문 추가
+        if body:
+            text_part = MIMEText(body, 'plain', 'utf-8')
+            message.attach(text_part)
+        
+        if html_body:
+            html_part = MIMEText(html_body, 'html', 'utf-8')
+            message.attach(html_part)
+        
+        # 첨부파일 추가
+        if attachments:
+            for file_path in attachments:
+                if os.path.exists(file_path):
+                    with open(file_path, "rb") as attachment_file:
+                        part = MIMEBase('application', 'octet-stream')
+                        part.set_payload(attachment_file.read())
+                        encoders.encode_base64(part)
+                        part.add_header(
+                            'Content-Disposition',
+                            f'attachment; filename= {os.path.basename(file_path)}'
+                        )
+                        message.attach(part)
+        
+        return message
+    
     async def send_via_smtp(self, to_emails: List[str], subject: str, body: str,
                            html_body: Optional[str] = None, attachments: List[str] = None,
                            cc_emails: List[str] = None, bcc_emails: List[str] = None,
@@ -74,64 +314,24 @@ class EmailManager:
         """SMTP를 통한 이메일 발송"""
         try:
             # SMTP 설정 가져오기
-            smtp_host = os.getenv('SMTP_HOST', 'smtp.gmail.com')
-            smtp_port = int(os.getenv('SMTP_PORT', '587'))
-            smtp_user = os.getenv('SMTP_USER')
-            smtp_password = os.getenv('SMTP_PASSWORD')
-            smtp_use_tls = os.getenv('SMTP_USE_TLS', 'true').lower() == 'true'
-            
-            if not smtp_user or not smtp_password:
+            smtp_server = self.get_smtp_server()
+            if smtp_server is None:
                 return {"success": False, "error": "SMTP 인증 정보가 설정되지 않았습니다"}
             
-            # 발신자 정보 설정
-            sender_email = from_email or smtp_user
-            sender_name = from_name or "자동 이메일 시스템"
-            
             # 메시지 생성
-            message = MIMEMultipart('alternative')
-            message['From'] = formataddr((sender_name, sender_email))
-            message['To'] = ', '.join(to_emails)
-            message['Subject'] = subject
-            
-            if cc_emails:
-                message['Cc'] = ', '.join(cc_emails)
-            
-            # 본문 추가
-            if body:
-                text_part = MIMEText(body, 'plain', 'utf-8')
-                message.attach(text_part)
-            
-            if html_body:
-                html_part = MIMEText(html_body, 'html', 'utf-8')
-                message.attach(html_part)
-            
-            # 첨부파일 추가
-            if attachments:
-                for file_path in attachments:
-                    if os.path.exists(file_path):
-                        with open(file_path, "rb") as attachment_file:
-                            part = MIMEBase('application', 'octet-stream')
-                            part.set_payload(attachment_file.read())
-                            encoders.encode_base64(part)
-                            part.add_header(
-                                'Content-Disposition',
-                                f'attachment; filename= {os.path.basename(file_path)}'
-                            )
-                            message.attach(part)
+            message = self.build_smtp_message(
+                to_emails, subject, body, html_body, attachments, cc_emails,
+                from_email or smtp_server.user, from_name
+            )
             
             # 전체 수신자 목록
             all_recipients = to_emails + (cc_emails or []) + (bcc_emails or [])
             
-            # SMTP 서버 연결 및 전송
-            context = ssl.create_default_context()
-            
-            with smtplib.SMTP(smtp_host, smtp_port) as server:
-                if smtp_use_tls:
-                    server.starttls(context=context)
-                server.login(smtp_user, smtp_password)
-                
-                # 이메일 전송
-                server.send_message(message, to_addrs=all_recipients)
+            # 연결 풀로 전송 (STARTTLS/로그인된 연결 재사용)
+            error = await self.smtp_pool.send(smtp_server, message, all_recipients)
+            if error:
+                logger.error(f"SMTP 이메일 발송 실패: {error}")
+                return {"success": False, "error": error}
             
             return {
                 "success": True,
@@ -343,6 +543,10 @@ class EmailManager:
             logger.error(f"AWS SES 이메일 발송 실패: {e}")
             return {"success": False, "error": str(e)}
     
+    async def close(self):
+        """SMTP 연결 풀 정리"""
+        await self.smtp_pool.close()
+    
     def create_html_template(self, title: str, content: str, 
                            additional_info: Optional[str] = None) -> str:
         """기본 HTML 이메일 템플릿 생성"""
@@ -2,28 +2,90 @@
 HTTP 클라이언트 공통 모듈
 """
 
+import os
+import time
+import asyncio
 import aiohttp
 import json
 import base64
 from typing import Dict, Any, Optional, Union
+from urllib.parse import urlsplit
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 class HttpClient:
-    """HTTP 요청을 위한 공통 클래스"""
+    """
+    HTTP 요청을 위한 공통 클래스
+
+    이벤트 루프마다 ClientSession 하나를 처음 요청할 때 만들어 재사용하므로, 같은 호스트
+    (Slack/Teams 웹훅, OAuth 토큰 엔드포인트 등)로 가는 요청은 DNS 조회와 TCP/TLS 연결을 다시 하지 않는다.
+    """
     
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, limit: Optional[int] = None, limit_per_host: Optional[int] = None,
+                 dns_cache_ttl: Optional[int] = None, keepalive_timeout: Optional[float] = None):
+        """
+        Args:
+            limit: 전체 동시 연결 수 상한
+            limit_per_host: 호스트별 동시 연결 수 상한
+            dns_cache_ttl: DNS 조회 결과 캐시 시간 (초)
+            keepalive_timeout: 유휴 연결 유지 시간 (초)
+        """
         self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.limit = limit or int(os.getenv('HTTP_POOL_LIMIT', '100'))
+        self.limit_per_host = limit_per_host or int(os.getenv('HTTP_POOL_LIMIT_PER_HOST', '20'))
+        self.dns_cache_ttl = dns_cache_ttl or int(os.getenv('HTTP_DNS_CACHE_TTL', '300'))
+        self.keepalive_timeout = keepalive_timeout or float(os.getenv('HTTP_KEEPALIVE_TIMEOUT', '30'))
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self.stats = {"requests": 0, "errors": 0, "sessions_created": 0}
+        self._host_stats: Dict[str, Dict[str, float]] = {}
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프의 세션 (없거나 닫혔으면 생성)"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            # 종료된 루프의 세션은 더 이상 쓸 수 없으므로 버림
+            for stale in [other for other in self._sessions if other.is_closed()]:
+                del self._sessions[stale]
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            session = aiohttp.ClientSession(timeout=self.timeout, connector=connector)
+            self._sessions[loop] = session
+            self.stats["sessions_created"] += 1
+        return session
+    
+    def _record(self, url: str, elapsed: float, success: bool):
+        host = urlsplit(url).netloc
+        stats = self._host_stats.setdefault(host, {"requests": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0})
+        elapsed_ms = elapsed * 1000
+        stats["requests"] += 1
+        stats["errors"] += not success
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+        self.stats["requests"] += 1
+        self.stats["errors"] += not success
+    
+    async def _request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        start = time.perf_counter()
+        result = None
+        try:
+            async with self._get_session().request(method, url, **kwargs) as response:
+                result = await self._process_response(response)
+                return result
+        finally:
+            self._record(url, time.perf_counter() - start, bool(result and result.get("success")))
     
     async def get(self, url: str, headers: Optional[Dict[str, str]] = None, 
                   params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """GET 요청"""
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    return await self._process_response(response)
+            return await self._request("GET", url, headers=headers, params=params)
         except Exception as e:
             logger.error(f"GET 요청 실패 ({url}): {e}")
             return {"success": False, "error": str(e)}
@@ -33,16 +95,14 @@ class HttpClient:
                    headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """POST 요청"""
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                kwargs = {"headers": headers}
-                
-                if json_data:
-                    kwargs["json"] = json_data
-                elif data:
-                    kwargs["data"] = data
-                
-                async with session.post(url, **kwargs) as response:
-                    return await self._process_response(response)
+            kwargs = {"headers": headers}
+            
+            if json_data:
+                kwargs["json"] = json_data
+            elif data:
+                kwargs["data"] = data
+            
+            return await self._request("POST", url, **kwargs)
         except Exception as e:
             logger.error(f"POST 요청 실패 ({url}): {e}")
             return {"success": False, "error": str(e)}
@@ -52,16 +112,14 @@ class HttpClient:
                   headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """PUT 요청"""
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                kwargs = {"headers": headers}
-                
-                if json_data:
-                    kwargs["json"] = json_data
-                elif data:
-                    kwargs["data"] = data
-                
-                async with session.put(url, **kwargs) as response:
-                    return await self._process_response(response)
+            kwargs = {"headers": headers}
+            
+            if json_data:
+                kwargs["json"] = json_data
+            elif data:
+                kwargs["data"] = data
+            
+            return await self._request("PUT", url, **kwargs)
         except Exception as e:
             logger.error(f"PUT 요청 실패 ({url}): {e}")
             return {"success": False, "error": str(e)}
@@ -69,13 +127,38 @@ class HttpClient:
     async def delete(self, url: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """DELETE 요청"""
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.delete(url, headers=headers) as response:
-                    return await self._process_response(response)
+            return await self._request("DELETE", url, headers=headers)
         except Exception as e:
             logger.error(f"DELETE 요청 실패 ({url}): {e}")
             return {"success": False, "error": str(e)}
     
+    async def close(self):
+        """현재 이벤트 루프의 세션과 유지 중인 연결 정리 (이후 요청 시 다시 생성)"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.pop(loop, None)
+        for stale in [other for other in self._sessions if other.is_closed()]:
+            del self._sessions[stale]
+        if session and not session.closed:
+            await session.close()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """요청 수/오류 수와 호스트별 응답 시간"""
+        return {
+            **self.stats,
+            "open_sessions": sum(1 for session in self._sessions.values() if not session.closed),
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "hosts": {
+                host: {
+                    "requests": stats["requests"],
+                    "errors": stats["errors"],
+                    "avg_ms": round(stats["total_ms"] / stats["requests"], 1),
+                    "max_ms": round(stats["max_ms"], 1)
+                }
+                for host, stats in self._host_stats.items()
+            }
+        }
+    
     async def _process_response(self, response: aiohttp.ClientResponse) -> Dict[str, Any]:
         """응답 처리"""
         try:
@@ -193,3 +276,9 @@ def get_oauth_http_client() -> OAuthHttpClient:
     if _oauth_http_client is None:
         _oauth_http_client = OAuthHttpClient()
     return _oauth_http_client
+
+async def close_http_clients():
+    """전역 HTTP 클라이언트의 세션 정리 (종료 시 호출)"""
+    for client in (_http_client, _oauth_http_client):
+        if client is not None:
+            await client.close()
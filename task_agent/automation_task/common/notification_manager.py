@@ -3,6 +3,8 @@
 """
 
 import json
+import time
+import asyncio
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import logging
@@ -14,6 +16,9 @@ from .db_helper import get_db_helper
 
 logger = logging.getLogger(__name__)
 
+# 사용자와 무관하게 채널/웹훅 하나로 보내는 채널 (대량 발송 시 한 번만 발송)
+SHARED_CHANNELS = ("slack", "teams")
+
 
 class NotificationManager:
     """알림 발송을 위한 통합 관리 클래스"""
@@ -23,57 +28,140 @@ class NotificationManager:
         self.email_manager = get_email_manager()
         self.config_manager = get_config_manager()
         self.db_helper = get_db_helper()
+        self.notification_config = self.config_manager.get_notification_config()
     
     async def send_notification(self, user_id: int, message: str, 
                                channels: List[str] = None, urgency: str = "medium",
                                additional_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """통합 알림 발송"""
+        """
+        통합 알림 발송
+        
+        채널들을 동시에 발송하고(채널별 제한 시간 적용) 결과 로그는 한 번에 저장한다.
+        """
         if not channels:
             channels = ["app"]  # 기본값: 앱 알림
         
-        results = {}
-        success_count = 0
+        start = time.perf_counter()
         
         # 사용자 알림 설정 확인
         notification_settings = await self.db_helper.get_notification_settings(user_id)
         
-        for channel in channels:
-            try:
-                if channel == "app" and notification_settings.get("app_notification", True):
-                    result = await self.send_app_notification(user_id, message, urgency, additional_data)
-                elif channel == "email" and notification_settings.get("email_notification", True):
-                    result = await self.send_email_notification(user_id, message, additional_data)
-                elif channel == "sms" and notification_settings.get("sms_notification", True):
-                    result = await self.send_sms_notification(user_id, message)
-                elif channel == "slack":
-                    result = await self.send_slack_notification(message, additional_data)
-                elif channel == "teams":
-                    result = await self.send_teams_notification(message, additional_data)
-                else:
-                    result = {"success": False, "reason": "disabled_or_unsupported"}
-                
-                results[channel] = result
-                if result.get("success"):
-                    success_count += 1
-                
-                # 알림 로그 저장
-                await self.db_helper.save_notification_log(
-                    user_id, channel, message, result.get("success", False),
-                    result.get("error") or result.get("reason")
-                )
-                
-            except Exception as e:
-                logger.error(f"알림 발송 실패 ({channel}): {e}")
-                results[channel] = {"success": False, "error": str(e)}
-                await self.db_helper.save_notification_log(
-                    user_id, channel, message, False, str(e)
-                )
+        outcomes = await asyncio.gather(*[
+            self._dispatch_channel(channel, user_id, message, urgency, additional_data, notification_settings)
+            for channel in channels
+        ])
+        results = dict(zip(channels, outcomes))
+        
+        # 알림 로그 저장
+        await self.db_helper.save_notification_logs([
+            self._log_entry(user_id, channel, message, result) for channel, result in results.items()
+        ])
         
+        success_count = sum(1 for result in outcomes if result.get("success"))
         return {
             "success": success_count > 0,
             "total_channels": len(channels),
             "success_count": success_count,
-            "results": results
+            "results": results,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1)
+        }
+    
+    async def send_bulk(self, user_ids: List[int], message: str,
+                        channels: List[str] = None, urgency: str = "medium",
+                        additional_data: Optional[Dict[str, Any]] = None,
+                        concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """
+        여러 사용자에게 같은 알림 발송
+        
+        사용자 설정은 한 번에 조회하고, 사용자별 채널(app/email/sms)은 최대 concurrency 명씩 동시에,
+        공용 채널(slack/teams)은 한 번만 발송한 뒤 전체 결과 로그를 한 번에 저장한다.
+        
+        Returns:
+            Dict: success_users/failed_users 와 사용자별 채널 결과(results), 공용 채널 결과(shared_results)
+        """
+        if not channels:
+            channels = ["app"]
+        user_ids = list(dict.fromkeys(user_ids))
+        user_channels = [channel for channel in channels if channel not in SHARED_CHANNELS]
+        shared_channels = [channel for channel in channels if channel in SHARED_CHANNELS]
+        
+        start = time.perf_counter()
+        settings = await self.db_helper.get_notification_settings_bulk(user_ids)
+        semaphore = asyncio.Semaphore(concurrency or self.notification_config["bulk_concurrency"])
+        
+        async def notify(user_id: int) -> Dict[str, Dict[str, Any]]:
+            async with semaphore:
+                outcomes = await asyncio.gather(*[
+                    self._dispatch_channel(channel, user_id, message, urgency, additional_data, settings[user_id])
+                    for channel in user_channels
+                ])
+                return dict(zip(user_channels, outcomes))
+        
+        user_results, shared_outcomes = await asyncio.gather(
+            asyncio.gather(*[notify(user_id) for user_id in user_ids]),
+            asyncio.gather(*[
+                self._dispatch_channel(channel, None, message, urgency, additional_data, {})
+                for channel in shared_channels
+            ])
+        )
+        results = dict(zip(user_ids, user_results))
+        shared_results = dict(zip(shared_channels, shared_outcomes))
+        
+        logs = [
+            self._log_entry(user_id, channel, message, result)
+            for user_id, channel_results in results.items() for channel, result in channel_results.items()
+        ]
+        logs += [self._log_entry(None, channel, message, result) for channel, result in shared_results.items()]
+        await self.db_helper.save_notification_logs(logs)
+        
+        success_users = sum(
+            1 for channel_results in results.values() if any(result.get("success") for result in channel_results.values())
+        )
+        shared_success = any(result.get("success") for result in shared_outcomes)
+        return {
+            "success": success_users > 0 or shared_success,
+            "total_users": len(user_ids),
+            "success_users": success_users,
+            "failed_users": len(user_ids) - success_users if user_channels else 0,
+            "results": results,
+            "shared_results": shared_results,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1)
+        }
+    
+    async def _dispatch_channel(self, channel: str, user_id: Optional[int], message: str, urgency: str,
+                                additional_data: Optional[Dict[str, Any]],
+                                notification_settings: Dict[str, bool]) -> Dict[str, Any]:
+        """채널 하나 발송 (채널별 제한 시간을 넘기면 실패로 처리)"""
+        if channel == "app" and notification_settings.get("app_notification", True):
+            send = self.send_app_notification(user_id, message, urgency, additional_data)
+        elif channel == "email" and notification_settings.get("email_notification", True):
+            send = self.send_email_notification(user_id, message, additional_data)
+        elif channel == "sms" and notification_settings.get("sms_notification", True):
+            send = self.send_sms_notification(user_id, message)
+        elif channel == "slack":
+            send = self.send_slack_notification(message, additional_data)
+        elif channel == "teams":
+            send = self.send_teams_notification(message, additional_data)
+        else:
+            return {"success": False, "reason": "disabled_or_unsupported"}
+        
+        timeout = self.notification_config["channel_timeouts"].get(channel, self.notification_config["default_timeout"])
+        try:
+            return await asyncio.wait_for(send, timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"알림 발송 시간 초과 ({channel}, {timeout}초): User {user_id}")
+            return {"success": False, "error": f"timeout after {timeout}s", "timed_out": True}
+        except Exception as e:
+            logger.error(f"알림 발송 실패 ({channel}): {e}")
+            return {"success": False, "error": str(e)}
+    
+    def _log_entry(self, user_id: Optional[int], channel: str, message: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "user_id": user_id,
+            "channel": channel,
+            "message": message,
+            "success": result.get("success", False),
+            "error_message": result.get("error") or result.get("reason")
         }
     
     async def send_app_notification(self, user_id: int, message: str, 
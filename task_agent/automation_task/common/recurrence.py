@@ -0,0 +1,131 @@
+"""
+반복 자동화 작업 일정 계산
+automation_task.recurrence 에 cron 표현식 또는 RRULE 을 저장하고, 작업마다 다음 실행 1회만
+scheduled_at 으로 기록한다. 실행이 끝나면 다음 실행 시각을 다시 계산해 같은 행을 대기 상태로 되돌린다.
+
+    cron : "0 9 * * MON"                              (분 시 일 월 요일)
+    RRULE: "FREQ=WEEKLY;BYDAY=MO;BYHOUR=9;BYMINUTE=0"  (RFC 5545, DTSTART 가 없으면 첫 예약 시각)
+           "DTSTART;TZID=America/New_York:20260105T090000\nRRULE:FREQ=DAILY"  (DTSTART 의 시간대가 우선)
+
+일정은 작업의 timezone 벽시계 기준으로 계산한 뒤 서버 로컬 시각(naive)으로 저장하므로
+서머타임이 있는 시간대에서도 "매주 월요일 9시" 가 그 지역의 9시로 유지된다.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from apscheduler.triggers.cron import CronTrigger
+from dateutil.rrule import rrulestr
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEZONE = "Asia/Seoul"
+
+# 지연된 실행 처리 방식
+MISFIRE_RUN_ONCE = "run_once"  # 늦었더라도 한 번 실행하고, 그 사이 놓친 회차는 건너뜀
+MISFIRE_SKIP = "skip"          # 허용 지연을 넘기면 이번 회차는 실행하지 않음
+MISFIRE_RUN_ALL = "run_all"    # 놓친 회차를 모두 순서대로 실행
+MISFIRE_POLICIES = (MISFIRE_RUN_ONCE, MISFIRE_SKIP, MISFIRE_RUN_ALL)
+
+
+def get_zone(timezone: Optional[str]) -> ZoneInfo:
+    try:
+        return ZoneInfo(timezone or DEFAULT_TIMEZONE)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f"알 수 없는 시간대: {timezone}")
+
+
+def is_rrule(recurrence: str) -> bool:
+    upper = recurrence.upper()
+    return "FREQ=" in upper or upper.startswith(("RRULE:", "DTSTART"))
+
+
+def _to_wall_clock(value: datetime, zone: ZoneInfo) -> datetime:
+    """서버 로컬 시각(naive)을 zone 의 벽시계 시각(naive)으로 변환"""
+    return value.astimezone(zone).replace(tzinfo=None)
+
+
+def _to_server_time(value: datetime) -> datetime:
+    """시간대가 있는 시각을 서버 로컬 시각(naive)으로 변환 (DB 저장 형식)"""
+    return value.astimezone().replace(tzinfo=None)
+
+
+def normalize_recurrence(recurrence: str, timezone: Optional[str] = None, start: Optional[datetime] = None) -> str:
+    """
+    반복 규칙 검증 및 저장 형식으로 정리
+
+    DTSTART 가 없는 RRULE 은 start(기본: 지금)를 timezone 벽시계 기준 DTSTART 로 고정해
+    COUNT/INTERVAL 이 매 계산마다 달라지지 않게 한다.
+
+    Raises:
+        ValueError: 규칙 또는 시간대가 올바르지 않은 경우
+    """
+    recurrence = (recurrence or "").strip()
+    if not recurrence:
+        raise ValueError("반복 규칙이 비어 있습니다")
+    zone = get_zone(timezone)
+
+    if not is_rrule(recurrence):
+        CronTrigger.from_crontab(recurrence, timezone=zone)
+        return recurrence
+
+    if "DTSTART" not in recurrence.upper():
+        dtstart = _to_wall_clock(start or datetime.now(), zone).replace(microsecond=0)
+        rule = recurrence if recurrence.upper().startswith("RRULE:") else f"RRULE:{recurrence}"
+        recurrence = f"DTSTART:{dtstart.strftime('%Y%m%dT%H%M%S')}\n{rule}"
+    try:
+        rrulestr(recurrence)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"잘못된 RRULE: {e}")
+    return recurrence
+
+
+def next_occurrence(recurrence: str, timezone: Optional[str], after: datetime) -> Optional[datetime]:
+    """
+    after(서버 로컬 시각) 이후 첫 실행 시각 (서버 로컬 시각, 반복이 끝났으면 None)
+
+    회차가 끝날 때 작업 하나에 대해 한 번만 호출되며, 스케줄러/워커는 scheduled_at 인덱스로
+    가까운 작업만 읽으므로 반복 작업 수가 늘어도 주기마다 전체를 계산하지 않는다.
+    """
+    zone = get_zone(timezone)
+    if not is_rrule(recurrence):
+        trigger = CronTrigger.from_crontab(recurrence, timezone=zone)
+        fire_time = trigger.get_next_fire_time(None, (after + timedelta(seconds=1)).astimezone(zone))
+        return _to_server_time(fire_time) if fire_time else None
+
+    rule = rrulestr(recurrence)
+    first = next(iter(rule), None)
+    if first is None:
+        return None
+    if first.tzinfo is not None:
+        # DTSTART 에 시간대가 있으면(UTC "Z" 또는 TZID) 그 시간대 기준으로 비교
+        occurrence = rule.after(after.astimezone(first.tzinfo), inc=False)
+    else:
+        occurrence = rule.after(_to_wall_clock(after, zone), inc=False)
+    if occurrence is None:
+        return None
+    if occurrence.tzinfo is None:
+        occurrence = occurrence.replace(tzinfo=zone)
+    return _to_server_time(occurrence)
+
+
+def is_misfired(scheduled_at: Optional[datetime], grace_seconds: float, now: Optional[datetime] = None) -> bool:
+    """예정 시각보다 허용 지연 이상 늦었는지 여부"""
+    if scheduled_at is None:
+        return False
+    return ((now or datetime.now()) - scheduled_at).total_seconds() > grace_seconds
+
+
+def plan_next_run(recurrence: str, timezone: Optional[str], scheduled_at: Optional[datetime],
+                  misfire_policy: str = MISFIRE_RUN_ONCE, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    이번 회차(scheduled_at)가 끝난 뒤의 다음 실행 시각
+
+    run_all 은 이번 회차 바로 다음 회차(이미 지났으면 곧바로 실행), 그 외에는 지금 이후 첫 회차.
+    """
+    now = now or datetime.now()
+    if misfire_policy == MISFIRE_RUN_ALL and scheduled_at is not None:
+        return next_occurrence(recurrence, timezone, scheduled_at)
+    return next_occurrence(recurrence, timezone, max(now, scheduled_at or now))
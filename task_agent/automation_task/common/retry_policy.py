@@ -0,0 +1,121 @@
+"""
+자동화 작업 재시도 정책
+작업 타입별 최대 시도 횟수와 지수 백오프(+지터)를 정의하고, 실패 결과가 일시적인 오류인지 분류한다.
+
+일시적 오류(타임아웃, 연결 끊김, 429/5xx 등)만 재시도하며, 알 수 없는 오류는 중복 발송을
+막기 위해 재시도하지 않는다. 서비스 결과에 "retryable" 이 있으면 그 값을 우선하고,
+HTTP 상태 코드(status_code / error_code)가 있으면 메시지보다 먼저 본다.
+"""
+
+import re
+import random
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 메시지에 포함되면 일시적 오류로 보는 문자열 (소문자 비교)
+RETRYABLE_ERROR_PATTERNS = (
+    "timeout", "timed out", "temporar", "connection", "reset by peer", "unavailable",
+    "rate limit", "too many requests", "try again", "server disconnected",
+    "시간 초과", "일시적", "연결 끊김", "연결 실패"
+)
+# 재시도해도 결과가 같은 오류 (일시적 오류 패턴보다 우선)
+PERMANENT_ERROR_PATTERNS = (
+    "지원하지 않는", "초기화되지 않았습니다", "찾을 수 없습니다", "invalid", "not found",
+    "unauthorized", "forbidden", "authentication"
+)
+# HTTP 상태 코드 (결과의 status_code/error_code 또는 메시지 안의 독립된 세 자리 숫자)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+PERMANENT_STATUS_CODES = frozenset({401, 403, 404})
+_STATUS_CODE_PATTERN = re.compile(r"\b[1-5]\d\d\b")
+# 예외 객체가 직접 전달된 경우 일시적 오류로 보는 타입
+RETRYABLE_EXCEPTIONS = (asyncio.TimeoutError, TimeoutError, ConnectionError)
+
+
+class RetryPolicy:
+    """최대 시도 횟수와 지수 백오프 설정"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 30, max_delay: float = 1800,
+                 multiplier: float = 2.0, jitter: float = 0.5, retryable_errors: Iterable[str] = ()):
+        """
+        Args:
+            max_attempts: 첫 실행을 포함한 최대 시도 횟수
+            base_delay: 첫 재시도 대기 시간 (초)
+            max_delay: 재시도 대기 시간 상한 (초)
+            multiplier: 시도마다 대기 시간에 곱하는 값
+            jitter: 대기 시간에서 무작위로 줄이는 최대 비율 (0~1, 동시에 실패한 작업이 한꺼번에 재시도되지 않도록)
+            retryable_errors: 기본 패턴 외에 일시적 오류로 볼 문자열
+        """
+        self.max_attempts = max(int(max_attempts), 1)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = min(max(jitter, 0.0), 1.0)
+        self.retryable_errors = tuple(pattern.lower() for pattern in retryable_errors)
+
+    def next_delay(self, attempt: int) -> float:
+        """attempt 번째 시도가 실패한 뒤 다음 시도까지 대기할 시간 (초)"""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        return delay - random.uniform(0, delay * self.jitter)
+
+    def should_retry(self, attempt: int, retryable: bool) -> bool:
+        return retryable and attempt < self.max_attempts
+
+    def is_retryable(self, result: Optional[Dict[str, Any]] = None, error: Optional[BaseException] = None) -> bool:
+        """실패 결과 또는 예외가 일시적인 오류인지 분류"""
+        if error is not None:
+            if isinstance(error, RETRYABLE_EXCEPTIONS):
+                return True
+            message = f"{type(error).__name__}: {error}"
+            status_codes: Tuple[int, ...] = ()
+        else:
+            result = result or {}
+            if "retryable" in result:
+                return bool(result["retryable"])
+            details = result.get("details")
+            if not isinstance(details, dict):
+                details = {}
+            if "retryable" in details:
+                return bool(details["retryable"])
+            message = " ".join(str(part) for part in (result.get("message", ""), details.get("error", "")))
+            status_codes = tuple(
+                code for source in (result, details) for key in ("status_code", "error_code")
+                for code in (source.get(key),) if isinstance(code, int)
+            )
+
+        # 서비스가 넘긴 상태 코드가 없을 때만 메시지 안의 숫자를 상태 코드로 봄 ("5001번 작업" 등은 제외)
+        status_codes = status_codes or tuple(int(code) for code in _STATUS_CODE_PATTERN.findall(message))
+        if any(code in PERMANENT_STATUS_CODES for code in status_codes):
+            return False
+        if any(code in RETRYABLE_STATUS_CODES for code in status_codes):
+            return True
+
+        message = message.lower()
+        if any(pattern in message for pattern in PERMANENT_ERROR_PATTERNS):
+            return False
+        return any(pattern in message for pattern in RETRYABLE_ERROR_PATTERNS + self.retryable_errors)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "max_attempts": self.max_attempts,
+            "base_delay": self.base_delay,
+            "max_delay": self.max_delay,
+            "multiplier": self.multiplier,
+            "jitter": self.jitter
+        }
+
+
+def build_retry_policies(config: Dict[str, Dict[str, Any]]) -> Dict[str, RetryPolicy]:
+    """
+    설정(automation.retry_policies)에서 작업 타입별 정책 생성
+
+    "default" 값을 기준으로 타입별 값을 덮어쓴다. 반환값의 "default" 는 설정에 없는 타입에 사용한다.
+    """
+    default = config.get("default", {})
+    policies = {"default": RetryPolicy(**default)}
+    for task_type, overrides in config.items():
+        if task_type != "default":
+            policies[task_type] = RetryPolicy(**{**default, **overrides})
+    return policies
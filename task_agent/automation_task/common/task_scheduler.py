@@ -0,0 +1,191 @@
+"""
+DB 기반 자동화 작업 스케줄러
+automation_task 테이블을 예약 작업의 원본으로 두고, 가까운 시일(lookahead) 안에 실행될
+작업만 APScheduler 에 적재한다. 재시작 후에도 주기적인 동기화로 예약이 복구되며,
+먼 미래의 예약은 DB 에만 남아 있으므로 메모리 사용량이 예약 건수와 무관하다.
+"""
+
+import os
+import socket
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from automation_task.common.db_helper import get_automation_db_helper
+
+logger = logging.getLogger(__name__)
+
+SYNC_JOB_ID = "automation_task_sync"
+HEARTBEAT_JOB_ID = "automation_task_heartbeat"
+
+
+def get_task_job_id(task_id: int) -> str:
+    return f"auto_{task_id}"
+
+
+class DurableTaskScheduler:
+    """automation_task 테이블에서 예약 작업을 주기적으로 적재하는 스케줄러"""
+
+    def __init__(self, scheduler: AsyncIOScheduler, execute: Callable[[int], Awaitable[Any]],
+                 poll_interval: int = 30, lookahead: int = 300, batch_size: int = 500,
+                 lease_seconds: int = 60, heartbeat_interval: float = 15):
+        """
+        Args:
+            scheduler: 실행 중인 AsyncIOScheduler
+            execute: task_id 를 받아 작업을 실행하는 코루틴 함수
+            poll_interval: DB 동기화 주기 (초)
+            lookahead: 이 시간 안에 실행될 작업만 메모리에 적재 (초, poll_interval 보다 커야 함)
+            batch_size: 동기화 1회에 적재하는 최대 작업 수
+            lease_seconds: 실행 시 선점 리스 (하트비트가 이 시간 동안 연장하지 못하면 워커가 다시 가져갈 수 있음)
+            heartbeat_interval: 선점한 작업의 리스 연장 주기 (초)
+        """
+        self.scheduler = scheduler
+        self.execute = execute
+        self.db_helper = get_automation_db_helper()
+        self.poll_interval = poll_interval
+        self.lookahead = max(lookahead, poll_interval * 2)
+        self.batch_size = batch_size
+        self.lease_seconds = max(lease_seconds, int(heartbeat_interval * 2))
+        self.heartbeat_interval = heartbeat_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:inline"
+        self._stats = {"syncs": 0, "loaded": 0, "executed": 0, "skipped": 0, "lost_leases": 0, "last_sync": None}
+        # 실행 중인 작업 (상태가 바뀌기 전에 동기화가 다시 적재하지 않도록)
+        self._running = set()
+        # 선점해 리스를 연장해야 하는 작업 (실행 엔진의 대기열/속도 제한 대기 중인 작업 포함)
+        self._claimed = set()
+
+    def start(self):
+        """주기 동기화와 리스 연장 등록 (첫 동기화는 즉시 실행되어 재시작 전 예약을 복구)"""
+        self.scheduler.add_job(
+            self.sync,
+            'interval',
+            seconds=self.poll_interval,
+            id=SYNC_JOB_ID,
+            next_run_time=datetime.now(),
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True
+        )
+        self.scheduler.add_job(
+            self.renew_leases,
+            'interval',
+            seconds=self.heartbeat_interval,
+            id=HEARTBEAT_JOB_ID,
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True
+        )
+        logger.info(f"DB 기반 스케줄러 시작 (주기 {self.poll_interval}초, 적재 구간 {self.lookahead}초)")
+
+    async def sync(self) -> int:
+        """적재 구간 안의 대기 작업 중 아직 등록되지 않은 작업을 스케줄러에 등록"""
+        horizon = datetime.now() + timedelta(seconds=self.lookahead)
+        due_tasks = await self.db_helper.get_due_automation_tasks(horizon, self.batch_size)
+
+        loaded = 0
+        for task in due_tasks:
+            if task["task_id"] in self._running or self.scheduler.get_job(get_task_job_id(task["task_id"])):
+                continue
+            self._add_job(task["task_id"], task["scheduled_at"])
+            loaded += 1
+
+        self._stats["syncs"] += 1
+        self._stats["loaded"] += loaded
+        self._stats["last_sync"] = datetime.now().isoformat()
+        if loaded:
+            logger.info(f"예약 작업 {loaded}개 적재 (~{horizon.strftime('%H:%M:%S')})")
+        return loaded
+
+    async def renew_leases(self) -> int:
+        """
+        선점한 작업의 리스 연장 (worker.py 의 하트비트와 같은 방식)
+
+        실행 시간이 리스보다 길거나 실행 엔진에서 오래 대기해도 다른 워커가 다시 가져가지 않는다.
+
+        Returns:
+            int: 연장한 작업 수
+        """
+        task_ids = list(self._claimed)
+        if not task_ids:
+            return 0
+        renewed = await self.db_helper.renew_automation_task_leases(self.worker_id, task_ids, self.lease_seconds)
+        if renewed < len(task_ids):
+            # 리스를 잃은 작업은 워커가 다시 실행할 수 있음 (하트비트 지연/DB 장애)
+            self._stats["lost_leases"] += len(task_ids) - renewed
+            logger.warning(f"리스 연장 실패: {len(task_ids) - renewed}/{len(task_ids)}개")
+        return renewed
+
+    def schedule(self, task_id: int, run_date: datetime) -> bool:
+        """
+        새 예약 작업 등록 (작업 행은 이미 저장되어 있어야 함)
+
+        적재 구간 밖의 작업은 등록하지 않고 이후 동기화에서 적재된다.
+
+        Returns:
+            bool: 즉시 스케줄러에 등록되었는지 여부
+        """
+        if run_date > datetime.now() + timedelta(seconds=self.lookahead):
+            return False
+        self._add_job(task_id, run_date)
+        return True
+
+    def unschedule(self, task_id: int) -> bool:
+        """스케줄러에서 작업 제거 (적재되지 않은 작업이면 False)"""
+        job = self.scheduler.get_job(get_task_job_id(task_id))
+        if job is None:
+            return False
+        job.remove()
+        return True
+
+    def _add_job(self, task_id: int, run_date: datetime):
+        # 재시작 중에 지난 예약은 즉시 실행 (misfire_grace_time=None: 지연과 무관하게 실행)
+        self.scheduler.add_job(
+            self.run_task,
+            'date',
+            run_date=max(run_date, datetime.now()),
+            args=[task_id],
+            id=get_task_job_id(task_id),
+            misfire_grace_time=None,
+            replace_existing=True
+        )
+
+    async def run_task(self, task_id: int) -> Optional[Any]:
+        """
+        작업을 선점한 뒤 실행 (예약 실행 / 즉시 실행 공통)
+
+        선점 리스를 기록하고 실행이 끝날 때까지 하트비트로 연장하므로, 실행 중 프로세스가 죽으면
+        리스 만료 후 워커가 다시 가져간다.
+
+        Returns:
+            실행 결과 (다른 프로세스에서 취소/선점해 건너뛴 작업은 None)
+        """
+        self._running.add(task_id)
+        try:
+            if not await self.db_helper.claim_automation_task(task_id, self.worker_id, self.lease_seconds):
+                self._stats["skipped"] += 1
+                logger.info(f"대기 상태가 아닌 작업 건너뜀: {task_id}")
+                return None
+
+            self._stats["executed"] += 1
+            self._claimed.add(task_id)
+            try:
+                return await self.execute(task_id)
+            finally:
+                self._claimed.discard(task_id)
+                await self.db_helper.release_automation_task(task_id, self.worker_id)
+        finally:
+            self._running.discard(task_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적재 현황 (메모리에 올라간 예약 작업 수 포함)"""
+        loaded_jobs = sum(1 for job in self.scheduler.get_jobs() if job.id.startswith("auto_"))
+        return {
+            **self._stats,
+            "loaded_jobs": loaded_jobs,
+            "running": len(self._running),
+            "lease_seconds": self.lease_seconds,
+            "poll_interval": self.poll_interval,
+            "lookahead": self.lookahead
+        }
@@ -93,6 +93,10 @@ class EmailService:
         """HTML 이메일 템플릿 생성"""
         return self.email_manager.create_html_template(title, content, additional_info)
     
+    async def cleanup(self):
+        """유지 중인 SMTP 연결 정리"""
+        await self.email_manager.close()
+    
     async def send_reminder_email(self, to_email: str, reminder_message: str,
                                  task_id: Optional[str] = None, 
                                  custom_subject: Optional[str] = None) -> Dict[str, Any]:
@@ -2,11 +2,17 @@
 Google Calendar API 연동 서비스 - 공용 모듈 사용 버전
 """
 
+import asyncio
+import threading
 import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
+import httplib2
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
@@ -21,9 +27,17 @@ logger = logging.getLogger(__name__)
 # Google Calendar API 스코프
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+# Calendar API 배치 요청 하나에 담는 최대 호출 수
+BATCH_LIMIT = 50
+
 
 class GoogleCalendarService:
-    """Google Calendar API 서비스 클래스 (공용 모듈 사용)"""
+    """
+    Google Calendar API 서비스 클래스 (공용 모듈 사용)
+
+    googleapiclient 의 요청은 동기 HTTP 이므로 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않는다.
+    httplib2 연결은 스레드 간에 공유할 수 없어 스레드마다 하나씩 두고, 요청마다 사용자 인증 정보로 감싼다.
+    """
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
@@ -47,8 +61,16 @@ class GoogleCalendarService:
         else:
             self.config = self.config_manager.get_oauth_config("google_calendar")
         
-        self.services_cache = {}  # 사용자별 서비스 객체 캐시
+        # 사용자별 (서비스 객체, 인증 정보) LRU 캐시
+        self.services_cache: "OrderedDict[str, Tuple[Any, Credentials]]" = OrderedDict()
+        self.services_cache_size = self.config_manager.get("google_calendar.services_cache_size", 256)
         self.platform = "google_calendar"
+        
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config_manager.get("google_calendar.max_workers", 8),
+            thread_name_prefix="google-calendar"
+        )
+        self._local = threading.local()
     
     # ===== OAuth 인증 관련 메서드들 =====
     
@@ -151,8 +173,8 @@ class GoogleCalendarService:
         success = self.auth_manager.store_token(user_id, self.platform, token_data)
         
         # 서비스 캐시 초기화 (새 토큰으로 업데이트)
-        if success and user_id in self.services_cache:
-            del self.services_cache[user_id]
+        if success:
+            self.services_cache.pop(user_id, None)
         
         return success
     
@@ -215,11 +237,12 @@ class GoogleCalendarService:
     
     # ===== Google Calendar API 서비스 객체 관리 =====
     
-    async def _get_calendar_service(self, user_id: str):
-        """사용자별 Google Calendar API 서비스 객체 가져오기"""
+    async def _get_calendar_service(self, user_id: str) -> Tuple[Any, Credentials]:
+        """사용자별 Google Calendar API 서비스 객체와 인증 정보 가져오기"""
         try:
             # 캐시된 서비스가 있고 토큰이 유효하면 반환
             if user_id in self.services_cache and self.is_token_valid(user_id):
+                self.services_cache.move_to_end(user_id)
                 return self.services_cache[user_id]
             
             # 토큰 가져오기
@@ -244,24 +267,87 @@ class GoogleCalendarService:
                 scopes=SCOPES
             )
             
-            # Calendar API 서비스 객체 생성
-            service = build('calendar', 'v3', credentials=credentials)
+            # Calendar API 서비스 객체 생성 (discovery 문서 파싱은 스레드 풀에서)
+            service = await asyncio.get_running_loop().run_in_executor(
+                self._executor, lambda: build('calendar', 'v3', credentials=credentials, cache_discovery=False)
+            )
             
-            # 캐시에 저장
-            self.services_cache[user_id] = service
+            # 캐시에 저장 (가장 오래 사용하지 않은 사용자부터 제거)
+            self.services_cache[user_id] = (service, credentials)
+            self.services_cache.move_to_end(user_id)
+            while len(self.services_cache) > self.services_cache_size:
+                self.services_cache.popitem(last=False)
             
-            return service
+            return service, credentials
             
         except Exception as e:
             logger.error(f"Google Calendar 서비스 객체 생성 실패: {e}")
             raise e
     
+    def _thread_http(self, credentials: Credentials) -> AuthorizedHttp:
+        """현재 스레드의 httplib2 연결을 사용자 인증 정보로 감싼 HTTP 객체"""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = httplib2.Http(timeout=self.config_manager.get("google_calendar.timeout", 30))
+        return AuthorizedHttp(credentials, http=http)
+    
+    async def _execute(self, request, credentials: Credentials) -> Any:
+        """API 요청을 스레드 풀에서 실행"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, lambda: request.execute(http=self._thread_http(credentials))
+        )
+    
+    async def _execute_batch(self, service, credentials: Credentials, requests: List[Any]) -> List[Tuple[Any, Optional[Exception]]]:
+        """
+        여러 API 요청을 배치 엔드포인트로 실행 (BATCH_LIMIT 개씩 묶어 동시에 전송)
+        
+        Returns:
+            List: 요청 순서대로 (응답, 오류)
+        """
+        results: List[Tuple[Any, Optional[Exception]]] = [(None, None)] * len(requests)
+        
+        def callback(request_id, response, exception):
+            results[int(request_id)] = (response, exception)
+        
+        batches = []
+        for offset in range(0, len(requests), BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=callback)
+            for index in range(offset, min(offset + BATCH_LIMIT, len(requests))):
+                batch.add(requests[index], request_id=str(index))
+            batches.append(batch)
+        
+        outcomes = await asyncio.gather(*[self._execute(batch, credentials) for batch in batches], return_exceptions=True)
+        
+        # 배치 요청 자체가 실패하면 그 배치의 요청 모두 같은 오류로 처리
+        for batch_index, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                for index in range(batch_index * BATCH_LIMIT, min((batch_index + 1) * BATCH_LIMIT, len(requests))):
+                    results[index] = (None, outcome)
+        return results
+    
+    def _batch_result(self, response: Any, error: Optional[Exception]) -> Dict[str, Any]:
+        if error is None:
+            return {
+                "success": True,
+                "event_id": response.get('id'),
+                "event_link": response.get('htmlLink'),
+                "event_data": response
+            }
+        if isinstance(error, HttpError):
+            return {"success": False, "error": f"Google Calendar API 오류: {error}", "error_code": error.resp.status}
+        return {"success": False, "error": str(error)}
+    
+    async def cleanup(self):
+        """스레드 풀과 서비스 캐시 정리"""
+        self._executor.shutdown(wait=False)
+        self.services_cache.clear()
+    
     # ===== Calendar API 메서드들 =====
     
     async def create_event(self, user_id: str, event_data: Dict[str, Any]) -> Dict[str, Any]:
         """Google Calendar에 이벤트 생성 (재시도 기능 포함)"""
         try:
-            service = await self._get_calendar_service(user_id)
+            service, credentials = await self._get_calendar_service(user_id)
             
             # 이벤트 데이터 준비
             event = self._prepare_event_data(event_data)
@@ -270,10 +356,10 @@ class GoogleCalendarService:
             calendar_id = event_data.get('calendar_id', 'primary')
             
             # 이벤트 생성
-            created_event = service.events().insert(
+            created_event = await self._execute(service.events().insert(
                 calendarId=calendar_id,
                 body=event
-            ).execute()
+            ), credentials)
             
             logger.info(f"Google Calendar 이벤트 생성 완료: {created_event.get('id')}")
             
@@ -313,18 +399,18 @@ class GoogleCalendarService:
         
         # 종료 시간이 없으면 시작 시간 + 1시간으로 설정
         if not end_time:
-            end_time = DateTimeUtils.add_time_delta(start_time, hours=1)
+            end_time = start_time + timedelta(hours=1)
         
         # Google Calendar 이벤트 객체
         event = {
             'summary': title,
             'description': event_data.get('description', ''),
             'start': {
-                'dateTime': DateTimeUtils.format_datetime(start_time, "iso"),
+                'dateTime': DateTimeUtils.format_datetime_iso(start_time),
                 'timeZone': event_data.get('timezone', 'Asia/Seoul'),
             },
             'end': {
-                'dateTime': DateTimeUtils.format_datetime(end_time, "iso"),
+                'dateTime': DateTimeUtils.format_datetime_iso(end_time),
                 'timeZone': event_data.get('timezone', 'Asia/Seoul'),
             },
         }
@@ -359,20 +445,20 @@ class GoogleCalendarService:
                         calendar_id: str = 'primary') -> Dict[str, Any]:
         """지정된 기간의 이벤트 조회"""
         try:
-            service = await self._get_calendar_service(user_id)
+            service, credentials = await self._get_calendar_service(user_id)
             
             # RFC3339 형식으로 시간 변환
-            time_min = DateTimeUtils.format_datetime(start_date, "iso") + 'Z'
-            time_max = DateTimeUtils.format_datetime(end_date, "iso") + 'Z'
+            time_min = DateTimeUtils.format_datetime_iso(start_date) + 'Z'
+            time_max = DateTimeUtils.format_datetime_iso(end_date) + 'Z'
             
             # 이벤트 조회
-            events_result = service.events().list(
+            events_result = await self._execute(service.events().list(
                 calendarId=calendar_id,
                 timeMin=time_min,
                 timeMax=time_max,
                 singleEvents=True,
                 orderBy='startTime'
-            ).execute()
+            ), credentials)
             
             events = events_result.get('items', [])
             
@@ -400,13 +486,13 @@ class GoogleCalendarService:
                           calendar_id: str = 'primary') -> Dict[str, Any]:
         """기존 이벤트 수정"""
         try:
-            service = await self._get_calendar_service(user_id)
+            service, credentials = await self._get_calendar_service(user_id)
             
             # 기존 이벤트 가져오기
-            existing_event = service.events().get(
+            existing_event = await self._execute(service.events().get(
                 calendarId=calendar_id, 
                 eventId=event_id
-            ).execute()
+            ), credentials)
             
             # 업데이트할 데이터 준비
             updated_event = self._prepare_event_data(event_data)
@@ -416,11 +502,11 @@ class GoogleCalendarService:
                 existing_event[key] = value
             
             # 이벤트 업데이트
-            updated = service.events().update(
+            updated = await self._execute(service.events().update(
                 calendarId=calendar_id,
                 eventId=event_id,
                 body=existing_event
-            ).execute()
+            ), credentials)
             
             logger.info(f"Google Calendar 이벤트 수정 완료: {event_id}")
             
@@ -448,13 +534,13 @@ class GoogleCalendarService:
     async def delete_event(self, user_id: str, event_id: str, calendar_id: str = 'primary') -> Dict[str, Any]:
         """이벤트 삭제"""
         try:
-            service = await self._get_calendar_service(user_id)
+            service, credentials = await self._get_calendar_service(user_id)
             
             # 이벤트 삭제
-            service.events().delete(
+            await self._execute(service.events().delete(
                 calendarId=calendar_id,
                 eventId=event_id
-            ).execute()
+            ), credentials)
             
             logger.info(f"Google Calendar 이벤트 삭제 완료: {event_id}")
             
@@ -477,6 +563,80 @@ class GoogleCalendarService:
                 "error": str(e)
             }
     
+    async def create_events(self, user_id: str, events_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """여러 이벤트를 배치 요청으로 생성 (결과는 입력 순서대로)"""
+        try:
+            service, credentials = await self._get_calendar_service(user_id)
+            
+            requests = [
+                service.events().insert(
+                    calendarId=event_data.get('calendar_id', 'primary'),
+                    body=self._prepare_event_data(event_data)
+                )
+                for event_data in events_data
+            ]
+            results = [self._batch_result(*outcome) for outcome in await self._execute_batch(service, credentials, requests)]
+            
+            success_count = sum(1 for result in results if result["success"])
+            logger.info(f"Google Calendar 이벤트 일괄 생성 완료: {success_count}/{len(results)}")
+            
+            return {
+                "success": success_count > 0,
+                "success_count": success_count,
+                "failed_count": len(results) - success_count,
+                "results": results
+            }
+            
+        except Exception as e:
+            logger.error(f"Google Calendar 이벤트 일괄 생성 실패: {e}")
+            return {"success": False, "error": str(e)}
+    
+    async def update_events(self, user_id: str, updates: List[Dict[str, Any]],
+                            calendar_id: str = 'primary') -> Dict[str, Any]:
+        """
+        여러 이벤트를 배치 요청으로 수정 (update_event 와 같이 기존 이벤트에 병합)
+        
+        Args:
+            updates: event_id 와 수정할 이벤트 데이터를 가진 항목 목록
+        
+        기존 이벤트 조회와 수정을 각각 배치 요청 하나로 보내므로 이벤트 수와 관계없이 왕복 2회로 끝난다.
+        """
+        try:
+            service, credentials = await self._get_calendar_service(user_id)
+            
+            existing = await self._execute_batch(service, credentials, [
+                service.events().get(calendarId=calendar_id, eventId=update['event_id']) for update in updates
+            ])
+            
+            results: List[Optional[Dict[str, Any]]] = [None] * len(updates)
+            indexes, requests = [], []
+            for index, (update, (existing_event, error)) in enumerate(zip(updates, existing)):
+                if error is not None:
+                    results[index] = self._batch_result(None, error)
+                    continue
+                existing_event.update(self._prepare_event_data(update))
+                indexes.append(index)
+                requests.append(service.events().update(
+                    calendarId=calendar_id, eventId=update['event_id'], body=existing_event
+                ))
+            
+            for index, outcome in zip(indexes, await self._execute_batch(service, credentials, requests)):
+                results[index] = self._batch_result(*outcome)
+            
+            success_count = sum(1 for result in results if result["success"])
+            logger.info(f"Google Calendar 이벤트 일괄 수정 완료: {success_count}/{len(results)}")
+            
+            return {
+                "success": success_count > 0,
+                "success_count": success_count,
+                "failed_count": len(results) - success_count,
+                "results": results
+            }
+            
+        except Exception as e:
+            logger.error(f"Google Calendar 이벤트 일괄 수정 실패: {e}")
+            return {"success": False, "error": str(e)}
+    
     # ===== 계정 연동 관리 =====
     
     def is_connected(self, user_id: str) -> bool:
@@ -489,8 +649,7 @@ class GoogleCalendarService:
         success = self.auth_manager.remove_token(user_id, self.platform)
         
         # 서비스 캐시에서 제거
-        if user_id in self.services_cache:
-            del self.services_cache[user_id]
+        self.services_cache.pop(user_id, None)
         
         return success
     
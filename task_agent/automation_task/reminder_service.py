@@ -54,8 +54,31 @@ class ReminderService:
         except Exception as e:
             logger.error(f"리마인더 발송 중 오류: {e}")
             return {"success": False, "error": str(e)}
-    
-    async def send_app_notification(self, user_id: int, message: str, 
+
+    async def send_bulk_reminder(self, user_ids: List[int], message: str,
+                                 channels: List[str] = None, urgency: str = "medium",
+                                 additional_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """여러 사용자에게 같은 리마인더 발송"""
+        try:
+            reminder_data = {"subject": "📋 업무 리마인더", **(additional_data or {})}
+
+            result = await self.notification_manager.send_bulk(
+                user_ids=user_ids,
+                message=message,
+                channels=channels or ["app", "email"],
+                urgency=urgency,
+                additional_data=reminder_data
+            )
+
+            logger.info(f"대량 리마인더 발송: {result.get('success_users')}/{result.get('total_users')}명 성공 "
+                        f"({result.get('elapsed_ms')}ms)")
+            return result
+
+        except Exception as e:
+            logger.error(f"대량 리마인더 발송 중 오류: {e}")
+            return {"success": False, "error": str(e)}
+
+    async def send_app_notification(self, user_id: int, message: str,
                                    urgency: str = "medium", 
                                    task_id: Optional[str] = None) -> Dict[str, Any]:
         """앱 내 알림 발송"""
@@ -13,8 +13,8 @@ os.environ['DO_NOT_TRACK'] = '1'
 
 import logging
 from datetime import datetime
-from typing import Dict, Any, List
-from models import UserQuery, AutomationRequest
+from typing import Dict, Any, List, Optional
+from models import UserQuery, AutomationRequest, TaskReplayRequest, CampaignRequest
 from utils import TaskAgentLogger, TaskAgentResponseFormatter
 from agent import TaskAgent
 from config import config
@@ -42,6 +42,7 @@ from shared_modules import (
 )
 from shared_modules.utils import get_or_create_conversation_session
 from shared_modules.logging_utils import setup_logging
+from shared_modules.migrations import ensure_schema_current
 
 # 로깅 설정
 logger = setup_logging("task", log_file="logs/task.log")
@@ -141,6 +142,9 @@ async def startup_event():
     for warning in validation["warnings"]:
         logger.warning(warning)
     
+    # DB 스키마 확인 (마이그레이션 전에 새 코드가 뜨면 누락 컬럼 조회 오류 대신 여기서 중단)
+    ensure_schema_current()
+    
     # 에이전트 초기화
     try:
         agent = TaskAgent()
@@ -299,6 +303,70 @@ async def get_system_status():
             "timestamp": datetime.now().isoformat()
         }
 
+# ===== 자동화 작업 관리 API =====
+
+@app.get("/automation/dead-letter")
+async def get_dead_letter_tasks(task_type: Optional[str] = None, user_id: Optional[int] = None,
+                                limit: int = 100, after_id: int = 0):
+    """재시도를 소진한 자동화 작업 목록 (next_after_id 로 다음 페이지 조회)"""
+    try:
+        if not agent:
+            return create_error_response("에이전트가 초기화되지 않았습니다.", "AGENT_NOT_INITIALIZED")
+        
+        tasks = await agent.get_dead_letter_tasks(task_type, user_id, min(limit, 1000), after_id)
+        return create_success_response(data={
+            "tasks": tasks,
+            "next_after_id": tasks[-1]["task_id"] if len(tasks) == min(limit, 1000) else None
+        })
+    except Exception as e:
+        logger.error(f"dead letter 작업 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/automation/dead-letter/replay")
+async def replay_dead_letter_tasks(request: TaskReplayRequest):
+    """dead letter 작업 일괄 재실행"""
+    try:
+        if not agent:
+            return create_error_response("에이전트가 초기화되지 않았습니다.", "AGENT_NOT_INITIALIZED")
+        
+        result = await agent.replay_automation_tasks(request)
+        return create_success_response(data=result, message=f"{result['replayed']}개 작업을 다시 실행합니다.")
+    except Exception as e:
+        logger.error(f"작업 재실행 요청 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/automation/campaigns")
+async def create_email_campaign(request: CampaignRequest):
+    """대량 이메일 캠페인 생성 (수신자별 템플릿 변수, 배치 발송)"""
+    try:
+        if not agent:
+            return create_error_response("에이전트가 초기화되지 않았습니다.", "AGENT_NOT_INITIALIZED")
+        
+        result = await agent.create_email_campaign(request)
+        if not result.get("success"):
+            return create_error_response(result.get("error") or result.get("message", "캠페인 생성 실패"), "CAMPAIGN_CREATE_ERROR")
+        return create_success_response(data=result, message=result.get("message"))
+    except Exception as e:
+        logger.error(f"캠페인 생성 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/automation/campaigns/{campaign_id}")
+async def get_email_campaign(campaign_id: int, status: Optional[str] = None, after_id: int = 0, limit: int = 100):
+    """캠페인 진행 현황과 수신자별 발송 상태 (status 로 sent | failed | pending 필터, next_after_id 로 다음 페이지)"""
+    try:
+        if not agent:
+            return create_error_response("에이전트가 초기화되지 않았습니다.", "AGENT_NOT_INITIALIZED")
+        
+        progress = await agent.get_email_campaign(campaign_id, status, after_id, min(limit, 1000))
+        if progress is None:
+            raise HTTPException(status_code=404, detail="캠페인을 찾을 수 없습니다")
+        return create_success_response(data=progress)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"캠페인 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 # ===== 에러 핸들러 =====
 
 @app.exception_handler(HTTPException)
@@ -40,6 +40,7 @@ class AutomationTaskType(str, Enum):
     SEND_EMAIL = "send_email"
     SEND_REMINDER = "send_reminder"
     SEND_MESSAGE = "send_message"
+    SEND_CAMPAIGN = "send_campaign"
 
 class AutomationStatus(str, Enum):
     PENDING = "pending"
@@ -47,6 +48,7 @@ class AutomationStatus(str, Enum):
     SUCCESS = "success"
     FAILED = "failed"
     CANCELLED = "cancelled"
+    DEAD_LETTER = "dead_letter"  # 재시도 횟수를 모두 소진한 작업
 
 class IntentType(str, Enum):
     GENERAL_INQUIRY = "general_inquiry"
@@ -133,7 +135,10 @@ class AutomationRequest(BaseModel):
     task_type: AutomationTaskType = Field(..., description="자동화 작업 타입")
     title: str = Field(..., description="작업 제목")
     task_data: Dict[str, Any] = Field(..., description="작업 데이터")
-    scheduled_at: Optional[datetime] = Field(None, description="예약 시간")
+    scheduled_at: Optional[datetime] = Field(None, description="예약 시간 (반복 작업이면 반복 시작 시각)")
+    recurrence: Optional[str] = Field(None, description="반복 규칙 (cron '0 9 * * MON' 또는 RRULE 'FREQ=WEEKLY;BYDAY=MO;BYHOUR=9')")
+    timezone: Optional[str] = Field(None, description="반복 규칙 시간대 (기본: Asia/Seoul)")
+    misfire_policy: Optional[str] = Field(None, description="지연된 회차 처리 (run_once | skip | run_all)")
     
     class Config:
         json_schema_extra = {
@@ -170,6 +175,52 @@ class AutomationResponse(BaseModel):
             }
         }
 
+class CampaignRecipient(BaseModel):
+    """캠페인 수신자"""
+    email: str = Field(..., description="수신자 이메일")
+    variables: Dict[str, Any] = Field(default_factory=dict, description="템플릿 변수 (예: {\"name\": \"홍길동\"})")
+
+class CampaignRequest(BaseModel):
+    """대량 이메일 캠페인 생성 요청 (template_id 또는 subject/body 지정)"""
+    user_id: int = Field(..., description="사용자 ID")
+    template_id: Optional[int] = Field(None, description="템플릿 메시지 ID (제목/본문 기본값)")
+    subject: Optional[str] = Field(None, description="제목 템플릿")
+    body: Optional[str] = Field(None, description="본문 템플릿 ({변수} 형식)")
+    content_type: Optional[str] = Field(None, description="본문 형식 (html | text)")
+    recipients: List[CampaignRecipient] = Field(..., min_length=1, description="수신자 목록")
+    batch_size: Optional[int] = Field(None, ge=1, le=500, description="연결 하나로 연속 발송할 메시지 수")
+    scheduled_at: Optional[datetime] = Field(None, description="발송 시각 (기본: 즉시)")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "user_id": 123,
+                "subject": "{name}님, 이번 주 예약 안내",
+                "body": "안녕하세요 {name}님, {date}에 예약이 있습니다.",
+                "recipients": [
+                    {"email": "customer1@example.com", "variables": {"name": "김고객", "date": "1월 20일"}},
+                    {"email": "customer2@example.com", "variables": {"name": "이고객", "date": "1월 21일"}}
+                ]
+            }
+        }
+
+class TaskReplayRequest(BaseModel):
+    """dead letter 작업 일괄 재실행 요청 (조건을 지정하지 않으면 dead letter 전체, 최대 limit 개)"""
+    task_ids: Optional[List[int]] = Field(None, description="재실행할 작업 ID 목록")
+    task_type: Optional[AutomationTaskType] = Field(None, description="작업 타입 필터")
+    user_id: Optional[int] = Field(None, description="사용자 ID 필터")
+    include_failed: bool = Field(False, description="재시도 대상이 아니었던 실패 작업도 포함")
+    limit: int = Field(500, ge=1, le=5000, description="최대 재실행 수")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "task_type": "send_email",
+                "include_failed": False,
+                "limit": 500
+            }
+        }
+
 # ===== 내부 모델 =====
 
 class KnowledgeChunk(BaseModel):
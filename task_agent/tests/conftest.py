@@ -0,0 +1,113 @@
+"""
+task_agent 테스트 공통 설정
+task_agent 모듈(from models import ...)과 shared_modules 를 함께 import 할 수 있도록 경로를 추가한다.
+"""
+
+import os
+import sys
+import socketserver
+import threading
+
+import pytest
+
+TASK_AGENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROOT = os.path.dirname(TASK_AGENT_DIR)
+
+for path in (ROOT, TASK_AGENT_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+class FakeSMTPServer(socketserver.ThreadingTCPServer):
+    """
+    SMTP 대역 서버 (init/benchmark_smtp.py 의 대역 서버와 같은 응답)
+
+    reject 에 있는 수신자는 RCPT 단계에서 550 으로 거부하고, drop_every 개를 받을 때마다
+    421 을 보내고 연결을 끊는다. 받은 메시지(수신자, 본문)와 연결 수를 기록한다.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.lock = threading.Lock()
+        self.reject = set()
+        self.drop_every = 0
+        self.messages = []
+        self.connections = 0
+        self.active = 0
+        self.max_active = 0
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            self.reply("220 fake ESMTP")
+            received = 0
+            recipients = []
+            while True:
+                line = self.rfile.readline()
+                if not line:
+                    break
+                command = line.decode(errors="replace").strip()
+                upper = command.upper()
+                if upper.startswith(("EHLO", "HELO")):
+                    self.reply("250-fake\r\n250 AUTH PLAIN LOGIN")
+                elif upper.startswith("AUTH"):
+                    self.reply("235 2.7.0 Authentication successful")
+                elif upper.startswith("MAIL"):
+                    recipients = []
+                    self.reply("250 OK")
+                elif upper.startswith("RCPT"):
+                    address = command.split(":", 1)[1].strip().strip("<>")
+                    if address in server.reject:
+                        self.reply("550 5.1.1 no such user")
+                    else:
+                        recipients.append(address)
+                        self.reply("250 OK")
+                elif upper.startswith("DATA"):
+                    self.reply("354 End data with <CR><LF>.<CR><LF>")
+                    data = b""
+                    line = self.rfile.readline()
+                    while line not in (b".\r\n", b""):
+                        data += line
+                        line = self.rfile.readline()
+                    received += 1
+                    with server.lock:
+                        server.messages.append((recipients, data))
+                    self.reply("250 2.0.0 queued")
+                    if server.drop_every and received % server.drop_every == 0:
+                        self.reply("421 4.7.0 too many messages, closing")
+                        break
+                elif upper.startswith("QUIT"):
+                    self.reply("221 bye")
+                    break
+                else:  # RSET / NOOP
+                    self.reply("250 OK")
+        finally:
+            with server.lock:
+                server.active -= 1
+
+
+@pytest.fixture
+def smtp_server():
+    """로컬 SMTP 대역 서버 (STARTTLS 없이 로그인만 받음)"""
+    server = FakeSMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
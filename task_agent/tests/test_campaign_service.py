@@ -0,0 +1,123 @@
+"""
+대량 이메일 캠페인 테스트
+임시 SQLite DB 와 로컬 SMTP 대역 서버로 개인화 발송, 배치 체크포인트, 중단 후 이어서 발송을 확인한다.
+"""
+
+import asyncio
+import email
+import email.policy
+
+import pytest
+
+import shared_modules.db_models as db_models
+from shared_modules import database
+from shared_modules.env_config import EnvironmentConfig
+
+from automation_task.campaign_service import CAMPAIGN_COMPLETED, CAMPAIGN_RUNNING, EmailCampaignService
+from automation_task.common.email_manager import EmailManager, SMTP_CONNECTION_ERROR
+
+
+@pytest.fixture
+def campaign_service(tmp_path, monkeypatch, smtp_server):
+    """임시 SQLite DB 와 SMTP 대역 서버를 사용하는 캠페인 서비스와 발신 사용자 ID"""
+    monkeypatch.setenv("MYSQL_URL", f"sqlite:///{tmp_path / 'campaign.db'}")
+    monkeypatch.delenv("MYSQL_REPLICA_URLS", raising=False)
+    for key, value in {"SMTP_HOST": "127.0.0.1", "SMTP_PORT": str(smtp_server.port), "SMTP_USER": "bot@example.com",
+                       "SMTP_PASSWORD": "secret", "SMTP_USE_TLS": "false"}.items():
+        monkeypatch.setenv(key, value)
+
+    manager = database.DatabaseManager(EnvironmentConfig())
+    db_models.Base.metadata.create_all(manager.engine)
+    with manager.engine.begin() as conn:
+        user_id = conn.execute(db_models.User.__table__.insert().values(
+            email="sender@example.com", nickname="sender", provider="test",
+            social_id="sender", admin=False, experience=False, access_token="test"
+        )).inserted_primary_key[0]
+    monkeypatch.setattr(database, "_global_db_manager", manager)
+
+    service = EmailCampaignService(concurrency=1)
+    service.email_manager = EmailManager()
+    yield service, user_id
+    database.dispose_engines()
+
+
+def _received(smtp_server) -> dict:
+    """수신자별 받은 제목"""
+    subjects = {}
+    for recipients, data in smtp_server.messages:
+        message = email.message_from_bytes(data, policy=email.policy.default)
+        for recipient in recipients:
+            subjects.setdefault(recipient, []).append(str(message["Subject"]))
+    return subjects
+
+
+def test_campaign_personalizes_and_rejects_bad_recipients(campaign_service, smtp_server):
+    service, user_id = campaign_service
+    recipients = [{"email": f"user{i}@example.com", "variables": {"name": f"고객{i}"}} for i in range(5)]
+    recipients += [
+        {"email": "not-an-address", "variables": {"name": "x"}},
+        {"email": "nameless@example.com", "variables": {}},
+    ]
+
+    async def scenario():
+        created = await service.create_campaign(user_id, recipients, subject="{name}님 안내", body="안녕하세요 {name}님",
+                                                batch_size=2)
+        result = await service.run_campaign(created["campaign_id"])
+        progress = await service.get_campaign_progress(created["campaign_id"])
+        await service.email_manager.smtp_pool.close()
+        return created, result, progress
+
+    created, result, progress = asyncio.run(scenario())
+    assert (created["total"], created["rejected"]) == (7, 2)
+    assert result["success"] and (result["sent"], result["failed"], result["remaining"]) == (5, 0, 0)
+    assert _received(smtp_server) == {f"user{i}@example.com": [f"고객{i}님 안내"] for i in range(5)}
+    assert progress["status"] == CAMPAIGN_COMPLETED
+    assert (progress["sent"], progress["failed"], progress["pending"]) == (5, 2, 0)
+    assert {row["email"]: row["error"] for row in progress["recipients"] if row["status"] == "failed"} == {
+        "not-an-address": "유효하지 않은 이메일 주소",
+        "nameless@example.com": "템플릿 변수 누락: name",
+    }
+
+
+def test_interrupted_campaign_resumes_from_checkpoint(campaign_service, smtp_server):
+    service, user_id = campaign_service
+    pool = service.email_manager.smtp_pool
+    send_many = pool.send_many
+    calls = []
+
+    async def flaky_send_many(server, messages):
+        # 두 번째 배치는 서버에 연결할 수 없는 상황
+        calls.append(len(messages))
+        if len(calls) == 2:
+            return [f"{SMTP_CONNECTION_ERROR}: connection refused"] * len(messages)
+        return await send_many(server, messages)
+
+    async def scenario():
+        created = await service.create_campaign(
+            user_id, [{"email": f"user{i}@example.com"} for i in range(6)], subject="공지", body="본문", batch_size=2
+        )
+        campaign_id = created["campaign_id"]
+
+        pool.send_many = flaky_send_many
+        first = await service.run_campaign(campaign_id)
+        checkpoint = await service.get_campaign_progress(campaign_id)
+
+        pool.send_many = send_many
+        second = await service.run_campaign(campaign_id)
+        final = await service.get_campaign_progress(campaign_id)
+        await pool.close()
+        return first, checkpoint, second, final
+
+    first, checkpoint, second, final = asyncio.run(scenario())
+
+    # 첫 배치는 기록되고, 연결 오류 배치의 수신자는 대기 상태로 남음
+    assert not first["success"] and first["retryable"]
+    assert (first["sent"], first["failed"], first["remaining"]) == (2, 0, 4)
+    assert checkpoint["status"] == CAMPAIGN_RUNNING
+    assert (checkpoint["sent"], checkpoint["pending"]) == (2, 4)
+
+    # 다시 실행하면 남은 수신자에게만 보냄
+    assert second["success"] and (second["sent"], second["remaining"]) == (4, 0)
+    assert final["status"] == CAMPAIGN_COMPLETED
+    assert (final["sent"], final["failed"], final["pending"]) == (6, 0, 0)
+    assert _received(smtp_server) == {f"user{i}@example.com": ["공지"] for i in range(6)}
@@ -0,0 +1,158 @@
+"""
+Google Calendar 배치 호출 테스트
+HTTP 전송을 대역 객체로 바꿔 배치 엔드포인트 왕복 횟수, 입력 순서대로의 결과, 항목별 오류,
+이벤트 루프를 막지 않는 실행을 확인한다.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from email.parser import BytesParser
+
+import httplib2
+import pytest
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build
+
+from automation_task.google_calendar_service import GoogleCalendarService
+
+
+class FakeCalendarHttp:
+    """
+    Calendar API 대역 전송 (httplib2.Http 의 request 인터페이스)
+
+    배치 요청은 multipart 본문을 풀어 항목마다 응답을 만들고, 요청마다 latency 만큼 지연한다.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requests = []
+        self.events = {"known": {"id": "known", "summary": "기존 일정", "colorId": "5"}}
+        self.lock = threading.Lock()
+        self.active = self.max_active = 0
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        with self.lock:
+            self.requests.append((method, uri))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.latency)
+            if uri.endswith("/batch/calendar/v3"):
+                return self._batch(body, headers)
+            status, payload = self._handle(method, uri.split("?")[0], body)
+            return httplib2.Response({"status": status, "content-type": "application/json"}), json.dumps(payload).encode()
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def _handle(self, method, path, body):
+        event_id = path.rsplit("/", 1)[-1]
+        if method == "POST":
+            with self.lock:
+                event = {**json.loads(body), "id": f"evt{len(self.events)}"}
+                self.events[event["id"]] = event
+            return 200, event
+        if event_id not in self.events:
+            return 404, {"error": {"code": 404, "message": "Not Found"}}
+        if method == "PUT":
+            self.events[event_id] = {**json.loads(body), "id": event_id}
+        return 200, self.events[event_id]
+
+    def _batch(self, body, headers):
+        if isinstance(body, str):
+            body = body.encode()
+        content_type = headers["content-type"]
+        multipart = BytesParser().parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+
+        boundary = f"batch_{uuid.uuid4().hex}"
+        parts = []
+        for part in multipart.get_payload():
+            request, _, request_body = part.get_payload().replace("\r\n", "\n").partition("\n\n")
+            method, path, _ = request.split(" ", 2)
+            status, payload = self._handle(method, path.split("?")[0], request_body)
+            parts.append(
+                f"--{boundary}\r\nContent-Type: application/http\r\nContent-ID: <response-{part['Content-ID'].strip('<>')}>\r\n\r\n"
+                f"HTTP/1.1 {status} OK\r\nContent-Type: application/json\r\n\r\n{json.dumps(payload)}\r\n"
+            )
+        content = "".join(parts) + f"--{boundary}--\r\n"
+        return httplib2.Response({"status": "200", "content-type": f"multipart/mixed; boundary={boundary}"}), content.encode()
+
+
+@pytest.fixture
+def calendar():
+    service = GoogleCalendarService({"google_calendar": {"client_id": "client"}})
+    credentials = Credentials(token="token")
+    api = build("calendar", "v3", credentials=credentials, cache_discovery=False)
+    transport = FakeCalendarHttp()
+
+    async def get_calendar_service(user_id):
+        return api, credentials
+
+    service._get_calendar_service = get_calendar_service
+    service._thread_http = lambda credentials: transport
+    yield service, transport
+    asyncio.run(service.cleanup())
+
+
+def _event(index: int) -> dict:
+    return {"title": f"일정 {index}", "start_time": "2026-01-15T14:00:00"}
+
+
+def test_create_events_uses_one_request_per_batch(calendar):
+    service, transport = calendar
+
+    result = asyncio.run(service.create_events("user", [_event(i) for i in range(120)]))
+
+    # 50개씩 배치 3번
+    assert len(transport.requests) == 3
+    assert result["success_count"] == 120
+    assert [item["event_data"]["summary"] for item in result["results"]] == [f"일정 {i}" for i in range(120)]
+    assert len({item["event_id"] for item in result["results"]}) == 120
+
+
+def test_update_events_merges_in_two_round_trips(calendar):
+    service, transport = calendar
+
+    result = asyncio.run(service.update_events("user", [
+        {"event_id": "known", **_event(1)},
+        {"event_id": "missing", **_event(2)},
+    ]))
+
+    # 기존 이벤트 조회 배치 1번 + 수정 배치 1번
+    assert len(transport.requests) == 2
+    assert (result["success_count"], result["failed_count"]) == (1, 1)
+    updated, missing = result["results"]
+    assert updated["event_data"]["summary"] == "일정 1"
+    assert updated["event_data"]["colorId"] == "5"  # 기존 이벤트 필드 유지
+    assert missing["error_code"] == 404
+
+
+def test_api_calls_do_not_block_the_event_loop(calendar):
+    service, transport = calendar
+    transport.latency = 0.2
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        results = await asyncio.gather(*[service.create_event("user", _event(i)) for i in range(4)])
+        elapsed = time.perf_counter() - start
+        ticking.cancel()
+        return results, elapsed, ticks
+
+    results, elapsed, ticks = asyncio.run(scenario())
+    assert all(result["success"] for result in results)
+    # 스레드 풀에서 동시에 실행되므로 0.8초가 아니라 약 0.2초, 그동안 루프는 계속 돎
+    assert transport.max_active == 4
+    assert elapsed < 0.6
+    assert ticks >= 10
@@ -0,0 +1,67 @@
+"""
+메타데이터 인덱스 테스트
+다중 값 필드(topic)와 일반 필드(category)의 필터 해석과 Chroma where 재작성을 확인한다.
+"""
+
+from shared_modules.metadata_index import MetadataIndex
+
+IDS = ["a", "b", "c", "d"]
+METADATAS = [
+    {"topic": "business_model,marketing", "category": "guide"},
+    {"topic": "business_model", "category": "faq"},
+    {"topic": "marketing,tax", "category": "guide"},
+    {"topic": "tax", "category": "law"},
+]
+
+
+def _index() -> MetadataIndex:
+    index = MetadataIndex()
+    index.add(IDS, METADATAS)
+    return index
+
+
+def test_single_operator_conditions():
+    index = _index()
+
+    assert index.resolve({"topic": "marketing"}) == {"a", "c"}
+    assert index.resolve({"topic": {"$in": ["business_model", "tax"]}}) == {"a", "b", "c", "d"}
+    assert index.resolve({"topic": {"$ne": "marketing"}}) == {"b", "d"}
+
+
+def test_multiple_operators_are_intersected():
+    index = _index()
+
+    assert index.resolve({"topic": {"$in": ["business_model", "marketing"], "$ne": "tax"}}) == {"a", "b"}
+    assert index.resolve({"topic": {"$in": ["marketing"], "$nin": ["business_model"]}, "category": "guide"}) == {"c"}
+
+
+def test_unknown_operator_falls_back_to_chroma():
+    index = _index()
+
+    assert index.resolve({"topic": {"$in": ["tax"], "$gt": 1}}) is None
+
+
+def test_rewrite_splits_multiple_operators_into_and():
+    index = _index()
+
+    rewritten = index.rewrite_filter({"topic": {"$in": ["business_model"], "$ne": "tax"}})
+
+    assert rewritten == {"$and": [
+        {"topic": {"$in": ["business_model", "business_model,marketing"]}},
+        {"topic": {"$nin": ["marketing,tax", "tax"]}},
+    ]}
+
+
+def test_rewrite_merges_with_existing_and():
+    index = _index()
+
+    rewritten = index.rewrite_filter({
+        "$and": [{"category": "guide"}],
+        "topic": {"$eq": "marketing", "$nin": ["tax"]},
+    })
+
+    assert rewritten == {"$and": [
+        {"category": "guide"},
+        {"topic": {"$in": ["business_model,marketing", "marketing,tax"]}},
+        {"topic": {"$nin": ["marketing,tax", "tax"]}},
+    ]}
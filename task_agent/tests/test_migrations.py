@@ -0,0 +1,110 @@
+"""
+마이그레이션 및 핫 쿼리 실행 계획 테스트
+임시 SQLite DB 에 create_all 없이 마이그레이션만 적용한 뒤 핫 쿼리가 인덱스를 타는지 확인한다.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import IntegrityError
+
+import shared_modules.db_models as db_models
+from shared_modules import migrations
+
+
+def _migrated_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    # 운영 DB 와 같이 인덱스 없는 기존 스키마에서 시작
+    for table in db_models.Base.metadata.sorted_tables:
+        table.create(bind=engine)
+        for index in list(table.indexes):
+            index.drop(bind=engine)
+    return engine
+
+
+def test_upgrade_applies_all_versions(tmp_path):
+    engine = _migrated_engine(tmp_path)
+
+    applied = migrations.upgrade(engine)
+
+    assert applied == [migration.version for migration in migrations.MIGRATIONS]
+    assert migrations.get_pending_migrations(engine) == []
+    assert migrations.upgrade(engine) == []
+
+
+def test_hot_queries_use_indexes(tmp_path):
+    engine = _migrated_engine(tmp_path)
+    migrations.upgrade(engine)
+
+    report = migrations.check_query_plans(engine)
+
+    assert report
+    full_scans = {name: result["plan"] for name, result in report.items() if result["full_scan"]}
+    assert full_scans == {}
+
+
+def test_check_query_plans_detects_missing_indexes(tmp_path):
+    engine = _migrated_engine(tmp_path)
+
+    report = migrations.check_query_plans(engine)
+
+    assert any(result["full_scan"] for result in report.values())
+
+
+def test_check_command_exit_code(tmp_path, monkeypatch):
+    engine = _migrated_engine(tmp_path)
+    monkeypatch.setattr(migrations, "get_db_manager", lambda: SimpleNamespace(engine=engine))
+
+    assert migrations.main(["check"]) == 1
+    assert migrations.main(["upgrade"]) == 0
+    assert migrations.main(["check"]) == 0
+
+
+def test_ensure_schema_current_requires_upgrade(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'outdated.db'}")
+    db_models.Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE conversation DROP COLUMN archived_at"))
+
+    with pytest.raises(migrations.SchemaOutdatedError, match="migrations upgrade"):
+        migrations.ensure_schema_current(engine)
+
+    migrations.upgrade(engine)
+    assert migrations.ensure_schema_current(engine) is True
+    assert migrations.find_schema_drift(engine) == {}
+
+
+def test_status_check_accepts_every_task_status(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'status.db'}")
+    db_models.Base.metadata.create_all(engine)
+    # 0007 이전의 대문자 전용 ck_status 로 만들어진 운영 DB 재현
+    with engine.begin() as conn:
+        migrations._replace_check_constraint(conn, "automation_task", "ck_status",
+                                             "status IN ('PENDING', 'RUNNING', 'COMPLETED', 'FAILED')")
+        user_id = conn.execute(db_models.User.__table__.insert().values(
+            email="status@example.com", nickname="status", provider="test",
+            social_id="status", admin=False, experience=False, access_token="test"
+        )).inserted_primary_key[0]
+        conn.execute(text(
+            "INSERT INTO automation_task (user_id, task_type, title, status) VALUES (:user_id, 'send_email', 'old', 'PENDING')"
+        ), {"user_id": user_id})
+    with pytest.raises(IntegrityError), engine.begin() as conn:
+        conn.execute(text("UPDATE automation_task SET status = 'processing'"))
+
+    migrations.upgrade(engine)
+
+    with engine.begin() as conn:
+        for status in ("pending", "processing", "success", "failed", "cancelled", "dead_letter", "COMPLETED"):
+            conn.execute(text("UPDATE automation_task SET status = :status"), {"status": status})
+        assert conn.execute(text("SELECT title FROM automation_task")).scalars().all() == ["old"]
+    with pytest.raises(IntegrityError), engine.begin() as conn:
+        conn.execute(text("UPDATE automation_task SET status = 'unknown'"))
+
+    # 테이블을 다시 만들어도 인덱스와 다른 테이블의 외래 키 대상은 그대로
+    inspector = inspect(engine)
+    assert {index["name"] for index in inspector.get_indexes("automation_task")} >= {
+        "ix_automation_task_status_scheduled", "ix_automation_task_status_lease"
+    }
+    assert [fk["referred_table"] for fk in inspector.get_foreign_keys("email_campaign")
+            if fk["constrained_columns"] == ["task_id"]] == ["automation_task"]
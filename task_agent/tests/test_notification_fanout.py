@@ -0,0 +1,108 @@
+"""
+알림 채널 동시 발송 테스트
+채널을 대역 함수로 바꿔 동시 발송, 채널별 제한 시간, 대량 발송의 공용 채널 1회 발송과 로그 일괄 저장을 확인한다.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from automation_task.common.notification_manager import NotificationManager
+
+
+class FakeNotificationDB:
+    """알림 설정 조회와 로그 저장 호출을 기록하는 대역"""
+
+    def __init__(self, settings=None):
+        self.settings = settings or {}
+        self.log_batches = []
+        self.settings_queries = []
+
+    async def get_notification_settings(self, user_id):
+        self.settings_queries.append([user_id])
+        return self.settings.get(user_id, {})
+
+    async def get_notification_settings_bulk(self, user_ids):
+        self.settings_queries.append(list(user_ids))
+        return {user_id: self.settings.get(user_id, {}) for user_id in user_ids}
+
+    async def save_notification_logs(self, logs):
+        self.log_batches.append(list(logs))
+        return True
+
+
+@pytest.fixture
+def manager():
+    manager = NotificationManager()
+    manager.db_helper = FakeNotificationDB({2: {"sms_notification": False}})
+    manager.notification_config = {
+        "channel_timeouts": {"sms": 0.2}, "default_timeout": 1, "bulk_concurrency": 3
+    }
+    manager.calls = []
+    manager.active = manager.max_active = 0
+
+    def channel(name: str, delay: float, success: bool = True):
+        async def send(*args, **kwargs):
+            manager.calls.append(name)
+            manager.active += 1
+            manager.max_active = max(manager.max_active, manager.active)
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                manager.active -= 1
+            return {"success": success}
+        return send
+
+    manager.send_app_notification = channel("app", 0.1)
+    manager.send_email_notification = channel("email", 0.1)
+    manager.send_sms_notification = channel("sms", 5)
+    manager.send_slack_notification = channel("slack", 0.1)
+    manager.send_teams_notification = channel("teams", 0.1, success=False)
+    return manager
+
+
+def test_channels_run_concurrently_with_per_channel_timeout(manager):
+    start = time.perf_counter()
+    result = asyncio.run(manager.send_notification(1, "알림", ["app", "email", "sms", "slack", "teams"]))
+    elapsed = time.perf_counter() - start
+
+    # 순서대로 보내면 5.4초, 동시에 보내면 가장 느린 sms 의 제한 시간(0.2초)에서 끝남
+    assert elapsed < 1
+    assert result["success_count"] == 3
+    assert result["results"]["sms"]["timed_out"]
+    assert not result["results"]["teams"]["success"]
+    # 채널 결과는 한 번에 저장
+    assert len(manager.db_helper.log_batches) == 1
+    assert [log["channel"] for log in manager.db_helper.log_batches[0]] == ["app", "email", "sms", "slack", "teams"]
+
+
+def test_disabled_channel_is_not_sent(manager):
+    result = asyncio.run(manager.send_notification(2, "알림", ["app", "sms"]))
+
+    assert result["results"]["sms"] == {"success": False, "reason": "disabled_or_unsupported"}
+    assert manager.calls == ["app"]
+
+
+def test_bulk_sends_shared_channels_once(manager):
+    user_ids = [1, 2, 3, 4, 5, 6, 1]
+    result = asyncio.run(manager.send_bulk(user_ids, "공지", ["app", "email", "slack"]))
+
+    assert result["total_users"] == 6
+    assert result["success_users"] == 6
+    assert manager.calls.count("app") == 6
+    assert manager.calls.count("email") == 6
+    assert manager.calls.count("slack") == 1
+    assert result["shared_results"] == {"slack": {"success": True}}
+    # 설정은 IN 쿼리 한 번, 로그는 사용자별 채널 12건 + 공용 채널 1건을 한 번에 저장
+    assert manager.db_helper.settings_queries == [[1, 2, 3, 4, 5, 6]]
+    assert len(manager.db_helper.log_batches) == 1
+    assert len(manager.db_helper.log_batches[0]) == 13
+
+
+def test_bulk_limits_concurrent_users(manager):
+    asyncio.run(manager.send_bulk(list(range(1, 10)), "공지", ["app"]))
+
+    # bulk_concurrency=3 명씩 발송
+    assert manager.max_active == 3
+    assert manager.calls.count("app") == 9
@@ -0,0 +1,139 @@
+"""
+읽기 전용 복제본 라우팅 테스트
+주 DB 와 복제본 두 개를 임시 SQLite 파일로, 나머지 하나는 열 수 없는 경로로 구성해
+순환 선택 / 지연 초과 시 주 DB 전환 / 오류 복제본 제외 / 상태 확인 주기 후 복구를 확인한다.
+"""
+
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from shared_modules import database
+from shared_modules.database import DatabaseManager, dispose_engines
+from shared_modules.env_config import EnvironmentConfig
+
+CHECK_INTERVAL = 0.2
+
+
+def _create_db(path, name: str) -> str:
+    url = f"sqlite:///{path}"
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE node (name VARCHAR(20))"))
+        conn.execute(text("INSERT INTO node (name) VALUES (:name)"), {"name": name})
+    engine.dispose()
+    return url
+
+
+def _node(session) -> str:
+    return session.execute(text("SELECT name FROM node")).scalar()
+
+
+@pytest.fixture
+def urls(tmp_path):
+    return {
+        "primary": _create_db(tmp_path / "primary.db", "primary"),
+        "replica_a": _create_db(tmp_path / "replica_a.db", "replica_a"),
+        "replica_b": _create_db(tmp_path / "replica_b.db", "replica_b"),
+        "unreachable": f"sqlite:///{tmp_path / 'missing' / 'replica.db'}",
+    }
+
+
+@pytest.fixture
+def make_manager(urls, monkeypatch):
+    monkeypatch.setenv("MYSQL_URL", urls["primary"])
+    monkeypatch.setenv("DB_REPLICA_MAX_LAG", "5")
+    monkeypatch.setenv("DB_REPLICA_CHECK_INTERVAL", str(CHECK_INTERVAL))
+
+    def _make(*replica_names):
+        config = EnvironmentConfig()
+        return DatabaseManager(config, replica_urls=[urls[name] for name in replica_names])
+
+    yield _make
+    dispose_engines()
+
+
+def _read_nodes(manager, count: int) -> list:
+    nodes = []
+    for _ in range(count):
+        with manager.get_session_context(read_only=True) as session:
+            nodes.append(_node(session))
+    return nodes
+
+
+def test_without_replicas_reads_use_primary(make_manager):
+    manager = make_manager()
+
+    assert manager.get_read_engine() is manager.engine
+    assert _read_nodes(manager, 2) == ["primary", "primary"]
+    assert manager.read_stats == {"replica": 0, "primary_fallback": 0}
+
+
+def test_round_robin_between_replicas(make_manager):
+    manager = make_manager("replica_a", "replica_b")
+
+    assert _read_nodes(manager, 4) == ["replica_a", "replica_b", "replica_a", "replica_b"]
+    assert manager.read_stats == {"replica": 4, "primary_fallback": 0}
+
+
+def test_write_session_uses_primary(make_manager):
+    manager = make_manager("replica_a", "replica_b")
+
+    with manager.get_session_context() as session:
+        assert _node(session) == "primary"
+
+
+def test_lagging_replicas_fall_back_to_primary(make_manager, monkeypatch):
+    manager = make_manager("replica_a", "replica_b")
+    lag = {"replica_a.db": 0.0, "replica_b.db": 0.0}
+    monkeypatch.setattr(
+        database, "measure_replica_lag",
+        lambda engine: lag[engine.url.database.rsplit("/", 1)[-1]]
+    )
+
+    lag["replica_a.db"] = manager.config.DB_REPLICA_MAX_LAG + 1
+    assert _read_nodes(manager, 2) == ["replica_b", "replica_b"]
+
+    lag["replica_b.db"] = manager.config.DB_REPLICA_MAX_LAG + 1
+    time.sleep(CHECK_INTERVAL)
+    assert _read_nodes(manager, 2) == ["primary", "primary"]
+    assert manager.read_stats["primary_fallback"] == 2
+
+    status = manager.get_replica_status()
+    assert all(not state["healthy"] for state in status["replicas"].values())
+
+
+def test_unreachable_replica_is_skipped(make_manager):
+    manager = make_manager("unreachable", "replica_a")
+
+    assert _read_nodes(manager, 3) == ["replica_a", "replica_a", "replica_a"]
+
+    status = manager.get_replica_status()["replicas"]
+    unreachable = next(state for key, state in status.items() if "missing" in key)
+    assert unreachable["healthy"] is False
+    assert unreachable["lag"] is None
+
+
+def test_failed_query_marks_replica_and_recovers(make_manager):
+    manager = make_manager("replica_a")
+    replica = next(iter(manager.replica_engines.values()))
+
+    with pytest.raises(OperationalError):
+        with manager.get_session_context(read_only=True) as session:
+            session.execute(text("SELECT * FROM missing_table"))
+
+    state = next(iter(manager._replica_state.values()))
+    assert state["healthy"] is False
+    assert state["errors"] == 1
+
+    # 상태 확인 주기 안에서는 주 DB 로 조회
+    assert manager.get_read_engine() is manager.engine
+    assert _read_nodes(manager, 1) == ["primary"]
+
+    # 주기가 지나면 다시 측정해 복제본으로 복귀
+    time.sleep(CHECK_INTERVAL)
+    assert manager.get_read_engine() is replica
+    assert _read_nodes(manager, 1) == ["replica_a"]
+    assert state["healthy"] is True
@@ -0,0 +1,124 @@
+"""
+반복 일정 계산 테스트
+서버 로컬 시간대를 UTC 로 고정하고 cron/RRULE 의 다음 실행 시각, 서머타임 전환, 지연 실행 정책을 확인한다.
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from automation_task.common.recurrence import (
+    MISFIRE_RUN_ALL, MISFIRE_RUN_ONCE, MISFIRE_SKIP,
+    is_misfired, next_occurrence, normalize_recurrence, plan_next_run
+)
+
+
+@pytest.fixture(autouse=True)
+def utc_server(monkeypatch):
+    # DB 에 저장하는 naive 시각은 서버 로컬 시각이므로 테스트 환경과 무관하게 UTC 로 고정
+    monkeypatch.setenv("TZ", "UTC")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_cron_uses_task_timezone_wall_clock():
+    # 서울 월요일 9시 = UTC 월요일 0시
+    assert next_occurrence("0 9 * * MON", "Asia/Seoul", datetime(2026, 1, 4, 23, 59)) == datetime(2026, 1, 5, 0, 0)
+    # 예정 시각과 같은 시각 이후는 다음 주
+    assert next_occurrence("0 9 * * MON", "Asia/Seoul", datetime(2026, 1, 5, 0, 0)) == datetime(2026, 1, 12, 0, 0)
+
+
+def test_cron_keeps_local_hour_across_dst():
+    # 2026-03-08 뉴욕 서머타임 시작: 9시(EST, UTC-5) → 9시(EDT, UTC-4)
+    assert next_occurrence("0 9 * * *", "America/New_York", datetime(2026, 3, 6, 15, 0)) == datetime(2026, 3, 7, 14, 0)
+    assert next_occurrence("0 9 * * *", "America/New_York", datetime(2026, 3, 7, 15, 0)) == datetime(2026, 3, 8, 13, 0)
+
+
+def test_rrule_without_dtstart_is_pinned_to_start():
+    rule = normalize_recurrence("FREQ=DAILY;COUNT=2;BYHOUR=9;BYMINUTE=0;BYSECOND=0", "Asia/Seoul",
+                                start=datetime(2026, 1, 1, 0, 0))
+
+    assert rule == "DTSTART:20260101T090000\nRRULE:FREQ=DAILY;COUNT=2;BYHOUR=9;BYMINUTE=0;BYSECOND=0"
+    first = next_occurrence(rule, "Asia/Seoul", datetime(2025, 12, 31, 0, 0))
+    second = next_occurrence(rule, "Asia/Seoul", first)
+    assert (first, second) == (datetime(2026, 1, 1, 0, 0), datetime(2026, 1, 2, 0, 0))
+    # COUNT 를 모두 채우면 반복 종료
+    assert next_occurrence(rule, "Asia/Seoul", second) is None
+
+
+def test_rrule_with_naive_dtstart_uses_task_timezone():
+    rule = normalize_recurrence("DTSTART:20260101T090000\nRRULE:FREQ=WEEKLY;BYDAY=MO", "Asia/Seoul")
+
+    assert rule == "DTSTART:20260101T090000\nRRULE:FREQ=WEEKLY;BYDAY=MO"
+    assert next_occurrence(rule, "Asia/Seoul", datetime(2026, 1, 1, 0, 0)) == datetime(2026, 1, 5, 0, 0)
+
+
+def test_rrule_keeps_local_hour_across_dst():
+    rule = normalize_recurrence("FREQ=DAILY;BYHOUR=9;BYMINUTE=0;BYSECOND=0", "America/New_York",
+                                start=datetime(2026, 3, 6, 12, 0))
+
+    assert next_occurrence(rule, "America/New_York", datetime(2026, 3, 6, 15, 0)) == datetime(2026, 3, 7, 14, 0)
+    assert next_occurrence(rule, "America/New_York", datetime(2026, 3, 7, 15, 0)) == datetime(2026, 3, 8, 13, 0)
+
+
+@pytest.mark.parametrize("recurrence, timezone", [
+    ("0 25 * * *", "Asia/Seoul"),
+    ("FREQ=SOMETIMES", "Asia/Seoul"),
+    ("", "Asia/Seoul"),
+    ("0 9 * * *", "Mars/Olympus"),
+])
+def test_invalid_rules_are_rejected(recurrence, timezone):
+    with pytest.raises(ValueError):
+        normalize_recurrence(recurrence, timezone)
+
+
+def test_is_misfired_uses_grace_period():
+    scheduled_at = datetime(2026, 1, 1, 10, 0)
+
+    assert not is_misfired(scheduled_at, 300, now=datetime(2026, 1, 1, 10, 4))
+    assert is_misfired(scheduled_at, 300, now=datetime(2026, 1, 1, 10, 6))
+    assert not is_misfired(None, 300, now=datetime(2026, 1, 1, 10, 6))
+
+
+@pytest.mark.parametrize("policy, expected", [
+    # 놓친 11~13시 회차는 건너뛰고 지금 이후 첫 회차
+    (MISFIRE_RUN_ONCE, datetime(2026, 1, 1, 14, 0)),
+    (MISFIRE_SKIP, datetime(2026, 1, 1, 14, 0)),
+    # 놓친 회차를 순서대로 실행하도록 바로 다음 회차
+    (MISFIRE_RUN_ALL, datetime(2026, 1, 1, 11, 0)),
+])
+def test_plan_next_run_misfire_policies(policy, expected):
+    assert plan_next_run("0 * * * *", "UTC", datetime(2026, 1, 1, 10, 0), policy,
+                         now=datetime(2026, 1, 1, 13, 30)) == expected
+
+
+def test_plan_next_run_on_time_run_continues_from_schedule():
+    # 예정 시각보다 일찍 끝난 경우에도 같은 회차를 다시 잡지 않음
+    assert plan_next_run("0 * * * *", "UTC", datetime(2026, 1, 1, 10, 0), MISFIRE_RUN_ONCE,
+                         now=datetime(2026, 1, 1, 9, 59)) == datetime(2026, 1, 1, 11, 0)
+
+
+def test_rrule_with_utc_dtstart():
+    rule = normalize_recurrence("DTSTART:20260101T090000Z\nRRULE:FREQ=DAILY", "Asia/Seoul")
+
+    # DTSTART 의 UTC 가 작업 시간대보다 우선
+    assert next_occurrence(rule, "Asia/Seoul", datetime(2026, 1, 1, 10, 0)) == datetime(2026, 1, 2, 9, 0)
+    assert next_occurrence(rule, "Asia/Seoul", datetime(2025, 12, 31, 0, 0)) == datetime(2026, 1, 1, 9, 0)
+    assert plan_next_run(rule, "Asia/Seoul", datetime(2026, 1, 1, 9, 0), MISFIRE_RUN_ALL,
+                         now=datetime(2026, 1, 3, 0, 0)) == datetime(2026, 1, 2, 9, 0)
+
+
+def test_rrule_with_tzid_dtstart_keeps_local_hour_across_dst():
+    rule = "DTSTART;TZID=America/New_York:20260305T090000\nRRULE:FREQ=DAILY;COUNT=5"
+
+    assert normalize_recurrence(rule, "Asia/Seoul") == rule
+    assert next_occurrence(rule, "Asia/Seoul", datetime(2026, 3, 6, 15, 0)) == datetime(2026, 3, 7, 14, 0)
+    assert next_occurrence(rule, "Asia/Seoul", datetime(2026, 3, 7, 15, 0)) == datetime(2026, 3, 8, 13, 0)
+    assert next_occurrence(rule, "Asia/Seoul", datetime(2026, 3, 9, 13, 0)) is None
+
+
+def test_rrule_without_occurrences_ends():
+    assert next_occurrence("DTSTART:20260101T090000Z\nRRULE:FREQ=DAILY;COUNT=0", "UTC", datetime(2025, 1, 1)) is None
@@ -0,0 +1,103 @@
+"""
+재시도 정책 테스트
+지수 백오프/지터 범위와 실패 결과의 일시적 오류 분류를 확인한다.
+"""
+
+import asyncio
+
+import pytest
+
+from automation_task.common.retry_policy import RetryPolicy, build_retry_policies
+
+
+def test_backoff_grows_exponentially_up_to_max_delay():
+    policy = RetryPolicy(base_delay=10, max_delay=100, multiplier=2, jitter=0)
+
+    assert [policy.next_delay(attempt) for attempt in range(1, 6)] == [10, 20, 40, 80, 100]
+
+
+@pytest.mark.parametrize("attempt", [1, 3, 8])
+def test_jitter_only_shortens_the_delay(attempt):
+    policy = RetryPolicy(base_delay=30, max_delay=600, multiplier=3, jitter=0.5)
+    ceiling = min(600, 30 * 3 ** (attempt - 1))
+
+    delays = [policy.next_delay(attempt) for _ in range(500)]
+    assert all(ceiling * 0.5 <= delay <= ceiling for delay in delays)
+    # 동시에 실패한 작업이 같은 시각에 몰리지 않도록 값이 흩어져야 함
+    assert max(delays) - min(delays) > ceiling * 0.25
+
+
+def test_jitter_and_attempts_are_clamped():
+    policy = RetryPolicy(max_attempts=0, base_delay=10, jitter=5)
+
+    assert policy.max_attempts == 1
+    assert policy.jitter == 1.0
+    assert all(0 <= policy.next_delay(1) <= 10 for _ in range(100))
+
+
+def test_should_retry_stops_after_max_attempts():
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.should_retry(1, True)
+    assert policy.should_retry(2, True)
+    assert not policy.should_retry(3, True)
+    assert not policy.should_retry(1, False)
+
+
+def test_explicit_retryable_flag_wins():
+    policy = RetryPolicy()
+
+    assert policy.is_retryable({"success": False, "message": "invalid address", "retryable": True})
+    assert not policy.is_retryable({"success": False, "message": "timeout", "details": {"retryable": False}})
+
+
+def test_transient_and_permanent_failures():
+    policy = RetryPolicy()
+
+    assert policy.is_retryable({"message": "SMTP 발송 실패", "details": {"error": "Connection reset by peer"}})
+    assert policy.is_retryable({"message": "Slack API 429 Too Many Requests"})
+    assert policy.is_retryable(error=asyncio.TimeoutError())
+    assert policy.is_retryable(error=ConnectionRefusedError("refused"))
+    # 영구 오류 패턴이 일시적 오류 패턴보다 우선
+    assert not policy.is_retryable({"message": "404 Not Found (connection closed)"})
+    assert not policy.is_retryable({"message": "유효하지 않은 이메일 주소"})
+    assert not policy.is_retryable(error=ValueError("invalid recurrence"))
+    # 알 수 없는 오류는 중복 발송을 막기 위해 재시도하지 않음
+    assert not policy.is_retryable({"message": "unexpected failure"})
+
+
+def test_status_codes_match_as_whole_numbers():
+    policy = RetryPolicy()
+
+    assert policy.is_retryable({"message": "HTTP 503 Service Unavailable"})
+    assert policy.is_retryable({"message": "요청 실패 (500)"})
+    # 다른 숫자의 일부인 "500"/"404" 는 상태 코드가 아님
+    assert not policy.is_retryable({"message": "작업 5001 실패"})
+    assert not policy.is_retryable({"message": "processed 1500 items before failing"})
+    assert policy.is_retryable({"message": "event 4041 timed out"})
+    # "연결" 만으로는 일시적 오류로 보지 않음
+    assert not policy.is_retryable({"message": "연결된 계정이 없습니다"})
+    assert policy.is_retryable({"message": "SMTP 연결 끊김"})
+
+
+def test_structured_status_code_wins_over_message():
+    policy = RetryPolicy()
+
+    assert policy.is_retryable({"message": "이벤트 생성 실패", "details": {"error_code": 503}})
+    assert policy.is_retryable({"message": "요청 실패", "status_code": 429})
+    assert not policy.is_retryable({"message": "request timed out", "details": {"status_code": 404}})
+    # 서비스 고유의 문자열 오류 코드는 상태 코드로 보지 않음
+    assert not policy.is_retryable({"message": "잘못된 사용자", "details": {"error_code": "INVALID_USER_ID"}})
+
+
+def test_configured_patterns_and_type_overrides():
+    policies = build_retry_policies({
+        "default": {"max_attempts": 3, "base_delay": 30, "jitter": 0},
+        "send_email": {"max_attempts": 5, "retryable_errors": ["Mailbox Busy"]},
+    })
+
+    assert policies["default"].max_attempts == 3
+    assert policies["send_email"].max_attempts == 5
+    assert policies["send_email"].base_delay == 30
+    assert policies["send_email"].is_retryable({"message": "452 mailbox busy"})
+    assert not policies["default"].is_retryable({"message": "452 mailbox busy"})
@@ -0,0 +1,103 @@
+"""
+SMTP 연결 풀 테스트
+로컬 SMTP 대역 서버로 연결 재사용, 서버별 동시 연결 제한, 끊긴 연결 재연결, 메시지 단위 실패를 확인한다.
+"""
+
+import asyncio
+from email.mime.text import MIMEText
+
+from automation_task.common.email_manager import SMTPConnectionPool, SMTPServer
+
+
+def _server(smtp_server) -> SMTPServer:
+    return SMTPServer("127.0.0.1", smtp_server.port, "bot@example.com", "secret", use_tls=False)
+
+
+def _message(recipient: str) -> tuple:
+    message = MIMEText("본문", "plain", "utf-8")
+    message["From"] = "bot@example.com"
+    message["To"] = recipient
+    message["Subject"] = "테스트"
+    return message, [recipient]
+
+
+def test_connection_is_reused_across_sends(smtp_server):
+    async def scenario():
+        pool = SMTPConnectionPool(max_connections=2, timeout=5)
+        server = _server(smtp_server)
+        errors = [await pool.send(server, *_message(f"user{i}@example.com")) for i in range(5)]
+        await pool.close()
+        return pool, errors
+
+    pool, errors = asyncio.run(scenario())
+    assert errors == [None] * 5
+    assert len(smtp_server.messages) == 5
+    assert smtp_server.connections == 1
+    assert pool.stats["connections_opened"] == 1
+    assert pool.stats["connections_reused"] == 4
+
+
+def test_concurrent_batches_respect_max_connections(smtp_server):
+    async def scenario():
+        pool = SMTPConnectionPool(max_connections=2, timeout=5)
+        server = _server(smtp_server)
+        batches = [[_message(f"user{b}-{i}@example.com") for i in range(3)] for b in range(6)]
+        results = await asyncio.gather(*[pool.send_many(server, batch) for batch in batches])
+        await pool.close()
+        return results
+
+    results = asyncio.run(scenario())
+    assert all(errors == [None] * 3 for errors in results)
+    assert len(smtp_server.messages) == 18
+    assert smtp_server.max_active <= 2
+    assert smtp_server.connections <= 2
+
+
+def test_dropped_connection_is_reopened(smtp_server):
+    smtp_server.drop_every = 3
+
+    async def scenario():
+        pool = SMTPConnectionPool(timeout=5)
+        errors = await pool.send_many(_server(smtp_server), [_message(f"user{i}@example.com") for i in range(8)])
+        await pool.close()
+        return pool, errors
+
+    pool, errors = asyncio.run(scenario())
+    # 3통마다 421 로 끊기므로 새 연결 두 번으로 나머지를 보냄
+    assert errors == [None] * 8
+    assert len(smtp_server.messages) == 8
+    assert pool.stats["reconnects"] == 2
+    assert smtp_server.connections == 3
+
+
+def test_refused_recipient_fails_only_its_message(smtp_server):
+    smtp_server.reject.add("gone@example.com")
+
+    async def scenario():
+        pool = SMTPConnectionPool(timeout=5)
+        errors = await pool.send_many(_server(smtp_server), [
+            _message("a@example.com"), _message("gone@example.com"), _message("b@example.com")
+        ])
+        await pool.close()
+        return pool, errors
+
+    pool, errors = asyncio.run(scenario())
+    assert errors[0] is None and errors[2] is None
+    assert "gone@example.com" in errors[1]
+    # 수신자 거부는 연결 문제가 아니므로 같은 연결로 계속 보냄
+    assert smtp_server.connections == 1
+    assert pool.stats == {**pool.stats, "sent": 2, "errors": 1, "reconnects": 0}
+
+
+def test_idle_connection_past_timeout_is_replaced(smtp_server):
+    async def scenario():
+        pool = SMTPConnectionPool(idle_timeout=0, timeout=5)
+        server = _server(smtp_server)
+        errors = [await pool.send(server, *_message(f"user{i}@example.com")) for i in range(3)]
+        await pool.close()
+        return pool, errors
+
+    pool, errors = asyncio.run(scenario())
+    assert errors == [None] * 3
+    assert pool.stats["connections_opened"] == 3
+    assert pool.stats["connections_reused"] == 0
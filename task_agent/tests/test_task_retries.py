@@ -0,0 +1,79 @@
+"""
+자동화 작업 재시도/dead letter 테스트
+CHECK 제약조건을 그대로 둔 임시 SQLite DB 에서 일시적 오류가 재시도 후 dead_letter 로 기록되고
+다시 대기 상태로 되돌릴 수 있는지 확인한다.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+import shared_modules.db_models as db_models
+from shared_modules import database, migrations
+from shared_modules.env_config import EnvironmentConfig
+
+from automation_task.common.retry_policy import build_retry_policies
+
+
+@pytest.fixture
+def task_db(tmp_path, monkeypatch):
+    """마이그레이션까지 적용한 임시 SQLite DB 와 대기 작업 하나"""
+    monkeypatch.setenv("MYSQL_URL", f"sqlite:///{tmp_path / 'retries.db'}")
+    monkeypatch.delenv("MYSQL_REPLICA_URLS", raising=False)
+    manager = database.DatabaseManager(EnvironmentConfig())
+    db_models.Base.metadata.create_all(manager.engine)
+    migrations.upgrade(manager.engine)
+    with manager.engine.begin() as conn:
+        user_id = conn.execute(db_models.User.__table__.insert().values(
+            email="retry@example.com", nickname="retry", provider="test",
+            social_id="retry", admin=False, experience=False, access_token="test"
+        )).inserted_primary_key[0]
+        task_id = conn.execute(db_models.AutomationTask.__table__.insert().values(
+            user_id=user_id, task_type="send_email", title="retry", status="pending", task_data={}
+        )).inserted_primary_key[0]
+    monkeypatch.setattr(database, "_global_db_manager", manager)
+    yield manager, task_id
+    database.dispose_engines()
+
+
+def _row(manager, task_id: int):
+    with manager.engine.connect() as conn:
+        return conn.execute(text(
+            "SELECT status, attempts FROM automation_task WHERE task_id = :task_id"
+        ), {"task_id": task_id}).one()
+
+
+def test_exhausted_retries_move_task_to_dead_letter(task_db):
+    from automation import TaskAgentAutomationManager
+
+    manager, task_id = task_db
+
+    async def scenario():
+        automation = TaskAgentAutomationManager(inline_execution=False)
+        automation.retry_policies = build_retry_policies({"default": {"max_attempts": 2, "base_delay": 0, "jitter": 0}})
+
+        async def execute_by_type(task_type, task_data, user_id):
+            return {"status": "failed", "message": "SMTP connection timed out"}
+
+        automation._execute_by_type = execute_by_type
+        rows = []
+        try:
+            for _ in range(2):
+                task_info = await automation.db_helper.get_automation_task_by_id(task_id)
+                await automation._run_task(task_info)
+                rows.append(_row(manager, task_id))
+            dead_letters = await automation.db_helper.get_dead_letter_automation_tasks()
+            replayed = await automation.db_helper.replay_automation_tasks([task_id])
+        finally:
+            await automation.shutdown()
+        return rows, dead_letters, replayed
+
+    rows, dead_letters, replayed = asyncio.run(scenario())
+
+    # 첫 실패는 재시도 예약, 두 번째 실패에서 시도 횟수를 소진
+    assert rows == [("pending", 1), ("dead_letter", 2)]
+    assert [task["task_id"] for task in dead_letters] == [task_id]
+    assert [error["attempt"] for error in dead_letters[0]["errors"]] == [1, 2]
+    assert replayed == [task_id]
+    assert _row(manager, task_id) == ("pending", 0)
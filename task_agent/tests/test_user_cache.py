@@ -0,0 +1,54 @@
+"""
+사용자 컨텍스트 캐시 테스트
+메모리 저장소에서 종류별 TTL(PHQ-9 캐시 우회)이 적용되는지 확인한다.
+"""
+
+from shared_modules.user_cache import UserContextCache
+
+
+class Loader:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def test_memory_backend_caches_by_default():
+    cache = UserContextCache(ttl=300)
+    loader = Loader({"business_type": "cafe"})
+
+    assert cache.get_or_load("business_type", 1, loader) == {"business_type": "cafe"}
+    assert cache.get_or_load("business_type", 1, loader) == {"business_type": "cafe"}
+    assert loader.calls == 1
+
+    cache.invalidate(1, ["business_type"])
+    cache.get_or_load("business_type", 1, loader)
+    assert loader.calls == 2
+
+
+def test_phq9_is_not_cached_in_process_memory():
+    cache = UserContextCache(ttl=300, memory_ttls={"phq9": 0})
+    loader = Loader((1, 12, 2, None))
+
+    for _ in range(3):
+        assert cache.get_or_load("phq9", 1, loader) == (1, 12, 2, None)
+
+    assert loader.calls == 3
+    stats = cache.get_stats()
+    assert stats["backend"] == "memory"
+    assert stats["ttl_by_kind"]["phq9"] == 0
+    assert stats["kinds"]["phq9"] == {"hits": 0, "misses": 0, "bypassed": 3, "hit_rate": 0.0}
+    assert stats["size"] == 0
+
+
+def test_phq9_memory_ttl_can_be_enabled():
+    cache = UserContextCache(ttl=300, memory_ttls={"phq9": 60})
+    loader = Loader(None)
+
+    cache.get_or_load("phq9", 1, loader)
+    cache.get_or_load("phq9", 1, loader)
+
+    assert loader.calls == 1
@@ -0,0 +1,55 @@
+"""
+벡터 스냅샷 내보내기 테스트
+스냅샷을 다시 내보내면 컬렉션 버전이 올라 이전 검색 결과 캐시가 무효화되는지 확인한다.
+"""
+
+import chromadb
+import numpy as np
+from langchain_core.documents import Document
+
+from shared_modules.metadata_index import read_collection_version
+from shared_modules.vector_snapshot import VectorSnapshot, export_snapshot
+from shared_modules.vector_utils import RetrievalCache
+
+
+def _collection(name: str):
+    client = chromadb.EphemeralClient()
+    collection = client.get_or_create_collection(name)
+    rng = np.random.default_rng(0)
+    collection.add(
+        ids=[f"doc-{i}" for i in range(20)],
+        embeddings=rng.normal(size=(20, 8)).tolist(),
+        documents=[f"문서 {i}" for i in range(20)],
+        metadatas=[{"topic": "tax" if i % 2 else "labor"} for i in range(20)]
+    )
+    return collection
+
+
+def test_export_bumps_collection_version(tmp_path):
+    collection = _collection("snapshot-version")
+    persist_directory = str(tmp_path / "chroma")
+    output_dir = str(tmp_path / "snapshot" / collection.name)
+
+    first = export_snapshot(collection, output_dir, dtype="float32", persist_directory=persist_directory)
+    assert first["collection_version"] == 1
+
+    cache = RetrievalCache()
+    key = cache.make_key(collection.name, persist_directory, "질문", 5)
+    cache.put(key, read_collection_version(persist_directory, collection.name), [(Document(page_content="old"), 0.1)])
+    assert cache.get(key, read_collection_version(persist_directory, collection.name)) is not None
+
+    second = export_snapshot(collection, output_dir, dtype="float32", persist_directory=persist_directory)
+    assert second["collection_version"] == 2
+    assert cache.get(key, read_collection_version(persist_directory, collection.name)) is None
+
+    snapshot = VectorSnapshot.open(output_dir)
+    assert len(snapshot) == 20
+    snapshot.close()
+
+
+def test_export_without_persist_directory_keeps_version(tmp_path):
+    collection = _collection("snapshot-no-version")
+
+    manifest = export_snapshot(collection, str(tmp_path / "snapshot"), dtype="int8")
+
+    assert "collection_version" not in manifest
@@ -0,0 +1,84 @@
+"""
+벡터 스토어 유틸리티 테스트
+검색 결과 캐시가 호출 측의 Document 수정과 분리되는지, 다른 프로세스가 만든 샤드가
+버전 변화나 재조회 주기에 맞춰 라우팅에 반영되는지 확인한다.
+"""
+
+from types import SimpleNamespace
+
+import chromadb
+import pytest
+from langchain_core.documents import Document
+
+from shared_modules.env_config import EnvironmentConfig
+from shared_modules.metadata_index import bump_collection_version
+from shared_modules.vector_utils import RetrievalCache, VectorStoreManager, get_shard_collection_name
+
+
+def test_cache_is_isolated_from_caller_documents():
+    cache = RetrievalCache()
+    key = cache.make_key("global-documents", "/tmp/chroma", "질문", 5)
+    results = [(Document(page_content="원문", metadata={"topic": "tax"}), 0.1)]
+
+    cache.put(key, 1, results)
+    # 저장 후 원본을 수정해도 캐시에는 반영되지 않음
+    results[0][0].metadata["topic"] = "changed"
+    results[0][0].page_content = "changed"
+    results.append((Document(page_content="추가"), 0.2))
+
+    cached = cache.get(key, 1)
+    assert [(doc.page_content, doc.metadata, score) for doc, score in cached] == [("원문", {"topic": "tax"}, 0.1)]
+
+    # 꺼낸 결과를 수정해도 다음 조회에는 영향 없음
+    cached[0][0].metadata["topic"] = "changed"
+    assert cache.get(key, 1)[0][0].metadata == {"topic": "tax"}
+
+
+@pytest.fixture
+def sharded_manager(tmp_path, monkeypatch):
+    """샤딩을 켠 VectorStoreManager 와 같은 디렉토리를 쓰는 별도 Chroma 클라이언트"""
+    persist_directory = str(tmp_path / "chroma")
+    monkeypatch.setenv("CHROMA_DIR", persist_directory)
+    monkeypatch.setenv("VECTOR_SHARDING", "true")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    manager = VectorStoreManager(EnvironmentConfig())
+    client = chromadb.PersistentClient(path=persist_directory)
+    client.get_or_create_collection(manager.default_collection)
+    manager.get_vectorstore = lambda collection_name=None, persist_directory=None: SimpleNamespace(_client=client)
+    return manager, client, persist_directory
+
+
+def _create_shard(client, persist_directory: str, category: str):
+    """init/shard_vector_db.py 처럼 샤드 컬렉션을 채우고 버전을 올림"""
+    shard = client.get_or_create_collection(get_shard_collection_name(category))
+    shard.add(ids=[f"{category}-1"], embeddings=[[0.1, 0.2, 0.3]], documents=["문서"], metadatas=[{"category": category}])
+    bump_collection_version(persist_directory, shard.name)
+
+
+def test_route_sees_shards_created_by_other_processes(sharded_manager):
+    manager, client, persist_directory = sharded_manager
+    filter_dict = {"category": "marketing"}
+
+    assert manager.route_collection(filter_dict=filter_dict) == "global-documents"
+
+    _create_shard(client, persist_directory, "marketing")
+    assert manager.route_collection(filter_dict=filter_dict) == "global-documents-marketing"
+
+
+def test_shard_list_is_reused_until_version_or_interval_changes(sharded_manager):
+    manager, client, persist_directory = sharded_manager
+    refreshes = []
+    refresh_shards = manager.refresh_shards
+    manager.refresh_shards = lambda persist_directory=None: refreshes.append(1) or refresh_shards(persist_directory)
+
+    for _ in range(3):
+        manager.route_collection(filter_dict={"category": "marketing"})
+    assert len(refreshes) == 1
+
+    # 버전 변화 없이 샤드가 생겨도 재조회 주기가 지나면 반영
+    shard = client.get_or_create_collection(get_shard_collection_name("mental_health"))
+    shard.add(ids=["m-1"], embeddings=[[0.1, 0.2, 0.3]], documents=["문서"])
+    assert manager.route_collection(filter_dict={"category": "mental_health"}) == "global-documents"
+    manager._shards_refreshed_at -= manager.shard_refresh_interval
+    assert manager.route_collection(filter_dict={"category": "mental_health"}) == "global-documents-mental_health"
+    assert len(refreshes) == 2
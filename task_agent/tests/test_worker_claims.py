@@ -0,0 +1,206 @@
+"""
+자동화 워커 선점 테스트
+임시 SQLite DB 에 작업을 넣고 워커 프로세스 여러 개를 동시에 띄워 모든 작업이 정확히 한 번씩 실행되는지 확인한다.
+"""
+
+import asyncio
+import multiprocessing
+
+import pytest
+from sqlalchemy import create_engine, event, text
+
+import shared_modules.db_models as db_models
+from shared_modules import database, migrations
+from shared_modules.env_config import EnvironmentConfig
+
+WORKERS = 3
+TASKS = 60
+
+
+def _sqlite_options(engine):
+    # 워커 프로세스 여러 개가 같은 파일에 쓰므로 잠금이 풀릴 때까지 기다린다 (init/benchmark_workers.py 와 동일)
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, _):
+        dbapi_connection.execute("PRAGMA busy_timeout = 30000")
+
+
+def _worker_process(worker_id: str, executed, ready):
+    import asyncio
+    from shared_modules.database import get_db_manager
+    _sqlite_options(get_db_manager().engine)
+
+    from worker import AutomationWorker
+    from automation_task.common.db_helper import get_automation_db_helper
+
+    db_helper = get_automation_db_helper()
+
+    async def execute(task_id: int):
+        await asyncio.sleep(0.01)
+        executed.put((worker_id, task_id))
+        await db_helper.update_automation_task_status(task_id, "success")
+
+    worker = AutomationWorker(execute, worker_id=worker_id, concurrency=4, poll_interval=0.05)
+    ready.wait()
+    asyncio.run(worker.run(drain=True))
+
+
+def _seed(url: str) -> list:
+    engine = create_engine(url)
+    _sqlite_options(engine)
+    db_models.Base.metadata.create_all(engine)
+    migrations.upgrade(engine)
+
+    with engine.begin() as conn:
+        user_id = conn.execute(db_models.User.__table__.insert().values(
+            email="worker@example.com", nickname="worker", provider="test",
+            social_id="worker", admin=False, experience=False, access_token="test"
+        )).inserted_primary_key[0]
+        conn.execute(db_models.AutomationTask.__table__.insert(), [
+            {"user_id": user_id, "task_type": "send_reminder", "title": f"task {i}", "status": "pending"}
+            for i in range(TASKS)
+        ])
+        task_ids = [row[0] for row in conn.execute(text("SELECT task_id FROM automation_task"))]
+    engine.dispose()
+    return task_ids
+
+
+def test_each_task_runs_exactly_once_across_workers(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'workers.db'}"
+    task_ids = _seed(url)
+    # spawn 된 워커는 부모 환경 변수로 DB 설정을 읽는다
+    monkeypatch.setenv("MYSQL_URL", url)
+    monkeypatch.delenv("MYSQL_REPLICA_URLS", raising=False)
+
+    context = multiprocessing.get_context("spawn")
+    executed = context.Queue()
+    ready = context.Barrier(WORKERS + 1)
+    processes = [
+        context.Process(target=_worker_process, args=(f"test-worker-{i}", executed, ready))
+        for i in range(WORKERS)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        ready.wait(timeout=120)
+        runs = [executed.get(timeout=120) for _ in task_ids]
+    finally:
+        for process in processes:
+            process.join(timeout=60)
+            if process.is_alive():
+                process.terminate()
+
+    assert all(process.exitcode == 0 for process in processes)
+    assert executed.empty(), "작업 수보다 많이 실행됨"
+    assert sorted(task_id for _, task_id in runs) == sorted(task_ids)
+    assert len({worker_id for worker_id, _ in runs}) > 1, "작업이 워커 하나에만 분배됨"
+
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        statuses = conn.execute(text(
+            "SELECT status, COUNT(*), SUM(locked_by IS NULL) FROM automation_task GROUP BY status"
+        )).all()
+    engine.dispose()
+    assert statuses == [("success", TASKS, TASKS)]
+
+
+@pytest.fixture
+def task_db(tmp_path, monkeypatch):
+    """이 프로세스의 전역 DB 매니저를 임시 SQLite DB 로 교체"""
+    url = f"sqlite:///{tmp_path / 'tasks.db'}"
+    task_ids = _seed(url)
+    monkeypatch.setenv("MYSQL_URL", url)
+    monkeypatch.delenv("MYSQL_REPLICA_URLS", raising=False)
+    manager = database.DatabaseManager(EnvironmentConfig())
+    _sqlite_options(manager.engine)
+    monkeypatch.setattr(database, "_global_db_manager", manager)
+    yield manager, task_ids
+    database.dispose_engines()
+
+
+def _lease(manager, task_id: int):
+    with manager.engine.connect() as conn:
+        return conn.execute(text(
+            "SELECT status, locked_by, lease_expires_at FROM automation_task WHERE task_id = :task_id"
+        ), {"task_id": task_id}).one()
+
+
+def test_processing_row_without_lease_is_reclaimed(task_db):
+    from automation_task.common.db_helper import get_automation_db_helper
+
+    manager, task_ids = task_db
+    stuck = task_ids[0]
+    with manager.engine.begin() as conn:
+        conn.execute(text(
+            "UPDATE automation_task SET status = 'processing', locked_by = NULL, lease_expires_at = NULL "
+            "WHERE task_id = :task_id"
+        ), {"task_id": stuck})
+
+    claimed = asyncio.run(get_automation_db_helper().claim_automation_tasks("reclaimer", 1, 60))
+
+    assert claimed == [stuck]
+    status, locked_by, lease_expires_at = _lease(manager, stuck)
+    assert (status, locked_by) == ("processing", "reclaimer")
+    assert lease_expires_at is not None
+
+
+def test_inline_run_claims_lease_before_executing(task_db):
+    from automation_task.common.task_scheduler import DurableTaskScheduler
+
+    manager, task_ids = task_db
+    task_id = task_ids[0]
+    seen = {}
+
+    async def execute(task_id: int):
+        seen["during"] = _lease(manager, task_id)
+        with manager.engine.begin() as conn:
+            conn.execute(text("UPDATE automation_task SET status = 'success' WHERE task_id = :task_id"),
+                         {"task_id": task_id})
+        return {"status": "success"}
+
+    scheduler = DurableTaskScheduler(None, execute, lease_seconds=60)
+
+    assert asyncio.run(scheduler.run_task(task_id)) == {"status": "success"}
+    status, locked_by, lease_expires_at = seen["during"]
+    assert (status, locked_by) == ("processing", scheduler.worker_id)
+    assert lease_expires_at is not None
+    assert _lease(manager, task_id) == ("success", None, None)
+
+    # 이미 실행된 작업은 다시 선점하지 않는다
+    assert asyncio.run(scheduler.run_task(task_id)) is None
+
+
+def test_inline_run_renews_lease_while_executing(task_db):
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    from automation_task.common.db_helper import get_automation_db_helper
+    from automation_task.common.task_scheduler import SYNC_JOB_ID, DurableTaskScheduler
+
+    manager, task_ids = task_db
+    task_id = task_ids[0]
+    db_helper = get_automation_db_helper()
+
+    async def scenario():
+        seen = {}
+
+        async def execute(task_id: int):
+            # 리스(1초)보다 오래 실행 엔진 대기열/실행에 머무는 작업
+            await asyncio.sleep(2.5)
+            seen["stolen"] = await db_helper.claim_automation_tasks("other-worker", TASKS, 60)
+            return {"status": "success"}
+
+        apscheduler = AsyncIOScheduler()
+        scheduler = DurableTaskScheduler(apscheduler, execute, lease_seconds=1, heartbeat_interval=0.3)
+        scheduler.start()
+        apscheduler.remove_job(SYNC_JOB_ID)  # 다른 대기 작업은 적재하지 않음
+        apscheduler.start()
+        try:
+            result = await scheduler.run_task(task_id)
+        finally:
+            apscheduler.shutdown(wait=False)
+        return result, seen["stolen"], scheduler.get_stats()
+
+    result, stolen, stats = asyncio.run(scenario())
+
+    assert result == {"status": "success"}
+    # 하트비트가 리스를 연장했으므로 다른 워커가 실행 중인 작업을 가져가지 못함
+    assert task_id not in stolen
+    assert stats["lost_leases"] == 0
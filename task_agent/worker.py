@@ -0,0 +1,173 @@
+"""
+Task Agent 자동화 워커
+API 서버(main.py)와 별도로 실행되어 automation_task 행을 선점하고 실행한다.
+워커 수를 늘리면 처리량이 늘어나며, 같은 작업이 두 워커에서 실행되지 않는다.
+
+    AUTOMATION_EXECUTION_MODE=worker 로 API 서버를 띄운 뒤
+    python task_agent/worker.py [--concurrency 4] [--worker-id ID] [--drain]
+
+선점한 작업은 lease 동안 이 워커 소유이며 하트비트로 연장된다.
+워커가 비정상 종료되면 lease 만료 후 다른 워커가 작업을 다시 가져간다.
+"""
+
+import os
+import sys
+import uuid
+import signal
+import socket
+import asyncio
+import argparse
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# 공통 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from automation_task.common.db_helper import get_automation_db_helper
+
+logger = logging.getLogger(__name__)
+
+
+def generate_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class AutomationWorker:
+    """automation_task 를 선점해 동시 실행하는 워커"""
+
+    def __init__(self, execute: Callable[[int], Awaitable[Any]], worker_id: str = None,
+                 concurrency: int = 4, lease_seconds: int = 60, heartbeat_interval: float = 15,
+                 poll_interval: float = 1.0):
+        """
+        Args:
+            execute: task_id 를 받아 작업을 실행하고 최종 상태를 기록하는 코루틴 함수
+            concurrency: 동시에 실행하는 최대 작업 수
+            lease_seconds: 선점 리스 (heartbeat_interval 의 2배 이상이어야 함)
+            heartbeat_interval: 리스 연장 주기 (초)
+            poll_interval: 실행할 작업이 없을 때 다시 확인하는 주기 (초)
+        """
+        self.execute = execute
+        self.worker_id = worker_id or generate_worker_id()
+        self.concurrency = concurrency
+        self.lease_seconds = max(lease_seconds, int(heartbeat_interval * 2))
+        self.heartbeat_interval = heartbeat_interval
+        self.poll_interval = poll_interval
+        self.db_helper = get_automation_db_helper()
+        self._active: Dict[int, asyncio.Task] = {}
+        self._wakeup = asyncio.Event()
+        self._stop = asyncio.Event()
+        self.stats = {"claimed": 0, "completed": 0, "errors": 0, "lost_leases": 0, "started_at": None}
+
+    def stop(self):
+        """새 작업 선점을 멈추고 실행 중인 작업이 끝나면 종료"""
+        self._stop.set()
+        self._wakeup.set()
+
+    async def run(self, drain: bool = False):
+        """
+        워커 실행
+
+        Args:
+            drain: True 이면 실행할 작업이 더 없을 때 종료 (배치 실행용)
+        """
+        self.stats["started_at"] = datetime.now().isoformat()
+        logger.info(f"자동화 워커 시작: {self.worker_id} (동시 실행 {self.concurrency}, 리스 {self.lease_seconds}초)")
+        heartbeat = asyncio.create_task(self._heartbeat_loop())
+
+        try:
+            while not self._stop.is_set():
+                free = self.concurrency - len(self._active)
+                claimed = []
+                if free > 0:
+                    claimed = await self.db_helper.claim_automation_tasks(self.worker_id, free, self.lease_seconds)
+                    for task_id in claimed:
+                        if task_id not in self._active:
+                            self._active[task_id] = asyncio.create_task(self._process(task_id))
+                    self.stats["claimed"] += len(claimed)
+
+                if drain and not claimed and not self._active:
+                    break
+
+                # 가득 찼거나 가져올 작업이 없으면 작업 완료 또는 poll_interval 까지 대기
+                if free <= 0 or not claimed:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            if self._active:
+                logger.info(f"실행 중인 작업 {len(self._active)}개 완료 대기")
+                await asyncio.gather(*self._active.values(), return_exceptions=True)
+            heartbeat.cancel()
+            logger.info(f"자동화 워커 종료: {self.worker_id} {self.stats}")
+
+    async def _process(self, task_id: int):
+        try:
+            await self.execute(task_id)
+            self.stats["completed"] += 1
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"작업 실행 오류 (ID: {task_id}): {e}")
+        finally:
+            await self.db_helper.release_automation_task(task_id, self.worker_id)
+            self._active.pop(task_id, None)
+            self._wakeup.set()
+
+    async def _heartbeat_loop(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            task_ids = list(self._active)
+            if not task_ids:
+                continue
+            renewed = await self.db_helper.renew_automation_task_leases(self.worker_id, task_ids, self.lease_seconds)
+            if renewed < len(task_ids):
+                # 리스를 잃은 작업은 다른 워커가 다시 실행할 수 있음 (하트비트 지연/DB 장애)
+                self.stats["lost_leases"] += len(task_ids) - renewed
+                logger.warning(f"리스 연장 실패: {len(task_ids) - renewed}/{len(task_ids)}개")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "worker_id": self.worker_id, "active": len(self._active)}
+
+
+async def run_worker(args: argparse.Namespace):
+    from automation import TaskAgentAutomationManager
+    from shared_modules.migrations import ensure_schema_current
+
+    # 선점 컬럼(locked_by / lease_expires_at)이 없으면 upgrade 안내와 함께 종료
+    ensure_schema_current()
+
+    manager = TaskAgentAutomationManager(inline_execution=False)
+    settings = manager.config_manager.get_automation_settings()
+    worker = AutomationWorker(
+        manager._execute_task,
+        worker_id=args.worker_id,
+        concurrency=args.concurrency or settings["worker_concurrency"],
+        lease_seconds=settings["worker_lease_seconds"],
+        heartbeat_interval=settings["worker_heartbeat_interval"],
+        poll_interval=settings["worker_poll_interval"]
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run(drain=args.drain)
+    finally:
+        await manager.shutdown()
+
+
+def main(argv: Optional[list] = None):
+    """메인 실행 함수"""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Task Agent 자동화 워커")
+    parser.add_argument("--concurrency", type=int, default=None, help="동시 실행 작업 수 (기본: automation.worker_concurrency)")
+    parser.add_argument("--worker-id", default=None, help="워커 ID (기본: 호스트:PID:난수)")
+    parser.add_argument("--drain", action="store_true", help="실행할 작업이 없으면 종료")
+    asyncio.run(run_worker(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,14 @@
 통합 에이전트 시스템 메인 FastAPI 애플리케이션
 """
 
+import json
 import logging
 import asyncio
 from contextlib import asynccontextmanager
 from typing import Dict, Any, List, Optional
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Body, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, FileResponse, Response
+from fastapi.responses import HTMLResponse, FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
@@ -29,11 +30,16 @@ from shared_modules import (
     create_message, 
     get_conversation_by_id, 
     get_recent_messages,
+    get_messages_page,
     get_user_by_social,
     create_user_social,
     get_template_by_title,
     get_template,
     get_templates_by_type,
+    get_templates_page,
+    stream_templates_by_type,
+    stream_all_users,
+    get_automation_tasks_page,
     save_or_update_phq9_result,
     get_latest_phq9_by_user,
     create_success_response,
@@ -50,8 +56,10 @@ from core.config import (
     SERVER_HOST, SERVER_PORT, DEBUG_MODE, 
     LOG_LEVEL, LOG_FORMAT
 )
-from shared_modules.database import get_session_context as unified_get_session_context
-from shared_modules.queries import get_conversation_history
+from shared_modules.database import get_session_context as unified_get_session_context, get_pool_stats
+from shared_modules.user_cache import get_user_cache
+from shared_modules.message_archive import rehydrate_conversation
+from shared_modules.migrations import ensure_schema_current
 from shared_modules.utils import get_or_create_conversation_session, create_success_response as unified_create_success_response
 
 # 로깅 설정
@@ -97,6 +105,7 @@ async def lifespan(app: FastAPI):
     """앱 시작/종료 시 실행되는 라이프사이클 함수"""
     # 시작 시
     logger.info("통합 에이전트 시스템 시작")
+    ensure_schema_current()
     workflow = get_workflow()
     
     # 에이전트 상태 확인
@@ -150,12 +159,21 @@ async def create_conversation_endpoint(req: ConversationCreate):
         return create_error_response("대화 세션 생성에 실패했습니다", "CONVERSATION_CREATE_ERROR")
 
 @app.get("/conversations/{user_id}")
-async def get_user_conversations(user_id: int):
-    """사용자의 대화 세션 목록 조회"""
+async def get_user_conversations(user_id: int, limit: Optional[int] = None, cursor: Optional[str] = None):
+    """
+    사용자의 대화 세션 목록 조회
+    
+    limit 을 주면 keyset 페이지로 조회하며, 응답의 next_cursor 를 cursor 로 넘겨 다음 페이지를 받는다.
+    """
     try:
-        with get_session_context() as db:
-            from shared_modules.queries import get_user_conversations
-            conversations = get_user_conversations(db, user_id, visible_only=True)
+        with get_session_context(read_only=True) as db:
+            from shared_modules.queries import get_user_conversations, get_user_conversations_page
+            page = None
+            if limit or cursor:
+                page = get_user_conversations_page(db, user_id, limit or 20, cursor, visible_only=True)
+                conversations = page["conversations"]
+            else:
+                conversations = get_user_conversations(db, user_id, visible_only=True)
             
             conversation_list = []
             for conv in conversations:
@@ -166,21 +184,32 @@ async def get_user_conversations(user_id: int):
                     "title": "대화"
                 })
             
-            return create_success_response(conversation_list)
+            response = create_success_response(conversation_list)
+            if page is not None:
+                response["next_cursor"] = page["next_cursor"]
+                response["has_more"] = page["has_more"]
+            return response
             
+    except ValueError:
+        return create_error_response("잘못된 커서입니다", "INVALID_CURSOR")
     except Exception as e:
         logger.error(f"대화 목록 조회 실패: {e}")
         return create_error_response("대화 목록 조회에 실패했습니다", "CONVERSATION_LIST_ERROR")
 
 @app.get("/conversations/{conversation_id}/messages")
-async def get_conversation_messages(conversation_id: int, limit: int = 50):
-    """대화의 메시지 목록 조회"""
+async def get_conversation_messages(conversation_id: int, limit: int = 50, before_id: Optional[int] = None):
+    """
+    대화의 메시지 목록 조회 (keyset 페이지네이션)
+    
+    최신 limit 개를 시간순으로 반환하며, 이전 메시지는 응답의 next_cursor 를
+    before_id 로 넘겨 이어서 조회한다.
+    """
     try:
-        with get_session_context() as db:
-            messages = get_recent_messages(db, conversation_id, limit)
+        with get_session_context(read_only=True) as db:
+            page = get_messages_page(db, conversation_id, limit, before_id)
             
             message_list = []
-            for msg in reversed(messages):  # 시간순 정렬
+            for msg in page["messages"]:
                 message_list.append({
                     "message_id": msg.message_id,
                     "role": "user" if msg.sender_type.lower() == "user" else "assistant",
@@ -189,7 +218,10 @@ async def get_conversation_messages(conversation_id: int, limit: int = 50):
                     "agent_type": msg.agent_type
                 })
             
-            return create_success_response(message_list)
+            response = create_success_response(message_list)
+            response["next_cursor"] = page["next_cursor"]
+            response["has_more"] = page["has_more"]
+            return response
             
     except Exception as e:
         logger.error(f"메시지 목록 조회 실패: {e}")
@@ -763,9 +795,24 @@ async def preview_template(template_id: int):
         return Response(content="<p>템플릿을 로드할 수 없습니다</p>", status_code=500, media_type="text/html")
 
 @app.get("/templates")
-async def get_templates(template_type: Optional[str] = None):
-    """템플릿 목록 조회"""
+async def get_templates(template_type: Optional[str] = None, limit: Optional[int] = None,
+                        cursor: Optional[str] = None):
+    """
+    템플릿 목록 조회
+    
+    limit 을 주면 keyset 페이지로 조회하며, 응답의 next_cursor 를 cursor 로 넘겨 다음 페이지를 받는다.
+    """
     try:
+        if limit or cursor:
+            page = get_templates_page(template_type or "전체", limit or 50, cursor)
+            return create_success_response({
+                "templates": page["templates"],
+                "count": len(page["templates"]),
+                "type": template_type or "전체",
+                "next_cursor": page["next_cursor"],
+                "has_more": page["has_more"]
+            })
+        
         if template_type:
             templates = get_templates_by_type(template_type)
         else:
@@ -777,6 +824,8 @@ async def get_templates(template_type: Optional[str] = None):
             "type": template_type or "전체"
         })
         
+    except ValueError:
+        return create_error_response("잘못된 커서입니다", "INVALID_CURSOR")
     except Exception as e:
         logger.error(f"템플릿 목록 조회 실패: {e}")
         return create_error_response("템플릿 목록 조회에 실패했습니다", "TEMPLATE_LIST_ERROR")
@@ -997,36 +1046,35 @@ async def cancel_automation_task(task_id: int):
         return create_error_response("자동화 작업 취소에 실패했습니다", "AUTOMATION_CANCEL_ERROR")
 
 @app.get("/automation")
-async def list_automation_tasks(user_id: Optional[int] = None, status: Optional[str] = None):
-    """자동화 작업 목록 조회 (목 구현)"""
+async def list_automation_tasks(user_id: Optional[int] = None, status: Optional[str] = None,
+                                limit: int = 50, cursor: Optional[int] = None):
+    """
+    자동화 작업 목록 조회 (task_id 최신순 keyset 페이지)
+    
+    응답의 next_cursor 를 cursor 로 넘겨 다음 페이지를 받는다.
+    """
     try:
         logger.info(f"자동화 작업 목록 조회: user_id={user_id}, status={status}")
         
-        # 목 데이터
+        with get_session_context(read_only=True) as db:
+            page = get_automation_tasks_page(db, user_id, status, min(limit, 500), cursor)
+        
         tasks = [
             {
-                "task_id": 12345,
-                "task_type": "email_send",
-                "status": "completed",
-                "user_id": user_id or 1,
-                "created_at": get_current_timestamp()
-            },
-            {
-                "task_id": 12346,
-                "task_type": "schedule_meeting",
-                "status": "running",
-                "user_id": user_id or 1,
-                "created_at": get_current_timestamp()
+                **task,
+                "status": task["status"].lower(),
+                "scheduled_at": task["scheduled_at"].isoformat() if task["scheduled_at"] else None,
+                "executed_at": task["executed_at"].isoformat() if task["executed_at"] else None,
+                "created_at": task["created_at"].isoformat() if task["created_at"] else None
             }
+            for task in page["tasks"]
         ]
         
-        # 상태 필터링
-        if status:
-            tasks = [t for t in tasks if t["status"] == status]
-        
         response_data = {
             "tasks": tasks,
             "total": len(tasks),
+            "next_cursor": page["next_cursor"],
+            "has_more": page["has_more"],
             "filter": {
                 "user_id": user_id,
                 "status": status
@@ -1040,6 +1088,35 @@ async def list_automation_tasks(user_id: Optional[int] = None, status: Optional[
         return create_error_response("자동화 작업 목록 조회에 실패했습니다", "AUTOMATION_LIST_ERROR")
 
 
+# ===== 관리자 내보내기 API (NDJSON 스트리밍) =====
+
+def _ndjson_response(rows, filename: str) -> StreamingResponse:
+    """행 iterator 를 한 줄에 JSON 하나씩 스트리밍 (결과 크기와 무관하게 메모리 일정)"""
+    def generate():
+        for row in rows:
+            yield json.dumps(row, default=str, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@app.get("/admin/export/users")
+async def export_users():
+    """전체 사용자 NDJSON 내보내기 (토큰 컬럼 제외)"""
+    rows = (
+        {key: value for key, value in user.items() if key not in ("access_token", "refresh_token")}
+        for user in stream_all_users()
+    )
+    return _ndjson_response(rows, "users.ndjson")
+
+@app.get("/admin/export/templates")
+async def export_templates(template_type: str = "전체"):
+    """템플릿 NDJSON 내보내기"""
+    return _ndjson_response(stream_templates_by_type(template_type), "templates.ndjson")
+
+
 @app.get("/test-ui")
 async def test_ui():
     """테스트 웹 인터페이스 제공"""
@@ -1142,6 +1219,10 @@ async def process_query(request: UnifiedRequest):
             with get_session_context() as db:
                 conversation = create_conversation(db, request.user_id)
                 request.conversation_id = conversation.conversation_id
+        elif config.MESSAGE_ARCHIVE_ENABLED:
+            # 보관된 대화가 다시 열리면 메시지를 핫 테이블로 복원
+            with get_session_context() as db:
+                rehydrate_conversation(db, request.conversation_id)
         
         # 사용자 메시지 저장
         with get_session_context() as db:
@@ -1177,19 +1258,6 @@ async def process_query(request: UnifiedRequest):
 
 
 
-# ===== 대화 관리 API =====
-
-@app.get("/conversations/{conversation_id}/messages")
-async def get_conversation_messages(conversation_id: int, limit: int = 50):
-    """대화의 메시지 목록 조회"""
-    try:
-        history = await get_conversation_history(conversation_id, limit)
-        return create_success_response(data=history)
-        
-    except Exception as e:
-        logger.error(f"메시지 목록 조회 실패: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
 # ===== 시스템 관리 API ===== 
 
 @app.get("/health", response_model=HealthCheck)
@@ -1206,7 +1274,9 @@ async def health_check():
                 "active_agents": status["active_agents"],
                 "total_agents": status["total_agents"],
                 "workflow_version": status["workflow_version"],
-                "multi_agent_enabled": status["config"]["enable_multi_agent"]
+                "multi_agent_enabled": status["config"]["enable_multi_agent"],
+                "database_pools": get_pool_stats(),
+                "user_cache": get_user_cache().get_stats()
             }
         )
         